@@ -0,0 +1,100 @@
+"""
+브로드캐스트 벤치마크
+플레이어 수에 따른 브로드캐스트 1회당 CPU 시간 비교
+(플레이어마다 인코딩 vs 한 번 인코딩 후 프레임 재사용)
+
+실행: python -m benchmarks.bench_broadcast
+"""
+
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.protocol import Protocol
+from common.message_types import DummyMessage, GameStateMessage
+
+PLAYER_COUNTS = [2, 4, 8, 16, 20, 50, 100]
+ITERATIONS = 500
+
+
+class Drain:
+    """수신 측 소켓을 계속 비워서 송신이 막히지 않도록 하는 스레드"""
+
+    def __init__(self, socks):
+        self.selector = selectors.DefaultSelector()
+        for s in socks:
+            s.setblocking(False)
+            self.selector.register(s, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while self.running:
+            for key, _ in self.selector.select(timeout=0.05):
+                try:
+                    key.fileobj.recv(1 << 16)
+                except BlockingIOError:
+                    pass
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        self.selector.close()
+
+
+def _per_socket(socks, message):
+    """기존 방식: 수신자마다 send_message (매번 인코딩)"""
+    for s in socks:
+        Protocol.send_message(s, message)
+
+
+def _encode_once(socks, message):
+    """새 방식: 한 번 인코딩 후 같은 프레임 전송"""
+    frame = Protocol.encode_message(message)
+    for s in socks:
+        Protocol.send_frame(s, frame)
+
+
+def measure(fn, socks, message) -> float:
+    """브로드캐스트 1회당 송신 스레드 CPU 시간 (마이크로초)"""
+    start = time.thread_time()
+    for _ in range(ITERATIONS):
+        fn(socks, message)
+    return (time.thread_time() - start) / ITERATIONS * 1e6
+
+
+def main():
+    messages = {
+        'DUMMY': DummyMessage(payload="DUMMY_ABCD1234"),
+        'ROUND_END': GameStateMessage(
+            state="ROUND_END", round_num=3, message="라운드 3 종료",
+            players=[{'player_id': f"Player{i}", 'ip': f"172.20.1.{i}", 'score': i * 10,
+                      'hp': 100, 'is_connected': True} for i in range(1, 21)]
+        ),
+    }
+
+    print(f"{'type':<10} {'players':>7} {'per-socket(us)':>15} {'encode-once(us)':>16} {'speedup':>8}")
+    for name, message in messages.items():
+        for count in PLAYER_COUNTS:
+            pairs = [socket.socketpair() for _ in range(count)]
+            senders = [a for a, _ in pairs]
+            drain = Drain([b for _, b in pairs])
+            try:
+                before = measure(_per_socket, senders, message)
+                after = measure(_encode_once, senders, message)
+            finally:
+                drain.stop()
+                for a, b in pairs:
+                    a.close()
+                    b.close()
+            print(f"{name:<10} {count:>7} {before:>15.1f} {after:>16.1f} {before / after:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
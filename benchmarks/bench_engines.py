@@ -0,0 +1,277 @@
+"""
+연결 엔진 벤치마크 (threaded vs asyncio)
+같은 GameServer 로직을 두 엔진으로 실행해 비교
+
+- 대기 연결: CONNECT 전 상태의 연결 IDLE_CONNECTIONS개를 열었을 때 스레드 수/RSS 증가량
+- 플레이어 접속: CONNECT~WELCOME 왕복 시간, 접속 후 스레드 수/RSS 증가량
+- 브로드캐스트 지연: broadcast_message 호출부터 모든 플레이어가 프레임을 다 받을 때까지
+- 락 대기 중 접속: 한 방의 GameManager.lock을 STALL_MS 동안 잡고 그 방 플레이어가
+  ATTACK_REQUEST를 보내 처리가 락을 기다리는 동안, 다른 방 새 플레이어의 CONNECT~WELCOME 시간
+  (연결 처리와 락 대기가 같은 스레드에 있으면 STALL_MS 가까이 늘어남)
+
+락 대기 측정 외의 플레이어는 모두 기본 방 하나에 접속.
+
+실행: python -m benchmarks.bench_engines
+"""
+
+import contextlib
+import io
+import os
+import selectors
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import SUPPORTED_WIRE_VERSIONS
+from common.message_types import ConnectMessage, GameStateMessage, AttackRequestMessage
+from common.protocol import Protocol, FrameReader
+from server.engines import ENGINES
+from server.game_server import GameServer
+
+IDLE_CONNECTIONS = 500
+PLAYER_COUNT = 20
+BROADCASTS = 300
+STALL_MS = 200
+
+
+class QuietGameServer(GameServer):
+    """로그 출력 없는 GameServer"""
+
+    def log_to_gui(self, message: str, level: str = "info"):
+        pass
+
+
+class FrameCounter:
+    """모든 클라이언트 소켓을 selector 하나로 읽으며 소켓별 수신 프레임 수를 세는 스레드"""
+
+    def __init__(self, socks):
+        self.selector = selectors.DefaultSelector()
+        self.buffers = {}
+        self.counts = {}
+        self.cond = threading.Condition()
+        for s in socks:
+            s.setblocking(False)
+            self.selector.register(s, selectors.EVENT_READ)
+            self.buffers[s] = bytearray()
+            self.counts[s] = 0
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while self.running:
+            for key, _ in self.selector.select(timeout=0.05):
+                s = key.fileobj
+                try:
+                    data = s.recv(1 << 16)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    self.selector.unregister(s)
+                    continue
+                buf = self.buffers[s]
+                buf += data
+                frames = 0
+                while len(buf) >= Protocol.HEADER_SIZE:
+                    length = struct.unpack_from(Protocol.HEADER_FORMAT, buf)[0]
+                    if len(buf) < Protocol.HEADER_SIZE + length:
+                        break
+                    del buf[:Protocol.HEADER_SIZE + length]
+                    frames += 1
+                if frames:
+                    with self.cond:
+                        self.counts[s] += frames
+                        self.cond.notify_all()
+
+    def total(self) -> int:
+        with self.cond:
+            return sum(self.counts.values())
+
+    def wait_total(self, target: int, timeout: float = 5.0) -> bool:
+        deadline = time.perf_counter() + timeout
+        with self.cond:
+            while sum(self.counts.values()) < target:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                self.cond.wait(remaining)
+            return True
+
+    def settle(self, quiet: float = 0.3):
+        """quiet초 동안 새 프레임이 없을 때까지 대기"""
+        last = -1
+        while True:
+            current = self.total()
+            if current == last:
+                return
+            last = current
+            time.sleep(quiet)
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        self.selector.close()
+
+
+def rss_kb() -> int:
+    """현재 프로세스 RSS (KB)"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_threads(expected_min: int, timeout: float = 2.0):
+    """스레드 생성이 반영될 때까지 잠시 대기"""
+    deadline = time.perf_counter() + timeout
+    while threading.active_count() < expected_min and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+
+def connect_player(port: int, player_id: str, room: Optional[str] = None) -> tuple:
+    """
+    CONNECT를 보내고 WELCOME까지 대기
+
+    Returns:
+        (소켓, 왕복 시간 ms)
+    """
+    t0 = time.perf_counter()
+    s = socket.create_connection(('127.0.0.1', port))
+    connect = ConnectMessage(player_id=player_id, player_ip="127.0.0.1", room=room,
+                             wire_versions=list(SUPPORTED_WIRE_VERSIONS))
+    Protocol.send_message(s, connect)
+    welcome = FrameReader(s).receive_message()
+    elapsed = (time.perf_counter() - t0) * 1000
+    assert welcome is not None and welcome.get('info_type') == "WELCOME"
+    return s, elapsed
+
+
+def lock_stall(server: GameServer, port: int) -> float:
+    """다른 방의 GameManager.lock을 기다리는 요청이 있는 동안 새 플레이어 접속 시간 (ms)"""
+    busy, _ = connect_player(port, "StallA", room="stall-a")
+    lock = server.rooms.get_room("stall-a").game_manager.lock
+    held = threading.Event()
+
+    def hold():
+        with lock:
+            held.set()
+            time.sleep(STALL_MS / 1000)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait()
+    Protocol.send_message(busy, AttackRequestMessage(attacker_id="StallA", target_id="StallX"))
+    time.sleep(0.02)  # 요청 처리가 락 대기에 들어가도록
+    other, elapsed = connect_player(port, "StallB", room="stall-b")
+    holder.join()
+    busy.close()
+    other.close()
+    return elapsed
+
+
+def run_engine(engine: str) -> dict:
+    port = free_port()
+    server = QuietGameServer(host='127.0.0.1', port=port, engine=engine)
+    result = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        server.start()
+        base_threads = threading.active_count()
+        base_rss = rss_kb()
+
+        # 1) 대기 연결
+        idle = []
+        start = time.perf_counter()
+        for _ in range(IDLE_CONNECTIONS):
+            idle.append(socket.create_connection(('127.0.0.1', port)))
+        result['idle_open_ms'] = (time.perf_counter() - start) * 1000
+        if engine == 'threaded':
+            wait_threads(base_threads + IDLE_CONNECTIONS)
+        time.sleep(0.3)
+        result['idle_threads'] = threading.active_count() - base_threads
+        result['idle_rss_kb'] = rss_kb() - base_rss
+        for s in idle:
+            s.close()
+        time.sleep(0.5)
+
+        # 2) 플레이어 접속
+        base_threads = threading.active_count()
+        base_rss = rss_kb()
+        players = []
+        handshake = []
+        for i in range(PLAYER_COUNT):
+            s, elapsed = connect_player(port, f"Bench{i}")
+            handshake.append(elapsed)
+            players.append(s)
+        time.sleep(0.3)
+        result['player_threads'] = threading.active_count() - base_threads
+        result['player_rss_kb'] = rss_kb() - base_rss
+        result['handshake_ms'] = statistics.mean(handshake)
+
+        # 3) 브로드캐스트 지연
+        counter = FrameCounter(players)
+        counter.settle()
+        room = server.rooms.get_room()
+        message = GameStateMessage(
+            state="ROUND_END", round_num=3, message="라운드 3 종료",
+            players=room.player_manager.get_players_info()
+        )
+        latencies = []
+        for _ in range(BROADCASTS):
+            target = counter.total() + PLAYER_COUNT
+            t0 = time.perf_counter()
+            room.broadcast_message(message)
+            if not counter.wait_total(target):
+                raise RuntimeError(f"{engine}: 브로드캐스트 수신 타임아웃")
+            latencies.append((time.perf_counter() - t0) * 1e6)
+        latencies.sort()
+        result['bcast_p50_us'] = latencies[len(latencies) // 2]
+        result['bcast_p99_us'] = latencies[int(len(latencies) * 0.99) - 1]
+
+        counter.stop()
+        for s in players:
+            s.close()
+        time.sleep(0.3)
+
+        # 4) 락 대기 중 접속
+        result['stall_handshake_ms'] = lock_stall(server, port)
+        time.sleep(0.3)
+        server.stop()
+
+    return result
+
+
+def main():
+    rows = [
+        ('idle_open_ms', f"{IDLE_CONNECTIONS} idle conn open ms"),
+        ('idle_threads', f"{IDLE_CONNECTIONS} idle conn +threads"),
+        ('idle_rss_kb', f"{IDLE_CONNECTIONS} idle conn +RSS KB"),
+        ('handshake_ms', "CONNECT/WELCOME ms"),
+        ('player_threads', f"{PLAYER_COUNT} players +threads"),
+        ('player_rss_kb', f"{PLAYER_COUNT} players +RSS KB"),
+        ('bcast_p50_us', f"broadcast x{PLAYER_COUNT} p50 us"),
+        ('bcast_p99_us', f"broadcast x{PLAYER_COUNT} p99 us"),
+        ('stall_handshake_ms', f"CONNECT during {STALL_MS}ms lock ms"),
+    ]
+    results = {engine: run_engine(engine) for engine in ENGINES}
+
+    print(f"{'metric':<32}" + "".join(f"{engine:>12}" for engine in ENGINES))
+    for key, label in rows:
+        print(f"{label:<32}" + "".join(f"{results[engine][key]:>12.1f}" for engine in ENGINES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+게임 이벤트 버스 벤치마크
+
+1) publish 비용: 구독자 수별 EventBus.publish() 1회 비용 (비교: 게임 스레드에서 핸들러를 바로 호출)
+2) 느린 구독자: 게임 스레드가 공격 이벤트 EVENTS개를 발행하는 동안 이벤트마다 SLOW_MS가 걸리는 구독자가 있을 때
+   - sync: 관찰자를 게임 스레드에서 바로 호출 (기존 콜백 방식)
+   - bus: 구독자 큐에 넣기만 함
+   발행 스레드 소요 시간, 구독자별 지연(p50/p99/최대), 빠른 구독자가 모든 이벤트를 순서대로 받았는지 확인
+3) 게임 진행: VirtualClock으로 5라운드 게임 전체를 느린 구독자와 함께 실행 (sync / bus)
+   - 게임 스레드 소요 시간, 받은 이벤트 순서가 라운드 진행과 같은지 확인
+
+실행: python -m benchmarks.bench_event_bus
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import TOTAL_ROUNDS
+from server.clock import VirtualClock
+from server.event_bus import (
+    EventBus, AttackApproved, AttackCompleted, GameStarted, RoundStarted, ScoresComputed, GameEnded
+)
+from server.room import Room
+
+PUBLISHES = 200000
+EVENTS = 2000
+SLOW_MS = 2.0
+PLAYERS = 6
+
+
+class NullWriter:
+    """송신 큐 대신 메시지를 버리는 writer"""
+
+    def send(self, message):
+        return True
+
+    def stats(self) -> dict:
+        return {}
+
+
+class SyncBus:
+    """비교용: 구독자를 발행 스레드에서 바로 호출하는 버스 (기존 콜백 방식)"""
+
+    def __init__(self):
+        self.handlers = []
+
+    def subscribe(self, handler, name=None, event_types=None, max_queue=None):
+        self.handlers.append(handler)
+
+    def publish(self, event):
+        for handler in self.handlers:
+            handler(event)
+
+
+def attack_event(i: int):
+    if i % 2 == 0:
+        return AttackApproved("main", i, f"P{i % 4}", f"P{(i + 1) % 4}", 1)
+    return AttackCompleted("main", i - 1, f"P{i % 4}", f"P{(i + 1) % 4}", "172.20.1.1", 12.5)
+
+
+def bench_publish() -> list:
+    events = [attack_event(i) for i in range(1000)]
+    rows = []
+
+    received = []
+    t0 = time.perf_counter()
+    for i in range(PUBLISHES):
+        received.append(events[i % 1000])
+    rows.append(('direct call', (time.perf_counter() - t0) / PUBLISHES * 1e9))
+
+    for subscribers in (0, 1, 4):
+        bus = EventBus()
+        for n in range(subscribers):
+            bus.subscribe(lambda event: None, name=f"null-{n}", max_queue=PUBLISHES)
+        t0 = time.perf_counter()
+        for i in range(PUBLISHES):
+            bus.publish(events[i % 1000])
+        rows.append((f"bus, {subscribers} subscribers", (time.perf_counter() - t0) / PUBLISHES * 1e9))
+        bus.close()
+    return rows
+
+
+def slow_handler(event):
+    time.sleep(SLOW_MS / 1000)
+
+
+def bench_slow_subscriber(kind: str) -> dict:
+    events = [attack_event(i) for i in range(EVENTS)]
+    received = []
+    bus = SyncBus() if kind == 'sync' else EventBus()
+    bus.subscribe(slow_handler, name="slow")
+    bus.subscribe(received.append, name="recorder")
+
+    t0 = time.perf_counter()
+    for event in events:
+        bus.publish(event)
+    publisher_ms = (time.perf_counter() - t0) * 1000
+
+    result = {'publisher_ms': publisher_ms}
+    if kind == 'bus':
+        stats = {s["name"]: s for s in bus.stats()["subscribers"]}  # 발행 직후 (느린 구독자는 아직 처리 중)
+        result['slow_pending'] = stats['slow']['pending']
+        result['publish_avg_us'] = bus.stats()['publish_avg_us']
+        subscriptions = bus._subscriptions
+        bus.close()  # 남은 이벤트 처리까지 대기
+        result['lag'] = {s.name: s.lag.to_dict() for s in subscriptions}
+    result['drained_ms'] = (time.perf_counter() - t0) * 1000
+
+    if received != events:
+        raise AssertionError(f"{kind}: 기록 구독자가 받은 이벤트가 발행 순서와 다름 ({len(received)}/{len(events)})")
+    return result
+
+
+def bench_game(kind: str) -> dict:
+    clock = VirtualClock()
+    received = []
+    bus = SyncBus() if kind == 'sync' else EventBus()
+    bus.subscribe(slow_handler, name="slow")
+    bus.subscribe(received.append, name="recorder")
+    room = Room("bench", 1, clock=clock, event_bus=bus)
+    for i in range(PLAYERS):
+        room.player_manager.add_player(f"P{i}", None, ("127.0.0.1", 0), writer=NullWriter())
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        room.start_game()
+        room.game_manager.game_thread.join()
+        game_ms = (time.perf_counter() - t0) * 1000
+        room.dummy_generator.stop()
+        if kind == 'bus':
+            bus.close()
+
+    expected = [GameStarted]
+    for _ in range(TOTAL_ROUNDS):
+        expected += [RoundStarted, ScoresComputed]
+    expected.append(GameEnded)
+    if [type(event) for event in received] != expected:
+        raise AssertionError(f"{kind}: 이벤트 순서가 라운드 진행과 다름: {[type(e).__name__ for e in received]}")
+    rounds = [event.round_num for event in received if isinstance(event, RoundStarted)]
+    if rounds != list(range(1, TOTAL_ROUNDS + 1)):
+        raise AssertionError(f"{kind}: 라운드 번호 {rounds}")
+    return {'game_ms': game_ms, 'events': len(received)}
+
+
+def main():
+    print(f"publish cost, {PUBLISHES} events (ns per event)")
+    for label, ns in bench_publish():
+        print(f"  {label:<22}{ns:>8.0f}")
+
+    print()
+    print(f"{EVENTS} attack events, one subscriber taking {SLOW_MS:.0f}ms per event + one recorder")
+    for kind in ('sync', 'bus'):
+        r = bench_slow_subscriber(kind)
+        line = f"  {kind:<5} publisher {r['publisher_ms']:.1f}ms, all handled {r['drained_ms']:.0f}ms"
+        if kind == 'bus':
+            line += (f", publish avg {r['publish_avg_us']:.2f}us, slow pending after publish {r['slow_pending']}"
+                     f"\n        lag recorder p50 {r['lag']['recorder']['p50_ms']}ms / max {r['lag']['recorder']['max_ms']}ms, "
+                     f"slow p99 {r['lag']['slow']['p99_ms']}ms / max {r['lag']['slow']['max_ms']}ms")
+        print(line + ", recorder order equal")
+
+    print()
+    print(f"virtual game ({TOTAL_ROUNDS} rounds, {PLAYERS} players) with a {SLOW_MS:.0f}ms subscriber")
+    for kind in ('sync', 'bus'):
+        r = bench_game(kind)
+        print(f"  {kind:<5} game thread {r['game_ms']:.1f}ms, {r['events']} events in round order")
+
+
+if __name__ == '__main__':
+    main()
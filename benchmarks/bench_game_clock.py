@@ -0,0 +1,169 @@
+"""
+게임 진행 시계 벤치마크 (VirtualClock 전체 게임 / 실제 시계 중지 지연)
+
+1) virtual: VirtualClock으로 방 하나에서 5라운드 게임 전체를 생성기(더미/노이즈/가짜 공격)와 함께 실행
+   - 실제 걸린 시간과 가상 경과 시간
+   - 단계 메시지 수가 실제 게임과 같은지 확인 (라운드 시작/종료, 10초 알림, 방어 단계, R5 가짜 공격 수 상한)
+2) early wake: 대기가 마감 몇 ms 전에 끝나는 가상 시계로 게임 진행 단계 하나를 실행
+   - 라운드가 ROUND_TIME에 끝나는지(남은 몇 ms 때문에 10초를 더 기다리지 않는지), 10초 알림 수가 같은지 확인
+3) stop: 실제 시계로 게임을 시작한 뒤 단계 대기 중에 stop_game()이 끝나기까지 걸린 시간
+
+실행: python -m benchmarks.bench_game_clock
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import TOTAL_ROUNDS, ROUND_TIME, PREPARATION_TIME, DIFFICULTY_BY_ROUND
+from server.clock import VirtualClock
+from server.room import Room
+
+PLAYERS = 6
+STOP_TRIALS = 5
+EARLY_WAKE = 0.004  # 가상 시계가 마감보다 일찍 깨어나는 시간 (초)
+
+
+class EarlyWakeClock(VirtualClock):
+    """대기가 마감 EARLY_WAKE초 전에 끝나는 가상 시계 (실제 시계의 타이머 오차 재현)"""
+
+    def wait(self, event: threading.Event, timeout):
+        # 남은 시간이 아주 짧으면 끝까지 대기 (계속 일찍 깨어나 끝나지 않는 일이 없도록)
+        if timeout is not None and timeout > 2 * EARLY_WAKE:
+            timeout -= EARLY_WAKE
+        return super().wait(event, timeout)
+
+
+class CountingWriter:
+    """송신 큐 대신 메시지 종류만 세는 writer"""
+
+    def __init__(self, counts: Counter, lock: threading.Lock, clock=None, marks=None):
+        self.counts = counts
+        self.lock = lock
+        self.clock = clock
+        self.marks = marks  # 메시지 타입별 마지막 수신 시각 (시계 기준)
+
+    def send(self, message):
+        message = getattr(message, 'message', message)  # EncodedFrame이면 원본 메시지
+        key = message.type  # 게임 상태 메시지는 상태 이름이 타입
+        if key == 'INFO':
+            key = (key, message.get('info_type'))
+        with self.lock:
+            self.counts[key] += 1
+            if self.marks is not None:
+                self.marks[key] = self.clock.now()
+
+    def stats(self) -> dict:
+        return {}
+
+
+def make_room(clock=None, marks=None):
+    counts = Counter()
+    lock = threading.Lock()
+    room = Room("bench", 1, clock=clock)
+    for i in range(PLAYERS):
+        room.player_manager.add_player(f"P{i}", None, ("127.0.0.1", 0),
+                                       writer=CountingWriter(counts, lock, clock, marks))
+    return room, counts
+
+
+def run_virtual():
+    clock = VirtualClock()
+    marks = {}
+    room, counts = make_room(clock, marks)
+    start_virtual = clock.now()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        room.start_game()
+        room.game_manager.game_thread.join()
+        room.dummy_generator.stop()
+    elapsed = time.perf_counter() - t0
+
+    # 플레이어 한 명이 받은 메시지 기준으로 단계 검증
+    per_player = {key: n // PLAYERS for key, n in counts.items()}
+    expected = {
+        'ROUND_START': TOTAL_ROUNDS,
+        'PLAYING': TOTAL_ROUNDS,
+        'DEFENSE_PHASE': TOTAL_ROUNDS,
+        'ROUND_END': TOTAL_ROUNDS,
+        'GAME_START': 1,
+        'GAME_END': 1,
+        ('INFO', 'TIME_UPDATE'): TOTAL_ROUNDS * ((ROUND_TIME - 1) // 10),
+    }
+    for key, value in expected.items():
+        if per_player.get(key, 0) != value:
+            raise AssertionError(f"{key}: {per_player.get(key, 0)}개 (예상 {value}개)")
+    decoys = sum(n for key, n in counts.items() if key == 'DECOY_ATTACK')
+    expected_decoys = sum(d['decoy_count'] for d in DIFFICULTY_BY_ROUND.values() if d['decoy_attacks'])
+    # 간격 지터 때문에 라운드가 먼저 끝나면 마지막 몇 개는 전송되지 않음 (실제 시계와 같은 동작)
+    if not 0 < decoys <= expected_decoys:
+        raise AssertionError(f"가짜 공격 {decoys}개 (예상 1~{expected_decoys}개)")
+
+    return {
+        'wall_ms': elapsed * 1000,
+        'virtual_s': marks['GAME_END'] - start_virtual,  # 게임 종료 후 더미 생성기를 멈추기 전까지는 제외
+        'advances': clock.advances,
+        'messages': sum(counts.values()),
+        'dummy': sum(n for key, n in counts.items() if key == 'DUMMY') // PLAYERS,
+        'noise': sum(n for key, n in counts.items() if key == 'NOISE'),
+        'decoy': decoys,
+    }
+
+
+def run_early_wake() -> dict:
+    clock = EarlyWakeClock()
+    room, counts = make_room(clock)
+    game_manager = room.game_manager
+    game_manager.running = True
+    game_manager.current_difficulty = DIFFICULTY_BY_ROUND[1]
+    start = clock.now()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_manager._playing_phase(1)
+    elapsed = clock.now() - start
+
+    updates = counts[('INFO', 'TIME_UPDATE')] // PLAYERS
+    if updates != (ROUND_TIME - 1) // 10:
+        raise AssertionError(f"10초 알림 {updates}개 (예상 {(ROUND_TIME - 1) // 10}개)")
+    if elapsed > ROUND_TIME + 0.1:
+        raise AssertionError(f"진행 단계가 {elapsed:.3f}초 동안 이어짐 (예상 {ROUND_TIME}초)")
+    return {'virtual_s': elapsed, 'updates': updates}
+
+
+def run_stop() -> list:
+    latencies = []
+    for _ in range(STOP_TRIALS):
+        room, _ = make_room()
+        with contextlib.redirect_stdout(io.StringIO()):
+            room.start_game()
+            time.sleep(0.05)  # 게임 시작 알림 대기(3초) 중
+            t0 = time.perf_counter()
+            room.stop_game()
+            latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies
+
+
+def main():
+    game_time = 3 + TOTAL_ROUNDS * (PREPARATION_TIME + ROUND_TIME + 5) + sum(
+        DIFFICULTY_BY_ROUND[r]['defense_time'] for r in range(1, TOTAL_ROUNDS + 1))
+    result = run_virtual()
+    print(f"virtual game: {TOTAL_ROUNDS} rounds, {PLAYERS} players (실제 시계로는 약 {game_time}초)")
+    print(f"  wall {result['wall_ms']:.1f}ms, virtual {result['virtual_s']:.0f}s, time jumps {result['advances']}")
+    print(f"  messages {result['messages']} (dummy {result['dummy']}, noise {result['noise']}, decoy {result['decoy']}), phase checks passed")
+
+    result = run_early_wake()
+    print(f"early wake ({EARLY_WAKE * 1000:.0f}ms): playing phase {result['virtual_s']:.3f}s "
+          f"(ROUND_TIME {ROUND_TIME}s), {result['updates']} time updates, checks passed")
+
+    latencies = run_stop()
+    print(f"stop_game during a phase wait (real clock, {STOP_TRIALS} trials): "
+          f"max {max(latencies):.1f}ms, avg {sum(latencies) / len(latencies):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+GUI 이벤트 발행 벤치마크 (수신 스레드에서 바로 emit vs GuiPublisher로 묶어서 emit)
+
+THREADS개의 수신 스레드가 패킷마다 패킷 로그를, EVENT_EVERY 패킷마다 서버 로그와 플레이어 목록(HP 변경)을 발행
+- direct: 기존 방식 (이벤트마다 emit, 플레이어 목록 변경마다 방 목록도 다시 계산해서 emit)
+- publisher: 수신 스레드는 큐에 넣기만 하고 발행 스레드가 INTERVAL마다 묶어서 emit
+
+emit은 Flask-SocketIO처럼 서버 락 안에서 JSON 직렬화 후 GUI 클라이언트 수만큼 쓰는 것으로 모델링
+측정: 수신 스레드의 이벤트 처리 시간(패킷당), emit 호출 수, 직렬화한 바이트 수
+
+실행: python -m benchmarks.bench_gui_publisher
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.gui_publisher import GuiPublisher
+
+THREADS = 8
+PACKETS_PER_THREAD = 20000
+EVENT_EVERY = 20  # 이 패킷 수마다 서버 로그 + 플레이어 목록 변경
+GUI_CLIENTS = 2
+ROOMS = 4
+
+
+class ModelSocketIO:
+    """emit 비용 모델: 락 안에서 JSON 직렬화 후 클라이언트마다 전송 버퍼에 씀"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.emits = 0
+        self.bytes = 0
+
+    def emit(self, event: str, data: dict):
+        with self.lock:
+            payload = json.dumps([event, data], ensure_ascii=False).encode('utf-8')
+            for _ in range(GUI_CLIENTS):
+                self.bytes += len(payload)
+            self.emits += 1
+
+
+def rooms_info() -> list:
+    return [{'room_id': f"room-{r}", 'subnet': f"172.20.{r + 1}.0/24", 'game_state': "PLAYING",
+             'current_round': 3, 'player_count': 4} for r in range(ROOMS)]
+
+
+def players_info(room: int) -> list:
+    return [{'player_id': f"P{room}-{i}", 'ip': f"172.20.{room + 1}.{i + 1}", 'score': i * 10, 'hp': 100 - i,
+             'is_connected': True} for i in range(4)]
+
+
+def packet(thread: int, i: int) -> dict:
+    return {'timestamp': "12:00:00", 'room_id': f"room-{thread % ROOMS}", 'player_id': f"P{thread}",
+            'type': "ATTACK_CONFIRM", 'data': {'attack_id': str(i), 'role': "sender"}, 'decoded_payload': None}
+
+
+def run(kind: str) -> dict:
+    socketio = ModelSocketIO()
+    publisher = None
+    if kind == 'direct':
+        def on_packet(data):
+            socketio.emit('packet_log', data)
+
+        def on_log(entry):
+            socketio.emit('server_log', entry)
+
+        def on_players(room_id, players):
+            socketio.emit('player_list_update', {'room_id': room_id, 'players': players})
+            socketio.emit('room_list_update', {'rooms': rooms_info()})
+    else:
+        publisher = GuiPublisher(socketio.emit, rooms_info=rooms_info)
+        publisher.start()
+        on_packet = publisher.publish_packet
+        on_log = publisher.publish_log
+        on_players = publisher.publish_player_list
+
+    handler_times = [0.0] * THREADS
+    room_players = [players_info(r) for r in range(ROOMS)]
+
+    def handler(index: int):
+        t0 = time.perf_counter()
+        for i in range(PACKETS_PER_THREAD):
+            on_packet(packet(index, i))
+            if i % EVENT_EVERY == 0:
+                on_log({'timestamp': "12:00:00", 'message': f"[room-{index % ROOMS}] 공격 완료 {i}", 'level': "info"})
+                on_players(f"room-{index % ROOMS}", room_players[index % ROOMS])
+        handler_times[index] = time.perf_counter() - t0
+
+    threads = [threading.Thread(target=handler, args=(i,)) for i in range(THREADS)]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handlers_done = time.perf_counter() - t0
+    if publisher:
+        publisher.stop()
+    total = time.perf_counter() - t0
+
+    result = {
+        'handler_us': sum(handler_times) / (THREADS * PACKETS_PER_THREAD) * 1e6,
+        'handlers_ms': handlers_done * 1000,
+        'total_ms': total * 1000,
+        'emits': socketio.emits,
+        'mb': socketio.bytes / (1024 * 1024),
+    }
+    if publisher:
+        stats = publisher.stats()
+        result.update(dropped=stats['packets_dropped'], coalesced=stats['player_lists_coalesced'])
+    return result
+
+
+def main():
+    print(f"{THREADS} handler threads x {PACKETS_PER_THREAD} packets, log+player list every {EVENT_EVERY}, "
+          f"{GUI_CLIENTS} GUI clients")
+    for kind in ('direct', 'publisher'):
+        r = run(kind)
+        extra = f", packets dropped {r['dropped']}, player lists coalesced {r['coalesced']}" if 'dropped' in r else ""
+        print(f"{kind:<10} handler {r['handler_us']:.2f} us/packet, handlers done {r['handlers_ms']:.0f}ms, "
+              f"total {r['total_ms']:.0f}ms, emits {r['emits']}, {r['mb']:.1f}MB serialized{extra}")
+
+
+if __name__ == '__main__':
+    main()
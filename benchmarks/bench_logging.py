@@ -0,0 +1,192 @@
+"""
+로그 벤치마크 (print vs 레벨별 logging)
+
+1) 호출 1회 비용 (출력은 줄 단위 버퍼 임시 파일, docker-compose의 python -u와 같이 줄마다 write)
+   - print: 기존처럼 f-string을 만들어 바로 출력
+   - debug (꺼짐): INFO 레벨에서 log.debug("... %s", 값) (레벨 비교만)
+   - info (동기): 호출 스레드에서 바로 포맷/출력하는 StreamHandler
+   - info (큐): setup_logging() 기본 설정 (큐에 넣고 출력 스레드가 씀)
+2) 서버 메시지 처리량: 실제 소켓으로 PLAYERS명이 게임 시작 전 ATTACK_REQUEST를 REQUESTS개씩 보내고
+   ATTACK_DENIED 응답을 모두 받을 때까지 (메시지마다 수신 로그 + 승인 요청 단계 로그 + 거부 로그)
+   - DEBUG + 동기 출력: 기존 print와 같은 양을 수신 스레드에서 바로 출력
+   - INFO + 큐: 운영 기본값
+   응답 수가 보낸 요청 수와 같은지 확인
+
+실행: python -m benchmarks.bench_logging
+"""
+
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import SUPPORTED_WIRE_VERSIONS
+from common.log import get_logger, setup_logging, shutdown_logging, get_log_stats, TextFormatter, ROOT_LOGGER
+from common.message_types import ConnectMessage, AttackRequestMessage
+from common.protocol import Protocol, FrameReader
+from server.game_server import GameServer
+from benchmarks.bench_engines import free_port
+
+CALLS = 100000
+PLAYERS = 8
+REQUESTS = 2000
+WINDOW = 64  # 플레이어별 응답을 받지 못한 최대 요청 수 (서버 송신 큐 OUTBOUND_QUEUE_SIZE보다 작게)
+
+log = get_logger("benchmarks.bench_logging", "Bench")
+
+
+def reset_logging():
+    """setup_logging / setup_sync로 붙인 핸들러 모두 제거 (측정 사이의 출력은 버림)"""
+    shutdown_logging()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.NullHandler())
+
+
+def setup_sync(level: str, stream):
+    """비교용: 큐 없이 호출 스레드에서 바로 출력 (기존 print와 같은 위치에서 쓰기)"""
+    reset_logging()
+    root = logging.getLogger(ROOT_LOGGER)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(TextFormatter())
+    root.addHandler(handler)
+    root.setLevel(level)
+    root.propagate = False
+    return handler
+
+
+def per_call(stream) -> dict:
+    """호출 1회 비용 (ns)"""
+    result = {}
+    player_id, attack_id, data = "Player3", 1234, {'target_id': "Player5", 'seq': 17}
+
+    saved = sys.stdout
+    sys.stdout = stream
+    try:
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            print(f"[GameServer] 메시지 수신: type=ATTACK_REQUEST, from={player_id}, data={data}")
+        stream.flush()
+        result['print'] = (time.perf_counter() - start) / CALLS * 1e9
+    finally:
+        sys.stdout = saved
+
+    setup_sync("INFO", stream)
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        log.debug("메시지 수신: type=%s, from=%s, data=%s", "ATTACK_REQUEST", player_id, data)
+    result['debug (꺼짐)'] = (time.perf_counter() - start) / CALLS * 1e9
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        log.info("공격 전송 확인: %s -> %s", player_id, attack_id)
+    stream.flush()
+    result['info (동기)'] = (time.perf_counter() - start) / CALLS * 1e9
+
+    reset_logging()
+    setup_logging("INFO", "text", stream)
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        log.info("공격 전송 확인: %s -> %s", player_id, attack_id)
+    result['info (큐)'] = (time.perf_counter() - start) / CALLS * 1e9
+    stats = get_log_stats()
+    reset_logging()  # 남은 기록 출력 (호출 비용에는 포함하지 않음)
+    result['dropped'] = stats['dropped']
+    return result
+
+
+def server_throughput() -> dict:
+    """ATTACK_REQUEST 처리량 (요청/초), 받은 거부 응답 수"""
+    port = free_port()
+    server = GameServer(host='127.0.0.1', port=port)
+    server.start()
+    socks = []
+    for i in range(PLAYERS):
+        s = socket.create_connection(('127.0.0.1', port))
+        Protocol.send_message(s, ConnectMessage(player_id=f"Bench{i}", player_ip="127.0.0.1",
+                                                wire_versions=list(SUPPORTED_WIRE_VERSIONS)))
+        reader = FrameReader(s)
+        welcome = reader.receive_message()
+        assert welcome is not None and welcome.get('info_type') == "WELCOME"
+        socks.append((s, reader))
+    time.sleep(0.3)
+
+    denied = [0] * PLAYERS
+    windows = [threading.Semaphore(WINDOW) for _ in range(PLAYERS)]
+
+    def send(index: int):
+        s, _ = socks[index]
+        target = f"Bench{(index + 1) % PLAYERS}"
+        request = AttackRequestMessage(attacker_id=f"Bench{index}", target_id=target)
+        for _ in range(REQUESTS):
+            # 응답을 읽는 속도보다 빨리 보내면 서버 송신 큐가 넘쳐 연결이 끊기므로 WINDOW개까지만 앞서 보냄
+            if not windows[index].acquire(timeout=10):
+                return
+            Protocol.send_message(s, request)
+
+    def receive(index: int):
+        _, reader = socks[index]
+        while denied[index] < REQUESTS:
+            msg = reader.receive_message()
+            if msg is None:
+                break
+            if msg.get('info_type') == "ATTACK_DENIED":
+                denied[index] += 1
+                windows[index].release()
+
+    threads = [threading.Thread(target=fn, args=(i,)) for i in range(PLAYERS) for fn in (receive, send)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    for s, _ in socks:
+        s.close()
+    server.stop()
+    time.sleep(0.3)  # 연결 종료 로그까지 같은 출력에 남도록 대기
+    return {'rate': PLAYERS * REQUESTS / elapsed, 'elapsed_ms': elapsed * 1000, 'denied': sum(denied)}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"== 호출 1회 비용 ({CALLS}회, 출력: 줄 단위 버퍼 임시 파일) ==")
+        with open(os.path.join(tmp, 'calls.log'), 'w', buffering=1) as stream:
+            costs = per_call(stream)
+        for name in ('print', 'debug (꺼짐)', 'info (동기)', 'info (큐)'):
+            print(f"  {name:<14} {costs[name]:8.0f} ns")
+        print(f"  (큐가 넘쳐 버린 기록: {costs['dropped']})")
+
+        print(f"\n== 서버 메시지 처리량 (플레이어 {PLAYERS}명 x ATTACK_REQUEST {REQUESTS}개) ==")
+        configs = [
+            ("DEBUG + 동기 출력", lambda stream: setup_sync("DEBUG", stream)),
+            ("INFO + 큐", lambda stream: (reset_logging(), setup_logging("INFO", "text", stream))),
+        ]
+        ok = True
+        for name, configure in configs:
+            path = os.path.join(tmp, 'server.log')
+            with open(path, 'w', buffering=1) as stream:
+                configure(stream)
+                result = server_throughput()
+                reset_logging()
+            with open(path) as f:
+                lines = sum(1 for _ in f)
+            match = result['denied'] == PLAYERS * REQUESTS
+            ok = ok and match
+            print(f"  {name:<18} {result['rate']:9.0f} 요청/s  ({result['elapsed_ms']:7.1f} ms, "
+                  f"출력 {lines}줄, 응답 {result['denied']}/{PLAYERS * REQUESTS} {'OK' if match else 'MISMATCH'})")
+
+    print(f"\n응답 수 일치: {'OK' if ok else 'FAIL'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
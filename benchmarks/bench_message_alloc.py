@@ -0,0 +1,152 @@
+"""
+메시지 할당 벤치마크 (tracemalloc)
+기존 **kwargs 딕셔너리 기반 Message와 __slots__ 기반 메시지 클래스의
+메시지 1개당 메모리 할당량 비교
+
+- 서버 팬아웃 경로: 메시지 생성 + v2 인코딩 (이전 구현과 같은 포맷)
+- 클라이언트 수신 경로: 프레임 디코딩 + 필드 조회
+- 보관 크기: 디코딩된 메시지 객체를 유지할 때 1개당 점유 메모리
+
+실행: python -m benchmarks.bench_message_alloc
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import WIRE_VERSION_JSON, WIRE_VERSION_BINARY
+from common.message_types import DummyMessage, ScoreMessage, AttackApprovedMessage, encode_payload
+from common.protocol import Protocol
+
+COUNT = 20000
+
+
+class LegacyMessage:
+    """이전 구현: 생성 시 timestamp 기록, 필드는 kwargs 딕셔너리"""
+
+    def __init__(self, msg_type, **kwargs):
+        self.type = msg_type
+        self.timestamp = time.time()
+        self.data = kwargs
+
+    def to_dict(self):
+        return {"type": self.type, "timestamp": self.timestamp, **self.data}
+
+
+def legacy_encode(message: LegacyMessage) -> bytes:
+    """이전 Protocol.send_message의 인코딩 경로 (to_dict + copy + 이중 JSON)"""
+    message_dict = message.to_dict()
+    from_ip = message_dict.get('from_ip')
+    to_ip = message_dict.get('to_ip')
+    encrypted_data = message_dict.copy()
+    if from_ip is not None:
+        encrypted_data.pop('from_ip', None)
+    if to_ip is not None:
+        encrypted_data.pop('to_ip', None)
+    encrypted_json = json.dumps(encrypted_data, ensure_ascii=False)
+    encoded = base64.b64encode(encrypted_json.encode('utf-8')).decode('ascii')
+    final_message = {}
+    if from_ip is not None:
+        final_message['from_ip'] = from_ip
+    if to_ip is not None:
+        final_message['to_ip'] = to_ip
+    final_message['encrypted_data'] = encoded
+    return json.dumps(final_message, ensure_ascii=False).encode('utf-8')
+
+
+def legacy_decode(body: bytes) -> LegacyMessage:
+    """이전 Protocol.receive_message의 디코딩 경로"""
+    received = json.loads(body.decode('utf-8'))
+    decrypted = json.loads(base64.b64decode(received['encrypted_data']).decode('utf-8'))
+    msg_type = decrypted.pop('type', 'UNKNOWN')
+    decrypted.pop('timestamp', None)
+    return LegacyMessage(msg_type, **decrypted)
+
+
+CASES = {
+    'DUMMY': (
+        lambda i: LegacyMessage("DUMMY", payload=encode_payload(f"DUMMY_{i:08d}")),
+        lambda i: DummyMessage(payload=f"DUMMY_{i:08d}"),
+        'payload',
+    ),
+    'SCORE': (
+        lambda i: LegacyMessage("SCORE", player_id="Player1", score=i, hp=90, correct=True, reason="공격 없음"),
+        lambda i: ScoreMessage(player_id="Player1", score=i, hp=90, correct=True, reason="공격 없음"),
+        'score',
+    ),
+    'ATTACK_APPROVED': (
+        lambda i: LegacyMessage("ATTACK_APPROVED", attack_id=str(i), target_ip="172.20.0.12",
+                                target_port=10002, target_id="Player2"),
+        lambda i: AttackApprovedMessage(attack_id=str(i), target_ip="172.20.0.12",
+                                        target_port=10002, target_id="Player2"),
+        'target_port',
+    ),
+}
+
+
+def traced(fn):
+    """
+    fn 실행 중 할당량 측정
+
+    Returns:
+        (최대 일시 할당 바이트, 메시지당 유지 바이트)
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    kept = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak - base, (current - base) / COUNT
+
+
+def main():
+    print(f"{'type':<16} {'path':<24} {'legacy B':>13} {'slots B':>12}")
+    for name, (make_legacy, make_new, field) in CASES.items():
+        # 팬아웃 경로: 생성 + 인코딩 (결과는 버림 -> 메시지 1개 처리 중 일시 할당 최대치 비교)
+        def fanout_legacy():
+            for i in range(COUNT):
+                legacy_encode(make_legacy(i))
+
+        def fanout_new():
+            for i in range(COUNT):
+                Protocol.encode_bytes(make_new(i), WIRE_VERSION_JSON)
+
+        # 수신 경로: 디코딩 후 메시지 유지 (메시지당 점유 메모리 비교)
+        legacy_bodies = [legacy_encode(make_legacy(i)) for i in range(COUNT)]
+        new_bodies = [Protocol.encode_bytes(make_new(i), WIRE_VERSION_BINARY)[Protocol.HEADER_SIZE:]
+                      for i in range(COUNT)]
+
+        def receive_legacy():
+            kept = []
+            for body in legacy_bodies:
+                message = legacy_decode(body)
+                message.data.get(field)
+                kept.append(message)
+            return kept
+
+        def receive_new():
+            kept = []
+            for body in new_bodies:
+                message = Protocol.decode_body(body)
+                message.get(field)
+                kept.append(message)
+            return kept
+
+        legacy_peak, _ = traced(fanout_legacy)
+        new_peak, _ = traced(fanout_new)
+        print(f"{name:<16} {'fan-out peak/msg':<24} {legacy_peak:>13.1f} {new_peak:>12.1f}")
+
+        _, legacy_kept = traced(receive_legacy)
+        _, new_kept = traced(receive_new)
+        print(f"{name:<16} {'receive retained/msg':<24} {legacy_kept:>13.1f} {new_kept:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+지표 벤치마크 (스레드별 Counter/Histogram vs 락 하나를 공유하는 카운터)
+
+1) 호출 1회 비용 (단일 스레드)
+   - 락 카운터: threading.Lock + dict[(레이블,)] += 1 (흔한 구현)
+   - Counter.inc: server.metrics (스레드별 dict에 더함)
+   - Histogram.observe: 버킷 이진 탐색 + 스레드별 셀 갱신
+2) 동시 기록: THREADS개 스레드가 INCS번씩 기록, 그동안 다른 스레드가 쉬지 않고 수집 (최악의 경우)
+   - 락 카운터 inc / Counter.inc / Histogram.observe 각각 (Counter/Histogram 수집은 collect + 텍스트 변환)
+   - 스레드별 기록 처리량 (수집 없음 / 수집 중)
+   - 수집 결과가 줄어들지 않는지 (단조 증가), 끝난 뒤 합계가 정확히 THREADS x INCS인지 확인
+   - 기록을 마친 스레드가 종료된 뒤에도 값이 남는지 확인
+
+실행: python -m benchmarks.bench_metrics
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.metrics import MetricsRegistry, FAST_BUCKETS, render_prometheus
+
+CALLS = 200000
+THREADS = 8
+INCS = 100000
+TYPES = ("DUMMY", "NOISE", "PLAYER_LIST", "INFO")
+METRIC = {'counter': 'bench_frames_total', 'histogram': 'bench_latency_seconds'}
+
+
+class LockedCounter:
+    """비교용: 모든 스레드가 락 하나를 공유하는 카운터"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def total(self) -> int:
+        with self.lock:
+            return sum(self.values.values())
+
+
+def per_call() -> dict:
+    """호출 1회 비용 (ns)"""
+    registry = MetricsRegistry()
+    counter = registry.counter('bench_frames_total', '벤치마크', ('type',))
+    histogram = registry.histogram('bench_latency_seconds', '벤치마크', ('type',), FAST_BUCKETS)
+    locked = LockedCounter()
+    result = {}
+
+    for name, fn in (("락 카운터", locked.inc), ("Counter.inc", counter.inc)):
+        start = time.perf_counter()
+        for i in range(CALLS):
+            fn(TYPES[i & 3])
+        result[name] = (time.perf_counter() - start) / CALLS * 1e9
+
+    start = time.perf_counter()
+    for i in range(CALLS):
+        histogram.observe(0.0003, TYPES[i & 3])
+    result["Histogram.observe"] = (time.perf_counter() - start) / CALLS * 1e9
+    return result
+
+
+def counter_total(families: list, name: str) -> float:
+    """수집 결과에서 지표 하나의 모든 샘플 합 (히스토그램은 관측 수)"""
+    for family in families:
+        if family['name'] == name:
+            if family['type'] == 'histogram':
+                return sum(sum(cell[:-1]) for cell in family['samples'].values())
+            return sum(family['samples'].values())
+    return 0
+
+
+def concurrent(kind: str, scrape: bool) -> dict:
+    """
+    THREADS개 스레드 동시 기록
+
+    Args:
+        kind: "locked" (락 카운터), "counter" (Counter.inc), "histogram" (Histogram.observe)
+        scrape: 기록하는 동안 계속 수집할지 여부
+    """
+    registry = MetricsRegistry()
+    counter = registry.counter('bench_frames_total', '벤치마크', ('type',))
+    histogram = registry.histogram('bench_latency_seconds', '벤치마크', ('type',), FAST_BUCKETS)
+    locked = LockedCounter()
+    barrier = threading.Barrier(THREADS + 1)
+    done = threading.Event()
+    scrapes = []
+    monotonic = [True]
+
+    def record():
+        barrier.wait()
+        if kind == "histogram":
+            observe = histogram.observe
+            for i in range(INCS):
+                observe(0.0003, TYPES[i & 3])
+        else:
+            inc = locked.inc if kind == "locked" else counter.inc
+            for i in range(INCS):
+                inc(TYPES[i & 3])
+
+    def scraper():
+        last = 0
+        while not done.is_set():
+            if kind == "locked":
+                total = locked.total()
+            else:
+                families = registry.collect()
+                render_prometheus(families)
+                total = counter_total(families, METRIC[kind])
+            if total < last:
+                monotonic[0] = False
+            last = total
+            scrapes.append(total)
+
+    threads = [threading.Thread(target=record) for _ in range(THREADS)]
+    for t in threads:
+        t.start()
+    scrape_thread = threading.Thread(target=scraper) if scrape else None
+    if scrape_thread:
+        scrape_thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    if scrape_thread:
+        scrape_thread.join()
+
+    # 기록 스레드는 모두 종료됨 (종료된 스레드 값도 남아 있어야 함)
+    if kind == "locked":
+        total = locked.total()
+    else:
+        total = counter_total(registry.collect(), METRIC[kind])
+    return {
+        'rate': THREADS * INCS / elapsed,
+        'elapsed_ms': elapsed * 1000,
+        'scrapes': len(scrapes),
+        'ok': total == THREADS * INCS and monotonic[0]
+    }
+
+
+def main():
+    print(f"== 호출 1회 비용 ({CALLS}회, 단일 스레드) ==")
+    for name, ns in per_call().items():
+        print(f"  {name:<18} {ns:7.0f} ns")
+
+    print(f"\n== 동시 기록 (스레드 {THREADS}개 x {INCS}회) ==")
+    ok = True
+    for kind, label in (("locked", "락 카운터"), ("counter", "Counter.inc"), ("histogram", "Histogram.observe")):
+        for scrape in (False, True):
+            result = concurrent(kind, scrape)
+            ok = ok and result['ok']
+            print(f"  {label:<18} {'수집 중' if scrape else '수집 없음':<6} {result['rate']:11.0f} 기록/s "
+                  f"({result['elapsed_ms']:7.1f} ms, 수집 {result['scrapes']}회, "
+                  f"합계 {'OK' if result['ok'] else 'MISMATCH'})")
+
+    print(f"\n합계 일치: {'OK' if ok else 'FAIL'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+패킷 로그 벤치마크
+
+1) 메모리 로그: 기존 list.append + pop(0) vs deque(maxlen) 링 버퍼 (보관 개수별 추가 1회 비용)
+2) 디스크 로그: 수신 스레드가 부담하는 MmapPacketLog.append() 비용과 기록 스레드 처리량
+   - 비교용으로 수신 스레드에서 바로 파일에 JSON 줄을 쓰는 경우
+   - 다시 읽은 기록이 보낸 기록과 같은지 확인
+
+실행: python -m benchmarks.bench_packet_log
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.packet_log import MmapPacketLog, read_packet_log
+
+APPENDS = 200000
+DISK_RECORDS = 100000
+
+
+def make_record(i: int) -> dict:
+    return {
+        'timestamp': "12:00:00",
+        'room_id': "main",
+        'player_id': f"P{i % 4}",
+        'type': "DEFENSE" if i % 10 == 0 else "ATTACK_CONFIRM",
+        'data': {'attack_id': str(i), 'role': "sender", 'payload': "QVRUQUNLX1RBUkdFVA=="},
+        'decoded_payload': f"ATTACK_TARGET_{i}"
+    }
+
+
+def bench_memory(capacity: int) -> tuple:
+    record = make_record(0)
+
+    log = []
+    t0 = time.perf_counter()
+    for _ in range(APPENDS):
+        log.append(record)
+        if len(log) > capacity:
+            log.pop(0)
+    list_ns = (time.perf_counter() - t0) / APPENDS * 1e9
+
+    ring = deque(maxlen=capacity)
+    t0 = time.perf_counter()
+    for _ in range(APPENDS):
+        ring.append(record)
+    ring_ns = (time.perf_counter() - t0) / APPENDS * 1e9
+    return list_ns, ring_ns
+
+
+def bench_disk(directory: str) -> dict:
+    records = [make_record(i) for i in range(DISK_RECORDS)]
+
+    # 비교: 수신 스레드에서 바로 파일에 쓰기
+    path = os.path.join(directory, "direct.jsonl")
+    with open(path, 'wb') as f:
+        t0 = time.perf_counter()
+        for record in records:
+            f.write(json.dumps({'ts': time.time(), **record}, ensure_ascii=False,
+                               separators=(',', ':')).encode('utf-8') + b'\n')
+        direct_us = (time.perf_counter() - t0) / DISK_RECORDS * 1e6
+    os.remove(path)
+
+    # MmapPacketLog: 작은 세그먼트로 회전까지 포함
+    log_dir = os.path.join(directory, "mmap")
+    store = MmapPacketLog(log_dir, segment_size=4 * 1024 * 1024, max_segments=0, max_pending=DISK_RECORDS)
+    store.start()
+    t0 = time.perf_counter()
+    for record in records:
+        store.append(record)
+    append_us = (time.perf_counter() - t0) / DISK_RECORDS * 1e6
+    store.close()
+    total = time.perf_counter() - t0
+
+    read_back = list(read_packet_log(log_dir))
+    for record in read_back:
+        del record['ts']
+    if read_back != records:
+        raise AssertionError("다시 읽은 패킷 로그가 보낸 기록과 다름")
+    stats = store.stats()
+    return {
+        'direct_us': direct_us,
+        'append_us': append_us,
+        'writer_rps': DISK_RECORDS / total,
+        'segments': stats['segments'],
+        'mb': stats['bytes'] / (1024 * 1024),
+        'dropped': stats['dropped'],
+    }
+
+
+def main():
+    print(f"in-memory packet log, {APPENDS} appends (ns per append)")
+    print(f"{'capacity':>10}{'list+pop(0)':>14}{'deque ring':>12}")
+    for capacity in (100, 1000, 10000, 100000):
+        list_ns, ring_ns = bench_memory(capacity)
+        print(f"{capacity:>10}{list_ns:>14.0f}{ring_ns:>12.0f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        result = bench_disk(directory)
+    print()
+    print(f"disk packet log, {DISK_RECORDS} records")
+    print(f"  handler thread, direct file write: {result['direct_us']:.2f} us/packet")
+    print(f"  handler thread, MmapPacketLog.append: {result['append_us']:.2f} us/packet")
+    print(f"  writer thread throughput: {result['writer_rps']:,.0f} records/s "
+          f"({result['mb']:.1f}MB in {result['segments']} segments, dropped {result['dropped']}), read-back equal")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+플레이어 목록 조회 경합 벤치마크 (락 조회 vs 불변 스냅샷)
+
+생성기/메시지 처리 스레드처럼 목록을 계속 읽는 스레드 READERS개와,
+WRITE_INTERVAL초마다 플레이어 접속/점수 변경/HP 변경/종료를 하는 스레드 WRITERS개를
+DURATION초 동안 함께 실행해 초당 조회 수와 조회/변경 지연을 비교
+
+- locked: 기존 방식 (조회마다 PlayerManager.lock을 잡고 목록 복사, IP 조회는 전체 순회)
+- snapshot: 현재 방식 (락 없이 스냅샷 조회)
+
+실행: python -m benchmarks.bench_player_table
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.player_manager import PlayerManager
+
+BASE_PLAYERS = 100
+READERS = 8
+WRITERS = 2
+DURATION = 2.0
+WRITE_INTERVAL = 0.001
+
+
+class LockedPlayerManager(PlayerManager):
+    """기존 방식: 조회마다 self.lock을 잡고 목록을 복사"""
+
+    def _publish_locked(self, membership: bool = True):
+        pass
+
+    def get_all_players(self):
+        with self.lock:
+            return list(self.players.values())
+
+    def get_players_info(self):
+        with self.lock:
+            return [player.to_dict() for player in self.players.values()]
+
+    def get_player_by_ip(self, ip):
+        with self.lock:
+            for player in self.players.values():
+                if player.ip == ip:
+                    return player
+            return None
+
+
+def run(manager_class) -> dict:
+    manager = manager_class(network="10.0.0.0/16")
+    stop = threading.Event()
+    reads = [0] * READERS
+    writes = [0] * WRITERS
+    slowest = [[] for _ in range(READERS)]
+    write_latency = [[] for _ in range(WRITERS)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(BASE_PLAYERS):
+            manager.add_player(f"Base{i}", None, ("127.0.0.1", 0))
+    ips = [p.ip for p in manager.get_all_players()]
+
+    def reader(n):
+        rng = random.Random(n)
+        samples = slowest[n]
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            players = manager.get_all_players()
+            manager.get_players_info()
+            manager.get_player_by_ip(rng.choice(ips))
+            samples.append(time.perf_counter() - t0)
+            if len(players) < 2:
+                raise RuntimeError("플레이어 목록이 비어 있음")
+            reads[n] += 1
+            time.sleep(0)  # 실제 생성기/핸들러처럼 다른 스레드에 GIL 양보
+
+    def writer(n):
+        i = 0
+        while not stop.is_set():
+            player_id = f"W{n}-{i}"
+            t0 = time.perf_counter()
+            manager.add_player(player_id, None, ("127.0.0.1", 0))
+            manager.update_score(player_id, 10)
+            manager.update_hp(f"Base{i % BASE_PLAYERS}", 0)
+            manager.remove_player(player_id)
+            write_latency[n].append(time.perf_counter() - t0)
+            writes[n] += 1
+            i += 1
+            time.sleep(WRITE_INTERVAL)
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(READERS)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for t in threads:
+            t.start()
+        time.sleep(DURATION)
+        stop.set()
+        for t in threads:
+            t.join()
+
+    latencies = sorted(x for samples in slowest for x in samples)
+    write_latencies = sorted(x for samples in write_latency for x in samples)
+    return {
+        'reads_per_s': sum(reads) / DURATION,
+        'writes_per_s': sum(writes) / DURATION,
+        'read_p50_us': latencies[len(latencies) // 2] * 1e6,
+        'read_p99_us': latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+        'write_p50_us': write_latencies[len(write_latencies) // 2] * 1e6,
+        'write_p99_us': write_latencies[int(len(write_latencies) * 0.99) - 1] * 1e6,
+    }
+
+
+def main():
+    modes = {'locked': LockedPlayerManager, 'snapshot': PlayerManager}
+    results = {name: run(cls) for name, cls in modes.items()}
+
+    print(f"{BASE_PLAYERS} players, {READERS} readers, {WRITERS} writers, {DURATION:.0f}s")
+    print(f"{'metric':<20}" + "".join(f"{name:>12}" for name in modes))
+    for key in ('reads_per_s', 'writes_per_s', 'read_p50_us', 'read_p99_us', 'write_p50_us', 'write_p99_us'):
+        print(f"{key:<20}" + "".join(f"{results[name][key]:>12.1f}" for name in modes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""
+라운드 점수 계산 벤치마크 (기존 _calculate_scores 방식 vs ScoreEngine)
+
+합성 라운드(플레이어 수, 대상별 공격 수, 방어 제출)를 만들어
+- 기존 방식: 대상별 리스트 + IP마다 list.count (print 제외)
+- counter: ScoreEngine Counter 경로
+- numpy: ScoreEngine NumPy 경로 (NumPy 설치 시)
+- scoreboard: RoundScoreboard (공격/제출 시 미리 집계, 라운드 종료 시 results()만 측정)
+의 계산 시간을 비교하고, 모든 경로의 결과(점수 변화, HP 감소, 정답 여부, 설명)가
+기존 규칙과 같은지 NORMAL/FINAL 라운드 모두 확인
+(scoreboard는 공격/제출 순서를 섞어 재생하고, 함께 쌓인 RoundAttackLog를 ScoreEngine으로
+다시 계산한 recount() 결과도 확인)
+
+실행: python -m benchmarks.bench_scoring
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import HP_DAMAGE_PER_ATTACK
+from server.ip_allocator import ip_to_int
+from server.score_engine import ScoreEngine, RoundScoreboard, round_weights, np
+
+# 방어 제출에 섞는 잘못된 IP 표기
+INVALID_ANSWERS = ["172.20.1", "172.20.01.1", " 172.20.1.1", "abc"]
+
+# (플레이어 수, 대상별 평균 공격 수, 대상별 최대 공격자 수)
+SCENARIOS = [(4, 4, 3), (20, 10, 6), (254, 50, 6), (254, 200, 200), (2000, 100, 6), (2000, 100, 100), (10000, 20, 20)]
+REPEAT = 3
+
+
+def legacy_scores(player_ids, attacks, submissions, is_final_round) -> dict:
+    """기존 GameManager._calculate_scores 규칙 (출력/상태 변경 제외)"""
+    score_correct, score_wrong, score_missed = round_weights(is_final_round)
+
+    real_attacks_by_target = {}
+    for attack in attacks:
+        if attack.get('is_real', True):
+            target_id = attack['target_id']
+            if target_id not in real_attacks_by_target:
+                real_attacks_by_target[target_id] = []
+            real_attacks_by_target[target_id].append(attack['attacker_ip'])
+
+    results = {}
+    for player_id in player_ids:
+        actual_attacks = real_attacks_by_target.get(player_id, [])
+        actual_attacks_unique = set(actual_attacks)
+        submitted = set(submissions.get(player_id, []))
+
+        correct_defenses = actual_attacks_unique & submitted
+        wrong_defenses = submitted - actual_attacks_unique
+
+        missed_attacks_count = 0
+        for ip in actual_attacks_unique:
+            attack_count = actual_attacks.count(ip)
+            if ip in submitted:
+                missed_attacks_count += max(0, attack_count - 1)
+            else:
+                missed_attacks_count += attack_count
+        missed_attacks = actual_attacks_unique - submitted
+
+        score_change = (len(correct_defenses) * score_correct
+                        + len(wrong_defenses) * score_wrong
+                        + missed_attacks_count * score_missed)
+
+        reason_parts = []
+        if correct_defenses:
+            reason_parts.append(f"정확한 방어: {len(correct_defenses)}개 (+{len(correct_defenses) * score_correct}점)")
+        if wrong_defenses:
+            reason_parts.append(f"오답: {len(wrong_defenses)}개 ({len(wrong_defenses) * score_wrong}점)")
+        if missed_attacks_count > 0:
+            reason_parts.append(f"놓친 공격: {missed_attacks_count}개 ({missed_attacks_count * score_missed}점)")
+        reason = ", ".join(reason_parts) if reason_parts else "공격 없음"
+        if is_final_round and len(wrong_defenses) > 0:
+            reason += f" [경고: 가짜 공격 {len(wrong_defenses)}개 포함 가능]"
+
+        results[player_id] = (
+            score_change,
+            missed_attacks_count * HP_DAMAGE_PER_ATTACK,
+            len(wrong_defenses) == 0 and len(missed_attacks) == 0,
+            reason
+        )
+    return results
+
+
+def make_round(players: int, attacks_per_target: int, max_attackers: int, seed: int):
+    """합성 라운드 (공격자 편중, 가짜 공격, 정답/오답/누락이 섞인 방어 제출)"""
+    rng = random.Random(seed)
+    player_ids = [f"P{i}" for i in range(players)]
+    ips = [f"172.20.{1 + i // 254}.{1 + i % 254}" for i in range(players)]
+
+    attacks = []
+    for target in player_ids:
+        # 대상마다 max_attackers명 이하의 공격자가 여러 번 공격
+        attackers = rng.sample(ips, min(len(ips), rng.randint(1, max_attackers)))
+        for _ in range(rng.randint(0, attacks_per_target * 2)):
+            attacks.append({
+                'target_id': target,
+                'attacker_ip': rng.choice(attackers),
+                'is_real': rng.random() > 0.1
+            })
+
+    submissions = {}
+    for player_id in player_ids:
+        if rng.random() < 0.2:
+            continue  # 제출하지 않은 플레이어
+        submissions[player_id] = rng.sample(ips, min(len(ips), rng.randint(0, 5)))
+        # 일부는 실제 공격자 IP를 중복 포함해 제출
+        submissions[player_id] += [a['attacker_ip'] for a in attacks[:3] if a['target_id'] == player_id]
+        # 잘못된 표기 (줄인 표기/앞자리 0은 inet_aton이 받아 주지만 오답이어야 함)
+        if rng.random() < 0.3:
+            submissions[player_id] += rng.sample(INVALID_ANSWERS, 2)
+    return player_ids, attacks, submissions
+
+
+def replay(player_ids, attacks, submissions, seed: int) -> RoundScoreboard:
+    """
+    GameManager처럼 공격 완료와 방어 제출을 섞인 순서로 RoundScoreboard(+RoundAttackLog)에 반영
+    (공격자 IP는 Player.ip_int처럼 정수로, 제출은 ip_key로 변환)
+    """
+    rng = random.Random(seed)
+    events = [('attack', attack) for attack in attacks if attack.get('is_real', True)]
+    for player_id, ips in submissions.items():
+        # 여러 번 나눠 제출 (누적)
+        cut = rng.randint(0, len(ips))
+        events.append(('submit', (player_id, ips[:cut])))
+        events.append(('submit', (player_id, ips[cut:])))
+    rng.shuffle(events)
+
+    board = RoundScoreboard()
+    for kind, event in events:
+        if kind == 'attack':
+            board.record_attack('attacker', event['target_id'], ip_to_int(event['attacker_ip']), 0.0)
+        else:
+            player_id, ips = event
+            board.submit(player_id, [board.ip_key(ip) for ip in ips])
+
+    # 배열 기록을 다시 읽어도 같은 공격 목록이어야 함
+    real = [(a['target_id'], ip_to_int(a['attacker_ip'])) for a in attacks if a.get('is_real', True)]
+    if sorted(board.log.real_pairs()) != sorted(real):
+        raise AssertionError("RoundAttackLog 기록이 원본과 다름")
+    return board
+
+
+def as_tuples(results: dict) -> dict:
+    return {pid: (r.score_delta, r.hp_damage, r.correct, r.reason) for pid, r in results.items()}
+
+
+def best_time(fn) -> float:
+    best = float('inf')
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    engines = {'counter': ScoreEngine(use_numpy=False)}
+    if np is not None:
+        engines['numpy'] = ScoreEngine(use_numpy=True)
+    else:
+        print("NumPy 미설치: numpy 경로 생략")
+
+    # 결과 동일성 확인 (작은 라운드 여러 개 + 벤치마크 라운드)
+    checks = [make_round(p, a, m, seed) for seed in range(30) for p, a, m in ((2, 1, 1), (4, 4, 3), (12, 8, 12))]
+    checks += [make_round(p, a, m, 100) for p, a, m in SCENARIOS]
+    for player_ids, attacks, submissions in checks:
+        for final in (False, True):
+            expected = legacy_scores(player_ids, attacks, submissions, final)
+            for name, engine in engines.items():
+                actual = as_tuples(engine.score_round(player_ids, attacks, submissions, final))
+                if actual != expected:
+                    raise AssertionError(f"{name}: 기존 규칙과 결과가 다름 (플레이어 {len(player_ids)}명, final={final})")
+            board = replay(player_ids, attacks, submissions, seed=len(attacks))
+            if as_tuples(board.results(player_ids, final)) != expected:
+                raise AssertionError(f"scoreboard: 기존 규칙과 결과가 다름 (플레이어 {len(player_ids)}명, final={final})")
+            for name, engine in engines.items():
+                if as_tuples(board.recount(player_ids, final, engine)) != expected:
+                    raise AssertionError(f"recount({name}): 기존 규칙과 결과가 다름 (플레이어 {len(player_ids)}명, final={final})")
+    print(f"결과 동일성 확인: 라운드 {len(checks) * 2}개 통과")
+
+    header = f"{'players':>8}{'attackers':>10}{'attacks':>10}{'legacy ms':>12}" + "".join(f"{name + ' ms':>12}" for name in engines) + f"{'board ms':>12}"
+    print(header)
+    for players, per_target, max_attackers in SCENARIOS:
+        player_ids, attacks, submissions = make_round(players, per_target, max_attackers, 100)
+        row = f"{players:>8}{max_attackers:>10}{len(attacks):>10}"
+        row += f"{best_time(lambda: legacy_scores(player_ids, attacks, submissions, False)):>12.2f}"
+        for engine in engines.values():
+            row += f"{best_time(lambda: engine.score_round(player_ids, attacks, submissions, False)):>12.2f}"
+        board = replay(player_ids, attacks, submissions, seed=0)
+        row += f"{best_time(lambda: board.results(player_ids, False)):>12.2f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
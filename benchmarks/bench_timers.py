@@ -0,0 +1,140 @@
+"""
+공격 타임아웃 타이머 벤치마크 (threading.Timer vs TimerService)
+
+공격 승인처럼 TIMERS개의 타임아웃(DELAY초)을 짧은 시간에 예약하고 그중 절반을
+공격 완료처럼 취소했을 때
+- 예약/취소에 걸린 시간
+- 최대 스레드 수 증가량
+- 실제 실행 시각과 예정 시각의 차이(lag) p50/p99
+를 비교
+
+busy room: 두 방이 같은 TimerService를 쓰고 한 방이 락을 오래 잡고 있을 때
+다른 방의 공격 타임아웃이 제때 만료되는지 확인 (타이머 스레드가 방 락을 기다리지 않음)
+
+실행: python -m benchmarks.bench_timers
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import DIFFICULTY_BY_ROUND
+from server.game_manager import GameManager, GameState
+from server.player_manager import PlayerManager
+from server.timer_service import TimerService
+
+TIMERS = 2000
+DELAY = 1.0
+BUSY_HOLD = 0.5  # 바쁜 방이 락을 잡고 있는 시간 (초)
+BUSY_TIMEOUT = 0.05  # 두 방의 공격 타임아웃 (초)
+
+
+def run(kind: str) -> dict:
+    lags = []
+    lag_lock = threading.Lock()
+    done = threading.Event()
+    expected = TIMERS - TIMERS // 2
+
+    def fire(due: float):
+        lag = time.monotonic() - due
+        with lag_lock:
+            lags.append(lag)
+            if len(lags) == expected:
+                done.set()
+
+    service = TimerService(name="bench-timers") if kind == 'service' else None
+    base_threads = threading.active_count()
+
+    t0 = time.perf_counter()
+    handles = []
+    for _ in range(TIMERS):
+        due = time.monotonic() + DELAY
+        if service:
+            handles.append(service.schedule(DELAY, fire, due))
+        else:
+            timer = threading.Timer(DELAY, fire, args=[due])
+            timer.daemon = True
+            timer.start()
+            handles.append(timer)
+    schedule_ms = (time.perf_counter() - t0) * 1000
+    peak_threads = threading.active_count() - base_threads
+
+    t0 = time.perf_counter()
+    for handle in handles[::2]:
+        handle.cancel()
+    cancel_ms = (time.perf_counter() - t0) * 1000
+
+    done.wait(DELAY * 10)
+    time.sleep(0.2)
+    if service:
+        service.stop()
+    lags.sort()
+    return {
+        'schedule_ms': schedule_ms,
+        'cancel_ms': cancel_ms,
+        'peak_threads': peak_threads,
+        'fired': len(lags),
+        'lag_p50_ms': lags[len(lags) // 2] * 1000,
+        'lag_p99_ms': lags[int(len(lags) * 0.99) - 1] * 1000,
+    }
+
+
+def make_game(service: TimerService) -> GameManager:
+    player_manager = PlayerManager()
+    for i in range(2):
+        player_manager.add_player(f"P{i}", None, (f"10.0.0.{i}", 0))
+    game = GameManager(player_manager, lambda message, targets: None, timer_service=service)
+    game.state = GameState.PLAYING
+    game.current_round = 1
+    game.current_difficulty = DIFFICULTY_BY_ROUND[1]
+    return game
+
+
+def run_busy_room() -> dict:
+    service = TimerService(name="bench-busy-room")
+    busy, idle = make_game(service), make_game(service)
+    attack_ids = {}
+    for name, game in (('busy', busy), ('idle', idle)):
+        _, _, attack_id = game.request_attack_approval("P0", "P1")
+        record = game.attacks.get(attack_id)
+        record.timer.cancel()  # ATTACK_APPROVAL_TIMEOUT 대신 짧은 타임아웃으로 다시 예약
+        record.timer = service.schedule(BUSY_TIMEOUT, game._handle_attack_timeout, attack_id)
+        attack_ids[name] = attack_id
+
+    expired_at = {}
+    t0 = time.monotonic()
+    with busy.lock:
+        while time.monotonic() - t0 < BUSY_HOLD:
+            if 'idle' not in expired_at and idle.attacks.get(attack_ids['idle']) is None:
+                expired_at['idle'] = time.monotonic() - t0
+            time.sleep(0.001)
+    while busy.attacks.get(attack_ids['busy']) is not None and time.monotonic() - t0 < BUSY_HOLD * 4:
+        time.sleep(0.001)
+    expired_at['busy'] = time.monotonic() - t0
+    service.stop()
+
+    if 'idle' not in expired_at or expired_at['idle'] > BUSY_TIMEOUT + 0.1:
+        raise AssertionError(f"바쁜 방 때문에 다른 방의 타임아웃이 늦어짐: {expired_at}")
+    if busy.attacks.timed_out != 1 or idle.attacks.timed_out != 1:
+        raise AssertionError("타임아웃 만료 수가 다름")
+    return {name: value * 1000 for name, value in expired_at.items()}
+
+
+def main():
+    kinds = ('threading', 'service')
+    results = {kind: run(kind) for kind in kinds}
+    print(f"{TIMERS} timers, {DELAY}s timeout, half cancelled")
+    print(f"{'metric':<16}" + "".join(f"{kind:>12}" for kind in kinds))
+    for key in ('schedule_ms', 'cancel_ms', 'peak_threads', 'fired', 'lag_p50_ms', 'lag_p99_ms'):
+        print(f"{key:<16}" + "".join(f"{results[kind][key]:>12.1f}" for kind in kinds))
+
+    busy = run_busy_room()
+    print(f"busy room ({BUSY_TIMEOUT * 1000:.0f}ms timeout, other room holds its lock {BUSY_HOLD * 1000:.0f}ms): "
+          f"idle room expired at {busy['idle']:.1f}ms, busy room at {busy['busy']:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+트래픽 프레임 생성 벤치마크 (즉석 생성 vs 미리 만든 프레임 풀)
+
+생성기 emit()을 간격 없이 연속 호출해 최대 전송률(packets/sec)을 비교
+- on-demand: 풀이 빈 상태 (기존 방식: 매번 랜덤 페이로드, base64, Message 생성, 직렬화)
+- pooled: 단계 경계에서 refill()로 미리 만든 프레임을 꺼내 전송 (refill 시간은 따로 표시)
+
+전송은 송신 큐 대신 와이어 버전별 직렬화만 하는 writer로 대체 (실제 writer 스레드가 하는 일)
+더미는 방 전체 브로드캐스트 1회를 패킷 1개로 센다
+
+실행: python -m benchmarks.bench_traffic_frames
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import WIRE_VERSION_JSON, WIRE_VERSION_BINARY
+from common.protocol import EncodedFrame
+from server.room import Room
+
+PLAYERS = 8
+PACKETS = 20000
+
+
+class EncodingWriter:
+    """송신 큐 대신 프레임을 플레이어 와이어 버전으로 직렬화만 하는 writer"""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.sent = 0
+
+    def send(self, message):
+        frame = message if isinstance(message, EncodedFrame) else EncodedFrame(message)
+        frame.for_version(self.version)
+        self.sent += 1
+        return True
+
+    def stats(self) -> dict:
+        return {}
+
+
+class NullWriter:
+    """생성기 로그 출력 버리기"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def make_room(version: int) -> Room:
+    room = Room("bench", 1)
+    with contextlib.redirect_stdout(NullWriter()):
+        for i in range(PLAYERS):
+            room.player_manager.add_player(f"P{i}", None, ("127.0.0.1", 0),
+                                           wire_version=version, writer=EncodingWriter(version))
+    return room
+
+
+def measure(generator, refill) -> dict:
+    """emit()을 PACKETS번 호출 (refill이 있으면 먼저 풀을 채우고 그 시간도 측정)"""
+    generator.pool.clear()
+    misses = generator.pool.misses
+    refill_ms = 0.0
+    with contextlib.redirect_stdout(NullWriter()):
+        if refill:
+            t0 = time.perf_counter()
+            refill()
+            refill_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        for _ in range(PACKETS):
+            generator.emit()
+        elapsed = time.perf_counter() - t0
+    if refill and generator.pool.misses != misses:
+        raise AssertionError(f"{type(generator).__name__}: 풀이 부족함 ({generator.pool.misses - misses}회)")
+    return {'pps': PACKETS / elapsed, 'refill_ms': refill_ms,
+            'pps_with_refill': PACKETS / (elapsed + refill_ms / 1000)}
+
+
+def main():
+    for version in (WIRE_VERSION_JSON, WIRE_VERSION_BINARY):
+        room = make_room(version)
+        versions = (version,)
+        dummy = room.dummy_generator
+        decoy = room.decoy_generator
+        decoy.decoy_count = PACKETS * 2  # emit() 횟수 제한 없이 측정
+
+        cases = {
+            'dummy': (dummy, lambda: dummy.pool.refill(PACKETS, versions)),
+            'noise': (room.noise_generator, lambda: room.noise_generator.pool.refill(PACKETS, versions)),
+            'decoy': (decoy, lambda: decoy.refill(PACKETS, versions)),
+        }
+        print(f"wire v{version}, {PLAYERS} players, {PACKETS} packets per generator")
+        print(f"{'generator':<10}{'on-demand pps':>15}{'pooled pps':>12}{'speedup':>9}{'refill ms':>11}{'pooled+refill':>15}")
+        for name, (generator, refill) in cases.items():
+            before = measure(generator, None)
+            after = measure(generator, refill)
+            print(f"{name:<10}{before['pps']:>15,.0f}{after['pps']:>12,.0f}{after['pps'] / before['pps']:>8.1f}x"
+                  f"{after['refill_ms']:>11.1f}{after['pps_with_refill']:>15,.0f}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+트래픽 프로필 벤치마크 (토큰 버킷 전송률 정확도)
+
+부하 프로필마다 방 하나(플레이어 PLAYERS명)에 더미/노이즈/가짜 공격 생성기를 DURATION초 동안 돌리고
+- 생성기별 요청 전송률 대비 실제 전송률 (TokenBucket.stats)
+- 더미 패킷 간격의 p50/p99 (요청 간격 1/rate 대비)
+- 스케줄러 최대 지연
+을 표시
+
+전송은 송신 큐 대신 와이어 버전별 직렬화만 하는 writer로 대체 (실제 writer 스레드가 하는 일)
+
+실행: python -m benchmarks.bench_traffic_profiles
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import WIRE_VERSION_BINARY, ROUND_TIME, MSG_TYPE_DUMMY
+from common.protocol import EncodedFrame
+from server.room import Room
+from server.traffic_profiles import TRAFFIC_PROFILES
+from server.traffic_scheduler import TrafficScheduler
+
+PLAYERS = 8
+DURATION = 3.0
+
+
+class TimingWriter:
+    """프레임을 직렬화만 하고 더미 패킷 수신 시각을 기록하는 writer"""
+
+    def __init__(self, version: int, stamps: list = None):
+        self.version = version
+        self.stamps = stamps
+
+    def send(self, message):
+        frame = message if isinstance(message, EncodedFrame) else EncodedFrame(message)
+        frame.for_version(self.version)
+        if self.stamps is not None and frame.type == MSG_TYPE_DUMMY:
+            self.stamps.append(time.perf_counter())
+        return True
+
+    def stats(self) -> dict:
+        return {}
+
+
+class NullWriter:
+    """생성기 로그 출력 버리기"""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def run(profile) -> dict:
+    stamps = []
+    scheduler = TrafficScheduler(name=f"bench-{profile.name}")
+    room = Room("bench", 1, scheduler=scheduler)
+    generators = {
+        'dummy': (room.dummy_generator, profile.dummy_pps),
+        'noise': (room.noise_generator, profile.noise_pps),
+        'decoy': (room.decoy_generator, profile.decoy_pps),
+    }
+    with contextlib.redirect_stdout(NullWriter()):
+        for i in range(PLAYERS):
+            room.player_manager.add_player(f"P{i}", None, ("127.0.0.1", 0), wire_version=WIRE_VERSION_BINARY,
+                                           writer=TimingWriter(WIRE_VERSION_BINARY, stamps if i == 0 else None))
+        for generator, pps in generators.values():
+            generator.set_rate(pps, profile.burst)
+
+        room.dummy_generator.start()
+        room.noise_generator.start()
+        room.decoy_generator.start(ROUND_TIME, int(profile.decoy_pps * ROUND_TIME))
+        time.sleep(DURATION)
+        for generator, _ in generators.values():
+            generator.stop()
+        scheduler.stop()
+
+    gaps = sorted(b - a for a, b in zip(stamps, stamps[1:]))
+    return {
+        'rates': {name: generator.pacing_stats() for name, (generator, _) in generators.items()},
+        'gap_p50_ms': gaps[len(gaps) // 2] * 1000 if gaps else 0.0,
+        'gap_p99_ms': gaps[int(len(gaps) * 0.99) - 1] * 1000 if gaps else 0.0,
+        'interval_ms': 1000 / profile.dummy_pps,
+        'lag_max_ms': scheduler.stats()['lag_max_ms'],
+    }
+
+
+def main():
+    print(f"{PLAYERS} players, wire v{WIRE_VERSION_BINARY}, {DURATION:.0f}s per profile")
+    print(f"{'profile':<10}{'generator':<8}{'requested':>11}{'achieved':>11}{'ratio':>8}")
+    for profile in TRAFFIC_PROFILES.values():
+        if not profile.paced:
+            continue
+        result = run(profile)
+        for name, stats in result['rates'].items():
+            print(f"{profile.name:<10}{name:<8}{stats['requested_pps']:>11,.0f}{stats['achieved_pps']:>11,.1f}"
+                  f"{stats['ratio']:>8.3f}")
+        print(f"{'':<10}dummy gap p50 {result['gap_p50_ms']:.3f}ms / p99 {result['gap_p99_ms']:.3f}ms "
+              f"(interval {result['interval_ms']:.3f}ms, burst {profile.burst}), "
+              f"scheduler lag max {result['lag_max_ms']:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
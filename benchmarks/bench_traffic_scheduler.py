@@ -0,0 +1,141 @@
+"""
+트래픽 생성기 스케줄링 벤치마크 (생성기마다 스레드 vs TrafficScheduler)
+
+방 ROOMS개에 더미/노이즈/가짜 공격 생성기 3개씩을 INTERVAL 범위의 랜덤 간격으로 DURATION초 동안 돌리고
+- 최대 스레드 수 증가량
+- 전송 수와 예정 시각 대비 지연(lag) p50/p99
+- 방 하나의 생성기 3개를 차례로 stop()하는 데 걸린 시간 (기존 방식은 잠든 스레드 join 대기)
+를 비교
+
+- threads: 기존 방식 (생성기마다 스레드, time.sleep 후 전송, stop()은 join(timeout=3))
+- scheduler: 현재 방식 (TrafficScheduler 스레드 하나, stop()은 O(1) 취소)
+
+실행: python -m benchmarks.bench_traffic_scheduler
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.traffic_scheduler import TrafficScheduler
+
+ROOMS = 100
+KINDS = 3  # 더미/노이즈/가짜 공격
+INTERVAL = (0.2, 0.6)
+DURATION = 2.0
+STOP_ROOMS = 10
+
+
+class BenchSource:
+    """전송 시각만 기록하는 생성기 (스케줄러용 next_delay/emit)"""
+
+    def __init__(self, rng: random.Random, lags: list):
+        self.rng = rng
+        self.lags = lags
+        self.expected = 0.0
+        self.entry = None
+
+    def next_delay(self) -> float:
+        delay = self.rng.uniform(*INTERVAL)
+        self.expected = time.monotonic() + delay
+        return delay
+
+    def emit(self):
+        self.lags.append(time.monotonic() - self.expected)
+
+    def stop(self):
+        if self.entry:
+            self.entry.cancel()
+            self.entry = None
+
+
+class ThreadSource(BenchSource):
+    """기존 방식: 생성기마다 스레드 + time.sleep"""
+
+    def __init__(self, rng: random.Random, lags: list):
+        super().__init__(rng, lags)
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while self.running:
+            time.sleep(self.next_delay())
+            if not self.running:
+                break
+            self.emit()
+
+    def stop(self):
+        self.running = False
+        self.thread.join(timeout=3)
+
+
+def run(kind: str) -> dict:
+    lags = []
+    base_threads = threading.active_count()
+    scheduler = TrafficScheduler(name="bench-traffic") if kind == 'scheduler' else None
+
+    rooms = []
+    for r in range(ROOMS):
+        sources = []
+        for k in range(KINDS):
+            rng = random.Random(r * KINDS + k)
+            if scheduler:
+                source = BenchSource(rng, lags)
+                source.entry = scheduler.add(source)
+            else:
+                source = ThreadSource(rng, lags)
+            sources.append(source)
+        rooms.append(sources)
+    peak_threads = threading.active_count() - base_threads
+
+    time.sleep(DURATION)
+    emitted = len(lags)  # 중지 단계에서 나머지 방이 계속 보내는 패킷은 제외
+
+    # 라운드 종료처럼 방마다 생성기를 차례로 중지
+    stop_times = []
+    for sources in rooms[:STOP_ROOMS]:
+        t0 = time.perf_counter()
+        for source in sources:
+            source.stop()
+        stop_times.append((time.perf_counter() - t0) * 1000)
+
+    for sources in rooms[STOP_ROOMS:]:
+        for source in sources:
+            if scheduler:
+                source.stop()
+            else:
+                source.running = False
+    if scheduler:
+        scheduler.stop()
+    else:
+        for sources in rooms[STOP_ROOMS:]:
+            for source in sources:
+                source.thread.join(timeout=3)
+
+    ordered = sorted(lags[:emitted])
+    return {
+        'peak_threads': peak_threads,
+        'emitted': emitted,
+        'lag_p50_ms': ordered[len(ordered) // 2] * 1000,
+        'lag_p99_ms': ordered[int(len(ordered) * 0.99) - 1] * 1000,
+        'stop_room_avg_ms': sum(stop_times) / len(stop_times),
+        'stop_room_max_ms': max(stop_times),
+    }
+
+
+def main():
+    kinds = ('threads', 'scheduler')
+    results = {kind: run(kind) for kind in kinds}
+    print(f"{ROOMS} rooms x {KINDS} generators, interval {INTERVAL[0]}~{INTERVAL[1]}s, {DURATION:.0f}s")
+    print(f"{'metric':<18}" + "".join(f"{kind:>12}" for kind in kinds))
+    for key in ('peak_threads', 'emitted', 'lag_p50_ms', 'lag_p99_ms', 'stop_room_avg_ms', 'stop_room_max_ms'):
+        print(f"{key:<18}" + "".join(f"{results[kind][key]:>12.1f}" for kind in kinds))
+
+
+if __name__ == '__main__':
+    main()
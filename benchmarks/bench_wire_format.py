@@ -0,0 +1,90 @@
+"""
+와이어 포맷 벤치마크
+common/message_types.py의 모든 메시지 클래스에 대해
+v2(JSON + base64) / v3(바이너리 헤더 + 난독화 본문)의 프레임 크기와 인코딩/디코딩 CPU 시간 비교
+
+실행: python -m benchmarks.bench_wire_format
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.constants import WIRE_VERSION_JSON, WIRE_VERSION_BINARY
+from common.message_types import (
+    DummyMessage, NoiseMessage, DecoyAttackMessage, AttackMessage, DefenseMessage, ScoreMessage,
+    ConnectMessage, GameStateMessage, PlayerListMessage, ErrorMessage, InfoMessage,
+    AttackRequestMessage, AttackApprovedMessage, IncomingAttackWarningMessage,
+    AttackConfirmMessage
+)
+from common.protocol import Protocol
+
+ITERATIONS = 5000
+
+PLAYERS = [
+    {'player_id': f"Player{i}", 'ip': f"172.20.1.{i}", 'score': i * 10, 'hp': 100, 'is_connected': True}
+    for i in range(1, 5)
+]
+
+SAMPLES = {
+    'DummyMessage': DummyMessage(payload="DUMMY_ABCD1234"),
+    'AttackMessage': AttackMessage(from_ip="172.20.1.1", to_ip="172.20.1.2", from_player="Player1",
+                                   to_player="Player2", payload="ATTACK_TARGET_Player2", attack_id="42"),
+    'DefenseMessage': DefenseMessage(player_id="Player1", attacker_ips=["172.20.1.2", "172.20.1.3"]),
+    'ScoreMessage': ScoreMessage(player_id="Player1", score=35, hp=90, correct=False,
+                                 reason="정확한 방어: 2개 (+20점), 놓친 공격: 1개 (-3점)"),
+    'ConnectMessage': ConnectMessage(player_id="Player1", player_ip="", wire_versions=[3, 2]),
+    'GameStateMessage': GameStateMessage(state="ROUND_END", round_num=3, message="라운드 3 종료",
+                                         players=PLAYERS),
+    'PlayerListMessage': PlayerListMessage(players=PLAYERS),
+    'ErrorMessage': ErrorMessage(error_code="E001", error_message="잘못된 요청"),
+    'InfoMessage': InfoMessage(info_type="TIME_UPDATE", message="남은 시간: 40초", time_remaining=40),
+    'AttackRequestMessage': AttackRequestMessage(attacker_id="Player1", target_id="Player2"),
+    'AttackApprovedMessage': AttackApprovedMessage(attack_id="42", target_ip="172.20.0.12",
+                                                   target_port=10002, target_id="Player2"),
+    'IncomingAttackWarningMessage': IncomingAttackWarningMessage(attack_id="42", attacker_ip="172.20.1.1",
+                                                                 attacker_id="Player1"),
+    'AttackConfirmMessage': AttackConfirmMessage(attack_id="42", from_player="Player1",
+                                                 to_player="Player2", status="SENT"),
+    'NoiseMessage': NoiseMessage(from_ip="172.20.1.1", to_ip="172.20.1.3", from_player="Player1",
+                                 to_player="Player3", payload="NOISE_ABCD1234"),
+    'DecoyAttackMessage': DecoyAttackMessage(from_ip="172.20.1.2", to_ip="172.20.1.1", from_player="Player2",
+                                             to_player="Player1", payload="ATTACK_TARGET_Player1_ABCD1234"),
+}
+
+
+def _time_us(fn) -> float:
+    """1회당 평균 시간 (마이크로초)"""
+    return timeit.timeit(fn, number=ITERATIONS) / ITERATIONS * 1e6
+
+
+def main():
+    header = f"{'message':<30} {'v2 B':>6} {'v3 B':>6} {'size':>6} {'v2 enc':>7} {'v3 enc':>7} {'v2 dec':>7} {'v3 dec':>7}"
+    print(header)
+    print('-' * len(header))
+    for name, message in SAMPLES.items():
+        v2 = Protocol.encode_bytes(message, WIRE_VERSION_JSON)
+        v3 = Protocol.encode_bytes(message, WIRE_VERSION_BINARY)
+
+        # 왕복 변환 결과가 같은지 확인
+        decoded_v2 = Protocol.decode_body(v2[Protocol.HEADER_SIZE:])
+        decoded_v3 = Protocol.decode_body(v3[Protocol.HEADER_SIZE:])
+        assert decoded_v2.type == decoded_v3.type == message.type, name
+        assert decoded_v2.data == decoded_v3.data == message.data, name
+
+        enc_v2 = _time_us(lambda: Protocol.encode_bytes(message, WIRE_VERSION_JSON))
+        enc_v3 = _time_us(lambda: Protocol.encode_bytes(message, WIRE_VERSION_BINARY))
+        body_v2 = v2[Protocol.HEADER_SIZE:]
+        body_v3 = v3[Protocol.HEADER_SIZE:]
+        dec_v2 = _time_us(lambda: Protocol.decode_body(body_v2))
+        dec_v3 = _time_us(lambda: Protocol.decode_body(body_v3))
+
+        print(f"{name:<30} {len(v2):>6} {len(v3):>6} {len(v3) / len(v2):>5.0%} "
+              f"{enc_v2:>7.1f} {enc_v3:>7.1f} {dec_v2:>7.1f} {dec_v3:>7.1f}")
+    print("\n(시간 단위: 마이크로초, size = v3 / v2)")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,10 @@
 서버와 통신하고 게임 로직 처리
 """
 
+import errno
 import socket
 import threading
+import time
 import sys
 import os
 from typing import Optional, Callable
@@ -12,36 +14,65 @@ from typing import Optional, Callable
 # 프로젝트 루트를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.protocol import Protocol, ConnectionManager
+from common.protocol import Protocol, ConnectionManager, FrameReader
 from common.constants import (
     DEFAULT_PORT, MSG_TYPE_ATTACK, MSG_TYPE_DEFENSE,
     MSG_TYPE_ATTACK_REQUEST, MSG_TYPE_ATTACK_APPROVED,
     MSG_TYPE_INCOMING_ATTACK_WARNING, MSG_TYPE_ATTACK_CONFIRM,
-    PLAYER_ATTACK_PORT_BASE
+    PLAYER_ATTACK_PORT_BASE, WIRE_VERSION_JSON, SUPPORTED_WIRE_VERSIONS,
+    CONFIRM_SENT, CONFIRM_RECEIVED, CONFIRM_FAILED
 )
 from common.message_types import (
     Message, ConnectMessage, AttackMessage, DefenseMessage,
     AttackRequestMessage, AttackConfirmMessage, InfoMessage,
     AttackApprovedMessage, IncomingAttackWarningMessage
 )
+from common.log import get_logger, setup_logging, add_logging_arguments
+
+log = get_logger(__name__, "클라이언트")
+p2p_log = get_logger("client.p2p", "P2P")  # P2P 공격 송수신 (단계별 상세 로그는 DEBUG)
+
+MAX_PENDING_WARNINGS = 64  # 공격 패킷이 오지 않은 수신 공격 경고를 보관하는 최대 수
+
+
+def _ms(seconds: float) -> float:
+    """추적 구간 (ATTACK_CONFIRM trace, ms)"""
+    return round(seconds * 1000, 3)
+
+
+def _failure_reason(error: Exception) -> str:
+    """P2P 전송 실패 원인 (서버 지표 레이블)"""
+    if isinstance(error, socket.timeout):
+        return "timeout"
+    if isinstance(error, ConnectionRefusedError):
+        return "refused"
+    if isinstance(error, OSError) and error.errno in (errno.ENETUNREACH, errno.EHOSTUNREACH):
+        return "unreachable"
+    return "error"
 
 
 class GameClient:
     """게임 클라이언트 클래스"""
 
-    def __init__(self, player_id: str, host: str = 'localhost', port: int = DEFAULT_PORT):
+    def __init__(self, player_id: str, host: str = 'localhost', port: int = DEFAULT_PORT,
+                 room: Optional[str] = None):
         """
         Args:
             player_id: 플레이어 ID
             host: 서버 호스트
             port: 서버 포트
+            room: 참가할 방 ID (None이면 서버가 자동 배정)
         """
         self.player_id = player_id
         self.host = host
         self.port = port
+        self.room = room
         self.socket: Optional[socket.socket] = None
+        self.reader: Optional[FrameReader] = None  # 서버 연결 수신 버퍼
+        self.send_lock = threading.Lock()  # 여러 스레드(P2P 핸들러 등)의 프레임이 섞이지 않도록 보호
         self.connected = False
         self.running = False
+        self.wire_version = WIRE_VERSION_JSON  # 서버와 협상된 와이어 포맷 버전
 
         # 서버로부터 받은 정보
         self.my_ip = None
@@ -56,7 +87,7 @@ class GameClient:
         self.p2p_server_socket: Optional[socket.socket] = None
         self.p2p_server_thread: Optional[threading.Thread] = None
         self.p2p_port: Optional[int] = None
-        self.pending_attacks = {}  # 진행 중인 공격 추적
+        self.pending_attacks = {}  # 수신 공격 경고를 받은 시각 (attack_id → 단조 시각, 타겟 추적 구간용)
 
         # 콜백 함수들
         self.message_callbacks = []
@@ -73,40 +104,55 @@ class GameClient:
             self.socket = ConnectionManager.create_client_socket(self.host, self.port)
             if not self.socket:
                 return False
+            self.reader = FrameReader(self.socket)
 
             # 연결 메시지 전송
+            connect_fields = {}
+            if self.room:
+                connect_fields['room'] = self.room  # 참가할 방 (없으면 서버가 자동 배정)
             connect_msg = ConnectMessage(
                 player_id=self.player_id,
-                player_ip=""  # 서버가 자동으로 감지
+                player_ip="",  # 서버가 자동으로 감지
+                wire_versions=list(SUPPORTED_WIRE_VERSIONS),  # 지원하는 와이어 포맷 (구버전 서버는 무시)
+                **connect_fields
             )
             if not Protocol.send_message(self.socket, connect_msg):
-                print("[클라이언트] 연결 메시지 전송 실패")
+                log.error("연결 메시지 전송 실패")
                 return False
 
             # 환영 메시지 수신
-            welcome_msg = Protocol.receive_message(self.socket)
+            welcome_msg = self.reader.receive_message()
+            if welcome_msg and welcome_msg.get('info_type') == "ERROR":
+                # 서버가 접속을 거절함 (예: 같은 ID로 이미 접속 중)
+                log.error("접속 거절: %s", welcome_msg.get('message'))
+                self.disconnect()
+                return False
             if not welcome_msg or welcome_msg.type != "INFO":
-                print(f"[클라이언트] 잘못된 환영 메시지 수신: {welcome_msg.to_dict() if welcome_msg else 'None'}")
+                log.warning("잘못된 환영 메시지 수신: %s", welcome_msg.to_dict() if welcome_msg else 'None')
                 self.disconnect()
                 return False
 
-            self.my_ip = welcome_msg.data.get('player_ip', 'Unknown')
-            self.my_index = welcome_msg.data.get('player_index', -1)
+            self.my_ip = welcome_msg.get('player_ip', 'Unknown')
+            self.my_index = welcome_msg.get('player_index', -1)
+            # 구버전 서버는 wire_version을 보내지 않으므로 JSON v2로 폴백
+            self.wire_version = welcome_msg.get('wire_version', WIRE_VERSION_JSON)
+            # 배정된 방 (구버전 서버는 방 개념이 없음)
+            self.room = welcome_msg.get('room_id', self.room)
 
             if self.my_index == -1:
-                print("[클라이언트] 오류: 유효하지 않은 플레이어 인덱스 수신")
+                log.error("오류: 유효하지 않은 플레이어 인덱스 수신")
                 self.disconnect()
                 return False
 
-            print(f"[클라이언트] 서버 연결 성공: {self.my_ip} (인덱스: {self.my_index})")
+            log.info("서버 연결 성공: %s (인덱스: %s, 방: %s)", self.my_ip, self.my_index, self.room)
 
-            # P2P 서버 시작
+            # P2P 서버 시작 (수락 루프가 running을 보므로 먼저 설정, 실패하면 disconnect()가 되돌림)
+            self.running = True
             if not self._start_p2p_server():
                 self.disconnect()
                 return False
 
             self.connected = True
-            self.running = True
 
             # 메시지 수신 스레드 시작
             self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -115,124 +161,151 @@ class GameClient:
             return True
 
         except Exception as e:
-            print(f"[클라이언트] 연결 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("연결 실패: %s", e, exc_info=True)
             return False
 
     def _start_p2p_server(self) -> bool:
         """v2.0: P2P 공격 수신 서버 시작"""
         try:
             self.p2p_port = PLAYER_ATTACK_PORT_BASE + self.my_index
-            print(f"[P2P] P2P 서버 시작 시도: player_id={self.player_id}, index={self.my_index}, port={self.p2p_port}")
+            p2p_log.debug("P2P 서버 시작 시도: player_id=%s, index=%s, port=%s", self.player_id, self.my_index, self.p2p_port)
 
             self.p2p_server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            print(f"[P2P] 소켓 생성 완료")
+            p2p_log.debug("소켓 생성 완료")
 
             self.p2p_server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            print(f"[P2P] SO_REUSEADDR 설정 완료")
+            p2p_log.debug("SO_REUSEADDR 설정 완료")
 
             self.p2p_server_socket.bind(('0.0.0.0', self.p2p_port))
-            print(f"[P2P] 바인드 완료: 0.0.0.0:{self.p2p_port}")
+            p2p_log.debug("바인드 완료: 0.0.0.0:%s", self.p2p_port)
 
             self.p2p_server_socket.listen(5)
-            print(f"[P2P] listen(5) 완료")
+            p2p_log.debug("listen(5) 완료")
 
             self.p2p_server_thread = threading.Thread(target=self._p2p_server_loop, daemon=True)
             self.p2p_server_thread.start()
-            print(f"[P2P] 서버 스레드 시작됨: thread_id={self.p2p_server_thread.ident}")
+            p2p_log.debug("서버 스레드 시작됨: thread_id=%s", self.p2p_server_thread.ident)
 
-            print(f"[클라이언트] P2P 서버 시작 성공: 포트 {self.p2p_port}")
+            log.info("P2P 서버 시작 성공: 포트 %s", self.p2p_port)
             return True
         except Exception as e:
-            print(f"[클라이언트] P2P 서버 시작 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("P2P 서버 시작 실패: %s", e)
             return False
 
     def _p2p_server_loop(self):
         """P2P 공격 수신 루프"""
-        print(f"[P2P] 서버 루프 시작: player_id={self.player_id}, port={self.p2p_port}, running={self.running}")
+        p2p_log.debug("서버 루프 시작: player_id=%s, port=%s, running=%s", self.player_id, self.p2p_port, self.running)
 
         loop_count = 0
         while self.running:
             try:
                 loop_count += 1
                 if loop_count == 1 or loop_count % 10 == 0:
-                    print(f"[P2P] accept() 대기 중... (loop_count={loop_count}, port={self.p2p_port})")
+                    p2p_log.debug("accept() 대기 중... (loop_count=%s, port=%s)", loop_count, self.p2p_port)
 
                 client_sock, client_addr = self.p2p_server_socket.accept()
-                print(f"[P2P] ✅ 공격 연결 수신 성공: {client_addr} (loop_count={loop_count})")
+                accepted_at = time.monotonic()
+                p2p_log.debug("✅ 공격 연결 수신 성공: %s (loop_count=%s)", client_addr, loop_count)
 
                 handler_thread = threading.Thread(
                     target=self._handle_p2p_attack,
-                    args=(client_sock, client_addr),
+                    args=(client_sock, client_addr, accepted_at),
                     daemon=True
                 )
                 handler_thread.start()
-                print(f"[P2P] 핸들러 스레드 시작: thread_id={handler_thread.ident}")
+                p2p_log.debug("핸들러 스레드 시작: thread_id=%s", handler_thread.ident)
             except Exception as e:
                 if self.running:
-                    print(f"[P2P] ❌ 연결 수락 오류: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    p2p_log.warning("❌ 연결 수락 오류: %s", e, exc_info=True)
                 else:
-                    print(f"[P2P] 서버 루프 정상 종료 (running=False)")
+                    p2p_log.debug("서버 루프 정상 종료 (running=False)")
                 break
 
-        print(f"[P2P] 서버 루프 종료: player_id={self.player_id}, loop_count={loop_count}")
+        p2p_log.debug("서버 루프 종료: player_id=%s, loop_count=%s", self.player_id, loop_count)
 
-    def _handle_p2p_attack(self, client_sock: socket.socket, client_addr: tuple):
-        """P2P 공격 처리"""
-        print(f"[P2P] 핸들러 시작: client_addr={client_addr}, player_id={self.player_id}")
+    def _handle_p2p_attack(self, client_sock: socket.socket, client_addr: tuple,
+                           accepted_at: Optional[float] = None):
+        """
+        P2P 공격 처리
+
+        Args:
+            client_sock: 공격자 연결
+            client_addr: 공격자 주소
+            accepted_at: 연결을 수락한 단조 시각 (추적 구간용)
+        """
+        p2p_log.debug("핸들러 시작: client_addr=%s, player_id=%s", client_addr, self.player_id)
         try:
-            print(f"[P2P] 메시지 수신 대기 중...")
+            p2p_log.debug("메시지 수신 대기 중...")
             attack_msg = Protocol.receive_message(client_sock)
-            print(f"[P2P] 메시지 수신 완료: type={attack_msg.type if attack_msg else None}")
+            read_at = time.monotonic()
+            p2p_log.debug("메시지 수신 완료: type=%s", attack_msg.type if attack_msg else None)
 
             if not attack_msg or attack_msg.type != MSG_TYPE_ATTACK:
-                print(f"[P2P] ❌ 잘못된 메시지 타입: {attack_msg.type if attack_msg else 'None'}")
+                p2p_log.warning("❌ 잘못된 메시지 타입: %s", attack_msg.type if attack_msg else 'None')
                 return
 
-            attacker_id = attack_msg.data.get('from_player')
-            attack_id = attack_msg.data.get('attack_id')
+            attacker_id = attack_msg.get('from_player')
+            attack_id = attack_msg.get('attack_id')
 
-            print(f"[P2P] ✅ 공격 수신: {attacker_id} -> {self.player_id} (attack_id: {attack_id})")
+            p2p_log.info("✅ 공격 수신: %s -> %s (attack_id: %s)", attacker_id, self.player_id, attack_id)
+
+            # 추적 구간: 연결 수락 → 공격 패킷 읽기, 수신 공격 경고 → 공격 패킷 수신
+            trace = {'read': _ms(read_at - (accepted_at or read_at))}
+            warning_at = self.pending_attacks.pop(attack_id, None)
+            if warning_at is not None:
+                trace['wait'] = _ms(read_at - warning_at)
 
             # 서버에 공격 수신 확인 전송
             confirm_msg = AttackConfirmMessage(
                 attack_id=attack_id,
                 from_player=attacker_id,
                 to_player=self.player_id,
-                status="RECEIVED"
+                confirm_type=CONFIRM_RECEIVED,
+                trace=trace
             )
 
-            print(f"[P2P] 서버에 수신 확인 전송 시도...")
-            Protocol.send_message(self.socket, confirm_msg)
-            print(f"[P2P] ✅ 공격 수신 확인 전송 완료: {attack_id}")
+            p2p_log.debug("서버에 수신 확인 전송 시도...")
+            self._send_to_server(confirm_msg)
+            p2p_log.debug("✅ 공격 수신 확인 전송 완료: %s", attack_id)
         except Exception as e:
-            print(f"[P2P] ❌ 공격 처리 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            p2p_log.warning("❌ 공격 처리 오류: %s", e, exc_info=True)
         finally:
             try:
                 client_sock.close()
-                print(f"[P2P] 클라이언트 소켓 닫음: {client_addr}")
+                p2p_log.debug("클라이언트 소켓 닫음: %s", client_addr)
             except Exception as e:
-                print(f"[P2P] 소켓 닫기 오류: {e}")
+                p2p_log.debug("소켓 닫기 오류: %s", e)
+
+    def _send_p2p_attack(self, attack_id: str, target_player_id: str, target_ip: str, target_port: int,
+                         approved_at: Optional[float] = None):
+        """
+        v2.0: P2P 직접 공격 전송
+        전송 확인(또는 실패 보고)에 단계별 구간 시간을 실어 서버가 공격별 타임라인을 만들 수 있게 함
 
-    def _send_p2p_attack(self, attack_id: str, target_player_id: str, target_ip: str, target_port: int):
-        """v2.0: P2P 직접 공격 전송"""
-        print(f"[P2P] 공격 전송 시작: {self.player_id} -> {target_player_id} ({target_ip}:{target_port})")
+        Args:
+            attack_id: 서버가 발급한 공격 ID (추적 ID)
+            target_player_id: 타겟 ID
+            target_ip: 타겟 실제 IP
+            target_port: 타겟 P2P 포트
+            approved_at: ATTACK_APPROVED를 받은 단조 시각 (None이면 이 함수 시작 시각)
+        """
+        p2p_log.debug("공격 전송 시작: %s -> %s (%s:%s)", self.player_id, target_player_id, target_ip, target_port)
+        started_at = time.monotonic()
+        approved_at = approved_at or started_at
+        trace = {'dispatch': _ms(started_at - approved_at)}
+        stage = "connect"
         attack_socket = None
         try:
-            print(f"[P2P] 소켓 생성 중...")
+            p2p_log.debug("소켓 생성 중...")
             attack_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             attack_socket.settimeout(5.0)
 
-            print(f"[P2P] 연결 시도: {target_ip}:{target_port}")
+            p2p_log.debug("연결 시도: %s:%s", target_ip, target_port)
             attack_socket.connect((target_ip, target_port))
-            print(f"[P2P] ✅ 직접 연결 성공: {target_ip}:{target_port}")
+            connected_at = time.monotonic()
+            trace['connect'] = _ms(connected_at - started_at)
+            stage = "send"
+            p2p_log.debug("✅ 직접 연결 성공: %s:%s", target_ip, target_port)
 
             attack_msg = AttackMessage(
                 from_player=self.player_id,
@@ -241,36 +314,84 @@ class GameClient:
                 attack_id=attack_id
             )
 
-            print(f"[P2P] 공격 메시지 전송 중... (attack_id={attack_id})")
-            Protocol.send_message(attack_socket, attack_msg)
-            print(f"[P2P] ✅ 공격 패킷 전송 완료: {self.player_id} -> {target_player_id}")
+            p2p_log.debug("공격 메시지 전송 중... (attack_id=%s)", attack_id)
+            # P2P 공격 패킷은 Wireshark 실습과 구버전 피어 호환을 위해 항상 JSON v2로 전송
+            if not Protocol.send_message(attack_socket, attack_msg):
+                raise ConnectionError("공격 패킷 전송 실패")
+            sent_at = time.monotonic()
+            trace['send'] = _ms(sent_at - connected_at)
+            p2p_log.info("✅ 공격 패킷 전송 완료: %s -> %s", self.player_id, target_player_id)
 
+            trace['total'] = _ms(time.monotonic() - approved_at)
             confirm_msg = AttackConfirmMessage(
                 attack_id=attack_id,
                 from_player=self.player_id,
                 to_player=target_player_id,
-                status="SENT"
+                confirm_type=CONFIRM_SENT,
+                trace=trace
             )
 
-            print(f"[P2P] 서버에 전송 확인 전송 중...")
-            Protocol.send_message(self.socket, confirm_msg)
-            print(f"[P2P] ✅ 공격 전송 확인 완료: {attack_id}")
-        except socket.timeout:
-            print(f"[P2P] ❌ 공격 전송 타임아웃: {target_ip}:{target_port}")
-        except ConnectionRefusedError:
-            print(f"[P2P] ❌ 연결 거부됨: {target_ip}:{target_port} (대상 P2P 서버가 실행 중이 아님)")
+            p2p_log.debug("서버에 전송 확인 전송 중...")
+            self._send_to_server(confirm_msg)
+            p2p_log.debug("✅ 공격 전송 확인 완료: %s", attack_id)
+        except socket.timeout as e:
+            p2p_log.warning("❌ 공격 전송 타임아웃: %s:%s", target_ip, target_port)
+            self._report_attack_failure(attack_id, target_player_id, stage, e, trace, approved_at)
+        except ConnectionRefusedError as e:
+            p2p_log.warning("❌ 연결 거부됨: %s:%s (대상 P2P 서버가 실행 중이 아님)", target_ip, target_port)
+            self._report_attack_failure(attack_id, target_player_id, stage, e, trace, approved_at)
         except Exception as e:
-            print(f"[P2P] ❌ 공격 전송 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            p2p_log.warning("❌ 공격 전송 실패: %s", e, exc_info=True)
+            self._report_attack_failure(attack_id, target_player_id, stage, e, trace, approved_at)
         finally:
             if attack_socket:
                 try:
                     attack_socket.close()
-                    print(f"[P2P] 공격 소켓 닫음")
+                    p2p_log.debug("공격 소켓 닫음")
                 except:
                     pass
 
+    def _report_attack_failure(self, attack_id: str, target_player_id: str, stage: str, error: Exception,
+                               trace: dict, approved_at: float):
+        """
+        P2P 전송 실패를 서버에 보고 (서버는 타임아웃을 기다리지 않고 공격을 만료하고 타임라인에 남김)
+
+        Args:
+            attack_id: 공격 ID
+            target_player_id: 타겟 ID
+            stage: 실패한 단계 ("connect" / "send")
+            error: 발생한 예외
+            trace: 실패 전까지의 구간 시간 (ms)
+            approved_at: ATTACK_APPROVED를 받은 단조 시각
+        """
+        trace = dict(trace, stage=stage, error=_failure_reason(error), total=_ms(time.monotonic() - approved_at))
+        failure_msg = AttackConfirmMessage(
+            attack_id=attack_id,
+            from_player=self.player_id,
+            to_player=target_player_id,
+            confirm_type=CONFIRM_FAILED,
+            trace=trace
+        )
+        try:
+            self._send_to_server(failure_msg)
+        except Exception as e:
+            p2p_log.debug("실패 보고 전송 오류: %s", e)
+
+    def _note_incoming_attack(self, attack_id: Optional[str]):
+        """수신 공격 경고 시각 기록 (공격 패킷이 도착하면 _handle_p2p_attack이 꺼내 씀)"""
+        if attack_id is None:
+            return
+        pending = self.pending_attacks
+        if len(pending) >= MAX_PENDING_WARNINGS:
+            # 공격 패킷이 끝내 오지 않은 가장 오래된 경고부터 버림
+            pending.pop(next(iter(pending), None), None)
+        pending[attack_id] = time.monotonic()
+
+    def _send_to_server(self, message: Message) -> bool:
+        """서버로 메시지 전송 (협상된 와이어 버전, 송신 락으로 직렬화)"""
+        with self.send_lock:
+            return Protocol.send_message(self.socket, message, self.wire_version)
+
     def disconnect(self):
         """서버 연결 종료"""
         self.running = False
@@ -286,20 +407,20 @@ class GameClient:
         if self.p2p_server_socket:
             try:
                 self.p2p_server_socket.close()
-                print("[클라이언트] P2P 서버 소켓 닫음")
+                log.debug("P2P 서버 소켓 닫음")
             except:
                 pass
 
-        print("[클라이언트] 서버 연결 종료")
+        log.info("서버 연결 종료")
 
     def _receive_loop(self):
         """서버로부터 메시지 수신 루프"""
         while self.running and self.connected:
             try:
-                message = Protocol.receive_message(self.socket)
+                message = self.reader.receive_message()
 
                 if not message:
-                    print("[클라이언트] 서버 연결 끊김")
+                    log.info("서버 연결 끊김")
                     self.connected = False
                     break
 
@@ -308,7 +429,7 @@ class GameClient:
 
             except Exception as e:
                 if self.running:
-                    print(f"[클라이언트] 메시지 수신 오류: {e}")
+                    log.warning("메시지 수신 오류: %s", e)
                 break
 
         self.connected = False
@@ -321,7 +442,6 @@ class GameClient:
             message: 수신 메시지
         """
         msg_type = message.type
-        msg_data = message.data
 
         # 게임 상태 업데이트
         if msg_type in ["GAME_START", "ROUND_START", "PLAYING", "DEFENSE_PHASE", "ROUND_END", "GAME_END"]:
@@ -329,18 +449,18 @@ class GameClient:
 
         # 플레이어 목록 업데이트
         elif msg_type == "PLAYER_LIST":
-            self.players = msg_data.get('players', [])
-            # 플레이어 인덱스 업데이트
+            self.players = message.get('players', [])
+            # 플레이어 인덱스 업데이트 (서버가 준 player_index 사용, 목록 위치는 P2P 포트와 다를 수 있음)
             for idx, player in enumerate(self.players):
                 if player['player_id'] == self.player_id:
-                    self.my_index = idx
+                    self.my_index = player.get('player_index', idx)
                     break
 
         # 점수 업데이트
         elif msg_type == "SCORE":
-            if msg_data.get('player_id') == self.player_id:
-                self.my_score = msg_data.get('score', 0)
-                self.my_hp = msg_data.get('hp', 100)
+            if message.get('player_id') == self.player_id:
+                self.my_score = message.get('score', 0)
+                self.my_hp = message.get('hp', 100)
 
         # v2.0: 공격 승인
         elif msg_type == MSG_TYPE_ATTACK_APPROVED:
@@ -348,12 +468,13 @@ class GameClient:
 
         # v2.0: 수신 공격 경고
         elif msg_type == MSG_TYPE_INCOMING_ATTACK_WARNING:
-            print(f"[클라이언트] 공격 경고: {msg_data.get('attacker_id')}로부터 공격 예정")
+            self._note_incoming_attack(message.get('attack_id'))
+            log.info("공격 경고: %s로부터 공격 예정", message.get('attacker_id'))
 
         # 정보 메시지 (공격 거부 등)
         elif msg_type == "INFO":
-            if msg_data.get('info_type') == "ATTACK_DENIED":
-                print(f"[클라이언트] 공격 거부됨: {msg_data.get('message')}")
+            if message.get('info_type') == "ATTACK_DENIED":
+                log.info("공격 거부됨: %s", message.get('message'))
 
         # 더미 패킷 (로깅 외 처리 불필요)
         elif msg_type == "DUMMY":
@@ -364,20 +485,21 @@ class GameClient:
             try:
                 callback(message)
             except Exception as e:
-                print(f"[클라이언트] 콜백 오류: {e}")
+                log.error("콜백 오류: %s", e)
 
     def _handle_attack_approved(self, message: Message):
         """v2.0: 서버로부터 공격 승인을 받았을 때 처리"""
-        attack_id = message.data.get('attack_id')
-        target_player_id = message.data.get('target_id')
-        target_ip = message.data.get('target_ip')
-        target_port = message.data.get('target_port')
+        approved_at = time.monotonic()
+        attack_id = message.get('attack_id')
+        target_player_id = message.get('target_id')
+        target_ip = message.get('target_ip')
+        target_port = message.get('target_port')
 
-        print(f"[클라이언트] 공격 승인됨: {attack_id} -> {target_player_id} ({target_ip}:{target_port})")
+        log.info("공격 승인됨: %s -> %s (%s:%s)", attack_id, target_player_id, target_ip, target_port)
 
         attack_thread = threading.Thread(
             target=self._send_p2p_attack,
-            args=(attack_id, target_player_id, target_ip, target_port),
+            args=(attack_id, target_player_id, target_ip, target_port, approved_at),
             daemon=True
         )
         attack_thread.start()
@@ -385,17 +507,17 @@ class GameClient:
     def _update_game_state(self, message: Message):
         """게임 상태 업데이트"""
         self.game_state = message.to_dict()
-        self.current_round = message.data.get('round_num', 0)
+        self.current_round = message.get('round_num', 0)
 
     def send_attack(self, target: str) -> bool:
         """v2.0: 다른 플레이어에게 공격 요청 (서버 승인 후 P2P 전송)"""
         if not self.connected:
-            print("[클라이언트] 서버에 연결되지 않음")
+            log.warning("서버에 연결되지 않음")
             return False
 
         try:
-            print(f"[클라이언트] 공격 시도: target={target}")
-            print(f"[클라이언트] 현재 플레이어 목록: {self.players}")
+            log.debug("공격 시도: target=%s", target)
+            log.debug("현재 플레이어 목록: %s", self.players)
 
             target_player = None
             for player in self.players:
@@ -404,8 +526,8 @@ class GameClient:
                     break
 
             if not target_player:
-                print(f"[클라이언트] 대상 플레이어 없음: {target}")
-                print(f"[클라이언트] 가능한 플레이어: {[p['player_id'] for p in self.players]}")
+                log.warning("대상 플레이어 없음: %s", target)
+                log.debug("가능한 플레이어: %s", [p['player_id'] for p in self.players])
                 return False
 
             request_msg = AttackRequestMessage(
@@ -413,13 +535,11 @@ class GameClient:
                 target_id=target_player['player_id']
             )
 
-            Protocol.send_message(self.socket, request_msg)
-            print(f"[클라이언트] 공격 승인 요청 전송: {self.player_id} -> {target_player['player_id']}")
+            self._send_to_server(request_msg)
+            log.debug("공격 승인 요청 전송: %s -> %s", self.player_id, target_player['player_id'])
             return True
         except Exception as e:
-            print(f"[클라이언트] 공격 요청 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("공격 요청 실패: %s", e, exc_info=True)
             return False
 
     def submit_defense(self, attacker_ips: list) -> bool:
@@ -433,7 +553,7 @@ class GameClient:
             제출 성공 여부
         """
         if not self.connected:
-            print("[클라이언트] 서버에 연결되지 않음")
+            log.warning("서버에 연결되지 않음")
             return False
 
         try:
@@ -442,12 +562,12 @@ class GameClient:
                 attacker_ips=attacker_ips
             )
 
-            Protocol.send_message(self.socket, defense_msg)
-            print(f"[클라이언트] 방어 제출: {attacker_ips}")
+            self._send_to_server(defense_msg)
+            log.info("방어 제출: %s", attacker_ips)
             return True
 
         except Exception as e:
-            print(f"[클라이언트] 방어 제출 실패: {e}")
+            log.warning("방어 제출 실패: %s", e)
             return False
 
     def add_message_callback(self, callback: Callable[[Message], None]):
@@ -474,7 +594,8 @@ class GameClient:
             'ip': self.my_ip,
             'score': self.my_score,
             'hp': self.my_hp,
-            'round': self.current_round
+            'round': self.current_round,
+            'room': self.room
         }
 
     def is_connected(self) -> bool:
@@ -490,11 +611,14 @@ def main():
     parser.add_argument('--id', required=True, help="플레이어 ID")
     parser.add_argument('--host', default='localhost', help="서버 호스트")
     parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="서버 포트")
+    parser.add_argument('--room', default=None, help="참가할 방 ID (생략 시 자동 배정)")
+    add_logging_arguments(parser)
 
     args = parser.parse_args()
+    setup_logging(args.log_level, args.log_format)
 
     # 클라이언트 생성 및 연결
-    client = GameClient(player_id=args.id, host=args.host, port=args.port)
+    client = GameClient(player_id=args.id, host=args.host, port=args.port, room=args.room)
 
     if not client.connect():
         print("서버 연결 실패")
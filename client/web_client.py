@@ -14,6 +14,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from client.client import GameClient
 from common.message_types import Message
+from common.log import get_logger, setup_logging, add_logging_arguments
+
+log = get_logger(__name__, "웹서버")
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'network_security_game_secret'
@@ -30,7 +33,7 @@ def message_callback(msg: Message):
 
     # 웹 클라이언트에 메시지 전송
     if msg_type == "PLAYER_LIST":
-        socketio.emit('player_list', {'players': msg.data.get('players', [])})
+        socketio.emit('player_list', {'players': msg.get('players', [])})
 
     elif msg_type == "SCORE":
         socketio.emit('score_update', msg.data)
@@ -39,7 +42,7 @@ def message_callback(msg: Message):
         socketio.emit('game_state', msg.to_dict())
 
     elif msg_type == "INFO":
-        socketio.emit('info_message', {'message': msg.data.get('message', '')})
+        socketio.emit('info_message', {'message': msg.get('message', '')})
 
     # 모든 메시지 로그
     socketio.emit('log_message', {
@@ -57,7 +60,7 @@ def index():
 @socketio.on('connect')
 def handle_connect():
     """웹소켓 연결"""
-    print("[웹서버] 클라이언트 연결됨")
+    log.info("클라이언트 연결됨")
 
     # 현재 상태 전송
     if game_client and game_client.is_connected():
@@ -79,56 +82,57 @@ def handle_game_connect(data):
     player_id = data.get('player_id', 'Player1')
     server_host = data.get('server_host', '172.20.0.10')
     server_port = data.get('server_port', 9999)
+    room = data.get('room') or None  # 빈 문자열이면 자동 배정
 
-    print(f"[웹서버] 게임 서버 연결 시도: player_id={player_id}, host={server_host}, port={server_port}")
+    log.info("게임 서버 연결 시도: player_id=%s, host=%s, port=%s, room=%s", player_id, server_host, server_port, room)
 
     with client_lock:
         try:
-            game_client = GameClient(player_id=player_id, host=server_host, port=server_port)
+            game_client = GameClient(player_id=player_id, host=server_host, port=server_port, room=room)
             game_client.add_message_callback(message_callback)
 
-            print(f"[웹서버] GameClient 생성 완료, 연결 시도 중...")
+            log.debug("GameClient 생성 완료, 연결 시도 중...")
 
             if game_client.connect():
                 info = game_client.get_my_info()
-                print(f"[웹서버] 게임 서버 연결 성공: {info}")
+                log.info("게임 서버 연결 성공: %s", info)
                 emit('connected', {
                     'success': True,
                     'player_id': info['player_id'],
                     'ip': info['ip'],
                     'score': info['score'],
                     'hp': info['hp'],
-                    'round': info['round']
+                    'round': info['round'],
+                    'room': info['room']
                 })
             else:
-                print(f"[웹서버] 게임 서버 연결 실패")
+                log.warning("게임 서버 연결 실패")
                 emit('connected', {'success': False, 'error': '서버 연결 실패'})
 
         except Exception as e:
-            print(f"[웹서버] 게임 서버 연결 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            log.warning("게임 서버 연결 오류: %s", e, exc_info=True)
             emit('connected', {'success': False, 'error': str(e)})
 
 
 @socketio.on('send_attack')
 def handle_attack(data):
     """공격 전송"""
-    print(f"[웹서버] 공격 요청 받음: {data}")
+    log.debug("공격 요청 받음: %s", data)
 
     if not game_client or not game_client.is_connected():
-        print(f"[웹서버] 게임 클라이언트 연결되지 않음: game_client={game_client}, connected={game_client.is_connected() if game_client else False}")
+        log.warning("게임 클라이언트 연결되지 않음: game_client=%s, connected=%s",
+                    game_client, game_client.is_connected() if game_client else False)
         emit('attack_result', {'success': False, 'error': '서버에 연결되지 않음'})
         return
 
     target = data.get('target', '')
-    print(f"[웹서버] 공격 전송 시도: target={target}")
+    log.debug("공격 전송 시도: target=%s", target)
 
     if game_client.send_attack(target):
-        print(f"[웹서버] 공격 전송 성공: {target}")
+        log.info("공격 전송 성공: %s", target)
         emit('attack_result', {'success': True, 'target': target})
     else:
-        print(f"[웹서버] 공격 전송 실패: {target}")
+        log.warning("공격 전송 실패: %s", target)
         emit('attack_result', {'success': False, 'error': '공격 실패'})
 
 
@@ -149,10 +153,10 @@ def handle_defense(data):
 @socketio.on('get_status')
 def handle_get_status():
     """현재 상태 조회"""
-    print(f"[웹서버] get_status 요청 받음. game_client 존재: {game_client is not None}")
+    log.debug("get_status 요청 받음. game_client 존재: %s", game_client is not None)
 
     if not game_client or not game_client.is_connected():
-        print(f"[웹서버] 게임 클라이언트가 연결되지 않음")
+        log.debug("게임 클라이언트가 연결되지 않음")
         emit('status', {'connected': False})
         return
 
@@ -160,7 +164,7 @@ def handle_get_status():
     players = game_client.get_players()
     game_state = game_client.get_game_state()
 
-    print(f"[웹서버] 상태 전송: {info['player_id']}, 플레이어 수: {len(players)}")
+    log.debug("상태 전송: %s, 플레이어 수: %s", info['player_id'], len(players))
 
     emit('status', {
         'connected': True,
@@ -184,24 +188,28 @@ def main():
     parser.add_argument('--player-id', default=None, help='플레이어 ID (자동 연결용)')
     parser.add_argument('--server-host', default='172.20.0.10', help='게임 서버 호스트')
     parser.add_argument('--server-port', type=int, default=9999, help='게임 서버 포트')
+    parser.add_argument('--room', default=None, help='참가할 방 ID (생략 시 자동 배정)')
+    add_logging_arguments(parser)
 
     args = parser.parse_args()
+    setup_logging(args.log_level, args.log_format)
 
     # 자동 연결
     if args.player_id:
         global game_client
-        game_client = GameClient(player_id=args.player_id, host=args.server_host, port=args.server_port)
+        game_client = GameClient(player_id=args.player_id, host=args.server_host, port=args.server_port,
+                                 room=args.room)
         game_client.add_message_callback(message_callback)
 
         def auto_connect():
             import time
             time.sleep(2)  # 웹서버 시작 대기
             if game_client.connect():
-                print(f"[웹클라이언트] 게임 서버에 자동 연결: {args.player_id}")
+                log.info("게임 서버에 자동 연결: %s", args.player_id)
 
         threading.Thread(target=auto_connect, daemon=True).start()
 
-    print(f"[웹클라이언트] 웹서버 시작: http://{args.host}:{args.port}")
+    log.info("웹서버 시작: http://%s:%s", args.host, args.port)
     try:
         socketio.run(app, host=args.host, port=args.port, debug=False, allow_unsafe_werkzeug=True)
     except TypeError:
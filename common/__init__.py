@@ -7,4 +7,4 @@ from .protocol import *
 from .message_types import *
 from .constants import *
 
-__all__ = ['protocol', 'message_types', 'constants']
+__all__ = ['protocol', 'message_types', 'constants', 'log']
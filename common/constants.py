@@ -7,11 +7,23 @@
 DEFAULT_PORT = 9999
 DEFAULT_HOST = '0.0.0.0'
 BUFFER_SIZE = 4096
+RECV_CHUNK_SIZE = 65536  # FrameReader가 한 번에 읽는 최대 바이트 수
+MAX_FRAME_SIZE = 1024 * 1024  # 허용하는 최대 프레임 본문 크기 (잘못된 길이 헤더 방어)
+OUTBOUND_QUEUE_SIZE = 256  # 플레이어별 송신 큐 최대 프레임 수
+PACKET_LOG_SIZE = 1000  # 방별로 메모리에 보관하는 최근 패킷 로그 수 (웹 GUI 표시용)
 ENCODING = 'utf-8'
 
+# 와이어 포맷 버전 (CONNECT 시 협상)
+WIRE_VERSION_JSON = 2  # 레거시: JSON + base64 이중 인코딩
+WIRE_VERSION_BINARY = 3  # v3: 고정 바이너리 헤더 + 난독화 본문
+SUPPORTED_WIRE_VERSIONS = (WIRE_VERSION_BINARY, WIRE_VERSION_JSON)
+
 # 게임 설정
 MIN_PLAYERS = 2
 MAX_PLAYERS = 4
+ROOM_PREFIX_LENGTH = 24  # 방별 가상 IP 대역 크기 (24 이상, /24: 방당 최대 254명)
+MAX_ROOMS = 254  # 방마다 172.20.<n>.0/24 대역 사용 (n = 1 ~ 254)
+DEFAULT_ROOM_ID = "main"  # 서버 시작 시 만들어지는 기본 방
 TOTAL_ROUNDS = 5
 ROUND_TIME = 90  # 초
 DEFENSE_INPUT_TIME = 20  # 초
@@ -120,9 +132,48 @@ MSG_TYPE_ATTACK_APPROVED = "ATTACK_APPROVED"  # 공격 승인
 MSG_TYPE_INCOMING_ATTACK_WARNING = "INCOMING_ATTACK_WARNING"  # 수신 공격 경고
 MSG_TYPE_ATTACK_CONFIRM = "ATTACK_CONFIRM"  # 공격 확인 (송신/수신)
 
+# v3 와이어 포맷의 메시지 타입 코드 (1바이트)
+# 0은 "코드 없음"으로 예약 (타입 문자열을 본문에 포함)
+MSG_TYPE_CODES = {
+    MSG_TYPE_DUMMY: 1,
+    MSG_TYPE_ATTACK: 2,
+    MSG_TYPE_DEFENSE: 3,
+    MSG_TYPE_SCORE: 4,
+    MSG_TYPE_CONNECT: 5,
+    MSG_TYPE_DISCONNECT: 6,
+    MSG_TYPE_GAME_START: 7,
+    MSG_TYPE_GAME_END: 8,
+    MSG_TYPE_ROUND_START: 9,
+    MSG_TYPE_ROUND_END: 10,
+    MSG_TYPE_PLAYER_LIST: 11,
+    MSG_TYPE_DEFENSE_PHASE: 12,
+    MSG_TYPE_ERROR: 13,
+    MSG_TYPE_INFO: 14,
+    MSG_TYPE_NOISE: 15,
+    MSG_TYPE_DECOY_ATTACK: 16,
+    MSG_TYPE_ATTACK_REQUEST: 17,
+    MSG_TYPE_ATTACK_APPROVED: 18,
+    MSG_TYPE_INCOMING_ATTACK_WARNING: 19,
+    MSG_TYPE_ATTACK_CONFIRM: 20,
+    "PLAYING": 21,  # 게임 진행 상태 메시지
+}
+MSG_TYPE_BY_CODE = {code: msg_type for msg_type, code in MSG_TYPE_CODES.items()}
+
 # 공격 승인 시스템 설정
 ATTACK_APPROVAL_TIMEOUT = 5.0  # 공격 승인 타임아웃 (초)
+ATTACK_TIMEOUT_RETRY = 0.01  # 타임아웃 시점에 방 락이 잡혀 있으면 이 간격(초) 뒤 다시 시도 (공용 타이머 스레드가 막히지 않도록)
 PLAYER_ATTACK_PORT_BASE = 10001  # 플레이어 P2P 공격 포트 시작
+ATTACK_TRACE_SIZE = 100  # 방별로 보관하는 최근 완료/만료 공격 타임라인 수 (웹 GUI 표시용)
+
+# 공격 확인 종류 (ATTACK_CONFIRM confirm_type)
+CONFIRM_SENT = "SENT"  # 공격자: P2P 공격 패킷 전송 완료
+CONFIRM_RECEIVED = "RECEIVED"  # 타겟: P2P 공격 패킷 수신
+CONFIRM_FAILED = "FAILED"  # 공격자: P2P 전송 실패 (trace에 실패 단계/원인, 서버는 바로 만료)
+
+# 플레이어 인덱스 (P2P 포트 = PLAYER_ATTACK_PORT_BASE + 인덱스) 방식
+PLAYER_INDEX_STABLE = "stable"  # 접속 중 고정되는 슬롯 번호 (종료한 플레이어의 슬롯은 재사용)
+PLAYER_INDEX_JOIN_ORDER = "join_order"  # 레거시: 현재 접속자 중 접속 순서 (앞 플레이어가 나가면 바뀜)
+PLAYER_INDEX_MODE = PLAYER_INDEX_STABLE
 
 # 게임 상태
 STATE_WAITING = "WAITING"
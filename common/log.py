@@ -0,0 +1,224 @@
+"""
+로그 모듈
+서버/클라이언트 공용 구조화 로그 (표준 logging 기반)
+
+- 모듈마다 get_logger(__name__, "태그")로 로거를 만들고 log.debug("... %s", 값)처럼 인자를 따로 넘김
+  (레벨이 꺼져 있으면 문자열을 만들지 않으므로 수신/전송 경로의 debug 로그는 레벨 비교 비용만 듦)
+- setup_logging(): 레벨/형식 설정, 기록은 큐에 넣기만 하고 출력은 별도 스레드(QueueListener)가 담당
+  (큐가 MAX_PENDING개를 넘으면 새 기록은 버리고 수만 셈)
+- 형식: text ("[태그] 메시지", 기존 print 출력과 같은 모양) 또는 json (한 줄에 하나, extra 필드 포함)
+- 환경 변수 COMNET_LOG_LEVEL / COMNET_LOG_FORMAT 으로도 지정 가능 (명령행 인자가 우선)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Dict, Optional
+
+DEFAULT_LEVEL = "INFO"  # 운영 기본값 (수신/전송 경로의 상세 로그는 DEBUG)
+DEFAULT_FORMAT = "text"
+LOG_FORMATS = ("text", "json")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+MAX_PENDING = 100000  # 출력 스레드가 아직 쓰지 않은 최대 기록 수
+
+ROOT_LOGGER = "comnet"
+
+_tags: Dict[str, str] = {}  # 로거 이름 -> 출력 태그
+_listener = None
+_handler = None
+_config = None  # 마지막 setup_logging 설정 (fork된 자식이 같은 설정으로 다시 설정)
+
+# LogRecord 기본 속성 (json 형식에서 extra 필드를 골라낼 때 제외)
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def get_logger(name: str, tag: Optional[str] = None) -> logging.Logger:
+    """
+    모듈 로거
+
+    Args:
+        name: 로거 이름 (보통 __name__, "comnet." 아래에 만들어짐)
+        tag: text 형식에서 메시지 앞에 붙일 태그 (예: "GameManager", None이면 이름 마지막 부분)
+
+    Returns:
+        logging.Logger
+    """
+    full_name = f"{ROOT_LOGGER}.{name}"
+    _tags[full_name] = tag or name.rsplit('.', 1)[-1]
+    return logging.getLogger(full_name)
+
+
+class TextFormatter(logging.Formatter):
+    """[태그] 메시지 (WARNING 이상은 레벨 표시)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        tag = _tags.get(record.name, record.name)
+        if record.levelno >= logging.WARNING:
+            line = f"[{tag}] [{record.levelname}] {message}"
+        else:
+            line = f"[{tag}] {message}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON 한 줄 (ts, level, logger, tag, thread, msg + extra 필드)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 6),
+            'level': record.levelname,
+            'logger': record.name,
+            'tag': _tags.get(record.name, record.name),
+            'thread': record.threadName,
+            'msg': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐에 기록을 넣기만 하는 핸들러
+
+    표준 QueueHandler는 큐에 넣기 전에 호출 스레드에서 메시지를 포맷하지만,
+    같은 프로세스 안의 큐이므로 기록을 그대로 넘기고 포맷은 출력 스레드에서 한다.
+    (로그 인자로 넘긴 객체는 이후 변경하지 않아야 함)
+    """
+
+    def __init__(self, log_queue, max_pending: int = MAX_PENDING):
+        super().__init__(log_queue)
+        self.max_pending = max_pending
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """기록마다 flush하지 않는 StreamHandler (출력 스레드가 큐를 비울 때마다 flush)"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """큐가 비어 기다리기 직전에만 출력 핸들러를 flush하는 QueueListener"""
+
+    def dequeue(self, block: bool):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+def setup_logging(level: Optional[str] = None, fmt: Optional[str] = None, stream=None, queued: bool = True):
+    """
+    로그 설정 (여러 번 호출하면 이전 설정을 정리하고 다시 설정)
+
+    fork로 만든 자식 프로세스는 같은 설정으로 자동으로 다시 설정됨 (부모의 출력 스레드는 자식에 없으므로)
+    출력 스레드가 있는 상태에서 fork하지 않도록, fork 전에는 queued=False로 설정했다가 fork 후 다시 호출
+
+    Args:
+        level: 로그 레벨 이름 (None이면 COMNET_LOG_LEVEL 또는 INFO)
+        fmt: "text" 또는 "json" (None이면 COMNET_LOG_FORMAT 또는 text)
+        stream: 출력 스트림 (None이면 sys.stdout)
+        queued: 출력 스레드 사용 여부 (False면 호출 스레드에서 바로 출력, fork 전 설정용)
+    """
+    global _listener, _handler, _config
+
+    level = (level or os.environ.get('COMNET_LOG_LEVEL') or DEFAULT_LEVEL).upper()
+    fmt = fmt or os.environ.get('COMNET_LOG_FORMAT') or DEFAULT_FORMAT
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"알 수 없는 로그 형식: {fmt} (사용 가능: {', '.join(LOG_FORMATS)})")
+
+    shutdown_logging()
+    _config = (level, fmt, stream)
+
+    formatter = JsonFormatter() if fmt == "json" else TextFormatter()
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level)
+    root.propagate = False
+    if queued:
+        output = _BufferedStreamHandler(stream or sys.stdout)
+        output.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        _handler = NonBlockingQueueHandler(log_queue)
+        _listener = _FlushingQueueListener(log_queue, output)
+        _listener.start()
+    else:
+        _handler = logging.StreamHandler(stream or sys.stdout)
+        _handler.setFormatter(formatter)
+    root.addHandler(_handler)
+
+
+def shutdown_logging():
+    """출력 스레드를 멈추고 남은 기록을 모두 출력 (프로세스 종료 시 자동 호출)"""
+    global _listener, _handler
+    root = logging.getLogger(ROOT_LOGGER)
+    if _handler is not None:
+        root.removeHandler(_handler)
+    listener, _listener = _listener, None
+    if listener is not None:
+        try:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+        except Exception:
+            pass
+    _handler = None
+
+
+def get_log_stats() -> dict:
+    """로그 설정/통계 (레벨, 대기 중인 기록 수, 큐가 넘쳐 버린 기록 수)"""
+    handler = _handler
+    queued = isinstance(handler, NonBlockingQueueHandler)
+    return {
+        'level': logging.getLevelName(logging.getLogger(ROOT_LOGGER).getEffectiveLevel()),
+        'queued': queued,
+        'pending': handler.queue.qsize() if queued else 0,
+        'dropped': handler.dropped if queued else 0
+    }
+
+
+def add_logging_arguments(parser):
+    """명령행 인자 --log-level / --log-format 추가 (argparse)"""
+    parser.add_argument('--log-level', type=str.upper, choices=LOG_LEVELS, default=None,
+                        help=f'로그 레벨 (기본: COMNET_LOG_LEVEL 또는 {DEFAULT_LEVEL}, DEBUG는 메시지마다 상세 로그)')
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default=None,
+                        help='로그 형식 (text: [태그] 메시지, json: 한 줄에 JSON 하나)')
+
+
+def _after_fork_in_child():
+    """fork된 자식: 부모의 출력 스레드 대신 새 큐와 출력 스레드로 다시 설정"""
+    global _listener
+    if _config is None:
+        return
+    _listener = None  # 자식에는 없는 스레드
+    level, fmt, stream = _config
+    setup_logging(level, fmt, stream)
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,14 +1,25 @@
 """
 메시지 타입 정의
 JSON 메시지 구조체 클래스
+
+메시지 타입마다 __slots__ 기반 클래스를 두고, 타입 문자열로 찾는 레지스트리
+(MESSAGE_REGISTRY)를 통해 인코딩/디코딩한다. 필드는 인스턴스 속성에 바로 저장되며
+중간 딕셔너리를 거치지 않는다. 정의되지 않은 추가 필드만 _extra 딕셔너리에 보관.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Type
 import json
 import time
 import base64
 
 
+# 메시지 타입 -> 메시지 클래스
+MESSAGE_REGISTRY: Dict[str, Type['Message']] = {}
+
+# 디코딩 시 누락된 필드 표시용
+_MISSING = object()
+
+
 def encode_payload(payload: str) -> str:
     """
     페이로드를 base64로 인코딩
@@ -40,30 +51,124 @@ def decode_payload(encoded_payload: str) -> str:
         return encoded_payload
 
 
+def register_message(*msg_types: str):
+    """
+    메시지 클래스를 타입 레지스트리에 등록하는 데코레이터
+
+    Args:
+        msg_types: 이 클래스로 디코딩할 메시지 타입 문자열들
+    """
+    def decorator(cls: Type['Message']) -> Type['Message']:
+        for msg_type in msg_types:
+            MESSAGE_REGISTRY[msg_type] = cls
+        return cls
+    return decorator
+
+
 class Message:
-    """기본 메시지 클래스"""
+    """
+    기본 메시지 클래스
+    타입이 등록되지 않은 메시지는 모든 필드를 _extra 딕셔너리에 보관
+    """
+
+    __slots__ = ('type', 'timestamp', '_extra')
+
+    # 하위 클래스의 고정 필드 (전송 순서대로)
+    FIELDS: Tuple[str, ...] = ()
 
     def __init__(self, msg_type: str, **kwargs):
         self.type = msg_type
-        self.timestamp = time.time()
-        self.data = kwargs
+        self.timestamp = time.time()  # 생성 시각 (한 번만 기록)
+        self._extra = kwargs
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """모든 필드를 딕셔너리로 반환 (하위 호환용, 핫 패스에서는 get() 사용)"""
+        if not self.FIELDS:
+            return self._extra
+        return self.wire_dict()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        필드 값 조회 (딕셔너리를 만들지 않음)
+
+        Args:
+            name: 필드 이름
+            default: 필드가 없을 때 반환할 값
+
+        Returns:
+            필드 값 또는 default
+        """
+        if name in self.FIELDS:
+            return getattr(self, name, default)
+        extra = self._extra
+        if extra:
+            return extra.get(name, default)
+        return default
+
+    def wire_dict(self) -> Dict[str, Any]:
+        """전송할 필드 딕셔너리 (type/timestamp 제외, 호출마다 새 딕셔너리)"""
+        fields = {}
+        for name in self.FIELDS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                fields[name] = value
+        if self._extra:
+            fields.update(self._extra)
+        return fields
 
     def to_json(self) -> str:
         """JSON 문자열로 변환"""
-        message_dict = {
-            "type": self.type,
-            "timestamp": self.timestamp,
-            **self.data
-        }
-        return json.dumps(message_dict, ensure_ascii=False)
+        return json.dumps(self.to_dict(), ensure_ascii=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return {
+        message_dict = {
             "type": self.type,
-            "timestamp": self.timestamp,
-            **self.data
+            "timestamp": self.timestamp
         }
+        for name in self.FIELDS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                message_dict[name] = value
+        if self._extra:
+            message_dict.update(self._extra)
+        return message_dict
+
+    @staticmethod
+    def decode(msg_type: str, fields: Dict[str, Any]) -> 'Message':
+        """
+        레지스트리에서 타입에 맞는 클래스를 찾아 메시지 복원
+        fields 딕셔너리는 그대로 재사용됨 (호출자가 소유권을 넘김)
+
+        Args:
+            msg_type: 메시지 타입
+            fields: type/timestamp를 제외한 필드 딕셔너리
+
+        Returns:
+            Message (또는 등록된 하위 클래스) 객체
+        """
+        cls = MESSAGE_REGISTRY.get(msg_type)
+        if cls is None:
+            message = Message.__new__(Message)
+            message.type = msg_type
+            message.timestamp = time.time()
+            message._extra = fields
+            return message
+        return cls._from_fields(msg_type, fields)
+
+    @classmethod
+    def _from_fields(cls, msg_type: str, fields: Dict[str, Any]) -> 'Message':
+        """__init__을 거치지 않고 슬롯에 필드를 직접 채움 (페이로드 재인코딩 방지)"""
+        message = cls.__new__(cls)
+        message.type = msg_type
+        message.timestamp = time.time()
+        for name in cls.FIELDS:
+            value = fields.pop(name, _MISSING)
+            if value is not _MISSING:
+                setattr(message, name, value)
+        message._extra = fields or None
+        return message
 
     @classmethod
     def from_json(cls, json_str: str) -> 'Message':
@@ -71,180 +176,270 @@ class Message:
         data = json.loads(json_str)
         msg_type = data.pop('type')
         data.pop('timestamp', None)
-        return cls(msg_type, **data)
+        return Message.decode(msg_type, data)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Message':
-        """딕셔너리에서 메시지 생성"""
-        msg_type = data.pop('type')
-        data.pop('timestamp', None)
-        return cls(msg_type, **data)
+        """딕셔너리에서 메시지 생성 (입력 딕셔너리는 변경하지 않음)"""
+        fields = {key: value for key, value in data.items() if key != 'type' and key != 'timestamp'}
+        return Message.decode(data['type'], fields)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(type={self.type!r}, data={self.data!r})"
 
 
+@register_message("DUMMY")
 class DummyMessage(Message):
     """더미 패킷 메시지"""
 
+    FIELDS = ('payload',)
+    __slots__ = FIELDS
+
     def __init__(self, payload: str):
+        self.type = "DUMMY"
+        self.timestamp = time.time()
         # 페이로드를 base64로 인코딩하여 Wireshark에서 평문이 보이지 않도록 함
-        encoded_payload = encode_payload(payload)
-        super().__init__("DUMMY", payload=encoded_payload)
+        self.payload = encode_payload(payload)
+        self._extra = None
 
 
+@register_message("ATTACK")
 class AttackMessage(Message):
     """공격 패킷 메시지 (v2.0: attack_id 추가)"""
 
+    FIELDS = ('from_ip', 'to_ip', 'from_player', 'to_player', 'payload', 'attack_id')
+    __slots__ = FIELDS
+
     def __init__(self, from_ip: str = "", to_ip: str = "", from_player: str = "",
                  to_player: str = "", payload: str = "", attack_id: str = ""):
+        self.type = "ATTACK"
+        self.timestamp = time.time()
+        self.from_ip = from_ip
+        self.to_ip = to_ip
+        self.from_player = from_player
+        self.to_player = to_player
         # 페이로드를 base64로 인코딩하여 Wireshark에서 평문이 보이지 않도록 함
-        encoded_payload = encode_payload(payload) if payload else ""
-        super().__init__(
-            "ATTACK",
-            from_ip=from_ip,
-            to_ip=to_ip,
-            from_player=from_player,
-            to_player=to_player,
-            payload=encoded_payload,
-            attack_id=attack_id  # v2.0: 공격 추적용 ID
-        )
+        self.payload = encode_payload(payload) if payload else ""
+        self.attack_id = attack_id  # v2.0: 공격 추적용 ID
+        self._extra = None
+
+
+@register_message("NOISE")
+class NoiseMessage(Message):
+    """노이즈 트래픽 메시지 (플레이어 간 배경 트래픽으로 위장)"""
+
+    FIELDS = ('from_ip', 'to_ip', 'from_player', 'to_player', 'payload')
+    __slots__ = FIELDS
+
+    def __init__(self, from_ip: str, to_ip: str, from_player: str, to_player: str,
+                 payload: str, **kwargs):
+        self.type = "NOISE"
+        self.timestamp = time.time()
+        self.from_ip = from_ip
+        self.to_ip = to_ip
+        self.from_player = from_player
+        self.to_player = to_player
+        self.payload = encode_payload(payload)
+        self._extra = kwargs or None
 
 
+@register_message("DECOY_ATTACK")
+class DecoyAttackMessage(Message):
+    """가짜 공격 메시지 (R5, 서버 생성)"""
+
+    FIELDS = ('from_ip', 'to_ip', 'from_player', 'to_player', 'payload', 'is_decoy')
+    __slots__ = FIELDS
+
+    def __init__(self, from_ip: str, to_ip: str, from_player: str, to_player: str, payload: str):
+        self.type = "DECOY_ATTACK"
+        self.timestamp = time.time()
+        self.from_ip = from_ip
+        self.to_ip = to_ip
+        self.from_player = from_player
+        self.to_player = to_player
+        self.payload = encode_payload(payload)
+        self.is_decoy = True  # 내부적으로 가짜임을 표시 (클라이언트는 모름)
+        self._extra = None
+
+
+@register_message("DEFENSE")
 class DefenseMessage(Message):
     """방어 입력 메시지"""
 
+    FIELDS = ('player_id', 'attacker_ips')
+    __slots__ = FIELDS
+
     def __init__(self, player_id: str, attacker_ips: list):
-        super().__init__(
-            "DEFENSE",
-            player_id=player_id,
-            attacker_ips=attacker_ips
-        )
+        self.type = "DEFENSE"
+        self.timestamp = time.time()
+        self.player_id = player_id
+        self.attacker_ips = attacker_ips
+        self._extra = None
 
 
+@register_message("SCORE")
 class ScoreMessage(Message):
     """점수 업데이트 메시지"""
 
+    FIELDS = ('player_id', 'score', 'hp', 'correct', 'reason')
+    __slots__ = FIELDS
+
     def __init__(self, player_id: str, score: int, hp: int, correct: bool, reason: str = ""):
-        super().__init__(
-            "SCORE",
-            player_id=player_id,
-            score=score,
-            hp=hp,
-            correct=correct,
-            reason=reason
-        )
+        self.type = "SCORE"
+        self.timestamp = time.time()
+        self.player_id = player_id
+        self.score = score
+        self.hp = hp
+        self.correct = correct
+        self.reason = reason
+        self._extra = None
 
 
+@register_message("CONNECT")
 class ConnectMessage(Message):
     """연결 메시지"""
 
-    def __init__(self, player_id: str, player_ip: str):
-        super().__init__(
-            "CONNECT",
-            player_id=player_id,
-            player_ip=player_ip
-        )
+    FIELDS = ('player_id', 'player_ip')
+    __slots__ = FIELDS
+
+    def __init__(self, player_id: str, player_ip: str, **kwargs):
+        self.type = "CONNECT"
+        self.timestamp = time.time()
+        self.player_id = player_id
+        self.player_ip = player_ip
+        self._extra = kwargs or None
 
 
+@register_message("GAME_START", "ROUND_START", "PLAYING", "DEFENSE_PHASE", "ROUND_END", "GAME_END")
 class GameStateMessage(Message):
     """게임 상태 메시지"""
 
+    FIELDS = ('round_num', 'time_remaining')
+    __slots__ = FIELDS
+
     def __init__(self, state: str, round_num: int = 0, time_remaining: int = 0, **kwargs):
-        super().__init__(
-            state,
-            round_num=round_num,
-            time_remaining=time_remaining,
-            **kwargs
-        )
+        self.type = state
+        self.timestamp = time.time()
+        self.round_num = round_num
+        self.time_remaining = time_remaining
+        self._extra = kwargs or None
 
 
+@register_message("PLAYER_LIST")
 class PlayerListMessage(Message):
     """플레이어 목록 메시지"""
 
+    FIELDS = ('players',)
+    __slots__ = FIELDS
+
     def __init__(self, players: list):
-        super().__init__(
-            "PLAYER_LIST",
-            players=players
-        )
+        self.type = "PLAYER_LIST"
+        self.timestamp = time.time()
+        self.players = players
+        self._extra = None
 
 
+@register_message("ERROR")
 class ErrorMessage(Message):
     """에러 메시지"""
 
+    FIELDS = ('error_code', 'error_message')
+    __slots__ = FIELDS
+
     def __init__(self, error_code: str, error_message: str):
-        super().__init__(
-            "ERROR",
-            error_code=error_code,
-            error_message=error_message
-        )
+        self.type = "ERROR"
+        self.timestamp = time.time()
+        self.error_code = error_code
+        self.error_message = error_message
+        self._extra = None
 
 
+@register_message("INFO")
 class InfoMessage(Message):
     """정보 메시지"""
 
+    FIELDS = ('info_type', 'message')
+    __slots__ = FIELDS
+
     def __init__(self, info_type: str, message: str, **kwargs):
-        super().__init__(
-            "INFO",
-            info_type=info_type,
-            message=message,
-            **kwargs
-        )
+        self.type = "INFO"
+        self.timestamp = time.time()
+        self.info_type = info_type
+        self.message = message
+        self._extra = kwargs or None
 
 
+@register_message("ATTACK_REQUEST")
 class AttackRequestMessage(Message):
     """공격 요청 메시지"""
 
+    FIELDS = ('attacker_id', 'target_id')
+    __slots__ = FIELDS
+
     def __init__(self, attacker_id: str, target_id: str):
-        super().__init__(
-            "ATTACK_REQUEST",
-            attacker_id=attacker_id,
-            target_id=target_id
-        )
+        self.type = "ATTACK_REQUEST"
+        self.timestamp = time.time()
+        self.attacker_id = attacker_id
+        self.target_id = target_id
+        self._extra = None
 
 
+@register_message("ATTACK_APPROVED")
 class AttackApprovedMessage(Message):
     """공격 승인 메시지"""
 
+    FIELDS = ('attack_id', 'target_ip', 'target_port', 'target_id')
+    __slots__ = FIELDS
+
     def __init__(self, attack_id: str, target_ip: str, target_port: int, target_id: str):
-        super().__init__(
-            "ATTACK_APPROVED",
-            attack_id=attack_id,
-            target_ip=target_ip,
-            target_port=target_port,
-            target_id=target_id
-        )
+        self.type = "ATTACK_APPROVED"
+        self.timestamp = time.time()
+        self.attack_id = attack_id
+        self.target_ip = target_ip
+        self.target_port = target_port
+        self.target_id = target_id
+        self._extra = None
 
 
+@register_message("INCOMING_ATTACK_WARNING")
 class IncomingAttackWarningMessage(Message):
     """수신 공격 경고 메시지"""
 
+    FIELDS = ('attack_id', 'attacker_ip', 'attacker_id')
+    __slots__ = FIELDS
+
     def __init__(self, attack_id: str, attacker_ip: str, attacker_id: str):
-        super().__init__(
-            "INCOMING_ATTACK_WARNING",
-            attack_id=attack_id,
-            attacker_ip=attacker_ip,
-            attacker_id=attacker_id
-        )
+        self.type = "INCOMING_ATTACK_WARNING"
+        self.timestamp = time.time()
+        self.attack_id = attack_id
+        self.attacker_ip = attacker_ip
+        self.attacker_id = attacker_id
+        self._extra = None
 
 
+@register_message("ATTACK_CONFIRM")
 class AttackConfirmMessage(Message):
     """공격 확인 메시지 (송신자/수신자 확인용, v2.0)"""
 
+    FIELDS = ('attack_id', 'from_player', 'to_player', 'confirm_type')
+    __slots__ = FIELDS
+
     def __init__(self, attack_id: str, from_player: str = "", to_player: str = "",
-                 status: str = "", confirm_type: str = ""):
+                 status: str = "", confirm_type: str = "", **kwargs):
         """
         Args:
             attack_id: 공격 ID
             from_player: 공격자 ID
             to_player: 타겟 ID
             status: "SENT" 또는 "RECEIVED" (하위 호환성)
-            confirm_type: "SENT" 또는 "RECEIVED" (새 파라미터)
+            confirm_type: "SENT", "RECEIVED" 또는 "FAILED" (새 파라미터)
+            kwargs: 추가 필드 (trace: 클라이언트가 잰 구간 시간 ms, 실패 단계/원인)
         """
+        self.type = "ATTACK_CONFIRM"
+        self.timestamp = time.time()
+        self.attack_id = attack_id
+        self.from_player = from_player
+        self.to_player = to_player
         # status와 confirm_type 중 하나를 사용
-        final_confirm_type = confirm_type or status
-
-        super().__init__(
-            "ATTACK_CONFIRM",
-            attack_id=attack_id,
-            from_player=from_player,
-            to_player=to_player,
-            confirm_type=final_confirm_type
-        )
+        self.confirm_type = confirm_type or status
+        self._extra = kwargs or None
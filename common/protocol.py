@@ -1,15 +1,114 @@
 """
 네트워크 프로토콜 핸들러
 TCP 통신을 위한 메시지 송수신 처리
+
+와이어 포맷 (4바이트 길이 헤더 뒤의 본문):
+- v2 (JSON): {"from_ip", "to_ip", "encrypted_data": base64(JSON)}
+- v3 (바이너리): [버전 1B][타입 코드 1B][플래그 1B][예약 1B][from_ip 4B][to_ip 4B][XOR 난독화 JSON]
+수신 측은 본문 첫 바이트로 버전을 판별하므로 두 포맷을 모두 받을 수 있고,
+송신 포맷은 CONNECT 시 협상된 버전을 따른다.
 """
 
 import socket
 import json
 import struct
 import base64
-from typing import Optional, Dict, Any
-from .constants import BUFFER_SIZE, ENCODING
+from typing import Optional, Dict, Any, Union, Iterable, Iterator
+from .constants import (
+    BUFFER_SIZE, ENCODING, RECV_CHUNK_SIZE, MAX_FRAME_SIZE,
+    WIRE_VERSION_JSON, WIRE_VERSION_BINARY, SUPPORTED_WIRE_VERSIONS,
+    MSG_TYPE_CODES, MSG_TYPE_BY_CODE
+)
 from .message_types import Message
+from .log import get_logger
+
+log = get_logger(__name__, "Protocol")
+
+
+# v3 고정 헤더: 버전, 타입 코드, 플래그, 예약(패딩), from_ip, to_ip
+V3_HEADER = struct.Struct('!BBBx4s4s')
+V3_FLAG_FROM_IP = 0x01
+V3_FLAG_TO_IP = 0x02
+_NO_IP = b'\x00\x00\x00\x00'
+
+# v3 본문 난독화 키 (암호화가 아니라 Wireshark에서 평문이 바로 보이지 않도록 하는 용도)
+_OBFUSCATION_KEY = b'ComNetGame-v3'
+_obfuscation_stream = _OBFUSCATION_KEY * 512
+
+
+def _obfuscate(data: bytes) -> bytes:
+    """
+    반복 키와 XOR (대칭 연산이므로 복호화에도 사용)
+    큰 정수 XOR로 바이트 단위 파이썬 루프를 피함
+    """
+    global _obfuscation_stream
+    size = len(data)
+    if size == 0:
+        return data
+    # 전역은 한 번만 읽고 지역 변수에서 자름 (다른 스레드가 더 짧은 키로 바꿔도 이 프레임 키는 그대로)
+    stream = _obfuscation_stream
+    if size > len(stream):
+        stream = _OBFUSCATION_KEY * (size // len(_OBFUSCATION_KEY) + 1)
+        _obfuscation_stream = stream
+    key = stream[:size]
+    value = int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')
+    return value.to_bytes(size, 'big')
+
+
+def _pack_ip(ip: Any) -> Optional[bytes]:
+    """IPv4 문자열을 4바이트로 변환 (정확히 왕복 변환되는 경우만)"""
+    if not isinstance(ip, str) or not ip:
+        return None
+    try:
+        packed = socket.inet_aton(ip)
+    except OSError:
+        return None
+    # "127.1" 같은 축약 표기는 원문이 보존되지 않으므로 본문에 남김
+    if socket.inet_ntoa(packed) != ip:
+        return None
+    return packed
+
+
+class EncodedFrame:
+    """
+    미리 인코딩된 프레임 (4바이트 헤더 + 본문)
+    브로드캐스트 시 와이어 버전마다 한 번만 직렬화하고 모든 수신자에게 같은 바이트를 전송
+    """
+
+    __slots__ = ('type', 'message', '_frames')
+
+    def __init__(self, message: Message):
+        self.type = message.type  # 로깅/분류용 메시지 타입
+        self.message = message
+        self._frames: Dict[int, bytes] = {}  # {wire_version: 헤더 포함 전송 바이트}
+
+    def for_version(self, version: int = WIRE_VERSION_JSON) -> bytes:
+        """
+        지정한 와이어 버전의 전송 바이트 반환 (처음 요청 시 인코딩 후 캐시)
+
+        Args:
+            version: 와이어 포맷 버전
+
+        Returns:
+            헤더 포함 전송 바이트
+        """
+        data = self._frames.get(version)
+        if data is None:
+            data = Protocol.encode_bytes(self.message, version)
+            self._frames[version] = data
+        return data
+
+    def __len__(self) -> int:
+        return len(self.for_version())
+
+
+class FrameTooLargeError(ValueError):
+    """길이 헤더가 허용 최대 프레임 크기를 넘는 경우"""
+
+    def __init__(self, length: int, limit: int):
+        super().__init__(f"프레임 크기 초과: {length} > {limit} bytes")
+        self.length = length
+        self.limit = limit
 
 
 class Protocol:
@@ -23,66 +122,220 @@ class Protocol:
     HEADER_FORMAT = '!I'  # 네트워크 바이트 오더 (빅 엔디안)
 
     @staticmethod
-    def send_message(sock: socket.socket, message: Message) -> bool:
+    def negotiate_version(offered: Optional[Iterable[int]]) -> int:
         """
-        메시지를 소켓으로 전송
-        IP 필드는 평문으로, 나머지는 암호화하여 전송
+        CONNECT 메시지의 wire_versions로 사용할 와이어 버전 결정
+
+        Args:
+            offered: 클라이언트가 지원하는 버전 목록 (구버전 클라이언트는 None)
+
+        Returns:
+            양쪽이 지원하는 가장 높은 버전 (없으면 JSON v2)
+        """
+        try:
+            common = set(offered or ()) & set(SUPPORTED_WIRE_VERSIONS)
+        except TypeError:
+            return WIRE_VERSION_JSON
+        return max(common) if common else WIRE_VERSION_JSON
+
+    @staticmethod
+    def encode_message(message: Message, version: Optional[int] = None) -> EncodedFrame:
+        """
+        메시지를 재사용 가능한 프레임으로 감싸기
+        실제 직렬화는 와이어 버전별로 처음 전송할 때 한 번만 수행
+
+        Args:
+            message: 인코딩할 Message 객체
+            version: 미리 인코딩해 둘 와이어 버전 (선택)
+
+        Returns:
+            EncodedFrame 객체 (여러 소켓에 그대로 재사용 가능)
+        """
+        frame = EncodedFrame(message)
+        if version is not None:
+            frame.for_version(version)
+        return frame
+
+    @staticmethod
+    def encode_bytes(message: Message, version: int = WIRE_VERSION_JSON) -> bytes:
+        """
+        메시지를 헤더 포함 전송 바이트로 직렬화
+
+        Args:
+            message: 인코딩할 Message 객체
+            version: 와이어 포맷 버전
+
+        Returns:
+            4바이트 길이 헤더 + 본문
+        """
+        if version == WIRE_VERSION_BINARY:
+            body = Protocol._encode_v3(message)
+        else:
+            body = Protocol._encode_json(message)
+        return struct.pack(Protocol.HEADER_FORMAT, len(body)) + body
+
+    @staticmethod
+    def _encode_json(message: Message) -> bytes:
+        """v2 본문: IP 필드는 평문, 나머지는 JSON + base64"""
+        # 메시지를 딕셔너리로 변환
+        message_dict = message.to_dict()
+
+        # IP 필드 추출 (평문으로 유지)
+        from_ip = message_dict.pop('from_ip', None)
+        to_ip = message_dict.pop('to_ip', None)
+
+        # 나머지 데이터를 JSON으로 직렬화 후 base64 인코딩
+        encrypted_json = json.dumps(message_dict, ensure_ascii=False)
+        encoded_data = base64.b64encode(encrypted_json.encode(ENCODING)).decode('ascii')
+
+        # 최종 메시지 구조: IP 필드(평문) + 암호화된 데이터
+        final_message = {}
+        if from_ip is not None:
+            final_message['from_ip'] = from_ip
+        if to_ip is not None:
+            final_message['to_ip'] = to_ip
+        final_message['encrypted_data'] = encoded_data
+
+        # JSON으로 직렬화
+        return json.dumps(final_message, ensure_ascii=False).encode(ENCODING)
+
+    @staticmethod
+    def _encode_v3(message: Message) -> bytes:
+        """v3 본문: 고정 바이너리 헤더 + XOR 난독화 JSON (timestamp 생략)"""
+        fields = message.wire_dict()
+
+        type_code = MSG_TYPE_CODES.get(message.type, 0)
+        if type_code == 0:
+            fields['type'] = message.type
+
+        flags = 0
+        from_packed = _pack_ip(fields.get('from_ip'))
+        if from_packed is not None:
+            flags |= V3_FLAG_FROM_IP
+            del fields['from_ip']
+        else:
+            from_packed = _NO_IP
+        to_packed = _pack_ip(fields.get('to_ip'))
+        if to_packed is not None:
+            flags |= V3_FLAG_TO_IP
+            del fields['to_ip']
+        else:
+            to_packed = _NO_IP
+
+        body = json.dumps(fields, ensure_ascii=False, separators=(',', ':')).encode(ENCODING) if fields else b''
+        header = V3_HEADER.pack(WIRE_VERSION_BINARY, type_code, flags, from_packed, to_packed)
+        return header + _obfuscate(body)
+
+    @staticmethod
+    def decode_body(message_bytes: bytes) -> Message:
+        """
+        프레임 본문(길이 헤더 제외)을 Message로 복원
+        첫 바이트로 와이어 버전 판별 ('{'이면 v2 JSON)
+
+        Args:
+            message_bytes: 프레임 본문
+
+        Returns:
+            Message 객체
+        """
+        if message_bytes[:1] == b'{':
+            return Protocol._decode_json(message_bytes)
+        if message_bytes[0] == WIRE_VERSION_BINARY:
+            return Protocol._decode_v3(message_bytes)
+        raise ValueError(f"알 수 없는 와이어 버전: {message_bytes[0]}")
+
+    @staticmethod
+    def _decode_json(message_bytes: bytes) -> Message:
+        """v2 본문 디코딩"""
+        # JSON 역직렬화
+        received_data = json.loads(message_bytes.decode(ENCODING))
+
+        # IP 필드 추출 (평문)
+        from_ip = received_data.get('from_ip')
+        to_ip = received_data.get('to_ip')
+
+        # 암호화된 데이터 디코딩
+        encrypted_data = received_data.get('encrypted_data', '')
+        if encrypted_data:
+            decrypted_json = base64.b64decode(encrypted_data.encode('ascii')).decode(ENCODING)
+            decrypted_data = json.loads(decrypted_json)
+        else:
+            decrypted_data = {}
+
+        # IP 필드를 복원된 데이터에 추가
+        if from_ip is not None:
+            decrypted_data['from_ip'] = from_ip
+        if to_ip is not None:
+            decrypted_data['to_ip'] = to_ip
+
+        # Message 객체 생성 (레지스트리에서 타입별 클래스로 복원)
+        msg_type = decrypted_data.pop('type', 'UNKNOWN')
+        decrypted_data.pop('timestamp', None)
+        return Message.decode(msg_type, decrypted_data)
+
+    @staticmethod
+    def _decode_v3(message_bytes: bytes) -> Message:
+        """v3 본문 디코딩"""
+        _, type_code, flags, from_packed, to_packed = V3_HEADER.unpack_from(message_bytes)
+        body = _obfuscate(bytes(message_bytes[V3_HEADER.size:]))
+        fields = json.loads(body.decode(ENCODING)) if body else {}
+
+        msg_type = MSG_TYPE_BY_CODE.get(type_code) or fields.pop('type', 'UNKNOWN')
+        fields.pop('type', None)
+        if flags & V3_FLAG_FROM_IP:
+            fields['from_ip'] = socket.inet_ntoa(from_packed)
+        if flags & V3_FLAG_TO_IP:
+            fields['to_ip'] = socket.inet_ntoa(to_packed)
+        return Message.decode(msg_type, fields)
+
+    @staticmethod
+    def send_frame(sock: socket.socket, frame: EncodedFrame, version: int = WIRE_VERSION_JSON) -> bool:
+        """
+        미리 인코딩된 프레임 전송
 
         Args:
             sock: 전송할 소켓
-            message: 전송할 Message 객체
+            frame: Protocol.encode_message()로 만든 프레임
+            version: 상대방과 협상된 와이어 버전
 
         Returns:
             성공 여부
         """
         try:
-            # 메시지를 딕셔너리로 변환
-            message_dict = message.to_dict()
-
-            # IP 필드 추출 (평문으로 유지)
-            from_ip = message_dict.get('from_ip')
-            to_ip = message_dict.get('to_ip')
-
-            # IP 필드 제거 후 나머지를 암호화
-            encrypted_data = message_dict.copy()
-            if from_ip is not None:
-                encrypted_data.pop('from_ip', None)
-            if to_ip is not None:
-                encrypted_data.pop('to_ip', None)
-
-            # 나머지 데이터를 JSON으로 직렬화 후 base64 인코딩
-            encrypted_json = json.dumps(encrypted_data, ensure_ascii=False)
-            encoded_data = base64.b64encode(encrypted_json.encode(ENCODING)).decode('ascii')
-
-            # 최종 메시지 구조: IP 필드(평문) + 암호화된 데이터
-            final_message = {}
-            if from_ip is not None:
-                final_message['from_ip'] = from_ip
-            if to_ip is not None:
-                final_message['to_ip'] = to_ip
-            final_message['encrypted_data'] = encoded_data
-
-            # JSON으로 직렬화
-            json_data = json.dumps(final_message, ensure_ascii=False)
-            message_bytes = json_data.encode(ENCODING)
-
-            # 메시지 길이를 헤더로 패킹
-            message_length = len(message_bytes)
-            header = struct.pack(Protocol.HEADER_FORMAT, message_length)
-
-            # 헤더 + 메시지 전송
-            sock.sendall(header + message_bytes)
+            data = frame.for_version(version)
+        except Exception as e:
+            log.warning("메시지 인코딩 실패: %s", e)
+            return False
+        try:
+            sock.sendall(data)
             return True
-
         except Exception as e:
-            print(f"[Protocol] 메시지 전송 실패: {e}")
+            log.warning("프레임 전송 실패: %s", e)
             return False
 
+    @staticmethod
+    def send_message(sock: socket.socket, message: Union[Message, EncodedFrame],
+                     version: int = WIRE_VERSION_JSON) -> bool:
+        """
+        메시지를 소켓으로 전송
+        IP 필드는 평문으로, 나머지는 암호화하여 전송
+
+        Args:
+            sock: 전송할 소켓
+            message: 전송할 Message 객체 또는 미리 인코딩된 EncodedFrame
+            version: 상대방과 협상된 와이어 버전 (기본값: JSON v2)
+
+        Returns:
+            성공 여부
+        """
+        frame = message if isinstance(message, EncodedFrame) else EncodedFrame(message)
+        return Protocol.send_frame(sock, frame, version)
+
     @staticmethod
     def receive_message(sock: socket.socket) -> Optional[Message]:
         """
         소켓에서 메시지를 수신
-        IP 필드는 평문으로, 나머지는 암호화되어 있음
+        v2(JSON)와 v3(바이너리) 본문을 모두 처리
 
         Args:
             sock: 수신할 소켓
@@ -98,49 +351,24 @@ class Protocol:
 
             # 메시지 길이 언패킹
             message_length = struct.unpack(Protocol.HEADER_FORMAT, header_bytes)[0]
+            if message_length > MAX_FRAME_SIZE:
+                raise FrameTooLargeError(message_length, MAX_FRAME_SIZE)
 
             # 메시지 본문 수신
             message_bytes = Protocol._receive_exact(sock, message_length)
             if not message_bytes:
                 return None
 
-            # JSON 역직렬화
-            json_str = message_bytes.decode(ENCODING)
-            received_data = json.loads(json_str)
-
-            # IP 필드 추출 (평문)
-            from_ip = received_data.get('from_ip')
-            to_ip = received_data.get('to_ip')
-
-            # 암호화된 데이터 디코딩
-            encrypted_data = received_data.get('encrypted_data', '')
-            if encrypted_data:
-                decrypted_json = base64.b64decode(encrypted_data.encode('ascii')).decode(ENCODING)
-                decrypted_data = json.loads(decrypted_json)
-            else:
-                decrypted_data = {}
-
-            # IP 필드를 복원된 데이터에 추가
-            if from_ip is not None:
-                decrypted_data['from_ip'] = from_ip
-            if to_ip is not None:
-                decrypted_data['to_ip'] = to_ip
-
-            # Message 객체 생성
-            msg_type = decrypted_data.pop('type', 'UNKNOWN')
-            decrypted_data.pop('timestamp', None)
-            message = Message(msg_type, **decrypted_data)
-
-            return message
+            return Protocol.decode_body(message_bytes)
 
         except Exception as e:
-            print(f"[Protocol] 메시지 수신 실패: {e}")
+            log.info("메시지 수신 실패: %s", e)
             return None
 
     @staticmethod
     def _receive_exact(sock: socket.socket, num_bytes: int) -> Optional[bytes]:
         """
-        정확히 지정된 바이트 수만큼 수신
+        정확히 지정된 바이트 수만큼 수신 (미리 할당한 버퍼에 recv_into)
 
         Args:
             sock: 수신할 소켓
@@ -149,17 +377,19 @@ class Protocol:
         Returns:
             수신한 바이트 또는 None
         """
-        buffer = b''
-        while len(buffer) < num_bytes:
+        buffer = bytearray(num_bytes)
+        view = memoryview(buffer)
+        received = 0
+        while received < num_bytes:
             try:
-                chunk = sock.recv(num_bytes - len(buffer))
-                if not chunk:
+                count = sock.recv_into(view[received:])
+                if not count:
                     return None
-                buffer += chunk
+                received += count
             except Exception as e:
-                print(f"[Protocol] 데이터 수신 중 오류: {e}")
+                log.warning("데이터 수신 중 오류: %s", e)
                 return None
-        return buffer
+        return bytes(buffer)
 
     @staticmethod
     def send_json(sock: socket.socket, data: Dict[str, Any]) -> bool:
@@ -174,10 +404,10 @@ class Protocol:
             성공 여부
         """
         try:
-            message = Message.from_dict(data.copy())
+            message = Message.from_dict(data)
             return Protocol.send_message(sock, message)
         except Exception as e:
-            print(f"[Protocol] JSON 전송 실패: {e}")
+            log.warning("JSON 전송 실패: %s", e)
             return False
 
     @staticmethod
@@ -197,11 +427,146 @@ class Protocol:
         return None
 
 
+class FrameReader:
+    """
+    연결별 버퍼 기반 스트림 디코더
+    재사용 bytearray에 recv_into로 큰 단위로 읽고, 버퍼에 쌓인 완전한 프레임을
+    추가 recv 없이 차례로 꺼낸다. 최대 프레임 크기를 넘는 길이 헤더는 즉시 거부.
+    """
+
+    def __init__(self, sock: socket.socket, max_frame_size: int = MAX_FRAME_SIZE,
+                 chunk_size: int = RECV_CHUNK_SIZE):
+        """
+        Args:
+            sock: 수신할 소켓
+            max_frame_size: 허용하는 최대 프레임 본문 크기 (바이트)
+            chunk_size: 한 번의 recv로 읽을 최대 바이트 수
+        """
+        self.sock = sock
+        self.max_frame_size = max_frame_size
+        self.chunk_size = chunk_size
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # 아직 처리하지 않은 데이터 시작 위치
+        self._end = 0  # 수신한 데이터 끝 위치
+        self.closed = False
+        self.last_frame_size = 0  # 마지막으로 꺼낸 프레임 크기 (길이 헤더 포함, 수신 통계용)
+
+    def _next_buffered(self) -> Optional[bytes]:
+        """버퍼에 완전한 프레임이 있으면 본문을 꺼내 반환 (없으면 None)"""
+        available = self._end - self._start
+        if available < Protocol.HEADER_SIZE:
+            return None
+
+        message_length = struct.unpack_from(Protocol.HEADER_FORMAT, self._buffer, self._start)[0]
+        if message_length > self.max_frame_size:
+            raise FrameTooLargeError(message_length, self.max_frame_size)
+
+        frame_end = self._start + Protocol.HEADER_SIZE + message_length
+        if frame_end > self._end:
+            return None
+
+        body = bytes(self._view[self._start + Protocol.HEADER_SIZE:frame_end])
+        self.last_frame_size = frame_end - self._start
+        self._start = frame_end
+        if self._start == self._end:
+            self._start = self._end = 0
+        return body
+
+    def _fill(self) -> bool:
+        """
+        소켓에서 한 번 읽어 버퍼를 채움
+
+        Returns:
+            데이터를 읽었으면 True, 연결이 닫혔으면 False
+        """
+        pending = self._end - self._start
+        if self._start > 0 and len(self._buffer) - self._end < self.chunk_size:
+            # 남은 데이터를 앞으로 당겨 공간 확보 (크기 변경 없는 슬라이스 대입)
+            self._buffer[0:pending] = bytes(self._view[self._start:self._end])
+            self._start, self._end = 0, pending
+
+        # 진행 중인 프레임이 버퍼보다 크면 (max_frame_size 이내에서) 버퍼 확장
+        needed = self._end + self.chunk_size
+        if pending >= Protocol.HEADER_SIZE:
+            message_length = struct.unpack_from(Protocol.HEADER_FORMAT, self._buffer, self._start)[0]
+            needed = max(needed, self._start + Protocol.HEADER_SIZE + message_length)
+        if needed > len(self._buffer):
+            self._view.release()
+            self._buffer.extend(bytes(needed - len(self._buffer)))
+            self._view = memoryview(self._buffer)
+
+        count = self.sock.recv_into(self._view[self._end:])
+        if not count:
+            self.closed = True
+            return False
+        self._end += count
+        return True
+
+    def feed(self, data: bytes):
+        """
+        소켓에서 읽은 것처럼 버퍼에 데이터 추가
+        (다른 프로세스가 이미 읽은 프레임과 함께 넘겨받은 연결 처리용)
+
+        Args:
+            data: 추가할 바이트 (완전한 프레임이 아니어도 됨)
+        """
+        needed = self._end + len(data)
+        if needed > len(self._buffer):
+            self._view.release()
+            self._buffer.extend(bytes(needed - len(self._buffer)))
+            self._view = memoryview(self._buffer)
+        self._buffer[self._end:needed] = data
+        self._end = needed
+
+    def read_frame(self) -> Optional[bytes]:
+        """
+        다음 프레임 본문 반환 (버퍼에 있으면 recv 없이 반환)
+
+        Returns:
+            프레임 본문 또는 None (연결 종료)
+
+        Raises:
+            FrameTooLargeError: 길이 헤더가 max_frame_size를 넘는 경우
+        """
+        while True:
+            body = self._next_buffered()
+            if body is not None:
+                return body
+            if self.closed or not self._fill():
+                return None
+
+    def frames(self) -> Iterator[bytes]:
+        """연결이 닫힐 때까지 수신한 프레임 본문을 차례로 반환"""
+        while True:
+            body = self.read_frame()
+            if body is None:
+                return
+            yield body
+
+    def receive_message(self) -> Optional[Message]:
+        """
+        다음 메시지 수신 (Protocol.receive_message의 버퍼 기반 버전)
+
+        Returns:
+            수신한 Message 객체 또는 None (연결 종료/오류)
+        """
+        try:
+            body = self.read_frame()
+            if body is None:
+                return None
+            return Protocol.decode_body(body)
+        except Exception as e:
+            log.info("메시지 수신 실패: %s", e)
+            return None
+
+
 class ConnectionManager:
     """연결 관리 유틸리티"""
 
     @staticmethod
-    def create_server_socket(host: str, port: int, backlog: int = 5) -> Optional[socket.socket]:
+    def create_server_socket(host: str, port: int, backlog: int = 5,
+                             reuse_port: bool = False) -> Optional[socket.socket]:
         """
         서버 소켓 생성
 
@@ -209,6 +574,7 @@ class ConnectionManager:
             host: 바인딩할 호스트
             port: 바인딩할 포트
             backlog: 대기 큐 크기
+            reuse_port: SO_REUSEPORT 설정 (여러 프로세스가 같은 포트에 바인딩, 커널이 연결 분산)
 
         Returns:
             생성된 소켓 또는 None
@@ -216,12 +582,15 @@ class ConnectionManager:
         try:
             server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                # Linux 3.9+ (SO_REUSEPORT가 없는 플랫폼에서는 AttributeError -> 생성 실패)
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             server_socket.bind((host, port))
             server_socket.listen(backlog)
-            print(f"[서버] {host}:{port}에서 대기 중...")
+            log.info("서버 소켓 %s:%s에서 대기 중...", host, port)
             return server_socket
         except Exception as e:
-            print(f"[서버] 소켓 생성 실패: {e}")
+            log.warning("서버 소켓 생성 실패: %s", e)
             return None
 
     @staticmethod
@@ -239,10 +608,10 @@ class ConnectionManager:
         try:
             client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             client_socket.connect((host, port))
-            print(f"[클라이언트] {host}:{port}에 연결됨")
+            log.info("서버 %s:%s에 연결됨", host, port)
             return client_socket
         except Exception as e:
-            print(f"[클라이언트] 연결 실패: {e}")
+            log.warning("서버 연결 실패: %s", e)
             return None
 
     @staticmethod
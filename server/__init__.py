@@ -8,5 +8,9 @@ from .player_manager import PlayerManager
 from .dummy_generator import DummyGenerator
 from .noise_generator import NoiseGenerator
 from .decoy_generator import DecoyGenerator
+from .room import Room, RoomManager
+from .game_server import GameServer
+from .sharding import ShardRouter, ShardSupervisor
 
-__all__ = ['GameManager', 'PlayerManager', 'DummyGenerator', 'NoiseGenerator', 'DecoyGenerator']
+__all__ = ['GameManager', 'PlayerManager', 'DummyGenerator', 'NoiseGenerator', 'DecoyGenerator',
+           'Room', 'RoomManager', 'GameServer', 'ShardRouter', 'ShardSupervisor']
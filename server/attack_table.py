@@ -0,0 +1,380 @@
+"""
+공격 수명 주기 테이블 모듈
+승인된 P2P 공격을 정수 ID로 추적하고 상태 전이마다 단조 시각을 기록
+
+상태: REQUESTED → APPROVED → SENT / RECEIVED → COMPLETE 또는 EXPIRED
+- SENT/RECEIVED는 공격자/타겟 확인이 도착한 순서대로 기록되며, 둘 다 오면 COMPLETE
+- 완료/만료된 기록은 테이블에서 빠지고 전이 시각은 지연 히스토그램에 반영
+- sweep(): 라운드/게임 경계에서 남은 기록을 한 번에 만료 (타임아웃 타이머도 취소)
+
+추적: attack_id가 추적 ID (서버 → ATTACK_APPROVED / INCOMING_ATTACK_WARNING → P2P ATTACK → ATTACK_CONFIRM)
+- 클라이언트는 ATTACK_CONFIRM의 trace 필드로 자기 단조 시계로 잰 구간 시간(ms)을 보고 (시계 동기화 불필요)
+- 서버 전이 시각과 합쳐 구간별 지연 히스토그램과 공격별 타임라인(timeline())을 만듦
+- 완료/만료된 기록은 최근 ATTACK_TRACE_SIZE개를 보관 (traces())
+
+스레드 안전하지 않음: GameManager.lock을 잡은 상태에서 호출
+"""
+
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional
+
+from common.constants import ATTACK_TRACE_SIZE
+from server.ip_allocator import int_to_ip
+from server.metrics import LatencyHistogram
+
+
+class AttackState(IntEnum):
+    """공격 상태 (값은 전이 시각 배열의 인덱스)"""
+    REQUESTED = 0
+    APPROVED = 1
+    SENT = 2
+    RECEIVED = 3
+    COMPLETE = 4
+    EXPIRED = 5
+
+
+# 클라이언트가 trace로 보고하는 구간 (ms, 각자의 단조 시계)
+ATTACKER_SPANS = (
+    'dispatch',  # ATTACK_APPROVED 수신 → P2P 연결 시작
+    'connect',   # TCP 연결
+    'send',      # 공격 패킷 전송
+    'total'      # ATTACK_APPROVED 수신 → 전송 확인 전송
+)
+TARGET_SPANS = (
+    'wait',      # INCOMING_ATTACK_WARNING 수신 → 공격 패킷 수신
+    'read'       # P2P 연결 수락 → 공격 패킷 읽기
+)
+FAILURE_STAGES = ('connect', 'send')  # 공격자가 보고하는 실패 단계
+FAILURE_ERRORS = ('timeout', 'refused', 'unreachable', 'error')  # 실패 원인 (지표 레이블이 늘지 않도록 고정)
+MAX_SPAN_MS = 60000.0  # 이보다 큰 보고 값은 버림
+
+
+def _clean_spans(trace, names) -> Dict[str, float]:
+    """클라이언트가 보낸 trace에서 알려진 구간만 골라냄 (0 이상 MAX_SPAN_MS 이하의 숫자)"""
+    spans = {}
+    if not isinstance(trace, dict):
+        return spans
+    for name in names:
+        value = trace.get(name)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= MAX_SPAN_MS:
+            spans[name] = float(value)
+    return spans
+
+
+class AttackRecord:
+    """공격 한 건의 수명 주기 기록"""
+
+    __slots__ = ('attack_id', 'attacker_id', 'target_id', 'attacker_ip_int', 'target_ip_int',
+                 'round_num', 'state', 'stamps', 'timer', 'attacker_spans', 'target_spans', 'failure',
+                 'expired_from')
+
+    def __init__(self, attack_id: int, attacker_id: str, target_id: str,
+                 attacker_ip_int: int, target_ip_int: int, round_num: int, requested_at: float):
+        self.attack_id = attack_id
+        self.attacker_id = attacker_id
+        self.target_id = target_id
+        self.attacker_ip_int = attacker_ip_int  # 가상 IP 정수 (Player.ip_int, 점수 키)
+        self.target_ip_int = target_ip_int
+        self.round_num = round_num
+        self.state = AttackState.REQUESTED
+        self.stamps: List[Optional[float]] = [None] * len(AttackState)  # 상태별 전이 시각 (단조 시계)
+        self.stamps[AttackState.REQUESTED] = requested_at
+        self.timer = None  # 타임아웃 TimerHandle
+        self.attacker_spans: Optional[Dict[str, float]] = None  # 공격자 보고 구간 (ms)
+        self.target_spans: Optional[Dict[str, float]] = None  # 타겟 보고 구간 (ms)
+        self.failure: Optional[dict] = None  # 공격자 실패 보고 (stage, error, elapsed_ms)
+        self.expired_from: Optional[AttackState] = None  # 만료 직전 상태 (어디서 멈췄는지)
+
+    @property
+    def sent(self) -> bool:
+        return self.stamps[AttackState.SENT] is not None
+
+    @property
+    def received(self) -> bool:
+        return self.stamps[AttackState.RECEIVED] is not None
+
+    def elapsed(self, state: AttackState) -> Optional[float]:
+        """요청부터 state 전이까지 걸린 시간 (초, 전이 전이면 None)"""
+        stamp = self.stamps[state]
+        if stamp is None:
+            return None
+        return stamp - self.stamps[AttackState.REQUESTED]
+
+    def timeline(self) -> dict:
+        """
+        공격별 타임라인 (웹 GUI 표시용)
+
+        Returns:
+            서버 전이 시각(요청 기준 ms), 클라이언트 보고 구간(ms), 실패 보고를 담은 딕셔너리
+        """
+        stages = []
+        for state in AttackState:
+            elapsed = self.elapsed(state)
+            if elapsed is not None and state != AttackState.REQUESTED:
+                stages.append({'stage': state.name, 'at_ms': round(elapsed * 1000, 3)})
+        stages.sort(key=lambda stage: stage['at_ms'])
+        timeline = self.to_dict()
+        timeline.update({
+            'stages': stages,
+            'attacker_spans': self.attacker_spans,
+            'target_spans': self.target_spans,
+            'failure': self.failure,
+            'expired_from': self.expired_from.name if self.expired_from is not None else None
+        })
+        return timeline
+
+    def to_dict(self) -> dict:
+        """상태 조회용 딕셔너리"""
+        return {
+            'attack_id': self.attack_id,
+            'from': self.attacker_id,
+            'to': self.target_id,
+            'from_ip': int_to_ip(self.attacker_ip_int),
+            'to_ip': int_to_ip(self.target_ip_int),
+            'round': self.round_num,
+            'state': self.state.name,
+            'attacker_sent': self.sent,
+            'target_received': self.received
+        }
+
+
+class AttackTable:
+    """진행 중인 공격 테이블 (정수 ID → AttackRecord)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            clock: 전이 시각에 쓸 단조 시계
+        """
+        self.clock = clock
+        self.live: Dict[int, AttackRecord] = {}
+        self._next_id = 1  # 0은 "없음"과 구분되도록 사용하지 않음
+
+        # 요청 시각 기준 지연 (P2P 공격 경로)
+        self.latency = {
+            'approve': LatencyHistogram('approve'),    # REQUESTED → APPROVED
+            'sent': LatencyHistogram('sent'),          # REQUESTED → SENT (공격자 확인)
+            'delivery': LatencyHistogram('delivery'),  # REQUESTED → RECEIVED (타겟 수신 확인)
+            'complete': LatencyHistogram('complete'),  # REQUESTED → COMPLETE
+            'approved_to_complete': LatencyHistogram('approved_to_complete'),  # APPROVED → COMPLETE (P2P 전송 + 양쪽 확인)
+            # 클라이언트 보고 구간
+            'attacker_dispatch': LatencyHistogram('attacker_dispatch'),  # 승인 수신 → P2P 연결 시작
+            'attacker_connect': LatencyHistogram('attacker_connect'),    # TCP 연결
+            'attacker_send': LatencyHistogram('attacker_send'),          # 공격 패킷 전송
+            'target_wait': LatencyHistogram('target_wait'),              # 경고 수신 → 공격 패킷 수신
+            'target_read': LatencyHistogram('target_read'),              # 연결 수락 → 공격 패킷 읽기
+            # APPROVED → SENT 중 공격자 안에서 보낸 시간을 뺀 나머지
+            # (서버 송신 큐 + 승인 메시지/확인 메시지 네트워크 왕복 + 클라이언트 수신 루프)
+            'transit': LatencyHistogram('transit')
+        }
+        self.created = 0
+        self.completed = 0
+        self.timed_out = 0
+        self.swept = 0
+        self.expired_from: Dict[str, int] = {}  # 만료 직전 상태별 수 (타임아웃 + 일괄 만료)
+        self.failures: Dict[tuple, int] = {}  # (실패 단계, 원인)별 공격자 실패 보고 수
+        self.recent = deque(maxlen=ATTACK_TRACE_SIZE)  # 완료/만료된 기록 (타임라인 조회용)
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def parse_id(self, attack_id) -> Optional[int]:
+        """
+        메시지로 받은 attack_id를 정수로 변환
+
+        Returns:
+            정수 ID (형식이 맞지 않으면 None)
+        """
+        if isinstance(attack_id, int):
+            return attack_id
+        try:
+            return int(attack_id)
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, attack_id) -> Optional[AttackRecord]:
+        """진행 중인 공격 조회 (정수 또는 숫자 문자열 ID)"""
+        key = self.parse_id(attack_id)
+        return self.live.get(key) if key is not None else None
+
+    def create(self, attacker_id: str, target_id: str, attacker_ip_int: int, target_ip_int: int,
+               round_num: int, requested_at: Optional[float] = None) -> AttackRecord:
+        """
+        공격 기록 생성 (REQUESTED)
+
+        Args:
+            attacker_id: 공격자 ID
+            target_id: 타겟 ID
+            attacker_ip_int: 공격자 가상 IP (정수, Player.ip_int)
+            target_ip_int: 타겟 가상 IP (정수)
+            round_num: 라운드 번호
+            requested_at: 요청 도착 시각 (None이면 지금)
+
+        Returns:
+            AttackRecord
+        """
+        attack_id = self._next_id
+        self._next_id += 1
+        record = AttackRecord(attack_id, attacker_id, target_id, attacker_ip_int, target_ip_int, round_num,
+                              self.clock() if requested_at is None else requested_at)
+        self.live[attack_id] = record
+        self.created += 1
+        return record
+
+    def _stamp(self, record: AttackRecord, state: AttackState):
+        record.state = state
+        record.stamps[state] = self.clock()
+
+    def approve(self, record: AttackRecord):
+        """승인 (APPROVED)"""
+        self._stamp(record, AttackState.APPROVED)
+        self.latency['approve'].observe(record.elapsed(AttackState.APPROVED))
+
+    def mark_sent(self, record: AttackRecord, trace: Optional[dict] = None) -> bool:
+        """
+        공격자 전송 확인 (SENT)
+
+        Args:
+            record: 공격 기록
+            trace: 공격자가 보고한 구간 시간 (ms, ATTACKER_SPANS)
+
+        Returns:
+            양방향 확인이 모두 끝났는지 여부
+        """
+        if not record.sent:
+            self._stamp(record, AttackState.SENT)
+            self.latency['sent'].observe(record.elapsed(AttackState.SENT))
+            spans = _clean_spans(trace, ATTACKER_SPANS)
+            if spans:
+                record.attacker_spans = spans
+                for name in ('dispatch', 'connect', 'send'):
+                    if name in spans:
+                        self.latency[f'attacker_{name}'].observe(spans[name] / 1000)
+                approved_at = record.stamps[AttackState.APPROVED]
+                if 'total' in spans and approved_at is not None:
+                    transit = record.stamps[AttackState.SENT] - approved_at - spans['total'] / 1000
+                    self.latency['transit'].observe(max(0.0, transit))
+        return record.received
+
+    def mark_received(self, record: AttackRecord, trace: Optional[dict] = None) -> bool:
+        """
+        타겟 수신 확인 (RECEIVED)
+
+        Args:
+            record: 공격 기록
+            trace: 타겟이 보고한 구간 시간 (ms, TARGET_SPANS)
+
+        Returns:
+            양방향 확인이 모두 끝났는지 여부
+        """
+        if not record.received:
+            self._stamp(record, AttackState.RECEIVED)
+            self.latency['delivery'].observe(record.elapsed(AttackState.RECEIVED))
+            spans = _clean_spans(trace, TARGET_SPANS)
+            if spans:
+                record.target_spans = spans
+                for name, value in spans.items():
+                    self.latency[f'target_{name}'].observe(value / 1000)
+        return record.sent
+
+    def mark_failed(self, record: AttackRecord, trace: Optional[dict] = None):
+        """
+        공격자 전송 실패 보고 기록 (상태는 바꾸지 않음, 호출자가 expire)
+
+        Args:
+            record: 공격 기록
+            trace: 실패 단계(stage), 원인(error), 구간 시간(ms)
+        """
+        trace = trace if isinstance(trace, dict) else {}
+        stage = trace.get('stage') if trace.get('stage') in FAILURE_STAGES else 'unknown'
+        error = trace.get('error') if trace.get('error') in FAILURE_ERRORS else 'error'
+        record.failure = {'stage': stage, 'error': error}
+        spans = _clean_spans(trace, ATTACKER_SPANS)
+        if spans:
+            record.attacker_spans = spans
+        key = (stage, error)
+        self.failures[key] = self.failures.get(key, 0) + 1
+
+    def complete(self, record: AttackRecord):
+        """완료 (COMPLETE): 타이머 취소 후 테이블에서 제거"""
+        self._stamp(record, AttackState.COMPLETE)
+        self.latency['complete'].observe(record.elapsed(AttackState.COMPLETE))
+        approved_at = record.stamps[AttackState.APPROVED]
+        if approved_at is not None:
+            self.latency['approved_to_complete'].observe(record.stamps[AttackState.COMPLETE] - approved_at)
+        self._remove(record)
+        self.completed += 1
+
+    def expire(self, record: AttackRecord):
+        """타임아웃/실패 보고 만료 (EXPIRED): 테이블에서 제거 (timed_out에는 실패 보고가 없는 기록만 셈)"""
+        self._mark_expired(record)
+        self._stamp(record, AttackState.EXPIRED)
+        self._remove(record)
+        if record.failure is None:  # 실패 보고로 만료된 기록은 failures에서 이미 셈
+            self.timed_out += 1
+
+    def _mark_expired(self, record: AttackRecord):
+        """만료 직전 상태 기록 (SENT/RECEIVED 중 하나만 왔으면 그 상태)"""
+        record.expired_from = record.state
+        name = record.state.name
+        self.expired_from[name] = self.expired_from.get(name, 0) + 1
+
+    def sweep(self) -> List[AttackRecord]:
+        """
+        남은 공격을 모두 만료 (라운드/게임 경계)
+
+        Returns:
+            만료된 기록 목록
+        """
+        if not self.live:
+            return []
+        now = self.clock()
+        records = list(self.live.values())
+        for record in records:
+            self._mark_expired(record)
+            self.recent.append(record)
+            record.state = AttackState.EXPIRED
+            record.stamps[AttackState.EXPIRED] = now
+            if record.timer:
+                record.timer.cancel()
+                record.timer = None
+        self.live.clear()
+        self.swept += len(records)
+        return records
+
+    def _remove(self, record: AttackRecord):
+        if record.timer:
+            record.timer.cancel()
+            record.timer = None
+        self.live.pop(record.attack_id, None)
+        self.recent.append(record)
+
+    def traces(self, limit: int = ATTACK_TRACE_SIZE) -> List[dict]:
+        """
+        최근 공격 타임라인 (진행 중인 공격 먼저, 이후 완료/만료 순서의 역순)
+
+        Args:
+            limit: 최대 개수
+        """
+        records = sorted(self.live.values(), key=lambda record: record.attack_id, reverse=True)
+        records.extend(reversed(self.recent))
+        return [record.timeline() for record in records[:limit]]
+
+    def stats(self) -> dict:
+        """진행 중 공격 수, 상태별 수, 누적 수, 지연 히스토그램 요약"""
+        by_state = {}
+        for record in self.live.values():
+            by_state[record.state.name] = by_state.get(record.state.name, 0) + 1
+        return {
+            'live': len(self.live),
+            'by_state': by_state,
+            'created': self.created,
+            'completed': self.completed,
+            'timed_out': self.timed_out,
+            'swept': self.swept,
+            'expired_from': dict(self.expired_from),
+            'failures': {f'{stage}/{error}': count for (stage, error), count in self.failures.items()},
+            'latency': {name: histogram.to_dict() for name, histogram in self.latency.items()}
+        }
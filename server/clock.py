@@ -0,0 +1,139 @@
+"""
+게임 시계 모듈
+GameManager/트래픽 생성기가 time.sleep 대신 사용하는 주입 가능한 시계
+
+- wait(event, timeout): timeout초 동안 기다리되 event가 설정되면 바로 깨어남 (중지 요청 즉시 반영)
+- MonotonicClock: 실제 시간 (운영 기본값)
+- VirtualClock: 가상 시간. 시계를 쓰는 모든 스레드가 wait 중이면 가장 이른 마감 시각으로
+  바로 건너뛰므로, 생성기를 포함한 게임 한 판이 실제로는 수 ms 만에 끝남 (테스트/벤치마크용)
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+
+class MonotonicClock:
+    """실제 단조 시계"""
+
+    name = "monotonic"
+
+    def now(self) -> float:
+        """현재 시각 (초, 단조 증가)"""
+        return time.monotonic()
+
+    def wall(self) -> float:
+        """현재 벽시계 시각 (time.time 기준)"""
+        return time.time()
+
+    def wait(self, event: threading.Event, timeout: Optional[float]) -> bool:
+        """
+        timeout초 대기 (event가 설정되면 즉시 반환, timeout이 None이면 event까지 무기한)
+
+        Returns:
+            event가 설정되어 깨어났는지 여부
+        """
+        return event.wait(None if timeout is None else max(0.0, timeout))
+
+    def attach(self, thread: threading.Thread):
+        """시계를 쓸 스레드 등록 (실제 시계에서는 할 일 없음)"""
+        pass
+
+
+class VirtualClock:
+    """
+    가상 시계 (이산 사건 방식)
+
+    wait()를 한 번이라도 호출했거나 attach()로 등록한 살아 있는 스레드를 참여자로 본다. 참여자가 모두 wait 중이면
+    가장 이른 마감 시각으로 시간을 건너뛰고, 하나라도 작업 중이면 기다린다.
+    wait()를 호출하지 않는 스레드(메시지 처리 등)의 작업은 가상 시간 0으로 취급한다.
+    참여자가 하나만 남으면 그 스레드는 바로바로 깨어나므로, 끝없이 도는 생성기는 다 쓴 뒤 중지해야 한다.
+    """
+
+    name = "virtual"
+
+    # event.set()은 조건 변수를 깨우지 않으므로 이 간격(실제 초)마다 다시 확인
+    POLL_INTERVAL = 0.005
+
+    def __init__(self, start: float = 0.0, wall_start: float = 1_700_000_000.0):
+        """
+        Args:
+            start: 시작 시각 (가상 초)
+            wall_start: start에 대응하는 벽시계 시각
+        """
+        self._now = start
+        self._wall_offset = wall_start - start
+        self._cond = threading.Condition()
+        self._participants: Dict[int, threading.Thread] = {}
+        self._waiting: Dict[int, float] = {}  # 스레드 ID → 마감 시각
+        self.advances = 0  # 시간을 건너뛴 횟수
+
+    def now(self) -> float:
+        return self._now
+
+    def wall(self) -> float:
+        return self._now + self._wall_offset
+
+    def advance(self, seconds: float):
+        """시간을 직접 진행 (참여자와 무관하게)"""
+        with self._cond:
+            self._now += seconds
+            self._cond.notify_all()
+
+    def attach(self, thread: threading.Thread):
+        """
+        시작한 스레드를 참여자로 미리 등록 (첫 wait 전에 시간이 건너뛰지 않도록)
+
+        Args:
+            thread: start()가 끝난 스레드
+        """
+        with self._cond:
+            self._participants[thread.ident] = thread
+
+    def wait(self, event: threading.Event, timeout: Optional[float]) -> bool:
+        """
+        가상 시간으로 timeout초 대기 (event가 설정되면 즉시 반환, timeout이 None이면 event까지 무기한)
+
+        Returns:
+            event가 설정되어 깨어났는지 여부
+        """
+        current = threading.current_thread()
+        ident = current.ident
+        with self._cond:
+            self._participants[ident] = current
+            deadline = math.inf if timeout is None else self._now + max(0.0, timeout)
+            self._waiting[ident] = deadline
+            try:
+                while True:
+                    if event.is_set():
+                        return True
+                    if self._now >= deadline:
+                        return False
+                    if self._all_waiting():
+                        earliest = min(self._waiting.values())
+                        if self._now < earliest < math.inf:  # 무기한 대기만 남으면 건너뛰지 않음
+                            self._now = earliest
+                            self.advances += 1
+                            self._cond.notify_all()
+                            continue
+                    self._cond.wait(self.POLL_INTERVAL)
+            finally:
+                del self._waiting[ident]
+                self._cond.notify_all()
+
+    def _all_waiting(self) -> bool:
+        """살아 있는 참여자가 모두 wait 중인지 (종료된 스레드는 참여자에서 제거)"""
+        for ident, thread in list(self._participants.items()):
+            if not thread.is_alive():
+                del self._participants[ident]
+                self._waiting.pop(ident, None)
+        return len(self._waiting) == len(self._participants)
+
+
+_default_clock = MonotonicClock()
+
+
+def get_default_clock() -> MonotonicClock:
+    """운영 기본 시계 (실제 단조 시계)"""
+    return _default_clock
@@ -0,0 +1,465 @@
+"""
+연결별 송신 큐 모듈
+플레이어마다 제한된 크기의 송신 큐와 전용 writer 스레드를 두어
+느린 클라이언트 하나가 게임 루프나 생성기 스레드를 막지 않도록 함
+(asyncio 엔진은 같은 큐 규칙에 이벤트 루프 태스크로 전송하는 AsyncConnectionWriter 사용)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Union
+
+from common.constants import (
+    OUTBOUND_QUEUE_SIZE, WIRE_VERSION_JSON,
+    MSG_TYPE_SCORE, MSG_TYPE_ROUND_END, MSG_TYPE_GAME_END,
+    MSG_TYPE_ATTACK_APPROVED, MSG_TYPE_INCOMING_ATTACK_WARNING,
+    MSG_TYPE_DUMMY, MSG_TYPE_NOISE
+)
+from common.message_types import Message
+from common.protocol import EncodedFrame, ConnectionManager
+from server.telemetry import FRAMES_SENT, BYTES_SENT, SEND_LATENCY
+
+
+# 우선 전송 레인: 점수/라운드 결과/공격 승인 등 지연되면 안 되는 제어 메시지
+PRIORITY_TYPES = frozenset({
+    MSG_TYPE_SCORE, MSG_TYPE_ROUND_END, MSG_TYPE_GAME_END,
+    MSG_TYPE_ATTACK_APPROVED, MSG_TYPE_INCOMING_ATTACK_WARNING
+})
+
+# 큐가 가득 차면 버려도 되는 배경 트래픽
+DROPPABLE_TYPES = frozenset({MSG_TYPE_DUMMY, MSG_TYPE_NOISE})
+
+# start(first)로 큐보다 먼저 보내는 바이트의 통계용 타입 (WELCOME)
+FIRST_FRAME_TYPE = "INFO"
+
+
+class ConnectionWriter:
+    """
+    플레이어별 송신 큐 + writer 스레드
+
+    레인 구성:
+    - priority: PRIORITY_TYPES (가장 먼저 전송)
+    - normal: 그 외 메시지
+    - bulk: DROPPABLE_TYPES (큐가 가득 차면 새 프레임을 버림)
+
+    큐 전체 크기는 max_queue로 제한된다. 제어 메시지가 들어올 자리가 없으면
+    bulk 레인의 가장 오래된 프레임을 버리고, 그래도 없으면 연결이 멈춘 것으로 보고 종료한다.
+    레인에는 (프레임, 큐에 넣은 시각)을 넣어 소켓에 다 쓴 시점에 송신 지연을 기록한다.
+    """
+
+    def __init__(self, sock, player_id: str, wire_version: int = WIRE_VERSION_JSON,
+                 max_queue: int = OUTBOUND_QUEUE_SIZE,
+                 on_error: Optional[Callable[[str, Exception], None]] = None):
+        """
+        Args:
+            sock: 플레이어 소켓
+            player_id: 플레이어 ID (로그/통계용)
+            wire_version: 협상된 와이어 포맷 버전
+            max_queue: 송신 큐 최대 프레임 수
+            on_error: 전송 실패/큐 초과 시 호출되는 콜백 (player_id, 예외)
+        """
+        self.sock = sock
+        self.player_id = player_id
+        self.wire_version = wire_version
+        self.max_queue = max_queue
+        self.on_error = on_error
+
+        self._priority = deque()  # (EncodedFrame, 큐에 넣은 시각)
+        self._normal = deque()
+        self._bulk = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._first: Optional[bytes] = None
+        self._started = False
+        self.running = False
+        self.thread = None
+
+        # 통계
+        self.sent_frames = 0
+        self.sent_bytes = 0
+        self.dropped: Dict[str, int] = {}  # {메시지 타입: 버린 프레임 수}
+        self.max_depth = 0
+
+    def start(self, first: Optional[bytes] = None):
+        """
+        writer 스레드 시작
+
+        Args:
+            first: 큐에 쌓인 프레임보다 먼저 보낼 인코딩된 바이트
+                   (예: 와이어 버전 협상 전 포맷으로 보내야 하는 WELCOME)
+        """
+        if self.running:
+            return
+        self._first = first
+        self._started = True
+        self.running = True
+        self.thread = threading.Thread(target=self._write_loop, daemon=True,
+                                       name=f"writer-{self.player_id}")
+        self.thread.start()
+
+    def send(self, message: Union[Message, EncodedFrame]) -> bool:
+        """
+        송신 큐에 프레임 추가 (블로킹 없음)
+
+        Args:
+            message: Message 또는 EncodedFrame
+
+        Returns:
+            큐에 들어갔으면 True, 버려졌거나 연결이 닫혔으면 False
+        """
+        frame = message if isinstance(message, EncodedFrame) else EncodedFrame(message)
+        msg_type = frame.type
+        entry = (frame, time.perf_counter())
+        overflow = False
+
+        with self._cond:
+            if not self.running and self._started:
+                return False
+
+            depth = len(self._priority) + len(self._normal) + len(self._bulk)
+            if msg_type in DROPPABLE_TYPES:
+                if depth >= self.max_queue:
+                    self.dropped[msg_type] = self.dropped.get(msg_type, 0) + 1
+                    return False
+                self._bulk.append(entry)
+            else:
+                if depth >= self.max_queue and self._bulk:
+                    # 제어 메시지 자리를 위해 가장 오래된 배경 트래픽을 버림
+                    evicted, _ = self._bulk.popleft()
+                    self.dropped[evicted.type] = self.dropped.get(evicted.type, 0) + 1
+                    depth -= 1
+                if depth >= self.max_queue:
+                    overflow = True
+                    self.dropped[msg_type] = self.dropped.get(msg_type, 0) + 1
+                elif msg_type in PRIORITY_TYPES:
+                    self._priority.append(entry)
+                else:
+                    self._normal.append(entry)
+
+            if not overflow:
+                depth += 1
+                if depth > self.max_depth:
+                    self.max_depth = depth
+                self._wake_locked()
+
+        if overflow:
+            self._fail(OverflowError(f"송신 큐 초과 ({self.max_queue}개), 연결 종료"))
+            return False
+        return True
+
+    def _wake_locked(self):
+        """송신 측 깨우기 (self._cond를 잡은 상태에서 호출)"""
+        self._cond.notify()
+
+    def _pop_locked(self) -> Optional[tuple]:
+        """우선순위 순으로 (프레임, 큐에 넣은 시각) 하나 꺼내기 (self._cond를 잡은 상태에서 호출), 비었으면 None"""
+        if self._priority:
+            return self._priority.popleft()
+        if self._normal:
+            return self._normal.popleft()
+        if self._bulk:
+            return self._bulk.popleft()
+        return None
+
+    def _next_frame(self) -> Optional[tuple]:
+        """다음 전송 (프레임, 큐에 넣은 시각) (우선순위 순), 종료 시 None"""
+        with self._cond:
+            while self.running:
+                entry = self._pop_locked()
+                if entry is not None:
+                    return entry
+                self._cond.wait()
+            return None
+
+    def _record_sent(self, msg_type: str, size: int, enqueued_at: Optional[float]):
+        """전송 통계 (writer 스레드/송신 태스크에서만 호출)"""
+        self.sent_frames += 1
+        self.sent_bytes += size
+        FRAMES_SENT.inc(msg_type)
+        BYTES_SENT.inc(msg_type, amount=size)
+        if enqueued_at is not None:
+            SEND_LATENCY.observe(time.perf_counter() - enqueued_at, self.player_id)
+
+    def _write_loop(self):
+        """송신 루프 (이 스레드만 소켓에 쓰므로 프레임이 섞이지 않음)"""
+        if self._first is not None:
+            first, self._first = self._first, None
+            try:
+                self.sock.sendall(first)
+                self._record_sent(FIRST_FRAME_TYPE, len(first), None)
+            except Exception as e:
+                self._fail(e)
+                return
+
+        while True:
+            entry = self._next_frame()
+            if entry is None:
+                break
+            frame, enqueued_at = entry
+            try:
+                data = frame.for_version(self.wire_version)
+                self.sock.sendall(data)
+                self._record_sent(frame.type, len(data), enqueued_at)
+            except Exception as e:
+                self._fail(e)
+                break
+
+    def _fail(self, error: Exception):
+        """전송 불가 상태 처리: 큐를 비우고 소켓을 닫아 수신 스레드가 정리하도록 함"""
+        with self._cond:
+            was_running = self.running
+            self.running = False
+            self._priority.clear()
+            self._normal.clear()
+            self._bulk.clear()
+            self._wake_locked()
+        if not was_running:
+            return
+        self._abort_connection()
+        if self.on_error:
+            self.on_error(self.player_id, error)
+
+    def _abort_connection(self):
+        """연결 강제 종료 (수신 측이 연결 끊김을 감지하고 플레이어를 정리하도록 함)"""
+        try:
+            # shutdown으로 수신 스레드의 recv도 깨움
+            ConnectionManager.close_socket(self.sock)
+        except Exception:
+            pass
+
+    def close(self):
+        """writer 중지 (남은 프레임은 버림)"""
+        with self._cond:
+            self.running = False
+            self._priority.clear()
+            self._normal.clear()
+            self._bulk.clear()
+            self._wake_locked()
+
+    def reject(self, data: bytes):
+        """
+        시작하지 않은 writer를 닫고 인코딩된 프레임 하나만 바로 전송 (접속 거절 응답용)
+
+        호출한 쪽이 이어서 소켓을 닫으므로 이 프레임이 마지막으로 전송된다.
+
+        Args:
+            data: 보낼 인코딩된 바이트 (예: JSON v2 ERROR INFO)
+        """
+        self.close()
+        try:
+            self.sock.sendall(data)
+            self._record_sent(FIRST_FRAME_TYPE, len(data), None)
+        except Exception:
+            pass
+
+    def queue_depth(self) -> int:
+        """현재 송신 큐에 쌓인 프레임 수"""
+        with self._cond:
+            return len(self._priority) + len(self._normal) + len(self._bulk)
+
+    def stats(self) -> dict:
+        """송신 큐 통계"""
+        with self._cond:
+            return {
+                'queue_depth': len(self._priority) + len(self._normal) + len(self._bulk),
+                'priority_depth': len(self._priority),
+                'bulk_depth': len(self._bulk),
+                'max_depth': self.max_depth,
+                'sent_frames': self.sent_frames,
+                'sent_bytes': self.sent_bytes,
+                'dropped': sum(self.dropped.values()),
+                'dropped_by_type': dict(self.dropped)
+            }
+
+
+class LoopWaker:
+    """
+    여러 송신 큐의 깨우기 요청을 모아 이벤트 루프에 한 번만 예약
+
+    브로드캐스트는 같은 순간 모든 플레이어 큐를 깨우므로, 큐마다 call_soon_threadsafe를
+    부르면 수신자 수만큼 루프 self-pipe 쓰기가 발생한다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Args:
+            loop: 송신 태스크가 실행되는 이벤트 루프
+        """
+        self.loop = loop
+        self._lock = threading.Lock()
+        self._pending = []
+        self._scheduled = False
+
+    def wake(self, event: asyncio.Event):
+        """이벤트 set 예약 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            self._pending.append(event)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨
+            pass
+
+    def _flush(self):
+        """예약된 이벤트를 한꺼번에 set (루프 스레드)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._scheduled = False
+        for event in pending:
+            event.set()
+
+
+class AsyncConnectionWriter(ConnectionWriter):
+    """
+    asyncio 엔진용 송신 큐
+
+    레인 구성과 드롭/초과 규칙은 ConnectionWriter와 같고, send()는 여전히 어느 스레드에서든
+    호출할 수 있다 (게임 스레드, 생성기 스레드 등). 실제 전송은 이벤트 루프의 태스크가
+    StreamWriter로 수행하므로 연결마다 스레드를 만들지 않는다.
+    """
+
+    # 한 번의 drain() 전에 몰아서 쓰는 최대 프레임 수
+    BATCH_SIZE = 64
+
+    def __init__(self, stream: asyncio.StreamWriter, waker: LoopWaker,
+                 player_id: str, wire_version: int = WIRE_VERSION_JSON,
+                 max_queue: int = OUTBOUND_QUEUE_SIZE,
+                 on_error: Optional[Callable[[str, Exception], None]] = None):
+        """
+        Args:
+            stream: 클라이언트 연결의 StreamWriter
+            waker: 연결이 속한 이벤트 루프의 LoopWaker (엔진 전체에서 공유)
+            player_id: 플레이어 ID (로그/통계용)
+            wire_version: 협상된 와이어 포맷 버전
+            max_queue: 송신 큐 최대 프레임 수
+            on_error: 전송 실패/큐 초과 시 호출되는 콜백 (player_id, 예외)
+        """
+        super().__init__(stream.get_extra_info('socket'), player_id, wire_version, max_queue, on_error)
+        self.stream = stream
+        self.waker = waker
+        self.loop = waker.loop
+        # 송신 태스크를 만들 때 루프에서 생성 (Python 3.9의 asyncio.Event는 만든 스레드의 루프에 묶임)
+        self._event: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def _on_loop(self) -> bool:
+        """이벤트 루프 스레드에서 호출되었는지 여부"""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def start(self, first: Optional[bytes] = None):
+        """
+        송신 태스크 시작 (어느 스레드에서든 호출 가능, 태스크는 이벤트 루프에서 생성)
+
+        루프 밖에서 호출하면 생성을 루프에 예약하며, 예약은 순서대로 실행되므로
+        호출 측이 루프로 돌아왔을 때는 task가 이미 있다.
+
+        Args:
+            first: 큐에 쌓인 프레임보다 먼저 보낼 인코딩된 바이트
+        """
+        if self.running:
+            return
+        self._first = first
+        self._started = True
+        self.running = True
+        if self._on_loop():
+            self._start_task()
+        else:
+            try:
+                self.loop.call_soon_threadsafe(self._start_task)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨
+                self.running = False
+
+    def _start_task(self):
+        """송신 태스크 생성 (이벤트 루프 스레드)"""
+        with self._cond:
+            self._event = asyncio.Event()
+        self.task = self.loop.create_task(self._write_loop())
+
+    def _wake_locked(self):
+        """이벤트 루프의 송신 태스크 깨우기 (다른 스레드에서도 안전)"""
+        # 태스크 시작 전에 쌓인 프레임은 태스크가 처음 큐를 확인할 때 보냄
+        if self._event is not None:
+            self.waker.wake(self._event)
+
+    def _take_batch(self) -> Optional[list]:
+        """우선순위 순으로 최대 BATCH_SIZE개 꺼내기, 종료 시 None"""
+        with self._cond:
+            if not self.running:
+                return None
+            batch = []
+            while len(batch) < self.BATCH_SIZE:
+                entry = self._pop_locked()
+                if entry is None:
+                    break
+                batch.append(entry)
+            return batch
+
+    async def _write_loop(self):
+        """송신 태스크 (이 태스크만 StreamWriter에 쓰므로 프레임이 섞이지 않음)"""
+        stream = self.stream
+        try:
+            if self._first is not None:
+                first, self._first = self._first, None
+                stream.write(first)
+                await stream.drain()
+                self._record_sent(FIRST_FRAME_TYPE, len(first), None)
+
+            while True:
+                batch = self._take_batch()
+                if batch is None:
+                    break
+                if not batch:
+                    # clear 이후 들어온 프레임의 set은 루프에 예약되므로 깨우기를 놓치지 않음
+                    self._event.clear()
+                    if self.queue_depth() == 0 and self.running:
+                        await self._event.wait()
+                    continue
+                sizes = []
+                for frame, _ in batch:
+                    data = frame.for_version(self.wire_version)
+                    stream.write(data)
+                    sizes.append(len(data))
+                await stream.drain()
+                # 송신 지연은 묶음 전체를 drain한 시점 기준
+                for (frame, enqueued_at), size in zip(batch, sizes):
+                    self._record_sent(frame.type, size, enqueued_at)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+    def reject(self, data: bytes):
+        """
+        시작하지 않은 writer를 닫고 인코딩된 프레임 하나만 전송 (접속 거절 응답용)
+
+        StreamWriter 버퍼에 넣은 바이트는 연결을 닫을 때 먼저 전송된다.
+        이벤트 루프 밖에서 호출하면 루프에 예약하며, 예약은 순서대로 실행되므로
+        이후 루프에서 닫는 것보다 먼저 들어간다.
+
+        Args:
+            data: 보낼 인코딩된 바이트 (예: JSON v2 ERROR INFO)
+        """
+        self.close()
+        try:
+            if self._on_loop():
+                self.stream.write(data)
+            else:
+                self.loop.call_soon_threadsafe(self.stream.write, data)
+            self._record_sent(FIRST_FRAME_TYPE, len(data), None)
+        except Exception:
+            pass
+
+    def _abort_connection(self):
+        """트랜스포트 종료 (수신 코루틴이 EOF를 받고 플레이어를 정리)"""
+        try:
+            self.loop.call_soon_threadsafe(self.stream.transport.abort)
+        except RuntimeError:
+            pass
@@ -4,30 +4,39 @@ R5에서만 작동하며, 서버가 생성한 가짜 공격 패킷을 플레이
 실제 공격과 구분하기 어렵게 만들어 난이도 증가
 """
 
-import threading
-import time
 import random
-import string
-from typing import Callable, List
-from common.message_types import Message
-from common.constants import MSG_TYPE_DECOY_ATTACK
+from typing import Callable, List, Optional
+from common.message_types import DecoyAttackMessage
+from server.traffic_scheduler import get_traffic_scheduler
+from server.frame_pool import FramePool, build_pair_frames, take_pair_frame, random_suffixes
+from server.traffic_profiles import TokenBucket
+from server.telemetry import GENERATOR_FRAMES
+from common.log import get_logger
+
+log = get_logger(__name__, "DecoyGenerator")
 
 
 class DecoyGenerator:
     """가짜 공격 생성기"""
 
-    def __init__(self, player_manager, send_to_player_callback: Callable):
+    def __init__(self, player_manager, send_to_player_callback: Callable, scheduler=None):
         """
         Args:
             player_manager: PlayerManager 인스턴스
             send_to_player_callback: 특정 플레이어에게 메시지 전송하는 콜백 (player, message)
+            scheduler: 전송 시각을 관리할 TrafficScheduler (None이면 프로세스 공용 스케줄러)
         """
         self.player_manager = player_manager
         self.send_to_player_callback = send_to_player_callback
         self.running = False
-        self.thread = None
+        self.scheduler = scheduler or get_traffic_scheduler()
+        self.entry = None  # 스케줄러 등록 항목 (stop() 시 취소)
+        self.pool = FramePool(self._build_frames)  # 미리 직렬화한 (프레임, 송신자, 수신자)
         self.decoy_count = 10  # 라운드당 가짜 공격 개수
         self.round_duration = 90  # 라운드 지속 시간 (초)
+        self.sent = 0  # 이번 라운드에 보낸 가짜 공격 수
+        self.pacer = None  # 트래픽 프로필의 토큰 버킷 (None이면 라운드 시간에 균등 분산)
+        self.log_packets = True
 
     def start(self, round_duration: int = 90, decoy_count: int = 10):
         """
@@ -42,95 +51,137 @@ class DecoyGenerator:
 
         self.round_duration = round_duration
         self.decoy_count = decoy_count
+        self.sent = 0
         self.running = True
-        self.thread = threading.Thread(target=self._generate_loop, daemon=True)
-        self.thread.start()
-        print(f"[DecoyGenerator] 가짜 공격 생성 시작 ({decoy_count}개, {round_duration}초 동안)")
+        if self.pacer:
+            self.pacer.reset()
+        self.entry = self.scheduler.add(self)
+        log.info("가짜 공격 생성 시작 (%s개, %s초 동안)", decoy_count, round_duration)
 
     def stop(self):
         """가짜 공격 생성 중지"""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=3)
-        print("[DecoyGenerator] 가짜 공격 생성 중지")
-
-    def _generate_loop(self):
+        # 스케줄러에서 빼기만 하면 되므로 스레드를 기다리지 않고 바로 반환
+        if self.entry:
+            self.entry.cancel()
+            self.entry = None
+        if self.pacer:
+            self.pacer.finish()
+        log.info("가짜 공격 생성 중지")
+
+    def next_delay(self):
         """
-        가짜 공격 생성 루프
-        라운드 시간 동안 균등하게 분산하여 가짜 공격 전송
+        다음 가짜 공격까지 대기 시간
+        라운드 시간 동안 균등하게 분산 (간격 ±20% 지터, 최소 1초)
+        전송률이 설정되어 있으면 토큰 버킷 간격
+
+        Returns:
+            대기 시간 (초), 이번 라운드 개수를 다 보냈으면 None
         """
+        if self.sent >= self.decoy_count:
+            return None
+        if self.pacer:
+            return self.pacer.next_delay()
+        interval = self.round_duration / self.decoy_count
+        jitter = random.uniform(-0.2, 0.2) * interval
+        return max(1.0, interval + jitter)
+
+    def emit(self):
+        """가짜 공격 한 개 전송 (스케줄러 스레드에서 호출)"""
+        self.sent += 1
         try:
-            # 가짜 공격을 라운드 시간 동안 균등하게 분산
-            interval = self.round_duration / self.decoy_count if self.decoy_count > 0 else 10
+            self._send_decoy_attack()
+        except Exception as e:
+            log.error("가짜 공격 생성 중 오류: %s", e)
 
-            for i in range(self.decoy_count):
-                if not self.running:
-                    break
+    def refill(self, count: int, versions) -> int:
+        """
+        가짜 공격 프레임 풀 채우기 (PREPARATION/ROUND_END 단계에서 호출)
 
-                # 랜덤 지터 추가 (±20%)
-                jitter = random.uniform(-0.2, 0.2) * interval
-                wait_time = max(1.0, interval + jitter)
-                time.sleep(wait_time)
+        Args:
+            count: 라운드에 보낼 가짜 공격 수
+            versions: 방 플레이어들의 와이어 버전
 
-                if not self.running:
-                    break
+        Returns:
+            새로 만든 프레임 수
+        """
+        return self.pool.refill(count, versions)
 
-                # 가짜 공격 전송
-                self._send_decoy_attack()
-
-        except Exception as e:
-            print(f"[DecoyGenerator] 가짜 공격 생성 중 오류: {e}")
+    def _build_frames(self, count: int, versions: tuple) -> list:
+        """가짜 공격 프레임 count개 생성 (가짜 공격자/타겟 쌍과 페이로드를 미리 뽑음)"""
+        return build_pair_frames(self.player_manager, count, versions, self._create_decoy_message)
 
     def _send_decoy_attack(self):
         """
         랜덤한 플레이어에게 가짜 공격 전송
-        가짜 송신자 IP도 무작위로 선택
+        가짜 송신자 IP도 무작위로 선택 (풀에 미리 만든 프레임이 있으면 그대로 전송)
         """
-        players = self.player_manager.get_all_players()
+        pooled = take_pair_frame(self.pool, self.player_manager)
+        if pooled:
+            fake_sender, real_target, decoy_msg = pooled
+        else:
+            players = self.player_manager.snapshot().players
 
-        # 최소 2명의 플레이어가 필요
-        if len(players) < 2:
-            return
+            # 최소 2명의 플레이어가 필요
+            if len(players) < 2:
+                return
 
-        # 랜덤으로 가짜 공격자와 실제 타겟 선택
-        fake_sender = random.choice(players)
-        real_target = random.choice([p for p in players if p.player_id != fake_sender.player_id])
+            # 랜덤으로 서로 다른 가짜 공격자와 실제 타겟 선택
+            fake_sender, real_target = random.sample(players, 2)
 
-        # 가짜 공격 메시지 생성
-        decoy_msg = self._create_decoy_message(fake_sender, real_target)
+            # 가짜 공격 메시지 생성
+            decoy_msg = self._create_decoy_message(fake_sender, real_target)
 
         # 타겟에게 전송
         self.send_to_player_callback(real_target, decoy_msg)
+        GENERATOR_FRAMES.inc("decoy")
+        if self.pacer:
+            self.pacer.record_sent()
 
-        print(f"[DecoyGenerator] 가짜 공격: {fake_sender.player_id} ({fake_sender.ip}) -> {real_target.player_id} [FAKE]")
+        if self.log_packets:
+            log.debug("가짜 공격: %s (%s) -> %s [FAKE]", fake_sender.player_id, fake_sender.ip, real_target.player_id)
 
-    def _create_decoy_message(self, fake_sender, real_target) -> Message:
+    def _create_decoy_message(self, fake_sender, real_target, random_suffix: Optional[str] = None) -> DecoyAttackMessage:
         """
         가짜 공격 메시지 생성 (실제 공격과 매우 유사하게)
 
         Args:
             fake_sender: 가짜 송신자 (실제 플레이어지만 보낸 적 없음)
             real_target: 실제 타겟
+            random_suffix: 페이로드 접미사 (None이면 새로 생성)
 
         Returns:
-            Message 객체
+            DecoyAttackMessage 객체
         """
-        from common.message_types import encode_payload
-
         # 실제 공격과 유사한 페이로드 생성
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        if random_suffix is None:
+            random_suffix = random_suffixes(1)[0]
         payload = f"ATTACK_TARGET_{real_target.player_id}_{random_suffix}"
 
-        # base64 인코딩
-        encoded_payload = encode_payload(payload)
-
-        return Message(
-            MSG_TYPE_DECOY_ATTACK,
+        # 페이로드는 DecoyAttackMessage에서 base64 인코딩
+        return DecoyAttackMessage(
             from_ip=fake_sender.ip,  # 실제 플레이어 IP 사용
             to_ip=real_target.ip,
             from_player=fake_sender.player_id,  # 실제 플레이어 ID 사용
             to_player=real_target.player_id,
-            payload=encoded_payload,
-            
-            is_decoy=True  # 내부적으로 가짜임을 표시 (클라이언트는 모름)
+            payload=payload
         )
+
+    def set_rate(self, pps: Optional[float], burst: int = 1):
+        """
+        토큰 버킷 전송률 설정 (트래픽 프로필)
+
+        Args:
+            pps: 초당 가짜 공격 수 (None이면 라운드 시간에 균등 분산)
+            burst: 밀린 전송을 한 번에 몰아 보낼 수 있는 최대 개수
+        """
+        if pps is None:
+            self.pacer = None
+        else:
+            self.pacer = TokenBucket(pps, burst, self.scheduler.clock)
+            log.info("전송률 설정: %spps (burst %s)", pps, burst)
+        self.log_packets = self.pacer is None  # 고속 전송 중에는 패킷마다 로그를 남기지 않음
+
+    def pacing_stats(self) -> Optional[dict]:
+        """요청 대비 실제 전송률 (전송률을 설정하지 않았으면 None)"""
+        return self.pacer.stats() if self.pacer else None
@@ -3,28 +3,38 @@
 게임 중 더미 패킷을 주기적으로 생성하여 전송
 """
 
-import threading
-import time
+import math
 import random
-import string
-from typing import Callable, List
+from typing import Callable, List, Optional
 from common.message_types import DummyMessage
 from common.constants import DUMMY_PACKET_INTERVAL_MIN, DUMMY_PACKET_INTERVAL_MAX
+from server.traffic_scheduler import get_traffic_scheduler
+from server.frame_pool import FramePool, prepare_frame, random_suffixes
+from server.traffic_profiles import TokenBucket
+from server.telemetry import GENERATOR_FRAMES
+from common.log import get_logger
+
+log = get_logger(__name__, "DummyGenerator")
 
 
 class DummyGenerator:
     """더미 패킷 생성기"""
 
-    def __init__(self, send_callback: Callable[[DummyMessage, List], None]):
+    def __init__(self, send_callback: Callable[[DummyMessage, List], None], scheduler=None):
         """
         Args:
             send_callback: 더미 패킷 전송 콜백 함수 (message, target_players)
+            scheduler: 전송 시각을 관리할 TrafficScheduler (None이면 프로세스 공용 스케줄러)
         """
         self.send_callback = send_callback
         self.running = False
-        self.thread = None
+        self.scheduler = scheduler or get_traffic_scheduler()
+        self.entry = None  # 스케줄러 등록 항목 (stop() 시 취소)
         self.interval_min = DUMMY_PACKET_INTERVAL_MIN
         self.interval_max = DUMMY_PACKET_INTERVAL_MAX
+        self.pool = FramePool(self._build_frames)  # 미리 직렬화한 더미 프레임
+        self.pacer = None  # 트래픽 프로필의 토큰 버킷 (None이면 랜덤 인터벌)
+        self.log_packets = True
 
     def start(self):
         """더미 패킷 생성 시작"""
@@ -32,46 +42,78 @@ class DummyGenerator:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._generate_loop, daemon=True)
-        self.thread.start()
-        print("[DummyGenerator] 더미 패킷 생성 시작")
+        if self.pacer:
+            self.pacer.reset()
+        self.entry = self.scheduler.add(self)
+        log.info("더미 패킷 생성 시작")
 
     def stop(self):
         """더미 패킷 생성 중지"""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=3)
-        print("[DummyGenerator] 더미 패킷 생성 중지")
-
-    def _generate_loop(self):
-        """더미 패킷 생성 루프"""
-        while self.running:
-            try:
-                # 랜덤 인터벌로 대기
-                interval = random.uniform(self.interval_min, self.interval_max)
-                time.sleep(interval)
-
-                if not self.running:
-                    break
-
-                # 더미 패킷 생성
+        # 스케줄러에서 빼기만 하면 되므로 스레드를 기다리지 않고 바로 반환
+        if self.entry:
+            self.entry.cancel()
+            self.entry = None
+        if self.pacer:
+            self.pacer.finish()
+        log.info("더미 패킷 생성 중지")
+
+    def next_delay(self) -> float:
+        """다음 더미 패킷까지 대기 시간 (전송률이 설정되어 있으면 토큰 버킷, 아니면 랜덤 인터벌)"""
+        if self.pacer:
+            return self.pacer.next_delay()
+        return random.uniform(self.interval_min, self.interval_max)
+
+    def emit(self):
+        """더미 패킷 한 개 전송 (스케줄러 스레드에서 호출)"""
+        try:
+            # 풀에서 미리 만든 프레임을 꺼내고, 비어 있으면 즉석에서 생성
+            # (EncodedFrame은 __len__이 v2 직렬화를 하므로 `or`로 진리값 판정하지 않음)
+            dummy_message = self.pool.take()
+            if dummy_message is None:
                 dummy_message = self._create_dummy_packet()
 
-                # 콜백을 통해 전송 (모든 플레이어에게)
-                self.send_callback(dummy_message, None)
+            # 콜백을 통해 전송 (모든 플레이어에게)
+            self.send_callback(dummy_message, None)
+            GENERATOR_FRAMES.inc("dummy")
+            if self.pacer:
+                self.pacer.record_sent()
+
+        except Exception as e:
+            log.error("더미 패킷 생성 중 오류: %s", e)
+
+    def refill(self, duration: float, versions) -> int:
+        """
+        duration초 동안 보낼 만큼 프레임 풀 채우기 (PREPARATION/ROUND_END 단계에서 호출)
+
+        Args:
+            duration: 다음 채우기까지 예상 시간 (초)
+            versions: 방 플레이어들의 와이어 버전
+
+        Returns:
+            새로 만든 프레임 수
+        """
+        if self.pacer:
+            return self.pool.refill(self.pacer.frames_for(duration), versions)
+        return self.pool.refill(math.ceil(duration / self.interval_min) + 1, versions)
 
-            except Exception as e:
-                print(f"[DummyGenerator] 더미 패킷 생성 중 오류: {e}")
+    def _build_frames(self, count: int, versions: tuple) -> list:
+        """더미 프레임 count개 생성 (페이로드는 한 번에 랜덤 생성)"""
+        return [prepare_frame(self._create_dummy_packet(suffix), versions) for suffix in random_suffixes(count)]
 
-    def _create_dummy_packet(self) -> DummyMessage:
+    def _create_dummy_packet(self, random_suffix: Optional[str] = None) -> DummyMessage:
         """
         더미 패킷 생성
 
+        Args:
+            random_suffix: 페이로드 접미사 (None이면 새로 생성)
+
         Returns:
             DummyMessage 객체
         """
         # 랜덤 페이로드 생성
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        if random_suffix is None:
+            random_suffix = random_suffixes(1)[0]
         payload = f"DUMMY_{random_suffix}"
 
         return DummyMessage(payload=payload)
@@ -87,6 +129,25 @@ class DummyGenerator:
         self.interval_min = min_sec
         self.interval_max = max_sec if max_sec is not None else min_sec
         if max_sec is None or min_sec == max_sec:
-            print(f"[DummyGenerator] 인터벌 설정: {min_sec}초 (고정)")
+            log.debug("인터벌 설정: %s초 (고정)", min_sec)
         else:
-            print(f"[DummyGenerator] 인터벌 설정: {min_sec}~{max_sec}초")
+            log.debug("인터벌 설정: %s~%s초", min_sec, max_sec)
+
+    def set_rate(self, pps: Optional[float], burst: int = 1):
+        """
+        토큰 버킷 전송률 설정 (트래픽 프로필)
+
+        Args:
+            pps: 초당 더미 패킷 수 (None이면 랜덤 인터벌로 복귀)
+            burst: 밀린 전송을 한 번에 몰아 보낼 수 있는 최대 개수
+        """
+        if pps is None:
+            self.pacer = None
+        else:
+            self.pacer = TokenBucket(pps, burst, self.scheduler.clock)
+            log.info("전송률 설정: %spps (burst %s)", pps, burst)
+        self.log_packets = self.pacer is None  # 고속 전송 중에는 패킷마다 로그를 남기지 않음
+
+    def pacing_stats(self) -> Optional[dict]:
+        """요청 대비 실제 전송률 (전송률을 설정하지 않았으면 None)"""
+        return self.pacer.stats() if self.pacer else None
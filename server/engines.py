@@ -0,0 +1,469 @@
+"""
+연결 처리 엔진 모듈
+같은 와이어 프로토콜과 GameServer 로직 위에서 연결 수락/수신 루프만 다르게 구현
+
+- threaded: 연결마다 수신 스레드 + 송신 스레드 (기존 방식)
+- asyncio: 이벤트 루프 스레드 하나에서 모든 연결의 수신/송신을 처리하고,
+  GameServer 처리(방/게임 락을 잡는 핸들러)는 핸들러 스레드 풀에서 실행
+
+두 엔진 모두 CONNECT를 읽은 뒤 다른 워커 프로세스가 소유한 방이면 연결을 넘기고
+(GameServer.route_client / handoff_client), 넘겨받은 연결은 adopt()로 처리한다.
+"""
+
+import asyncio
+import functools
+import socket
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from common.constants import MAX_FRAME_SIZE
+from common.protocol import Protocol, ConnectionManager, FrameReader, FrameTooLargeError
+from common.message_types import Message
+from server.connection_writer import ConnectionWriter, AsyncConnectionWriter, LoopWaker
+from server.telemetry import record_frame_received
+from common.log import get_logger
+
+log = get_logger(__name__, "서버")
+
+ENGINE_THREADED = "threaded"
+ENGINE_ASYNCIO = "asyncio"
+ENGINES = (ENGINE_THREADED, ENGINE_ASYNCIO)
+DEFAULT_ENGINE = ENGINE_THREADED
+
+# 두 엔진 공통 listen 대기 큐 크기 (접속이 몰릴 때 SYN 재전송 지연 방지)
+LISTEN_BACKLOG = 128
+
+# asyncio 엔진의 핸들러 스레드 수 (한 방의 락을 기다리는 핸들러가 이만큼 쌓여야 다른 방이 밀림)
+HANDLER_THREADS = 16
+
+
+class ThreadedEngine:
+    """연결마다 수신 스레드를 두는 엔진 (송신은 플레이어별 ConnectionWriter 스레드)"""
+
+    name = ENGINE_THREADED
+
+    def __init__(self, server, reuse_port: bool = False):
+        """
+        Args:
+            server: 연결 이벤트를 처리할 GameServer
+            reuse_port: SO_REUSEPORT로 바인딩 (멀티 프로세스 워커 모드)
+        """
+        self.server = server
+        self.reuse_port = reuse_port
+        self.server_socket = None
+        self.running = False
+        self.client_threads = []
+        self.client_sockets = set()
+        self.lock = threading.Lock()
+
+    def start(self, host: str, port: int) -> bool:
+        """
+        서버 소켓을 열고 연결 수락 스레드 시작
+
+        Returns:
+            성공 여부
+        """
+        self.server_socket = ConnectionManager.create_server_socket(host, port, backlog=LISTEN_BACKLOG,
+                                                                    reuse_port=self.reuse_port)
+        if not self.server_socket:
+            return False
+
+        self.running = True
+        accept_thread = threading.Thread(target=self._accept_clients, daemon=True)
+        accept_thread.start()
+        return True
+
+    def stop(self):
+        """서버 소켓과 모든 클라이언트 연결 종료"""
+        self.running = False
+
+        with self.lock:
+            sockets = list(self.client_sockets)
+        for client_socket in sockets:
+            try:
+                ConnectionManager.close_socket(client_socket)
+            except:
+                pass
+
+        if self.server_socket:
+            try:
+                ConnectionManager.close_socket(self.server_socket)
+            except:
+                pass
+            self.server_socket = None
+
+    def _accept_clients(self):
+        """클라이언트 연결 수락"""
+        while self.running:
+            try:
+                client_socket, address = self.server_socket.accept()
+                self.server.log_to_gui(f"새 연결: {address}", "info")
+
+                # 클라이언트 핸들러 스레드 시작
+                client_thread = threading.Thread(
+                    target=self._handle_client,
+                    args=(client_socket, address),
+                    daemon=True
+                )
+                client_thread.start()
+                self.client_threads.append(client_thread)
+
+            except Exception as e:
+                if self.running:
+                    self.server.log_to_gui(f"클라이언트 수락 오류: {e}", "error")
+                break
+
+    def adopt(self, client_socket: socket.socket, prefix: bytes):
+        """
+        다른 워커가 넘긴 연결 처리 시작
+
+        Args:
+            client_socket: 넘겨받은 클라이언트 소켓
+            prefix: 넘긴 워커가 이미 읽은 프레임 (CONNECT)
+        """
+        if not self.running:
+            client_socket.close()
+            return
+        address = client_socket.getpeername()
+        client_thread = threading.Thread(
+            target=self._handle_client,
+            args=(client_socket, address, prefix),
+            daemon=True
+        )
+        client_thread.start()
+        self.client_threads.append(client_thread)
+
+    @staticmethod
+    def _read_message(reader: FrameReader) -> Optional[Message]:
+        """프레임 하나를 읽어 디코딩하고 수신 통계 기록 (연결 종료/오류면 None)"""
+        message = reader.receive_message()
+        if message is not None:
+            record_frame_received(message.type, reader.last_frame_size)
+        return message
+
+    def _handle_client(self, client_socket: socket.socket, address: tuple, prefix: bytes = b""):
+        """개별 클라이언트 처리"""
+        player = None
+        handed_off = False
+        reader = FrameReader(client_socket)  # 연결별 수신 버퍼 (최대 프레임 크기 제한)
+        if prefix:
+            reader.feed(prefix)
+
+        with self.lock:
+            self.client_sockets.add(client_socket)
+
+        def make_writer(player_id: str, wire_version: int) -> ConnectionWriter:
+            return ConnectionWriter(client_socket, player_id, wire_version,
+                                    on_error=self.server.on_writer_error)
+
+        try:
+            # 첫 메시지: 연결 메시지 수신
+            connect_msg = reader.receive_message()
+
+            # 다른 워커가 소유한 방이면 연결을 넘김
+            # (클라이언트는 WELCOME을 받기 전까지 다른 메시지를 보내지 않으므로 CONNECT만 넘기면 됨)
+            target = self.server.route_client(connect_msg)
+            if target is not None:
+                handed_off = self.server.handoff_client(target, client_socket, connect_msg)
+                return
+            if connect_msg is not None:
+                # 넘긴 CONNECT는 넘겨받은 워커에서 한 번만 셈
+                record_frame_received(connect_msg.type, reader.last_frame_size)
+
+            player = self.server.register_client(connect_msg, client_socket, address, make_writer)
+            if not player:
+                return
+
+            # 클라이언트 메시지 수신 루프
+            while self.running and player.is_connected:
+                message = self._read_message(reader)
+
+                if not message:
+                    self.server.log_to_gui(f"{player.player_id} 연결 끊김", "warning")
+                    break
+
+                self.server.handle_client_message(player, message)
+
+        except Exception as e:
+            self.server.log_to_gui(f"{address} 처리 중 오류: {e}", "error")
+
+        finally:
+            if player:
+                self.server.unregister_client(player)
+
+            with self.lock:
+                self.client_sockets.discard(client_socket)
+
+            # 소켓 종료 (넘긴 연결은 shutdown 없이 이 프로세스의 fd만 닫음)
+            try:
+                if handed_off:
+                    client_socket.close()
+                else:
+                    ConnectionManager.close_socket(client_socket)
+            except:
+                pass
+
+
+class AsyncioEngine:
+    """
+    asyncio.start_server 기반 엔진
+
+    이벤트 루프는 전용 스레드 하나에서 실행된다. 수신한 메시지의 GameServer 처리
+    (register_client / handle_client_message / handoff_client)는 GameManager.lock 등을
+    기다릴 수 있으므로 핸들러 스레드 풀에서 실행하고, 연결마다 처리가 끝난 뒤 다음 프레임을
+    읽어 메시지 순서를 유지한다. GameManager/생성기 스레드가 보내는 메시지는
+    AsyncConnectionWriter 큐를 거쳐 루프의 송신 태스크가 전송한다.
+    """
+
+    name = ENGINE_ASYNCIO
+
+    def __init__(self, server, reuse_port: bool = False, max_frame_size: int = MAX_FRAME_SIZE,
+                 handler_threads: int = HANDLER_THREADS):
+        """
+        Args:
+            server: 연결 이벤트를 처리할 GameServer
+            reuse_port: SO_REUSEPORT로 바인딩 (멀티 프로세스 워커 모드)
+            max_frame_size: 허용하는 최대 프레임 본문 크기
+            handler_threads: GameServer 처리를 실행할 스레드 수
+        """
+        self.server = server
+        self.reuse_port = reuse_port
+        self.max_frame_size = max_frame_size
+        self.handler_threads = handler_threads
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waker: Optional[LoopWaker] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.thread = None
+        self.running = False
+        self._aserver = None
+        self._connections = set()  # 연결 처리 태스크
+        self._started = threading.Event()
+        self._start_ok = False
+
+    def start(self, host: str, port: int) -> bool:
+        """
+        이벤트 루프 스레드를 시작하고 서버 소켓이 열릴 때까지 대기
+
+        Returns:
+            성공 여부
+        """
+        self._started.clear()
+        self._start_ok = False
+        self.running = True
+        self.executor = ThreadPoolExecutor(max_workers=self.handler_threads,
+                                           thread_name_prefix="asyncio-handler")
+        self.thread = threading.Thread(target=self._run_loop, args=(host, port),
+                                       daemon=True, name="asyncio-engine")
+        self.thread.start()
+        self._started.wait()
+        if not self._start_ok:
+            self.running = False
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        return self._start_ok
+
+    def stop(self):
+        """서버 소켓과 모든 연결을 닫고 이벤트 루프 종료"""
+        self.running = False
+        loop = self.loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+        except Exception:
+            pass
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            pass
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=5)
+        if self.executor is not None:
+            # 락을 기다리는 핸들러가 있어도 기다리지 않음 (끝나면 스레드도 종료)
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def _run_loop(self, host: str, port: int):
+        """이벤트 루프 스레드 본체"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        self.waker = LoopWaker(loop)
+        try:
+            # 서버 소켓은 threaded 엔진과 같은 경로로 생성 (backlog, SO_REUSEPORT 동일)
+            server_socket = ConnectionManager.create_server_socket(host, port, backlog=LISTEN_BACKLOG,
+                                                                   reuse_port=self.reuse_port)
+            if server_socket:
+                self._aserver = loop.run_until_complete(
+                    asyncio.start_server(self._handle_connection, sock=server_socket)
+                )
+                self._start_ok = True
+                log.info("asyncio 엔진 시작: %s:%s", host, port)
+        except Exception as e:
+            log.warning("asyncio 엔진 시작 실패: %s", e)
+        finally:
+            self._started.set()
+
+        if self._start_ok:
+            loop.run_forever()
+
+        loop.close()
+        self.loop = None
+
+    def adopt(self, client_socket: socket.socket, prefix: bytes):
+        """
+        다른 워커가 넘긴 연결 처리 시작 (어느 스레드에서든 호출 가능)
+
+        Args:
+            client_socket: 넘겨받은 클라이언트 소켓
+            prefix: 넘긴 워커가 이미 읽은 프레임 (CONNECT)
+        """
+        loop = self.loop
+        if not self.running or loop is None:
+            client_socket.close()
+            return
+        asyncio.run_coroutine_threadsafe(self._adopt(client_socket, prefix), loop)
+
+    async def _adopt(self, client_socket: socket.socket, prefix: bytes):
+        """넘겨받은 소켓을 스트림으로 감싸 일반 연결과 같은 경로로 처리"""
+        reader = asyncio.StreamReader()
+        reader.feed_data(prefix)
+        try:
+            await self.loop.connect_accepted_socket(
+                lambda: asyncio.StreamReaderProtocol(reader, self._handle_connection),
+                client_socket
+            )
+        except Exception as e:
+            self.server.log_to_gui(f"넘겨받은 연결 처리 실패: {e}", "error")
+            client_socket.close()
+
+    async def _shutdown(self):
+        """서버 소켓과 연결 태스크 정리"""
+        if self._aserver is not None:
+            self._aserver.close()
+            await self._aserver.wait_closed()
+            self._aserver = None
+        for task in list(self._connections):
+            task.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Tuple[Optional[Message], int]:
+        """
+        프레임 하나를 읽어 디코딩
+
+        Returns:
+            (Message 객체, 길이 헤더를 포함한 프레임 크기),
+            연결이 끊겼거나 잘못된 프레임이면 (None, 0) (FrameReader와 동일)
+        """
+        try:
+            header = await reader.readexactly(Protocol.HEADER_SIZE)
+            length = struct.unpack(Protocol.HEADER_FORMAT, header)[0]
+            if length > self.max_frame_size:
+                raise FrameTooLargeError(length, self.max_frame_size)
+            body = await reader.readexactly(length)
+            return Protocol.decode_body(body), Protocol.HEADER_SIZE + length
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None, 0
+        except Exception as e:
+            log.info("메시지 수신 실패: %s", e)
+            return None, 0
+
+    async def _read_message(self, reader: asyncio.StreamReader) -> Optional[Message]:
+        """프레임 하나를 읽어 디코딩하고 수신 통계 기록 (연결 종료/오류면 None)"""
+        message, size = await self._read_frame(reader)
+        if message is not None:
+            record_frame_received(message.type, size)
+        return message
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, stream: asyncio.StreamWriter):
+        """개별 클라이언트 처리 (start_server 콜백)"""
+        task = asyncio.current_task()
+        self._connections.add(task)
+        address = stream.get_extra_info('peername')
+        client_socket = stream.get_extra_info('socket')
+        player = None
+        handed_off = False
+        waker = self.waker
+        # GameServer 처리는 핸들러 스레드에서 (락 대기가 루프의 다른 연결을 막지 않도록)
+        run = functools.partial(self.loop.run_in_executor, self.executor)
+
+        self.server.log_to_gui(f"새 연결: {address}", "info")
+
+        def make_writer(player_id: str, wire_version: int) -> AsyncConnectionWriter:
+            return AsyncConnectionWriter(stream, waker, player_id, wire_version,
+                                         on_error=self.server.on_writer_error)
+
+        try:
+            # 첫 메시지: 연결 메시지 수신
+            connect_msg, connect_size = await self._read_frame(reader)
+
+            # 다른 워커가 소유한 방이면 연결을 넘김
+            target = self.server.route_client(connect_msg)
+            if target is not None:
+                handed_off = await run(self.server.handoff_client, target, client_socket, connect_msg)
+                return
+            if connect_msg is not None:
+                # 넘긴 CONNECT는 넘겨받은 워커에서 한 번만 셈
+                record_frame_received(connect_msg.type, connect_size)
+
+            player = await run(self.server.register_client, connect_msg, client_socket, address, make_writer)
+            if not player:
+                return
+
+            # 클라이언트 메시지 수신 루프
+            while self.running and player.is_connected:
+                message = await self._read_message(reader)
+
+                if not message:
+                    self.server.log_to_gui(f"{player.player_id} 연결 끊김", "warning")
+                    break
+
+                # 처리가 끝난 뒤 다음 프레임을 읽으므로 연결 안의 메시지 순서는 유지됨
+                await run(self.server.handle_client_message, player, message)
+
+        except asyncio.CancelledError:
+            pass
+
+        except Exception as e:
+            self.server.log_to_gui(f"{address} 처리 중 오류: {e}", "error")
+
+        finally:
+            if player:
+                # 엔진 종료 중(태스크 취소)에는 기다리지 않고 루프에서 바로 정리
+                if self.running:
+                    try:
+                        await run(self.server.unregister_client, player)
+                    except asyncio.CancelledError:
+                        pass
+                else:
+                    self.server.unregister_client(player)
+                if player.writer is not None and player.writer.task is not None:
+                    player.writer.task.cancel()
+            if handed_off:
+                # 넘긴 연결은 FIN 없이 이 프로세스의 fd만 닫음
+                stream.transport.abort()
+            else:
+                stream.close()
+            self._connections.discard(task)
+
+
+def create_engine(name: str, server, reuse_port: bool = False):
+    """
+    이름으로 엔진 생성
+
+    Args:
+        name: "threaded" 또는 "asyncio"
+        server: 연결 이벤트를 처리할 GameServer
+        reuse_port: SO_REUSEPORT로 바인딩 (멀티 프로세스 워커 모드)
+
+    Returns:
+        엔진 객체
+    """
+    if name == ENGINE_THREADED:
+        return ThreadedEngine(server, reuse_port=reuse_port)
+    if name == ENGINE_ASYNCIO:
+        return AsyncioEngine(server, reuse_port=reuse_port)
+    raise ValueError(f"알 수 없는 엔진: {name} (사용 가능: {', '.join(ENGINES)})")
@@ -0,0 +1,301 @@
+"""
+게임 이벤트 버스 모듈
+게임 진행(GameManager)과 서버(GameServer)가 발행하는 이벤트를 관찰자(GUI 로그, 기록, 지표 등)에게 전달
+
+- 이벤트는 타입이 정해진 불변 데이터 클래스 (RoundStarted, AttackApproved, ScoresComputed ...)
+- 구독자마다 전용 큐와 스레드가 있어 publish()는 큐에 넣기만 함 (게임 스레드는 구독자 처리를 기다리지 않음)
+- 구독자 스레드는 깨어나면 큐를 다 비우고 잠들며, 발행 스레드는 구독자가 잠들어 있을 때만 깨움
+- 구독자 큐가 max_queue개를 넘으면 (처리가 못 따라가면) 그 구독자에게 가는 새 이벤트만 버리고 수를 셈
+- 발행 비용(publish 1회 평균/최대)과 구독자별 지연(발행→처리 시작), 대기 수는 stats()로 확인
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from server.metrics import LatencyHistogram
+from common.log import get_logger
+
+log = get_logger(__name__, "EventBus")
+
+MAX_QUEUE = 10000  # 구독자별 최대 대기 이벤트 수
+LAG_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 50, 100, 500, 1000, 5000)  # 발행→처리 시작 지연 버킷 (ms)
+
+
+# ========== 이벤트 ==========
+
+@dataclass(frozen=True)
+class GameEvent:
+    """게임 이벤트 공통 필드"""
+    room_id: str
+
+
+@dataclass(frozen=True)
+class PlayerJoined(GameEvent):
+    """플레이어 접속"""
+    player_id: str
+    ip: str
+
+
+@dataclass(frozen=True)
+class PlayerLeft(GameEvent):
+    """플레이어 종료"""
+    player_id: str
+
+
+@dataclass(frozen=True)
+class GameStarted(GameEvent):
+    """게임 시작"""
+    traffic_profile: str
+    players: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RoundStarted(GameEvent):
+    """라운드 시작 (준비 단계 진입)"""
+    round_num: int
+    difficulty: str
+
+
+@dataclass(frozen=True)
+class AttackApproved(GameEvent):
+    """공격 승인"""
+    attack_id: int
+    attacker_id: str
+    target_id: str
+    round_num: int
+
+
+@dataclass(frozen=True)
+class AttackDenied(GameEvent):
+    """공격 거부"""
+    attacker_id: str
+    target_id: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class AttackCompleted(GameEvent):
+    """공격 양방향 확인 완료"""
+    attack_id: int
+    attacker_id: str
+    target_id: str
+    attacker_ip: str
+    latency_ms: float
+
+
+@dataclass(frozen=True)
+class AttackExpired(GameEvent):
+    """공격 만료 (타임아웃 또는 라운드/게임 경계)"""
+    attack_id: int
+    attacker_id: str
+    target_id: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class DefenseSubmitted(GameEvent):
+    """방어 답안 제출"""
+    player_id: str
+    attacker_ips: Tuple[str, ...]
+    submitted: Tuple[str, ...]  # 누적 제출 IP (정렬)
+
+
+@dataclass(frozen=True)
+class ScoresComputed(GameEvent):
+    """라운드 점수 계산 완료"""
+    round_num: int
+    results: Tuple[dict, ...]  # 플레이어별 {player_id, score, hp, correct, reason}
+
+
+@dataclass(frozen=True)
+class GameEnded(GameEvent):
+    """게임 종료"""
+    winner: Optional[str]
+    rankings: Tuple[dict, ...]
+
+
+EVENT_TYPES = (PlayerJoined, PlayerLeft, GameStarted, RoundStarted, AttackApproved, AttackDenied,
+               AttackCompleted, AttackExpired, DefenseSubmitted, ScoresComputed, GameEnded)
+
+
+# ========== 버스 ==========
+
+class Subscription:
+    """구독자 하나 (전용 큐와 처리 스레드)"""
+
+    def __init__(self, bus: 'EventBus', handler: Callable[[GameEvent], None], name: str,
+                 event_types: Optional[Tuple[type, ...]], max_queue: int):
+        self.bus = bus
+        self.handler = handler
+        self.name = name
+        self.event_types = event_types  # None이면 모든 이벤트
+        self.max_queue = max_queue
+
+        self._queue = deque()  # (발행 시각, 이벤트), append/popleft는 스레드 안전
+        self._wake = threading.Event()  # 설정되어 있으면 구독자 스레드가 깨어 있음
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"events-{name}")
+        self.active = True
+
+        # 통계
+        self.delivered = 0
+        self.dropped = 0  # 큐가 가득 차서 버린 이벤트 수
+        self.errors = 0
+        self.busy = 0.0  # 핸들러 실행 누적 시간 (초)
+        self.lag = LatencyHistogram(f"events-{name}-lag", LAG_BUCKETS_MS)
+
+    def _offer(self, published_at: float, event: GameEvent):
+        """이벤트를 큐에 넣음 (발행 스레드, 가득 차면 버림)"""
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append((published_at, event))
+        if not self._wake.is_set():  # 처리 중인 구독자는 큐를 다 비울 때까지 다시 깨우지 않음
+            self._wake.set()
+
+    def _run(self):
+        """구독자 스레드 루프 (깨어나면 큐를 다 비우고, 비어 있으면 다음 발행까지 대기)"""
+        events = self._queue
+        while True:
+            # clear 후 다시 확인하므로 그 사이에 들어온 이벤트도 놓치지 않음
+            self._wake.clear()
+            if not events:
+                if not self.active:
+                    return
+                self._wake.wait()
+                continue
+            while events:
+                published_at, event = events.popleft()
+                start = time.perf_counter()
+                self.lag.observe(start - published_at)
+                try:
+                    self.handler(event)
+                except Exception as e:
+                    self.errors += 1
+                    log.error("%s 처리 오류 (%s): %s", self.name, type(event).__name__, e)
+                self.busy += time.perf_counter() - start
+                self.delivered += 1
+
+    def cancel(self, wait: bool = True):
+        """
+        구독 해제 (이미 큐에 들어간 이벤트는 처리한 뒤 스레드 종료)
+
+        Args:
+            wait: 남은 이벤트 처리가 끝날 때까지 기다릴지 여부
+        """
+        if not self.active:
+            return
+        self.active = False
+        self.bus._remove(self)
+        self._wake.set()
+        if wait and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def stats(self) -> dict:
+        """구독자 통계 (처리/버림 수, 대기 수, 발행→처리 시작 지연, 핸들러 평균 처리 시간)"""
+        delivered = self.delivered
+        return {
+            'name': self.name,
+            'events': [t.__name__ for t in self.event_types] if self.event_types else None,
+            'delivered': delivered,
+            'pending': len(self._queue),
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'handler_avg_ms': round(self.busy / delivered * 1000, 3) if delivered else 0.0,
+            'lag': self.lag.to_dict()
+        }
+
+
+class EventBus:
+    """
+    프로세스 내부 이벤트 버스
+
+    구독 목록은 이벤트 타입별 튜플로 미리 나눠 두고, 구독/해제 시에만 새로 만들어 교체한다.
+    publish()는 락 없이 현재 튜플을 읽어 구독자 큐에 넣기만 한다.
+    """
+
+    def __init__(self, name: str = "events"):
+        """
+        Args:
+            name: 로그/통계용 이름
+        """
+        self.name = name
+        self._lock = threading.Lock()  # 구독/해제 보호
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._routes: Dict[type, Tuple[Subscription, ...]] = {}
+        self._wildcard: Tuple[Subscription, ...] = ()  # 모든 이벤트를 받는 구독자 (EVENT_TYPES 밖의 타입용)
+
+        # 발행 통계
+        self.published = 0
+        self.publish_time = 0.0  # publish() 누적 시간 (초)
+        self.publish_max = 0.0
+
+    def subscribe(self, handler: Callable[[GameEvent], None], name: Optional[str] = None,
+                  event_types: Optional[Iterable[type]] = None, max_queue: int = MAX_QUEUE) -> Subscription:
+        """
+        구독자 등록 (전용 스레드에서 handler(event) 호출)
+
+        Args:
+            handler: 이벤트 처리 함수 (예외는 세고 로그만 남김)
+            name: 통계/스레드 이름 (None이면 handler 이름)
+            event_types: 받을 이벤트 타입 목록 (None이면 전부)
+            max_queue: 처리 대기 이벤트 최대 수 (넘으면 새 이벤트를 버림)
+
+        Returns:
+            Subscription (cancel()로 해제)
+        """
+        types = tuple(event_types) if event_types is not None else None
+        subscription = Subscription(self, handler, name or getattr(handler, '__name__', "subscriber"),
+                                    types, max_queue)
+        subscription._thread.start()
+        with self._lock:
+            self._subscriptions += (subscription,)
+            self._rebuild_routes()
+        return subscription
+
+    def _remove(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+            self._rebuild_routes()
+
+    def _rebuild_routes(self):
+        """이벤트 타입별 구독자 튜플을 새로 만들어 교체 (self._lock을 잡은 상태에서 호출)"""
+        routes = {}
+        for event_type in EVENT_TYPES:
+            routes[event_type] = tuple(s for s in self._subscriptions
+                                       if s.event_types is None or issubclass(event_type, s.event_types))
+        self._wildcard = tuple(s for s in self._subscriptions if s.event_types is None)
+        self._routes = routes
+
+    def publish(self, event: GameEvent):
+        """
+        이벤트 발행 (구독자 큐에 넣기만 하므로 구독자가 느려도 바로 반환)
+
+        Args:
+            event: 게임 이벤트
+        """
+        start = time.perf_counter()
+        for subscription in self._routes.get(type(event), self._wildcard):
+            subscription._offer(start, event)
+        elapsed = time.perf_counter() - start
+        self.published += 1
+        self.publish_time += elapsed
+        if elapsed > self.publish_max:
+            self.publish_max = elapsed
+
+    def close(self):
+        """모든 구독 해제"""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+
+    def stats(self) -> dict:
+        """버스 통계 (발행 수, publish 평균/최대 비용, 구독자별 통계)"""
+        published = self.published
+        return {
+            'published': published,
+            'publish_avg_us': round(self.publish_time / published * 1e6, 3) if published else 0.0,
+            'publish_max_us': round(self.publish_max * 1e6, 3),
+            'subscribers': [subscription.stats() for subscription in self._subscriptions]
+        }
@@ -0,0 +1,163 @@
+"""
+프레임 풀 모듈
+더미/노이즈/가짜 공격 패킷을 단계 경계(PREPARATION, ROUND_END)에서 미리 만들어 두는 풀
+
+- 랜덤 페이로드는 random.choices 한 번으로 묶어서 생성
+- 프레임은 EncodedFrame으로 만들고 방에서 쓰는 와이어 버전으로 미리 직렬화
+- 라운드 중 핫 패스는 take()로 하나 꺼내 그대로 전송 (풀이 비면 생성기가 즉석에서 만듦)
+- 노이즈/가짜 공격은 송신자/수신자 쌍도 미리 뽑아 두고, 꺼낼 때 그 플레이어가 아직 있는지만 확인
+- 주의: v2(JSON) 프레임의 timestamp는 전송 시각이 아니라 풀을 채운 시각
+"""
+
+import random
+import string
+from collections import deque
+from typing import Any, Callable, Iterable, List, Optional
+
+from common.protocol import EncodedFrame
+
+PAYLOAD_ALPHABET = string.ascii_uppercase + string.digits
+PAYLOAD_SUFFIX_LENGTH = 8
+MAX_POOL_FRAMES = 8192  # 풀 하나의 최대 항목 수 (고속 프로필은 넘는 만큼 즉석 생성)
+
+
+def random_suffixes(count: int, length: int = PAYLOAD_SUFFIX_LENGTH) -> List[str]:
+    """
+    랜덤 페이로드 접미사 여러 개를 한 번에 생성
+
+    Args:
+        count: 개수
+        length: 접미사 길이
+
+    Returns:
+        접미사 리스트
+    """
+    chars = ''.join(random.choices(PAYLOAD_ALPHABET, k=count * length))
+    return [chars[i:i + length] for i in range(0, count * length, length)]
+
+
+def prepare_frame(message, versions: Iterable[int]) -> EncodedFrame:
+    """
+    메시지를 EncodedFrame으로 만들고 지정한 와이어 버전으로 미리 직렬화
+
+    Args:
+        message: Message 객체
+        versions: 미리 직렬화할 와이어 버전들
+
+    Returns:
+        EncodedFrame
+    """
+    frame = EncodedFrame(message)
+    for version in versions:
+        frame.for_version(version)
+    return frame
+
+
+def build_pair_frames(player_manager, count: int, versions: Iterable[int],
+                      create: Callable[[Any, Any, str], Any]) -> List[tuple]:
+    """
+    무작위 (송신자, 수신자) 쌍 메시지 count개를 미리 만듦 (노이즈/가짜 공격용)
+
+    Args:
+        player_manager: PlayerManager 인스턴스
+        count: 개수
+        versions: 미리 직렬화할 와이어 버전들
+        create: (송신자, 수신자, 페이로드 접미사) -> Message
+
+    Returns:
+        [(EncodedFrame, 송신자 ID, 수신자 ID)] (플레이어가 2명 미만이면 빈 리스트)
+    """
+    players = player_manager.snapshot().players
+    if len(players) < 2:
+        return []
+    items = []
+    for suffix in random_suffixes(count):
+        sender, receiver = random.sample(players, 2)
+        items.append((prepare_frame(create(sender, receiver, suffix), versions), sender.player_id, receiver.player_id))
+    return items
+
+
+def take_pair_frame(pool: 'FramePool', player_manager) -> Optional[tuple]:
+    """
+    풀에서 쌍 프레임을 꺼내 현재 플레이어와 맞춰 봄
+    풀을 채운 뒤 나갔거나 가상 IP가 바뀐 플레이어의 항목은 버림
+
+    Returns:
+        (송신자, 수신자, EncodedFrame) 또는 쓸 수 있는 항목이 없으면 None
+    """
+    by_id = player_manager.snapshot().by_id
+    while True:
+        item = pool.take()
+        if item is None:
+            return None
+        frame, sender_id, receiver_id = item
+        sender = by_id.get(sender_id)
+        receiver = by_id.get(receiver_id)
+        if (sender is not None and receiver is not None
+                and sender.ip == frame.message.from_ip and receiver.ip == frame.message.to_ip):
+            return sender, receiver, frame
+        pool.stale += 1
+
+
+class FramePool:
+    """미리 만든 프레임 풀 (생성기 스레드가 꺼내고 게임 스레드가 채움)"""
+
+    def __init__(self, build_batch: Callable[[int, tuple], List[Any]], max_items: int = MAX_POOL_FRAMES):
+        """
+        Args:
+            build_batch: (개수, 와이어 버전들) -> 풀 항목 리스트
+            max_items: 최대 항목 수
+        """
+        self.build_batch = build_batch
+        self.max_items = max_items
+        self.items = deque()  # append/popleft는 스레드 안전
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0  # 플레이어가 바뀌어 버린 항목 수
+        self.built = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def refill(self, target: int, versions: Iterable[int]) -> int:
+        """
+        풀을 target개까지 채움 (max_items를 넘지 않음)
+
+        Args:
+            target: 채울 개수
+            versions: 미리 직렬화할 와이어 버전들
+
+        Returns:
+            새로 만든 항목 수
+        """
+        missing = min(target, self.max_items) - len(self.items)
+        if missing <= 0:
+            return 0
+        batch = self.build_batch(missing, tuple(versions))
+        self.items.extend(batch)
+        self.built += len(batch)
+        return len(batch)
+
+    def take(self) -> Optional[Any]:
+        """항목 하나 꺼냄 (비어 있으면 None)"""
+        try:
+            item = self.items.popleft()
+        except IndexError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return item
+
+    def clear(self):
+        """남은 항목 버림"""
+        self.items.clear()
+
+    def stats(self) -> dict:
+        """풀 통계 (남은 수, 적중/부족 수, 누적 생성 수)"""
+        return {
+            'size': len(self.items),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'built': self.built
+        }
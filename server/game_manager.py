@@ -3,8 +3,8 @@
 게임 로직, 라운드 관리, 점수 계산 담당
 """
 
+import math
 import threading
-import time
 from typing import Dict, List, Optional
 from enum import Enum
 
@@ -13,15 +13,26 @@ from common.constants import (
     STATE_ROUND_END, STATE_GAME_END, MIN_PLAYERS, TOTAL_ROUNDS,
     ROUND_TIME, DEFENSE_INPUT_TIME, PREPARATION_TIME,
     DIFFICULTY_BY_ROUND,
-    SCORE_CORRECT_DEFENSE_NORMAL, SCORE_WRONG_DEFENSE_NORMAL, SCORE_MISSED_ATTACK_NORMAL,
-    SCORE_CORRECT_DEFENSE_FINAL, SCORE_WRONG_DEFENSE_FINAL, SCORE_MISSED_ATTACK_FINAL,
-    ATTACK_APPROVAL_TIMEOUT, PLAYER_ATTACK_PORT_BASE,
-    HP_DAMAGE_PER_ATTACK
+    ATTACK_APPROVAL_TIMEOUT, ATTACK_TIMEOUT_RETRY, PLAYER_ATTACK_PORT_BASE, WIRE_VERSION_JSON, DEFAULT_ROOM_ID
 )
 from common.message_types import (
     GameStateMessage, ScoreMessage, InfoMessage,
     AttackApprovedMessage, IncomingAttackWarningMessage
 )
+from server.score_engine import RoundScoreboard, ScoreEngine
+from server.attack_table import AttackTable, AttackState
+from server.ip_allocator import int_to_ip
+from server.timer_service import get_timer_service
+from server.clock import get_default_clock
+from server.traffic_profiles import get_traffic_profile
+from server.telemetry import PHASE_DRIFT
+from common.log import get_logger
+from server.event_bus import (
+    EventBus, GameStarted, RoundStarted, AttackApproved, AttackDenied, AttackCompleted, AttackExpired,
+    DefenseSubmitted, ScoresComputed, GameEnded
+)
+
+log = get_logger(__name__, "GameManager")
 
 
 class GameState(Enum):
@@ -37,7 +48,8 @@ class GameState(Enum):
 class GameManager:
     """게임 매니저 클래스"""
 
-    def __init__(self, player_manager, broadcast_callback, dummy_generator=None, noise_generator=None, decoy_generator=None, player_list_callback=None):
+    def __init__(self, player_manager, broadcast_callback, dummy_generator=None, noise_generator=None, decoy_generator=None, player_list_callback=None,
+                 timer_service=None, clock=None, room_id: str = DEFAULT_ROOM_ID, event_bus=None):
         """
         Args:
             player_manager: PlayerManager 인스턴스
@@ -46,6 +58,10 @@ class GameManager:
             noise_generator: NoiseGenerator 인스턴스 (선택)
             decoy_generator: DecoyGenerator 인스턴스 (선택)
             player_list_callback: 플레이어 목록 업데이트 콜백 (선택)
+            timer_service: 공격 타임아웃용 TimerService (None이면 프로세스 공용 서비스)
+            clock: 단계 대기에 쓸 시계 (None이면 실제 단조 시계, 테스트는 VirtualClock)
+            room_id: 이벤트에 실을 방 ID
+            event_bus: 게임 이벤트를 발행할 EventBus (None이면 구독자 없는 전용 버스)
         """
         self.player_manager = player_manager
         self.broadcast_callback = broadcast_callback
@@ -53,53 +69,73 @@ class GameManager:
         self.dummy_generator = dummy_generator
         self.noise_generator = noise_generator
         self.decoy_generator = decoy_generator
+        self.room_id = room_id
+        self.events = event_bus or EventBus(name=f"events-{room_id}")  # 관찰자(GUI/기록/지표)는 구독자로 받음
 
         self.state = GameState.WAITING
         self.current_round = 0
         self.round_start_time = 0
-        self.defense_submissions: Dict[str, List[str]] = {}  # {player_id: [attacker_ips]}
+        self._phase_due = None  # 다음 단계가 시작되어야 할 시각 (clock.now 기준, 단계 시작 지연 측정용)
         self.current_difficulty = None  # 현재 라운드 난이도 설정
+        self.traffic_profile = get_traffic_profile()  # 더미/노이즈/가짜 공격 전송률 프로필 (게임마다 선택)
         self.attack_counts: Dict[str, int] = {}  # 플레이어별 라운드 공격 횟수
-        self.real_attacks: List[dict] = []  # 실제 공격 기록 (가짜 공격 판별용)
+        self.scoreboard = RoundScoreboard()  # 공격 완료/방어 제출 시 갱신되는 점수 카운터 + 라운드 공격 기록
+        self.score_engine = ScoreEngine()  # 라운드 종료 후 공격 기록 재계산용
         self.decoy_ips: set = set()  # 가짜 공격 IP 목록 (점수 계산용)
 
-        # 공격 승인 시스템 (v2.0)
-        self.pending_attacks: Dict[str, dict] = {}  # {attack_id: {from, to, timestamp, attacker_sent, target_received, timeout}}
-        self.attack_sequence = 0  # attack_id 생성용 시퀀스
+        # 공격 승인 시스템 (v2.0): 정수 attack_id별 상태/전이 시각, 라운드 경계에서 일괄 만료
+        self.clock = clock or get_default_clock()
+        self.attacks = AttackTable(clock=self.clock.now)
+        self.timers = timer_service or get_timer_service()  # 공격마다 스레드를 만들지 않도록 공용 타이머 사용
 
         self.game_thread = None
         self.running = False
+        self.stop_event = threading.Event()  # 설정되면 단계 대기가 바로 끝남
         self.lock = threading.Lock()
 
     def can_start_game(self) -> bool:
         """게임 시작 가능 여부 확인"""
         return self.player_manager.get_player_count() >= MIN_PLAYERS
 
-    def start_game(self):
-        """게임 시작"""
+    def start_game(self, traffic_profile: Optional[str] = None):
+        """
+        게임 시작
+
+        Args:
+            traffic_profile: 트래픽 프로필 이름 (None이면 기본 프로필)
+        """
         if not self.can_start_game():
-            print(f"[GameManager] 게임 시작 불가: 최소 {MIN_PLAYERS}명 필요")
+            log.warning("게임 시작 불가: 최소 %s명 필요", MIN_PLAYERS)
             return False
 
         if self.running:
-            print("[GameManager] 게임이 이미 실행 중")
+            log.warning("게임이 이미 실행 중")
             return False
 
+        self.traffic_profile = get_traffic_profile(traffic_profile)
+        self._apply_traffic_profile()
+
         self.running = True
+        self.stop_event.clear()
         self.current_round = 0
         self.state = GameState.PREPARATION
+        self._phase_due = None
 
         self.game_thread = threading.Thread(target=self._game_loop, daemon=True)
         self.game_thread.start()
-        print("[GameManager] 게임 시작")
+        log.info("게임 시작")
         return True
 
     def stop_game(self):
         """게임 중지"""
         self.running = False
-        if self.game_thread:
+        self.stop_event.set()  # 대기 중인 단계를 바로 깨움
+        if self.game_thread and self.game_thread is not threading.current_thread():
             self.game_thread.join(timeout=5)
 
+        with self.lock:
+            self._sweep_attacks("게임 중지")
+
         # 상태 초기화 (다시 시작할 수 있도록)
         self.state = GameState.WAITING
         self.current_round = 0
@@ -113,7 +149,7 @@ class GameManager:
         )
         self.broadcast_callback(end_msg, None)
 
-        print("[GameManager] 게임 중지 - 대기 상태로 전환")
+        log.info("게임 중지 - 대기 상태로 전환")
 
     def _game_loop(self):
         """게임 메인 루프"""
@@ -133,7 +169,7 @@ class GameManager:
             self._end_game()
 
         except Exception as e:
-            print(f"[GameManager] 게임 루프 오류: {e}")
+            log.error("게임 루프 오류: %s", e)
             self.stop_game()
 
     def _run_round(self, round_num: int):
@@ -143,11 +179,12 @@ class GameManager:
         Args:
             round_num: 라운드 번호
         """
-        print(f"[GameManager] 라운드 {round_num} 시작")
+        log.info("라운드 %s 시작", round_num)
 
         # 난이도 설정 로드
-        self.current_difficulty = DIFFICULTY_BY_ROUND.get(round_num, DIFFICULTY_BY_ROUND[1])
-        print(f"[GameManager] 난이도: {self.current_difficulty['name']}")
+        self.current_difficulty = self._difficulty_for(round_num)
+        log.info("난이도: %s", self.current_difficulty['name'])
+        self.events.publish(RoundStarted(self.room_id, round_num, self.current_difficulty['name']))
 
         # 더미 생성기 인터벌 조정
         if self.dummy_generator:
@@ -156,9 +193,10 @@ class GameManager:
 
         # 라운드 데이터 초기화
         self.player_manager.reset_all_round_data()
-        self.defense_submissions.clear()
-        self.attack_counts.clear()
-        self.real_attacks.clear()
+        with self.lock:
+            self._sweep_attacks(f"라운드 {round_num} 시작")
+            self.attack_counts.clear()
+            self.scoreboard.reset()
 
         # 준비 단계
         self._preparation_phase(round_num)
@@ -180,7 +218,7 @@ class GameManager:
 
     def _preparation_phase(self, round_num: int):
         """준비 단계"""
-        self.state = GameState.PREPARATION
+        self._enter_phase(GameState.PREPARATION, PREPARATION_TIME)
 
         # 난이도 정보 포함
         difficulty = self.current_difficulty
@@ -201,24 +239,28 @@ class GameManager:
         )
         self.broadcast_callback(message, None)
 
+        # 이번 라운드 트래픽 프레임 미리 생성 (ROUND_END에서 채운 풀을 난이도에 맞게 보충)
+        self._refill_traffic_pools(difficulty)
+
         # 준비 시간 대기
-        time.sleep(PREPARATION_TIME)
+        self._wait(PREPARATION_TIME)
 
     def _playing_phase(self, round_num: int):
         """게임 진행 단계"""
-        self.state = GameState.PLAYING
-        self.round_start_time = time.time()
+        self._enter_phase(GameState.PLAYING, ROUND_TIME)
+        self.round_start_time = self.clock.wall()
+        round_deadline = self.clock.now() + ROUND_TIME
 
         # 노이즈 트래픽 활성화 여부 확인 (R3+)
         if self.noise_generator and self.current_difficulty['noise_traffic']:
             self.noise_generator.start()
-            print(f"[GameManager] 노이즈 트래픽 활성화 (R{round_num})")
+            log.info("노이즈 트래픽 활성화 (R%s)", round_num)
 
         # 가짜 공격 활성화 여부 확인 (R5만)
         if self.decoy_generator and self.current_difficulty['decoy_attacks']:
             decoy_count = self.current_difficulty['decoy_count']
             self.decoy_generator.start(ROUND_TIME, decoy_count)
-            print(f"[GameManager] 가짜 공격 활성화 (R{round_num}, {decoy_count}개)")
+            log.info("가짜 공격 활성화 (R%s, %s개)", round_num, decoy_count)
 
         message = GameStateMessage(
             state="PLAYING",
@@ -228,14 +270,18 @@ class GameManager:
         )
         self.broadcast_callback(message, None)
 
-        # 라운드 시간 동안 대기 (실시간 타이머 업데이트)
-        elapsed = 0
-        while elapsed < ROUND_TIME and self.running:
-            time.sleep(1)
-            elapsed = int(time.time() - self.round_start_time)
+        # 라운드 시간 동안 대기 (남은 시간이 10초 단위가 될 때마다 깨어나 알림)
+        while self.running:
+            remaining = round_deadline - self.clock.now()
+            if remaining <= 0:
+                break
+            next_mark = math.ceil(remaining / 10 - 1e-3) * 10 - 10  # 일찍 깨어나도 같은 알림을 두 번 보내지 않도록
+            next_mark = max(next_mark, 0)  # 몇 ms 남기고 깨어나면 -10이 되어 10초를 더 기다리지 않도록
+            if self._wait(remaining - next_mark):
+                break
 
             # 10초마다 시간 알림
-            remaining = ROUND_TIME - elapsed
+            remaining = int(round(round_deadline - self.clock.now()))
             if remaining % 10 == 0 and remaining > 0:
                 info = InfoMessage(
                     info_type="TIME_UPDATE",
@@ -252,12 +298,14 @@ class GameManager:
         if self.decoy_generator:
             self.decoy_generator.stop()
 
+        if self.traffic_profile.paced:
+            self._log_traffic_rates(f"R{round_num}")
+
     def _defense_phase(self, round_num: int):
         """방어 입력 단계"""
-        self.state = GameState.DEFENSE
-
         # 난이도별 방어 입력 시간 사용
         defense_time = self.current_difficulty['defense_time']
+        self._enter_phase(GameState.DEFENSE, defense_time)
 
         message = GameStateMessage(
             state="DEFENSE_PHASE",
@@ -268,19 +316,21 @@ class GameManager:
         self.broadcast_callback(message, None)
 
         # 방어 입력 시간 대기
-        time.sleep(defense_time)
+        self._wait(defense_time)
 
     def _round_end_phase(self, round_num: int):
         """라운드 종료 단계"""
-        self.state = GameState.ROUND_END
+        self._enter_phase(GameState.ROUND_END, 5)
 
         # 점수 계산
         results = self._calculate_scores()
 
         # 결과 전송
+        scored = []
         for player_id, result in results.items():
             player = self.player_manager.get_player(player_id)
             if player:
+                scored.append({'player_id': player_id, 'score': player.score, 'hp': player.hp, **result})
                 score_msg = ScoreMessage(
                     player_id=player_id,
                     score=player.score,
@@ -289,6 +339,10 @@ class GameManager:
                     reason=result['reason']
                 )
                 self.broadcast_callback(score_msg, [player])
+        self.events.publish(ScoresComputed(self.room_id, round_num, tuple(scored)))
+
+        # SCORE 전송 후 라운드 공격 기록으로 다시 계산해 누적 카운터 검증 (응답 지연에 포함되지 않음)
+        self._verify_scores(list(results), round_num == 5)
 
         # 라운드 결과 요약
         players_info = self.player_manager.get_players_info()
@@ -300,121 +354,112 @@ class GameManager:
         )
         self.broadcast_callback(summary, None)
 
+        # 다음 라운드 트래픽 프레임 미리 생성
+        if round_num < TOTAL_ROUNDS:
+            self._refill_traffic_pools(self._difficulty_for(round_num + 1))
+
         # 다음 라운드 전 대기
-        time.sleep(5)
+        self._wait(5)
+
+    def _difficulty_for(self, round_num: int) -> dict:
+        """라운드 난이도 설정 (트래픽 프로필 적용)"""
+        return self.traffic_profile.apply(DIFFICULTY_BY_ROUND.get(round_num, DIFFICULTY_BY_ROUND[1]), ROUND_TIME)
+
+    def _apply_traffic_profile(self):
+        """트래픽 프로필의 전송률을 생성기에 설정 (pps가 None인 생성기는 난이도 설정의 간격 사용)"""
+        profile = self.traffic_profile
+        for generator, pps in ((self.dummy_generator, profile.dummy_pps),
+                               (self.noise_generator, profile.noise_pps),
+                               (self.decoy_generator, profile.decoy_pps)):
+            if generator:
+                # 0이면 생성기를 켜지 않으므로 토큰 버킷도 필요 없음
+                generator.set_rate(pps if pps else None, profile.burst)
+        log.info("트래픽 프로필: %s (%s)", profile.name, profile.description)
+
+    def _log_traffic_rates(self, label: str):
+        """토큰 버킷으로 보낸 생성기의 요청 대비 실제 전송률 출력"""
+        for name, stats in self.get_traffic_stats()['generators'].items():
+            if stats:
+                log.info("[%s] %s 전송률: 요청 %spps, 실제 %spps (%.1f%%, %s개)",
+                         label, name, stats['requested_pps'], stats['achieved_pps'], stats['ratio'] * 100, stats['sent'])
+
+    def _refill_traffic_pools(self, difficulty: dict):
+        """
+        더미/노이즈/가짜 공격 프레임 풀 채우기 (라운드 중에는 꺼내서 보내기만 하도록)
+
+        Args:
+            difficulty: 프레임을 보낼 라운드의 난이도 설정
+        """
+        versions = {player.wire_version for player in self.player_manager.snapshot().players} or {WIRE_VERSION_JSON}
+        built = 0
+        if self.dummy_generator:
+            # 더미는 라운드 사이에도 계속 전송되므로 다음 채우기까지 한 주기 분량
+            cycle = PREPARATION_TIME + ROUND_TIME + difficulty['defense_time'] + 5
+            built += self.dummy_generator.refill(cycle, versions)
+        if self.noise_generator and difficulty['noise_traffic']:
+            built += self.noise_generator.refill(ROUND_TIME, versions)
+        if self.decoy_generator and difficulty['decoy_attacks']:
+            built += self.decoy_generator.refill(difficulty['decoy_count'], versions)
+        if built:
+            log.info("트래픽 프레임 %s개 미리 생성 (와이어 버전 %s)", built, sorted(versions))
+
+    def _verify_scores(self, player_ids: List[str], is_final_round: bool):
+        """
+        누적 카운터 결과와 라운드 공격 기록(RoundAttackLog) 재계산 결과 비교
+
+        Args:
+            player_ids: 점수를 계산한 플레이어 ID 목록
+            is_final_round: 마지막 라운드 여부
+        """
+        with self.lock:
+            expected = self.scoreboard.recount(player_ids, is_final_round, self.score_engine)
+            actual = self.scoreboard.results(player_ids, is_final_round)
+            attack_total = len(self.scoreboard.log)
+        mismatched = [player_id for player_id in player_ids if expected[player_id] != actual[player_id]]
+        if mismatched:
+            log.error("점수 카운터 불일치 (공격 기록 %s건 재계산과 다름): %s", attack_total, mismatched)
 
     def _calculate_scores(self) -> Dict[str, dict]:
         """
         점수 계산 (라운드별 가중치 적용, v2.0: 가짜 공격 구분)
+        공격 완료/방어 제출 시점에 RoundScoreboard가 이미 집계해 두었으므로 결과만 반영
 
         Returns:
             {player_id: {'correct': bool, 'reason': str}}
         """
-        results = {}
         players = self.player_manager.get_all_players()
-
-        # 라운드별 점수 가중치 선택
         is_final_round = (self.current_round == 5)
-        if is_final_round:
-            score_correct = SCORE_CORRECT_DEFENSE_FINAL
-            score_wrong = SCORE_WRONG_DEFENSE_FINAL
-            score_missed = SCORE_MISSED_ATTACK_FINAL
-        else:
-            score_correct = SCORE_CORRECT_DEFENSE_NORMAL
-            score_wrong = SCORE_WRONG_DEFENSE_NORMAL
-            score_missed = SCORE_MISSED_ATTACK_NORMAL
-
-        # 플레이어별 실제 공격자 IP 추출 (real_attacks 기반, v2.0)
-        # v2.1: List 사용 (같은 IP의 공격도 모두 카운트)
-        real_attacks_by_target = {}
-        for attack in self.real_attacks:
-            if attack.get('is_real', True):  # 실제 공격만
-                target_id = attack['target_id']
-                attacker_ip = attack['attacker_ip']
-                if target_id not in real_attacks_by_target:
-                    real_attacks_by_target[target_id] = []
-                real_attacks_by_target[target_id].append(attacker_ip)
 
+        with self.lock:
+            scores = self.scoreboard.results([player.player_id for player in players], is_final_round)
+
+        results = {}
+        hp_changed = False
         for player in players:
-            # v2.1: 실제로 받은 공격 (real_attacks 기반, 가짜 공격 제외, 리스트로 변경)
-            actual_attacks = real_attacks_by_target.get(player.player_id, [])
-            actual_attacks_unique = set(actual_attacks)  # 중복 제거된 고유 IP 목록
-
-            # 플레이어가 제출한 방어 답변
-            submitted = set(self.defense_submissions.get(player.player_id, []))
-
-            print(f"[GameManager] {player.player_id} 점수 계산 - 실제 공격: {actual_attacks}, 제출: {submitted}")
-
-            # 정답 계산
-            # 고유 IP 기준으로 정답/오답 판정
-            correct_defenses = actual_attacks_unique & submitted  # 교집합 (정답)
-            wrong_defenses = submitted - actual_attacks_unique  # 오답 (가짜 공격 포함)
-
-            # 놓친 공격: 실제 공격 횟수 - 정답으로 방어한 공격 횟수
-            # v2.1: 정답으로 방어한 IP는 1번만 방어한 것으로 처리
-            missed_attacks_count = 0
-            for ip in actual_attacks_unique:
-                attack_count = actual_attacks.count(ip)  # 해당 IP의 총 공격 횟수
-                if ip in submitted:
-                    # 정답으로 제출한 경우: 1번만 방어, 나머지는 놓침
-                    missed_count = max(0, attack_count - 1)
-                    missed_attacks_count += missed_count
-                    print(f"[GameManager]   IP {ip}: {attack_count}번 공격, 1번 방어, {missed_count}번 놓침")
-                else:
-                    # 아예 제출하지 않은 경우: 모든 공격을 놓침
-                    missed_attacks_count += attack_count
-                    print(f"[GameManager]   IP {ip}: {attack_count}번 공격, 0번 방어, {attack_count}번 놓침")
-
-            print(f"[GameManager] {player.player_id} - 정답: {len(correct_defenses)}개, 오답: {len(wrong_defenses)}개, 놓친 공격: {missed_attacks_count}개")
-
-            # 하위 호환성을 위해 missed_attacks set도 유지
-            missed_attacks = actual_attacks_unique - submitted  # 놓친 공격자 IP (고유)
-
-            # 점수 업데이트
-            score_change = 0
-
-            score_change += len(correct_defenses) * score_correct
-            score_change += len(wrong_defenses) * score_wrong
-            score_change += missed_attacks_count * score_missed  # v2.1: 실제 공격 횟수 기준
+            score = scores[player.player_id]
+            log.debug("%s - 정답: %s개, 오답: %s개, 놓친 공격: %s개",
+                      player.player_id, score.correct_count, score.wrong_count, score.missed_count)
 
             # v2.1: 음수 점수 허용 (0점 제한 제거)
-            self.player_manager.update_score(player.player_id, score_change)
+            self.player_manager.update_score(player.player_id, score.score_delta)
 
-            # HP 감소 (놓친 공격 1개당 HP_DAMAGE_PER_ATTACK만큼 감소)
-            # v2.1: 실제 공격 횟수 기준으로 HP 감소
-            if missed_attacks_count > 0:
-                hp_damage = missed_attacks_count * HP_DAMAGE_PER_ATTACK
+            # HP 감소 (v2.1: 실제 공격 횟수 기준, 놓친 공격 1개당 HP_DAMAGE_PER_ATTACK)
+            if score.hp_damage > 0:
                 old_hp = player.hp
-                new_hp = self.player_manager.update_hp(player.player_id, -hp_damage)
-                print(f"[GameManager] {player.player_id} HP 감소: {old_hp} -> {new_hp} (-{hp_damage}, 놓친 공격: {missed_attacks_count}개)")
-
-                # v2.1: HP 변경 시 플레이어 목록 브로드캐스트
-                if self.player_list_callback:
-                    self.player_list_callback()
-
-            # 결과 메시지 생성
-            reason_parts = []
-            if correct_defenses:
-                reason_parts.append(f"정확한 방어: {len(correct_defenses)}개 (+{len(correct_defenses) * score_correct}점)")
-            if wrong_defenses:
-                reason_parts.append(f"오답: {len(wrong_defenses)}개 ({len(wrong_defenses) * score_wrong}점)")
-            if missed_attacks_count > 0:
-                reason_parts.append(f"놓친 공격: {missed_attacks_count}개 ({missed_attacks_count * score_missed}점)")
-
-            if not reason_parts:
-                reason = "공격 없음"
-            else:
-                reason = ", ".join(reason_parts)
-
-            # v2.0: 가짜 공격 경고 추가 (R5)
-            if is_final_round and len(wrong_defenses) > 0:
-                reason += f" [경고: 가짜 공격 {len(wrong_defenses)}개 포함 가능]"
+                new_hp = self.player_manager.update_hp(player.player_id, -score.hp_damage)
+                log.info("%s HP 감소: %s -> %s (-%s, 놓친 공격: %s개)",
+                         player.player_id, old_hp, new_hp, score.hp_damage, score.missed_count)
+                hp_changed = True
 
             results[player.player_id] = {
-                'correct': len(wrong_defenses) == 0 and len(missed_attacks) == 0,
-                'reason': reason
+                'correct': score.correct,
+                'reason': score.reason
             }
 
+        # v2.1: HP 변경 시 플레이어 목록 브로드캐스트 (라운드당 한 번)
+        if hp_changed and self.player_list_callback:
+            self.player_list_callback()
+
         return results
 
     def submit_defense(self, player_id: str, attacker_ips: List[str]):
@@ -423,19 +468,16 @@ class GameManager:
 
         Args:
             player_id: 플레이어 ID
-            attacker_ips: 공격자 IP 리스트
+            attacker_ips: 공격자 IP 리스트 (클라이언트가 보낸 문자열, 여기서 정수 키로 변환)
         """
         with self.lock:
-            # v2.1: 기존 제출에 추가 (덮어쓰기 대신 누적)
-            if player_id not in self.defense_submissions:
-                self.defense_submissions[player_id] = []
-
-            # 중복 제거하면서 추가
-            current = set(self.defense_submissions[player_id])
-            current.update(attacker_ips)
-            self.defense_submissions[player_id] = list(current)
+            # v2.1: 기존 제출에 추가 (덮어쓰기 대신 누적, 정답 카운터도 함께 갱신)
+            keys = [self.scoreboard.ip_key(ip) for ip in attacker_ips]
+            submitted = self.scoreboard.submit(player_id, keys)
 
-            print(f"[GameManager] {player_id} 방어 제출: {attacker_ips} (누적: {self.defense_submissions[player_id]})")
+            submitted = tuple(self.scoreboard.ip_text(key) for key in sorted(submitted))
+            log.info("%s 방어 제출: %s (누적: %s)", player_id, attacker_ips, list(submitted))
+        self.events.publish(DefenseSubmitted(self.room_id, player_id, tuple(attacker_ips), submitted))
 
     def _broadcast_game_start(self):
         """게임 시작 알림"""
@@ -448,11 +490,39 @@ class GameManager:
             players=players_info
         )
         self.broadcast_callback(message, None)
-        time.sleep(3)
+        self.events.publish(GameStarted(self.room_id, self.traffic_profile.name,
+                                        tuple(info['player_id'] for info in players_info)))
+        self._phase_due = self.clock.now() + 3
+        self._wait(3)
+
+    def _enter_phase(self, state: GameState, duration: Optional[float] = None):
+        """
+        단계 전환 (이전 단계가 끝나야 할 시각보다 늦게 시작했으면 그만큼을 단계 시작 지연으로 기록)
+
+        Args:
+            state: 새 게임 상태
+            duration: 단계 길이 (초, None이면 다음 단계 예정 시각 없음)
+        """
+        self.state = state
+        now = self.clock.now()
+        if self._phase_due is not None:
+            PHASE_DRIFT.observe(max(0.0, now - self._phase_due), state.value)
+        self._phase_due = now + duration if duration is not None else None
+
+    def _wait(self, seconds: float) -> bool:
+        """
+        단계 대기 (stop_game이 호출되면 바로 반환)
+
+        Returns:
+            중지 요청으로 깨어났는지 여부
+        """
+        return self.clock.wait(self.stop_event, seconds)
 
     def _end_game(self):
         """게임 종료"""
-        self.state = GameState.GAME_END
+        self._enter_phase(GameState.GAME_END)
+        with self.lock:
+            self._sweep_attacks("게임 종료")
         players = self.player_manager.get_all_players()
 
         # 최종 순위 계산
@@ -475,7 +545,13 @@ class GameManager:
             winner=winner.player_id if winner else None
         )
         self.broadcast_callback(message, None)
-        print(f"[GameManager] 게임 종료 - 우승자: {winner.player_id if winner else 'N/A'}")
+        self.events.publish(GameEnded(self.room_id, winner.player_id if winner else None, tuple(rankings)))
+
+        # 부하 테스트 트래픽은 게임이 끝나면 멈춤 (classic은 기존처럼 게임 중지 시까지 더미 전송)
+        if self.traffic_profile.paced and self.dummy_generator:
+            self.dummy_generator.stop()
+            self._log_traffic_rates("게임 전체")
+        log.info("게임 종료 - 우승자: %s", winner.player_id if winner else 'N/A')
 
     def can_attack(self, player_id: str) -> tuple[bool, str]:
         """
@@ -505,37 +581,34 @@ class GameManager:
 
         return True, f"공격 가능 ({attack_count}/{attack_limit})"
 
-    def record_attack(self, attacker_id: str, target_id: str, attacker_ip: str):
+    def record_attack(self, attacker_id: str, target_id: str, attacker_ip_int: int):
         """
         공격 기록 (실제 공격만)
 
         Args:
             attacker_id: 공격자 ID
             target_id: 타겟 ID
-            attacker_ip: 공격자 IP
+            attacker_ip_int: 공격자 가상 IP (정수, Player.ip_int)
         """
         with self.lock:
             # 공격 횟수 증가
             self.attack_counts[attacker_id] = self.attack_counts.get(attacker_id, 0) + 1
 
-            # 실제 공격 기록 (가짜 공격과 구분)
-            self.real_attacks.append({
-                'attacker_id': attacker_id,
-                'target_id': target_id,
-                'attacker_ip': attacker_ip,
-                'timestamp': time.time()
-            })
+            # 실제 공격만 점수 카운터/공격 기록에 반영 (가짜 공격과 구분)
+            self.scoreboard.record_attack(attacker_id, target_id, attacker_ip_int, self.clock.wall())
 
-            print(f"[GameManager] 공격 기록: {attacker_id} -> {target_id} (횟수: {self.attack_counts[attacker_id]}/{self.current_difficulty['attack_limit']})")
+            log.debug("공격 기록: %s -> %s (횟수: %s/%s)",
+                      attacker_id, target_id, self.attack_counts[attacker_id], self.current_difficulty['attack_limit'])
 
     def get_current_state(self) -> dict:
         """현재 게임 상태 반환"""
+        players_info = self.player_manager.get_players_info()  # 스냅샷 조회라 self.lock 밖에서
         with self.lock:
             return {
                 'state': self.state.value,
                 'current_round': self.current_round,
                 'total_rounds': TOTAL_ROUNDS,
-                'players': self.player_manager.get_players_info(),
+                'players': players_info,
                 'difficulty': self.current_difficulty
             }
 
@@ -552,66 +625,51 @@ class GameManager:
         Returns:
             (승인 여부, 메시지, attack_id)
         """
+        requested_at = self.attacks.clock()  # 락 대기 시간도 승인 지연에 포함
         with self.lock:
             # 1. 자기 자신에 대한 공격 차단
             if attacker_id == target_id:
-                print(f"[GameManager] 공격 거부: {attacker_id} - 자기 자신은 공격할 수 없습니다")
-                return False, "자기 자신은 공격할 수 없습니다", None
+                log.debug("공격 거부: %s - 자기 자신은 공격할 수 없습니다", attacker_id)
+                return self._deny_attack(attacker_id, target_id, "자기 자신은 공격할 수 없습니다")
 
             # 2. 공격 가능 여부 확인
             can_attack, msg = self.can_attack(attacker_id)
             if not can_attack:
-                print(f"[GameManager] 공격 거부: {attacker_id} - {msg}")
-                return False, msg, None
+                log.debug("공격 거부: %s - %s", attacker_id, msg)
+                return self._deny_attack(attacker_id, target_id, msg)
 
-            print(f"[GameManager] 공격 가능 확인 통과: {attacker_id}")
+            log.debug("공격 가능 확인 통과: %s", attacker_id)
 
             # 3. 타겟 플레이어 확인
             target_player = self.player_manager.get_player(target_id)
             if not target_player:
-                return False, f"타겟 플레이어를 찾을 수 없습니다: {target_id}", None
+                return self._deny_attack(attacker_id, target_id, f"타겟 플레이어를 찾을 수 없습니다: {target_id}")
 
             attacker_player = self.player_manager.get_player(attacker_id)
             if not attacker_player:
-                return False, "공격자 정보를 찾을 수 없습니다", None
-
-            # 3. attack_id 생성
-            self.attack_sequence += 1
-            attack_id = f"{attacker_id}→{target_id}_{int(time.time())}_{self.attack_sequence}"
-
-            # 4. pending_attacks에 등록
-            self.pending_attacks[attack_id] = {
-                'from': attacker_id,
-                'to': target_id,
-                'from_ip': attacker_player.ip,
-                'to_ip': target_player.ip,
-                'timestamp': time.time(),
-                'attacker_sent': False,
-                'target_received': False,
-                'timeout_timer': None
-            }
+                return self._deny_attack(attacker_id, target_id, "공격자 정보를 찾을 수 없습니다")
 
-            # 5. 타임아웃 타이머 설정
-            timeout_timer = threading.Timer(
-                ATTACK_APPROVAL_TIMEOUT,
-                self._handle_attack_timeout,
-                args=[attack_id]
-            )
-            timeout_timer.daemon = True
-            timeout_timer.start()
-            self.pending_attacks[attack_id]['timeout_timer'] = timeout_timer
+            # 4. 공격 테이블에 등록 (정수 attack_id 발급)
+            record = self.attacks.create(attacker_id, target_id, attacker_player.ip_int, target_player.ip_int,
+                                         self.current_round, requested_at)
+            attack_id = record.attack_id
+
+            # 5. 타임아웃 타이머 설정 (공용 타이머 서비스, 완료/만료 시 O(1) 취소)
+            record.timer = self.timers.schedule(ATTACK_APPROVAL_TIMEOUT, self._handle_attack_timeout, attack_id)
+            self.attacks.approve(record)
 
             # 6. 메시지 준비 (lock 안에서)
             # 공격자에게: 공격 승인 메시지 (타겟의 **실제 컨테이너 IP** 포함)
-            target_port = PLAYER_ATTACK_PORT_BASE + self.player_manager.get_player_index(target_id)
+            target_index = self.player_manager.get_player_index(target_id)
+            target_port = PLAYER_ATTACK_PORT_BASE + target_index
             # 실제 컨테이너 IP 가져오기 (address[0])
             target_real_ip = target_player.address[0]
 
-            print(f"[GameManager] 타겟 포트 계산: {target_port} = {PLAYER_ATTACK_PORT_BASE} + {self.player_manager.get_player_index(target_id)}")
-            print(f"[GameManager] 타겟 실제 IP: {target_real_ip} (가상 IP: {target_player.ip})")
+            log.debug("타겟 포트 계산: %s = %s + %s", target_port, PLAYER_ATTACK_PORT_BASE, target_index)
+            log.debug("타겟 실제 IP: %s (가상 IP: %s)", target_real_ip, target_player.ip)
 
             approved_msg = AttackApprovedMessage(
-                attack_id=attack_id,
+                attack_id=str(attack_id),  # 와이어에서는 문자열 (클라이언트가 그대로 되돌려 보냄)
                 target_ip=target_real_ip,  # 실제 컨테이너 IP 사용!
                 target_port=target_port,
                 target_id=target_id
@@ -619,128 +677,194 @@ class GameManager:
 
             # 타겟에게: 수신 공격 경고 메시지 (공격자 IP 포함)
             warning_msg = IncomingAttackWarningMessage(
-                attack_id=attack_id,
+                attack_id=str(attack_id),
                 attacker_ip=attacker_player.ip,
                 attacker_id=attacker_id
             )
 
-            print(f"[GameManager] 공격 승인: {attacker_id} -> {target_id} (attack_id: {attack_id})")
+            log.info("공격 승인: %s -> %s (attack_id: %s)", attacker_id, target_id, attack_id)
 
         # 7. Lock 해제 후 메시지 전송 (데드락 방지)
-        print(f"[GameManager] 공격 승인 메시지 전송 중: {attacker_id} -> {target_id} ({target_real_ip}:{target_port})")
+        log.debug("공격 승인 메시지 전송 중: %s -> %s (%s:%s)", attacker_id, target_id, target_real_ip, target_port)
         self.broadcast_callback(approved_msg, [attacker_player])
-        print(f"[GameManager] 공격 승인 메시지 전송 완료")
+        log.debug("공격 승인 메시지 전송 완료")
 
         self.broadcast_callback(warning_msg, [target_player])
-        print(f"[GameManager] 공격 경고 메시지 전송 완료")
+        log.debug("공격 경고 메시지 전송 완료")
 
+        self.events.publish(AttackApproved(self.room_id, attack_id, attacker_id, target_id, record.round_num))
         return True, "공격이 승인되었습니다", attack_id
 
-    def confirm_attack_sent(self, attack_id: str) -> bool:
+    def _deny_attack(self, attacker_id: str, target_id: str, reason: str) -> tuple[bool, str, None]:
+        """공격 거부 이벤트 발행 후 request_attack_approval 반환값"""
+        self.events.publish(AttackDenied(self.room_id, attacker_id, target_id, reason))
+        return False, reason, None
+
+    def confirm_attack_sent(self, attack_id, trace: Optional[dict] = None) -> bool:
         """
         공격 전송 확인 (공격자가 P2P로 패킷 전송 완료 시 호출)
 
         Args:
-            attack_id: 공격 ID
+            attack_id: 공격 ID (정수 또는 숫자 문자열)
+            trace: 공격자가 보고한 구간 시간 (ms, 구버전 클라이언트는 None)
 
         Returns:
             확인 성공 여부
         """
         with self.lock:
-            if attack_id not in self.pending_attacks:
-                print(f"[GameManager] 알 수 없는 attack_id (SENT): {attack_id}")
-                print(f"[GameManager] 현재 pending_attacks: {list(self.pending_attacks.keys())}")
+            record = self.attacks.get(attack_id)
+            if record is None:
+                log.warning("알 수 없는 attack_id (SENT): %s", attack_id)
+                log.debug("현재 진행 중인 공격: %s", list(self.attacks.live))
                 return False
 
-            self.pending_attacks[attack_id]['attacker_sent'] = True
-            attack_info = self.pending_attacks[attack_id]
-            print(f"[GameManager] 공격 전송 확인: {attack_id} (attacker_sent={attack_info['attacker_sent']}, target_received={attack_info['target_received']})")
+            both = self.attacks.mark_sent(record, trace)
+            log.debug("공격 전송 확인: %s (attacker_sent=%s, target_received=%s)",
+                      record.attack_id, record.sent, record.received)
 
             # 양방향 확인 완료 시 공격 완료 처리
-            self._check_attack_complete(attack_id)
+            if both:
+                self._complete_attack(record)
             return True
 
-    def confirm_attack_received(self, attack_id: str) -> bool:
+    def confirm_attack_received(self, attack_id, trace: Optional[dict] = None) -> bool:
         """
         공격 수신 확인 (타겟이 P2P 패킷 수신 완료 시 호출)
 
         Args:
-            attack_id: 공격 ID
+            attack_id: 공격 ID (정수 또는 숫자 문자열)
+            trace: 타겟이 보고한 구간 시간 (ms, 구버전 클라이언트는 None)
 
         Returns:
             확인 성공 여부
         """
         with self.lock:
-            if attack_id not in self.pending_attacks:
-                print(f"[GameManager] 알 수 없는 attack_id (RECEIVED): {attack_id}")
-                print(f"[GameManager] 현재 pending_attacks: {list(self.pending_attacks.keys())}")
+            record = self.attacks.get(attack_id)
+            if record is None:
+                log.warning("알 수 없는 attack_id (RECEIVED): %s", attack_id)
+                log.debug("현재 진행 중인 공격: %s", list(self.attacks.live))
                 return False
 
-            self.pending_attacks[attack_id]['target_received'] = True
-            attack_info = self.pending_attacks[attack_id]
-            print(f"[GameManager] 공격 수신 확인: {attack_id} (attacker_sent={attack_info['attacker_sent']}, target_received={attack_info['target_received']})")
+            both = self.attacks.mark_received(record, trace)
+            log.debug("공격 수신 확인: %s (attacker_sent=%s, target_received=%s)",
+                      record.attack_id, record.sent, record.received)
 
             # 양방향 확인 완료 시 공격 완료 처리
-            self._check_attack_complete(attack_id)
+            if both:
+                self._complete_attack(record)
             return True
 
-    def _check_attack_complete(self, attack_id: str):
+    def report_attack_failure(self, attack_id, reporter_id: str, trace: Optional[dict] = None) -> bool:
         """
-        공격 양방향 확인 완료 시 처리
+        공격자의 P2P 전송 실패 보고 (타임아웃을 기다리지 않고 바로 만료)
 
         Args:
-            attack_id: 공격 ID
+            attack_id: 공격 ID (정수 또는 숫자 문자열)
+            reporter_id: 보고한 플레이어 ID (공격자 본인만 인정)
+            trace: 실패 단계(stage), 원인(error), 구간 시간(ms)
+
+        Returns:
+            처리 여부
         """
-        if attack_id not in self.pending_attacks:
-            print(f"[GameManager] _check_attack_complete: attack_id not in pending_attacks: {attack_id}")
-            return
+        with self.lock:
+            record = self.attacks.get(attack_id)
+            if record is None or record.attacker_id != reporter_id:
+                log.warning("알 수 없는 attack_id (FAILED): %s (보고: %s)", attack_id, reporter_id)
+                return False
 
-        attack_info = self.pending_attacks[attack_id]
-        print(f"[GameManager] _check_attack_complete: {attack_id} - attacker_sent={attack_info['attacker_sent']}, target_received={attack_info['target_received']}")
+            self.attacks.mark_failed(record, trace)
+            failure = record.failure
+            log.info("공격 전송 실패: %s (%s -> %s, %s/%s)", record.attack_id, record.attacker_id,
+                     record.target_id, failure['stage'], failure['error'])
+            self.attacks.expire(record)
+            self.events.publish(AttackExpired(self.room_id, record.attack_id, record.attacker_id, record.target_id,
+                                              f"전송 실패 ({failure['stage']}/{failure['error']})"))
+            return True
 
-        # 양방향 확인 완료
-        if attack_info['attacker_sent'] and attack_info['target_received']:
-            # 타임아웃 타이머 취소
-            if attack_info['timeout_timer']:
-                attack_info['timeout_timer'].cancel()
+    def _complete_attack(self, record):
+        """
+        공격 양방향 확인 완료 처리 (self.lock을 잡은 상태에서 호출)
 
-            # 공격 횟수 증가
-            attacker_id = attack_info['from']
-            target_id = attack_info['to']
-            attacker_ip = attack_info['from_ip']
+        Args:
+            record: AttackRecord
+        """
+        # 완료 시각 기록, 타임아웃 타이머 취소, 테이블에서 제거
+        self.attacks.complete(record)
 
-            self.attack_counts[attacker_id] = self.attack_counts.get(attacker_id, 0) + 1
+        attacker_id = record.attacker_id
+        target_id = record.target_id
+        attacker_ip_int = record.attacker_ip_int
 
-            # 실제 공격 기록
-            self.real_attacks.append({
-                'attacker_id': attacker_id,
-                'target_id': target_id,
-                'attacker_ip': attacker_ip,
-                'timestamp': time.time(),
-                'is_real': True
-            })
+        # 공격 횟수 증가
+        self.attack_counts[attacker_id] = self.attack_counts.get(attacker_id, 0) + 1
 
-            # 타겟의 attacks_received 업데이트
-            self.player_manager.record_attack(target_id, attacker_ip)
+        # 공격 기록 및 점수 카운터 바로 갱신
+        self.scoreboard.record_attack(attacker_id, target_id, attacker_ip_int, self.clock.wall())
 
-            # pending_attacks에서 제거
-            del self.pending_attacks[attack_id]
+        # 타겟의 attacks_received 업데이트
+        self.player_manager.record_attack(target_id, attacker_ip_int)
 
-            print(f"[GameManager] ✅ 공격 완료: {attacker_id} -> {target_id} (attack_id: {attack_id}, 횟수: {self.attack_counts[attacker_id]}/{self.current_difficulty['attack_limit']}, total real_attacks: {len(self.real_attacks)})")
-        else:
-            print(f"[GameManager] 공격 미완료 (대기 중): {attack_id} - attacker_sent={attack_info['attacker_sent']}, target_received={attack_info['target_received']}")
+        latency_ms = record.elapsed(AttackState.COMPLETE) * 1000
+        self.events.publish(AttackCompleted(self.room_id, record.attack_id, attacker_id, target_id, int_to_ip(attacker_ip_int),
+                                            round(latency_ms, 3)))
+        log.info("✅ 공격 완료: %s -> %s (attack_id: %s, %.1fms, 횟수: %s/%s)",
+                 attacker_id, target_id, record.attack_id, latency_ms, self.attack_counts[attacker_id], self.current_difficulty['attack_limit'])
 
-    def _handle_attack_timeout(self, attack_id: str):
+    def _handle_attack_timeout(self, attack_id: int):
         """
-        공격 타임아웃 처리
+        공격 타임아웃 처리 (공용 타이머 스레드)
+
+        타이머 스레드는 모든 방이 함께 쓰므로 방 락을 기다리지 않는다. 락을 바로 잡지 못하면
+        ATTACK_TIMEOUT_RETRY초 뒤 다시 시도해, 바쁜 방 하나가 다른 방의 타임아웃을 늦추지 않게 함
+        (그 사이 완료/만료된 공격은 테이블에 없으므로 재시도는 아무 일도 하지 않음)
 
         Args:
             attack_id: 공격 ID
         """
+        if not self.lock.acquire(blocking=False):
+            self.timers.schedule(ATTACK_TIMEOUT_RETRY, self._handle_attack_timeout, attack_id)
+            return
+        try:
+            record = self.attacks.get(attack_id)
+            if record is not None:
+                log.info("공격 타임아웃: %s (attacker_sent=%s, target_received=%s)", attack_id, record.sent, record.received)
+
+                # 테이블에서 제거 (공격 무효화)
+                self.attacks.expire(record)
+                self.events.publish(AttackExpired(self.room_id, record.attack_id, record.attacker_id,
+                                                  record.target_id, "타임아웃"))
+        finally:
+            self.lock.release()
+
+    def _sweep_attacks(self, reason: str):
+        """
+        라운드/게임 경계에서 남은 공격 일괄 만료 (self.lock을 잡은 상태에서 호출)
+
+        Args:
+            reason: 로그용 사유
+        """
+        expired = self.attacks.sweep()
+        if expired:
+            log.info("미완료 공격 %s개 만료 (%s)", len(expired), reason)
+        for record in expired:
+            self.events.publish(AttackExpired(self.room_id, record.attack_id, record.attacker_id,
+                                              record.target_id, reason))
+
+    def get_traffic_stats(self) -> dict:
+        """트래픽 프로필과 생성기별 요청 대비 실제 전송률 (토큰 버킷을 쓰지 않는 생성기는 None)"""
+        generators = {}
+        for name, generator in (('dummy', self.dummy_generator),
+                                ('noise', self.noise_generator),
+                                ('decoy', self.decoy_generator)):
+            generators[name] = generator.pacing_stats() if generator else None
+        return {'profile': self.traffic_profile.name, 'generators': generators}
+
+    def get_attack_stats(self) -> dict:
+        """공격 테이블 통계 (진행 중/상태별 수, 요청→전달 지연 히스토그램)"""
         with self.lock:
-            if attack_id in self.pending_attacks:
-                attack_info = self.pending_attacks[attack_id]
-                print(f"[GameManager] 공격 타임아웃: {attack_id} (attacker_sent={attack_info['attacker_sent']}, target_received={attack_info['target_received']})")
+            return self.attacks.stats()
 
-                # pending_attacks에서 제거 (공격 무효화)
-                del self.pending_attacks[attack_id]
+    def get_attack_traces(self) -> List[dict]:
+        """진행 중 + 최근 완료/만료 공격의 타임라인 (최신순)"""
+        with self.lock:
+            return self.attacks.traces()
@@ -0,0 +1,564 @@
+"""
+게임 서버 코어
+연결 처리(엔진)와 화면(웹 GUI)을 제외한 게임 서버 로직
+- 플레이어 접속/종료, 방 배정, 메시지 처리
+- 게임 진행과 브로드캐스트는 방(server.room.Room) 단위
+- 연결 수락과 수신 루프는 server.engines의 엔진이 담당 (threaded / asyncio)
+"""
+
+import logging
+import time
+from typing import Optional
+
+from common.protocol import Protocol
+from common.constants import (
+    DEFAULT_HOST, DEFAULT_PORT, MIN_PLAYERS,
+    MSG_TYPE_ATTACK, MSG_TYPE_DEFENSE, MSG_TYPE_CONNECT,
+    MSG_TYPE_ATTACK_REQUEST, MSG_TYPE_ATTACK_CONFIRM, WIRE_VERSION_JSON,
+    CONFIRM_SENT, CONFIRM_RECEIVED, CONFIRM_FAILED
+)
+from common.message_types import (
+    Message, AttackMessage, InfoMessage,
+    decode_payload
+)
+from server.player_manager import Player, DuplicatePlayerError
+from server.room import Room, RoomManager
+from server.engines import create_engine, DEFAULT_ENGINE
+from server.timer_service import get_timer_service
+from server.traffic_scheduler import get_traffic_scheduler
+from server.traffic_profiles import TRAFFIC_PROFILES, DEFAULT_TRAFFIC_PROFILE, get_traffic_profile
+from server.packet_log import MmapPacketLog
+from server.telemetry import collect_server
+from common.log import get_logger, get_log_stats
+from server.event_bus import (
+    EventBus, PlayerJoined, PlayerLeft, RoundStarted, AttackApproved, AttackDenied, AttackCompleted,
+    AttackExpired, DefenseSubmitted, ScoresComputed, GameEnded
+)
+
+
+log = get_logger(__name__, "서버")
+
+# GUI 로그 레벨 -> 로그 레벨 (success/attack은 INFO)
+GUI_LOG_LEVELS = {'warning': logging.WARNING, 'error': logging.ERROR}
+
+# 서버 로그로 남기는 게임 이벤트 (GameStarted는 start_game이 프로필과 함께 직접 남김)
+GUI_LOG_EVENTS = (PlayerJoined, PlayerLeft, RoundStarted, AttackApproved, AttackDenied, AttackCompleted,
+                  AttackExpired, DefenseSubmitted, ScoresComputed, GameEnded)
+
+
+class GameServer:
+    """
+    게임 서버 코어
+
+    화면 갱신은 log_to_gui / _publish_player_list / _publish_packet 훅으로 분리되어 있어
+    웹 GUI(WebGameServer)는 이 클래스를 상속해 훅만 재정의한다.
+    게임 진행 이벤트(라운드/공격/방어/점수)는 self.events 구독자(_log_game_event)가 받아
+    구독자 스레드에서 서버 로그로 남기므로 게임 스레드와 수신 스레드는 화면 처리를 기다리지 않는다.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 engine: str = DEFAULT_ENGINE, shard=None, traffic_profile: str = DEFAULT_TRAFFIC_PROFILE,
+                 packet_log_dir: Optional[str] = None):
+        """
+        Args:
+            host: 게임 서버 호스트
+            port: 게임 서버 포트
+            engine: 연결 처리 엔진 이름 ("threaded" 또는 "asyncio")
+            shard: 멀티 프로세스 워커 모드의 ShardRouter (None이면 단일 프로세스)
+            traffic_profile: 게임 시작 시 프로필을 지정하지 않으면 쓸 트래픽 프로필 이름
+            packet_log_dir: 전체 패킷 로그를 남길 디렉터리 (None이면 메모리의 최근 기록만)
+        """
+        self.host = host
+        self.port = port
+        self.traffic_profile = get_traffic_profile(traffic_profile).name
+        self.packet_store = MmapPacketLog(packet_log_dir) if packet_log_dir else None
+        self.running = False
+        self.shard = shard
+
+        # 게임 이벤트 버스 (모든 방 공용, 관찰자는 구독자로 추가)
+        self.events = EventBus()
+        self.events.subscribe(self._log_game_event, name="gui-log", event_types=GUI_LOG_EVENTS)
+
+        # 연결 수락/수신 루프 엔진 (워커 모드에서는 SO_REUSEPORT로 포트 공유)
+        self.engine = create_engine(engine, self, reuse_port=shard is not None)
+
+        # 방 목록 (방마다 PlayerManager / GameManager / 생성기 / 가상 IP 대역)
+        if shard is None:
+            self.rooms = RoomManager(on_player_list=self._publish_player_list, event_bus=self.events)
+        else:
+            # 이 워커가 소유한 방만 만들고, 가상 IP 대역은 워커 번호로 나눔
+            self.rooms = RoomManager(on_player_list=self._publish_player_list,
+                                     owns=shard.owns,
+                                     subnet_start=shard.index + 1,
+                                     subnet_step=shard.workers,
+                                     event_bus=self.events)
+
+    def start(self):
+        """서버 시작"""
+        if self.running:
+            return False, "서버가 이미 실행 중입니다"
+
+        try:
+            self.running = True
+            if not self.engine.start(self.host, self.port):
+                self.running = False
+                return False, "서버 소켓 생성 실패"
+
+            if self.packet_store:
+                self.packet_store.start()
+            self.log_to_gui(f"서버 시작: {self.host}:{self.port} ({self.engine.name})", "success")
+            return True, "서버 시작됨"
+
+        except Exception as e:
+            self.running = False
+            return False, f"서버 시작 실패: {e}"
+
+    def stop(self):
+        """서버 중지"""
+        if not self.running:
+            return False, "서버가 실행되지 않았습니다"
+
+        self.running = False
+        rooms = self.rooms.get_all_rooms()
+        for room in rooms:
+            room.stop_game()
+
+        # 모든 송신 큐 중지 후 엔진이 서버 소켓과 클라이언트 연결을 종료
+        for room in rooms:
+            for player in room.player_manager.get_all_players():
+                try:
+                    if player.writer is not None:
+                        player.writer.close()
+                except:
+                    pass
+        self.engine.stop()
+        if self.packet_store:
+            self.packet_store.close()
+
+        self.log_to_gui("서버 중지됨", "warning")
+        return True, "서버 중지됨"
+
+    def start_game(self, room_id: Optional[str] = None, traffic_profile: Optional[str] = None):
+        """
+        방의 게임 시작
+
+        Args:
+            room_id: 방 ID (None이면 기본 방)
+            traffic_profile: 트래픽 프로필 이름 (None이면 서버 기본 프로필)
+        """
+        if not self.running:
+            return False, "서버가 실행되지 않았습니다"
+
+        try:
+            profile = get_traffic_profile(traffic_profile or self.traffic_profile)
+        except ValueError as e:
+            return False, str(e)
+
+        room = self.rooms.get_room(room_id)
+        if not room:
+            return False, f"방을 찾을 수 없습니다: {room_id}"
+
+        if not room.game_manager.can_start_game():
+            return False, f"최소 {MIN_PLAYERS}명의 플레이어가 필요합니다"
+
+        if room.start_game(profile.name):
+            self.log_to_gui(f"[{room.room_id}] 게임 시작됨 (트래픽 프로필: {profile.name})", "success")
+            return True, "게임 시작됨"
+        else:
+            return False, "게임 시작 실패"
+
+    def stop_game(self, room_id: Optional[str] = None):
+        """
+        방의 게임 중지
+
+        Args:
+            room_id: 방 ID (None이면 기본 방)
+        """
+        room = self.rooms.get_room(room_id)
+        if not room:
+            return False, f"방을 찾을 수 없습니다: {room_id}"
+
+        room.stop_game()
+        self.log_to_gui(f"[{room.room_id}] 게임 중지됨", "warning")
+        return True, "게임 중지됨"
+
+    def route_client(self, connect_msg: Message) -> Optional[int]:
+        """
+        CONNECT를 받은 연결을 다른 워커에 넘겨야 하는지 판단
+
+        Args:
+            connect_msg: 연결의 첫 메시지
+
+        Returns:
+            방을 소유한 워커 번호, 이 프로세스에서 처리하면 None
+            (방을 지정하지 않은 연결은 자동 배정 워커 한 곳으로 모음)
+        """
+        if self.shard is None or not connect_msg or connect_msg.type != MSG_TYPE_CONNECT:
+            return None
+        room_id = connect_msg.get('room')
+        if self.shard.owns(room_id):
+            return None
+        return self.shard.owner_of(room_id)
+
+    def handoff_client(self, worker: int, sock, connect_msg: Message) -> bool:
+        """
+        연결을 방을 소유한 워커에 넘김 (받은 워커가 CONNECT부터 다시 처리)
+
+        Args:
+            worker: 받을 워커 번호
+            sock: 클라이언트 소켓
+            connect_msg: 이미 읽은 CONNECT 메시지
+
+        Returns:
+            성공 여부 (성공하면 호출 측은 자기 소켓 객체만 닫음)
+        """
+        frame = Protocol.encode_bytes(connect_msg, WIRE_VERSION_JSON)
+        if not self.shard.handoff(worker, sock, frame):
+            return False
+        log.info("%s -> 워커 %s (방 %s)", connect_msg.get('player_id'), worker, connect_msg.get('room'))
+        return True
+
+    def register_client(self, connect_msg: Message, sock, address: tuple,
+                        make_writer) -> Optional[Player]:
+        """
+        첫 메시지(CONNECT) 처리: 와이어 포맷 협상, 플레이어 추가, 환영 메시지 전송
+
+        Args:
+            connect_msg: 연결의 첫 메시지 (None이면 잘못된 연결)
+            sock: 클라이언트 소켓
+            address: 클라이언트 주소
+            make_writer: (player_id, wire_version) -> 송신 큐 생성 함수 (엔진별 구현)
+
+        Returns:
+            추가된 Player 객체, 잘못된 연결이거나 같은 ID가 이미 접속 중이면 None
+        """
+        if not connect_msg or connect_msg.type != MSG_TYPE_CONNECT:
+            self.log_to_gui(f"{address} - 잘못된 연결 메시지", "error")
+            return None
+
+        player_id = connect_msg.get('player_id', f"Player_{address[0]}")
+
+        # 방 배정 (room을 지정하지 않은 클라이언트는 자리가 남은 대기 중인 방으로)
+        room = self.rooms.join(connect_msg.get('room'))
+
+        # 와이어 포맷 협상 (구버전 클라이언트는 wire_versions가 없으므로 JSON v2 유지)
+        wire_version = Protocol.negotiate_version(connect_msg.get('wire_versions'))
+
+        # 플레이어 전용 송신 큐 (환영 메시지를 보내기 전까지는 쌓아 두기만 함)
+        writer = make_writer(player_id, wire_version)
+
+        # 플레이어 추가 (가상 IP는 방 대역에서 할당)
+        try:
+            player = room.player_manager.add_player(player_id, sock, address,
+                                                    wire_version=wire_version, writer=writer)
+        except DuplicatePlayerError as e:
+            # 거절 사유를 알리고 연결 종료 (WELCOME과 같이 JSON v2로 전송)
+            self.rooms.leave(room)
+            self.log_to_gui(f"{address} - {e}", "warning")
+            error_msg = InfoMessage(info_type="ERROR", message=str(e))
+            writer.reject(Protocol.encode_bytes(error_msg, WIRE_VERSION_JSON))
+            return None
+        except Exception:
+            self.rooms.leave(room)
+            writer.close()
+            raise
+        player.room_id = room.room_id
+
+        # 연결 확인 메시지 전송 (v2.0: player_index 추가)
+        player_index = room.player_manager.get_player_index(player_id)
+        welcome_msg = InfoMessage(
+            info_type="WELCOME",
+            message=f"환영합니다, {player_id}!",
+            player_id=player_id,
+            player_ip=player.ip,
+            player_index=player_index,  # v2.0: P2P 포트 계산용
+            wire_version=wire_version,  # 이후 메시지에 사용할 와이어 포맷
+            room_id=room.room_id  # 배정된 방
+        )
+        # 환영 메시지는 협상 결과를 전달하므로 항상 JSON v2로, 큐에 쌓인 프레임보다 먼저 전송
+        writer.start(first=Protocol.encode_bytes(welcome_msg, WIRE_VERSION_JSON))
+
+        # 현재 플레이어 목록 브로드캐스트
+        room.broadcast_player_list()
+        self.events.publish(PlayerJoined(room.room_id, player_id, player.ip))
+        return player
+
+    def handle_client_message(self, player: Player, message: Message):
+        """
+        접속한 플레이어가 보낸 메시지 처리
+
+        Args:
+            player: 보낸 플레이어
+            message: 수신 메시지
+        """
+        room = self.rooms.get_room(player.room_id)
+        if not room:
+            return
+
+        # 패킷 로깅 (디버깅용)
+        self.log_packet(room, player.player_id, message)
+
+        # 메시지 처리
+        self._process_message(room, player, message)
+
+    def unregister_client(self, player: Player):
+        """
+        연결 종료 처리: 송신 큐 중지, 플레이어 제거
+
+        Args:
+            player: 종료된 플레이어
+        """
+        if player.writer is not None:
+            player.writer.close()
+        room = self.rooms.get_room(player.room_id)
+        if not room:
+            return
+        room.player_manager.remove_player(player.player_id)
+        room.broadcast_player_list()
+        self.rooms.leave(room)
+        self.events.publish(PlayerLeft(room.room_id, player.player_id))
+
+    def _process_message(self, room: Room, player, message: Message):
+        """메시지 처리"""
+        msg_type = message.type
+        if log.isEnabledFor(logging.DEBUG):
+            # message.data는 프레임마다 wire 딕셔너리를 만들므로 DEBUG일 때만 읽음
+            log.debug("[%s] 메시지 수신: type=%s, from=%s, data=%s",
+                      room.room_id, msg_type, player.player_id, message.data)
+
+        if msg_type == MSG_TYPE_ATTACK_REQUEST:
+            log.debug("공격 승인 요청 처리 시작")
+            self._handle_attack_request(room, player, message)
+
+        elif msg_type == MSG_TYPE_ATTACK_CONFIRM:
+            log.debug("공격 확인 메시지 처리")
+            self._handle_attack_confirm(room, player, message)
+
+        elif msg_type == MSG_TYPE_ATTACK:
+            self._handle_attack(room, player, message)
+
+        elif msg_type == MSG_TYPE_DEFENSE:
+            self._handle_defense(room, player, message)
+
+        else:
+            log.warning("알 수 없는 메시지 타입: %s", msg_type)
+
+    def _handle_attack_request(self, room: Room, player, message: Message):
+        """공격 승인 요청 처리 (v2.0)"""
+        try:
+            target_id = message.get('target_id')
+            log.debug("공격 승인 요청: %s -> %s", player.player_id, target_id)
+
+            if not target_id:
+                log.warning("타겟 ID 없음: message.data=%s", message.data)
+                error_msg = InfoMessage(info_type="ERROR", message="타겟 ID가 없습니다")
+                room.send_to_player(player, error_msg)
+                return
+
+            log.debug("게임 매니저에 공격 승인 요청 전달")
+            # 게임 매니저에서 공격 승인 처리
+            approved, msg, attack_id = room.game_manager.request_attack_approval(
+                player.player_id,
+                target_id
+            )
+            log.debug("게임 매니저 응답: approved=%s, msg=%s, attack_id=%s", approved, msg, attack_id)
+
+            # 승인/거부 로그는 GameManager가 발행한 이벤트로 남음
+            if not approved:
+                error_msg = InfoMessage(info_type="ATTACK_DENIED", message=msg)
+                room.send_to_player(player, error_msg)
+
+        except Exception as e:
+            log.exception("공격 승인 요청 처리 중 예외 발생: %s", e)
+
+    def _handle_attack_confirm(self, room: Room, player, message: Message):
+        """공격 확인 메시지 처리 (v2.0, trace: 클라이언트가 잰 구간 시간)"""
+        attack_id = message.get('attack_id')
+        confirm_type = message.get('confirm_type')
+        trace = message.get('trace')
+
+        if not attack_id or not confirm_type:
+            return
+
+        if confirm_type == CONFIRM_SENT:
+            room.game_manager.confirm_attack_sent(attack_id, trace)
+            self.log_to_gui(f"공격 전송 확인: {attack_id}", "info")
+        elif confirm_type == CONFIRM_RECEIVED:
+            room.game_manager.confirm_attack_received(attack_id, trace)
+            self.log_to_gui(f"공격 수신 확인: {attack_id}", "info")
+        elif confirm_type == CONFIRM_FAILED:
+            # 만료 로그는 GameManager가 발행한 AttackExpired 이벤트로 남음
+            room.game_manager.report_attack_failure(attack_id, player.player_id, trace)
+
+    def _handle_attack(self, room: Room, player, message: Message):
+        """공격 메시지 처리 (기존 호환성)"""
+        to_player_id = message.get('to_player')
+        target_player = room.player_manager.get_player(to_player_id)
+
+        if not target_player:
+            self.log_to_gui(f"공격 대상 없음: {to_player_id}", "warning")
+            error_msg = InfoMessage(
+                info_type="ERROR",
+                message=f"공격 대상을 찾을 수 없습니다: {to_player_id}"
+            )
+            room.send_to_player(player, error_msg)
+            return
+
+        # 공격 가능 여부 확인
+        can_attack, msg = room.game_manager.can_attack(player.player_id)
+        if not can_attack:
+            self.log_to_gui(f"공격 제한: {player.player_id} - {msg}", "warning")
+            error_msg = InfoMessage(info_type="ATTACK_LIMIT", message=msg)
+            room.send_to_player(player, error_msg)
+            return
+
+        # 공격 기록
+        room.game_manager.record_attack(player.player_id, to_player_id, player.ip_int)
+        room.player_manager.record_attack(to_player_id, player.ip_int)
+
+        # 공격 메시지를 대상에게 전송
+        attack_msg = AttackMessage(
+            from_ip=player.ip,
+            to_ip=target_player.ip,
+            from_player=player.player_id,
+            to_player=target_player.player_id,
+            payload=message.get('payload', f"ATTACK_TARGET_{to_player_id}")
+        )
+
+        room.send_to_player(target_player, attack_msg)
+
+        # 공격 성공 알림
+        success_msg = InfoMessage(
+            info_type="ATTACK_SUCCESS",
+            message=f"{to_player_id}에게 공격 성공! {msg}"
+        )
+        room.send_to_player(player, success_msg)
+
+        self.log_to_gui(f"공격: {player.player_id} → {to_player_id}", "attack")
+
+    def _handle_defense(self, room: Room, player, message: Message):
+        """방어 메시지 처리"""
+        attacker_ips = message.get('attacker_ips', [])
+        room.game_manager.submit_defense(player.player_id, attacker_ips)  # DefenseSubmitted 이벤트로 로그
+
+    def on_writer_error(self, player_id: str, error: Exception):
+        """송신 실패 또는 송신 큐 초과 (연결은 writer가 닫고 수신 스레드가 정리)"""
+        self.log_to_gui(f"{player_id}에게 메시지 전송 실패: {error}", "error")
+
+    def _log_game_event(self, event):
+        """게임 이벤트를 서버 로그로 남기는 구독자 (이벤트 버스 스레드)"""
+        room = f"[{event.room_id}]"
+        if isinstance(event, PlayerJoined):
+            self.log_to_gui(f"{room} 플레이어 접속: {event.player_id} ({event.ip})", "success")
+        elif isinstance(event, PlayerLeft):
+            self.log_to_gui(f"{room} 플레이어 종료: {event.player_id}", "info")
+        elif isinstance(event, RoundStarted):
+            self.log_to_gui(f"{room} 라운드 {event.round_num} 시작 ({event.difficulty})", "info")
+        elif isinstance(event, AttackApproved):
+            self.log_to_gui(f"{room} 공격 승인: {event.attacker_id} → {event.target_id} ({event.attack_id})", "info")
+        elif isinstance(event, AttackDenied):
+            self.log_to_gui(f"{room} 공격 거부: {event.attacker_id} → {event.target_id} - {event.reason}", "warning")
+        elif isinstance(event, AttackCompleted):
+            self.log_to_gui(f"{room} 공격 완료: {event.attacker_id} → {event.target_id} "
+                            f"({event.attack_id}, {event.latency_ms:.1f}ms)", "attack")
+        elif isinstance(event, AttackExpired):
+            self.log_to_gui(f"{room} 공격 만료: {event.attacker_id} → {event.target_id} "
+                            f"({event.attack_id}, {event.reason})", "warning")
+        elif isinstance(event, DefenseSubmitted):
+            self.log_to_gui(f"{room} {event.player_id} 방어 제출: {list(event.attacker_ips)}", "info")
+        elif isinstance(event, ScoresComputed):
+            scores = ", ".join(f"{r['player_id']} {r['score']}점/HP {r['hp']}" for r in event.results)
+            self.log_to_gui(f"{room} 라운드 {event.round_num} 점수: {scores}", "info")
+        elif isinstance(event, GameEnded):
+            self.log_to_gui(f"{room} 게임 종료 - 우승: {event.winner or 'N/A'}", "success")
+
+    def _publish_player_list(self, room_id: str, players_info: list):
+        """방의 플레이어 목록 변경 알림 훅 (기본: 없음)"""
+        pass
+
+    def _publish_packet(self, packet_data: dict):
+        """패킷 로그 알림 훅 (기본: 없음)"""
+        pass
+
+    def log_to_gui(self, message: str, level: str = "info"):
+        """서버 로그 훅 (기본: 로그 출력, level: info/success/attack/warning/error)"""
+        log.log(GUI_LOG_LEVELS.get(level, logging.INFO), message)
+
+    def log_packet(self, room: Room, player_id: str, message: Message):
+        """패킷 로그 (디버깅용, 방별로 보관)"""
+        message_data = message.data
+        packet_data = {
+            'timestamp': time.strftime("%H:%M:%S"),
+            'room_id': room.room_id,
+            'player_id': player_id,
+            'type': message.type,
+            'data': message_data,
+            'decoded_payload': None
+        }
+
+        # 페이로드 디코딩 시도
+        if 'payload' in message_data:
+            try:
+                packet_data['decoded_payload'] = decode_payload(message_data['payload'])
+            except:
+                packet_data['decoded_payload'] = message_data['payload']
+
+        room.add_packet_log(packet_data)
+        if self.packet_store:
+            self.packet_store.append(packet_data)  # 큐에 넣기만 하고 쓰기는 기록 스레드
+
+        # 화면에 전송
+        self._publish_packet(packet_data)
+
+    def get_packet_log(self, room_id: Optional[str] = None) -> list:
+        """
+        방의 패킷 로그
+
+        Args:
+            room_id: 방 ID (None이면 기본 방)
+        """
+        room = self.rooms.get_room(room_id)
+        return room.get_packet_log() if room else []
+
+    def get_attack_traces(self, room_id: Optional[str] = None) -> list:
+        """
+        방의 공격 타임라인 (진행 중 + 최근 완료/만료, 최신순)
+
+        Args:
+            room_id: 방 ID (None이면 기본 방)
+        """
+        room = self.rooms.get_room(room_id)
+        return room.game_manager.get_attack_traces() if room else []
+
+    def get_rooms_info(self) -> list:
+        """모든 방의 요약 정보"""
+        return self.rooms.get_rooms_info()
+
+    def get_metrics(self) -> list:
+        """지표 목록 (server.metrics.render_prometheus로 /metrics 텍스트 변환)"""
+        return collect_server(self.rooms.get_all_rooms())
+
+    def get_status(self, room_id: Optional[str] = None):
+        """
+        서버 상태 반환 (방 목록 + 선택한 방의 상세 상태)
+
+        Args:
+            room_id: 상세 상태를 볼 방 ID (None이거나 없는 방이면 기본 방)
+        """
+        status = {
+            'running': self.running,
+            'host': self.host,
+            'port': self.port,
+            'engine': self.engine.name,
+            'rooms': self.get_rooms_info(),
+            'timers': get_timer_service().stats(),  # 공격 타임아웃 타이머 수/지연
+            'traffic': get_traffic_scheduler().stats(),  # 더미/노이즈/가짜 공격 스케줄러
+            'traffic_profiles': [profile.to_dict() for profile in TRAFFIC_PROFILES.values()],
+            'default_traffic_profile': self.traffic_profile,
+            'packet_store': self.packet_store.stats() if self.packet_store else None,  # 디스크 패킷 로그
+            'events': self.events.stats(),  # 이벤트 발행 비용, 구독자별 지연/대기 수
+            'logging': get_log_stats()  # 로그 레벨, 출력 대기/버린 기록 수
+        }
+        room = self.rooms.get_room(room_id) or self.rooms.get_room()
+        status.update(room.get_status())
+        return status
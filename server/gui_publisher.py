@@ -0,0 +1,164 @@
+"""
+GUI 이벤트 발행 모듈
+서버 로그/패킷 로그/플레이어 목록 화면 갱신을 모아서 주기적으로 한 번에 전송
+
+- 수신 스레드(핫 패스)는 큐에 넣기만 하고, SocketIO emit은 발행 스레드가 INTERVAL마다 묶어서 호출
+- 패킷/서버 로그는 틱마다 최근 max_packets / max_logs개까지만 보냄 (넘친 만큼은 가장 오래된 것부터 버리고 수만 전달)
+- 플레이어 목록은 방마다 마지막 것만 보내고, 방 목록(room_list_update)은 틱마다 한 번만 다시 계산
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from common.log import get_logger
+
+log = get_logger(__name__, "GuiPublisher")
+
+INTERVAL = 0.2  # 발행 주기 (초)
+MAX_PACKETS_PER_TICK = 100  # 틱당 최대 패킷 로그 수 (화면은 최근 50개만 표시)
+MAX_LOGS_PER_TICK = 200  # 틱당 최대 서버 로그 수
+
+
+class GuiPublisher:
+    """틱마다 화면 이벤트를 모아 보내는 발행기 (스레드 하나)"""
+
+    def __init__(self, emit: Callable[[str, dict], None], rooms_info: Optional[Callable[[], List[dict]]] = None,
+                 interval: float = INTERVAL, max_packets: int = MAX_PACKETS_PER_TICK,
+                 max_logs: int = MAX_LOGS_PER_TICK):
+        """
+        Args:
+            emit: (이벤트 이름, 데이터) 전송 함수 (예: socketio.emit)
+            rooms_info: 방 목록 요약을 돌려주는 함수 (플레이어 목록이 바뀐 틱에 한 번 호출)
+            interval: 발행 주기 (초)
+            max_packets: 틱당 최대 패킷 로그 수
+            max_logs: 틱당 최대 서버 로그 수
+        """
+        self.emit = emit
+        self.rooms_info = rooms_info
+        self.interval = interval
+
+        # 핫 패스는 append만 (deque는 스레드 안전, 가득 차면 가장 오래된 항목이 빠짐)
+        self._packets = deque(maxlen=max_packets)
+        self._logs = deque(maxlen=max_logs)
+        self._player_lists: Dict[str, list] = {}  # {방 ID: 마지막 플레이어 목록}
+        self._player_lock = threading.Lock()
+        self._packets_dropped = 0
+        self._logs_dropped = 0
+
+        self._wake = threading.Event()  # stop() 시 설정
+        self._thread = None
+        self._running = False
+
+        # 통계
+        self.ticks = 0
+        self.emits = 0
+        self.packets_sent = 0
+        self.packets_dropped = 0
+        self.logs_sent = 0
+        self.logs_dropped = 0
+        self.player_lists_coalesced = 0  # 같은 틱에 덮어써진 플레이어 목록 수
+
+    def start(self):
+        """발행 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="gui-publisher")
+        self._thread.start()
+
+    def stop(self):
+        """발행 스레드 중지 (남은 이벤트는 마지막으로 한 번 보냄)"""
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def publish_packet(self, packet_data: dict):
+        """패킷 로그 추가 (수신 스레드에서 호출)"""
+        packets = self._packets
+        if len(packets) == packets.maxlen:
+            self._packets_dropped += 1
+        packets.append(packet_data)
+
+    def publish_log(self, log_entry: dict):
+        """서버 로그 추가"""
+        logs = self._logs
+        if len(logs) == logs.maxlen:
+            self._logs_dropped += 1
+        logs.append(log_entry)
+
+    def publish_player_list(self, room_id: str, players_info: list):
+        """방의 플레이어 목록 변경 (같은 틱 안의 이전 목록은 버림)"""
+        with self._player_lock:
+            if room_id in self._player_lists:
+                self.player_lists_coalesced += 1
+            self._player_lists[room_id] = players_info
+
+    def _run(self):
+        """발행 스레드 루프"""
+        while self._running:
+            self._wake.wait(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                log.error("발행 오류: %s", e)
+        try:
+            self.flush()
+        except Exception as e:
+            log.error("발행 오류: %s", e)
+
+    def flush(self):
+        """모인 이벤트를 지금 보냄 (발행 스레드에서 주기적으로 호출)"""
+        self.ticks += 1
+
+        logs = self._drain(self._logs)
+        if logs:
+            dropped, self._logs_dropped = self._logs_dropped, 0
+            self._emit('server_log_batch', {'logs': logs, 'dropped': dropped})
+            self.logs_sent += len(logs)
+            self.logs_dropped += dropped
+
+        with self._player_lock:
+            player_lists, self._player_lists = self._player_lists, {}
+        for room_id, players_info in player_lists.items():
+            self._emit('player_list_update', {'room_id': room_id, 'players': players_info})
+        if player_lists and self.rooms_info:
+            self._emit('room_list_update', {'rooms': self.rooms_info()})
+
+        packets = self._drain(self._packets)
+        if packets:
+            dropped, self._packets_dropped = self._packets_dropped, 0
+            self._emit('packet_log_batch', {'packets': packets, 'dropped': dropped})
+            self.packets_sent += len(packets)
+            self.packets_dropped += dropped
+
+    @staticmethod
+    def _drain(items: deque) -> list:
+        """deque에서 지금 있는 항목을 모두 꺼냄 (꺼내는 동안 추가되는 항목은 다음 틱)"""
+        drained = []
+        for _ in range(len(items)):
+            try:
+                drained.append(items.popleft())
+            except IndexError:
+                break
+        return drained
+
+    def _emit(self, event: str, data: dict):
+        self.emit(event, data)
+        self.emits += 1
+
+    def stats(self) -> dict:
+        """발행 통계 (틱/emit 수, 보낸/버린 패킷과 로그 수, 합쳐진 플레이어 목록 수)"""
+        return {
+            'interval_ms': int(self.interval * 1000),
+            'ticks': self.ticks,
+            'emits': self.emits,
+            'packets_sent': self.packets_sent,
+            'packets_dropped': self.packets_dropped,
+            'logs_sent': self.logs_sent,
+            'logs_dropped': self.logs_dropped,
+            'player_lists_coalesced': self.player_lists_coalesced
+        }
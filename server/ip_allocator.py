@@ -0,0 +1,121 @@
+"""
+가상 IP 할당 모듈
+CIDR 대역의 호스트 주소를 O(1)로 할당/반환하는 할당기
+
+- 주소는 내부적으로 정수(IPv4 32비트)로 관리하고, 문자열 변환은 경계에서만 수행
+- 아직 한 번도 쓰지 않은 주소는 워터마크(_next)로, 반환된 주소는 free-list로 관리하므로
+  /16처럼 큰 대역도 미리 목록을 만들지 않음
+"""
+
+import ipaddress
+import socket
+import struct
+from typing import List, Optional
+
+_IPV4 = struct.Struct('!I')
+
+
+def ip_to_int(ip: str, strict: bool = False) -> Optional[int]:
+    """
+    IPv4 문자열을 정수로 변환
+
+    Args:
+        ip: "a.b.c.d" 형식 문자열
+        strict: 정규 표기("a.b.c.d", 앞자리 0 없음)만 허용할지 여부
+            (inet_aton은 "172.20.1"처럼 줄인 표기도 받으므로 사용자 입력 비교에는 strict 사용)
+
+    Returns:
+        32비트 정수, 올바른 IPv4 주소가 아니면 None
+    """
+    try:
+        value = _IPV4.unpack(socket.inet_aton(ip))[0]
+    except (OSError, TypeError, ValueError):
+        return None
+    if strict and int_to_ip(value) != ip:
+        return None
+    return value
+
+
+def int_to_ip(value: int) -> str:
+    """정수를 IPv4 문자열로 변환"""
+    return socket.inet_ntoa(_IPV4.pack(value))
+
+
+class IPAllocator:
+    """CIDR 대역의 호스트 주소 할당기 (스레드 안전하지 않음, 호출 측 락 사용)"""
+
+    def __init__(self, network: str):
+        """
+        Args:
+            network: 할당할 대역 (예: "172.20.1.0/24", "10.0.0.0/16")
+        """
+        net = ipaddress.IPv4Network(network)
+        self.network = net
+        if net.num_addresses > 2:
+            # 네트워크 주소와 브로드캐스트 주소 제외
+            self.first = int(net.network_address) + 1
+            self.last = int(net.broadcast_address) - 1
+        else:
+            # /31, /32는 모든 주소 사용
+            self.first = int(net.network_address)
+            self.last = int(net.broadcast_address)
+
+        self._next = self.first  # 아직 할당한 적 없는 첫 주소
+        self._free: List[int] = []  # 반환된 주소 (최근 반환된 주소부터 재사용)
+        self._in_use = set()
+
+    @property
+    def capacity(self) -> int:
+        """할당 가능한 전체 주소 수"""
+        return self.last - self.first + 1
+
+    @property
+    def used(self) -> int:
+        """사용 중인 주소 수"""
+        return len(self._in_use)
+
+    def allocate(self) -> int:
+        """
+        주소 할당
+
+        Returns:
+            정수 주소
+
+        Raises:
+            Exception: 대역의 주소를 모두 사용한 경우
+        """
+        if self._free:
+            address = self._free.pop()
+        elif self._next <= self.last:
+            address = self._next
+            self._next += 1
+        else:
+            raise Exception(f"가상 IP 풀이 고갈됨. {self.network} 대역은 최대 {self.capacity}명까지 지원합니다.")
+        self._in_use.add(address)
+        return address
+
+    def release(self, address: int) -> bool:
+        """
+        주소 반환
+
+        Args:
+            address: allocate()로 받은 정수 주소
+
+        Returns:
+            반환 여부 (사용 중이 아닌 주소면 False)
+        """
+        if address not in self._in_use:
+            return False
+        self._in_use.remove(address)
+        self._free.append(address)
+        return True
+
+    def contains(self, address: int) -> bool:
+        """대역에 속한 할당 가능 주소인지 여부"""
+        return self.first <= address <= self.last
+
+    def reset(self):
+        """모든 주소 반환"""
+        self._next = self.first
+        self._free.clear()
+        self._in_use.clear()
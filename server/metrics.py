@@ -0,0 +1,424 @@
+"""
+서버 지표 모듈
+고정 버킷 지연 히스토그램 (공격 요청→전달 지연 등)과 /metrics로 내보내는 카운터/히스토그램
+
+- observe(): 버킷 이진 탐색 + 카운터 증가 (샘플을 보관하지 않음)
+- 버킷은 누적 형태로도 꺼낼 수 있어 다른 수집기로 내보내기 쉬움
+- merge(): 방마다 따로 모은 히스토그램을 합침
+- Counter / Histogram: 스레드마다 자기 dict에만 더하므로 락이 없음 (수집할 때 모든 스레드 값을 합침)
+- MetricsRegistry.collect(): 지표 목록 (파이프로 보낼 수 있는 dict), render_prometheus(): 텍스트 형식
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지연 버킷 상한 (ms), 마지막 버킷은 그 이상 전부
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Prometheus 텍스트 형식 응답 헤더
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Counter / Histogram 버킷 상한 (초)
+DEFAULT_BUCKETS = tuple(bound / 1000 for bound in DEFAULT_LATENCY_BUCKETS_MS)
+FAST_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)  # 송신 큐 대기, 브로드캐스트 분배
+
+
+class LatencyHistogram:
+    """지연 히스토그램 (초 단위로 기록, ms 버킷으로 집계)"""
+
+    def __init__(self, name: str, buckets_ms: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        """
+        Args:
+            name: 히스토그램 이름
+            buckets_ms: 버킷 상한 목록 (ms, 오름차순)
+        """
+        self.name = name
+        self.bounds = tuple(buckets_ms)
+        self.counts = [0] * (len(self.bounds) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0  # 합계 (초)
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """
+        지연 한 건 기록
+
+        Args:
+            seconds: 지연 (초)
+        """
+        index = bisect.bisect_left(self.bounds, seconds * 1000)
+        with self.lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def merge(self, other: 'LatencyHistogram'):
+        """같은 버킷을 쓰는 다른 히스토그램을 더함"""
+        if other.bounds != self.bounds:
+            raise ValueError(f"버킷이 다른 히스토그램은 합칠 수 없습니다: {self.name} / {other.name}")
+        with other.lock:
+            counts = list(other.counts)
+            count, total, maximum = other.count, other.total, other.max
+        with self.lock:
+            for i, n in enumerate(counts):
+                self.counts[i] += n
+            self.count += count
+            self.total += total
+            self.max = max(self.max, maximum)
+
+    def reset(self):
+        """기록 초기화"""
+        with self.lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def snapshot(self) -> tuple:
+        """(버킷별 개수, 개수, 합계 초)를 한 번에 복사"""
+        with self.lock:
+            return list(self.counts), self.count, self.total
+
+    def cumulative(self) -> List[tuple]:
+        """누적 버킷 [(상한 ms 또는 None(+Inf), 누적 개수)]"""
+        with self.lock:
+            counts = list(self.counts)
+        result = []
+        running = 0
+        for bound, n in zip(self.bounds + (None,), counts):
+            running += n
+            result.append((bound, running))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        분위수 추정 (ms, 해당 버킷의 상한)
+
+        Args:
+            q: 0~1
+
+        Returns:
+            버킷 상한 ms (기록이 없으면 None, +Inf 버킷이면 최댓값)
+        """
+        with self.lock:
+            counts = list(self.counts)
+            count, maximum = self.count, self.max
+        if count == 0:
+            return None
+        rank = max(1, int(count * q + 0.999999))
+        running = 0
+        for i, n in enumerate(counts):
+            running += n
+            if running >= rank:
+                if i < len(self.bounds):
+                    return float(self.bounds[i])
+                return round(maximum * 1000, 3)
+        return round(maximum * 1000, 3)
+
+    def to_dict(self) -> dict:
+        """상태 조회용 요약 (개수, 평균/최대 ms, p50/p90/p99, 버킷별 개수)"""
+        with self.lock:
+            counts = list(self.counts)
+            count, total, maximum = self.count, self.total, self.max
+        return {
+            'count': count,
+            'avg_ms': round(total / count * 1000, 3) if count else 0.0,
+            'max_ms': round(maximum * 1000, 3),
+            'p50_ms': self.quantile(0.5),
+            'p90_ms': self.quantile(0.9),
+            'p99_ms': self.quantile(0.99),
+            'buckets': {('+Inf' if bound is None else str(bound)): n
+                        for bound, n in zip(self.bounds + (None,), counts)}
+        }
+
+
+def _add_counts(total: dict, values: dict):
+    """Counter 값 합치기"""
+    for key, value in values.items():
+        total[key] = total.get(key, 0) + value
+
+
+def _add_cells(total: dict, values: dict):
+    """Histogram 칸(버킷별 개수 + 합계) 합치기"""
+    for key, cell in values.items():
+        current = total.get(key)
+        if current is None:
+            total[key] = list(cell)
+        else:
+            for i, value in enumerate(cell):
+                current[i] += value
+
+
+class _ThreadShards:
+    """
+    스레드별 값 dict 모음
+
+    값은 자기 스레드 dict에만 쓰므로 쓰는 쪽은 락을 잡지 않는다 (스레드당 첫 기록에서만 목록 등록).
+    수집할 때 모든 dict를 복사해 합치고, 종료된 스레드의 dict는 하나로 접어 목록에서 뺀다.
+    """
+
+    def __init__(self, merge: Callable[[dict, dict], None]):
+        """
+        Args:
+            merge: merge(합계 dict, 스레드 dict) 값 합치기 함수
+        """
+        self._merge = merge
+        self._local = threading.local()
+        self._lock = threading.Lock()  # 스레드 목록 변경과 수집만 보호
+        self._shards: List[tuple] = []  # [(스레드, dict)]
+        self._retired: dict = {}  # 종료된 스레드들의 값
+
+    def get(self) -> dict:
+        """현재 스레드의 dict"""
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), values))
+            return values
+
+    def snapshot(self) -> dict:
+        """모든 스레드 값의 합"""
+        with self._lock:
+            alive = []
+            for thread, values in self._shards:
+                if thread.is_alive():
+                    alive.append((thread, values))
+                else:
+                    self._merge(self._retired, values)  # 더 이상 쓰는 스레드가 없음
+            self._shards = alive
+            total = {}
+            self._merge(total, self._retired)
+            for _, values in alive:
+                self._merge(total, dict(values))
+        return total
+
+
+class Counter:
+    """증가만 하는 카운터 (레이블 값 조합별)"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        """
+        Args:
+            name: 지표 이름 (예: "comnet_frames_sent_total")
+            help: 설명
+            labels: 레이블 이름 목록
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._shards = _ThreadShards(_add_counts)
+
+    def inc(self, *label_values, amount: float = 1):
+        """
+        값 증가 (락 없음)
+
+        Args:
+            label_values: 레이블 값 (labels 순서)
+            amount: 증가량
+        """
+        values = self._shards.get()
+        values[label_values] = values.get(label_values, 0) + amount
+
+    def collect(self) -> dict:
+        return metric_family(self.name, self.type, self.help, self.labels, self._shards.snapshot())
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (초 단위, 레이블 값 조합별)"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            name: 지표 이름 (예: "comnet_send_latency_seconds")
+            help: 설명
+            labels: 레이블 이름 목록
+            buckets: 버킷 상한 목록 (초, 오름차순)
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.bounds = tuple(buckets)
+        self._shards = _ThreadShards(_add_cells)
+
+    def observe(self, seconds: float, *label_values):
+        """
+        한 건 기록 (락 없음)
+
+        Args:
+            seconds: 값 (초)
+            label_values: 레이블 값 (labels 순서)
+        """
+        values = self._shards.get()
+        cell = values.get(label_values)
+        if cell is None:
+            cell = values[label_values] = [0] * (len(self.bounds) + 1) + [0.0]  # 버킷별 개수 + 합계
+        cell[bisect.bisect_left(self.bounds, seconds)] += 1
+        cell[-1] += seconds
+
+    def collect(self) -> dict:
+        return metric_family(self.name, self.type, self.help, self.labels, self._shards.snapshot(), self.bounds)
+
+
+def metric_family(name: str, type: str, help: str, labels: Sequence[str], samples: dict,
+                  buckets: Optional[Sequence[float]] = None) -> dict:
+    """
+    수집 결과 한 종류 (파이프로 보낼 수 있는 dict)
+
+    Args:
+        name: 지표 이름
+        type: "counter", "gauge", "histogram"
+        help: 설명
+        labels: 레이블 이름 목록
+        samples: {레이블 값 튜플: 값} (histogram은 값이 [버킷별 개수..., 합계])
+        buckets: histogram 버킷 상한 (초)
+    """
+    return {'name': name, 'type': type, 'help': help, 'labels': tuple(labels),
+            'samples': samples, 'buckets': tuple(buckets) if buckets is not None else None}
+
+
+def latency_family(name: str, help: str, labels: Sequence[str],
+                   histograms: Dict[tuple, 'LatencyHistogram']) -> Optional[dict]:
+    """
+    LatencyHistogram 여러 개를 histogram 지표 한 종류로 변환 (버킷 상한 ms → 초)
+
+    Args:
+        histograms: {레이블 값 튜플: LatencyHistogram} (버킷이 모두 같아야 함)
+
+    Returns:
+        지표 dict (히스토그램이 없으면 None)
+    """
+    if not histograms:
+        return None
+    samples = {}
+    bounds = None
+    for key, histogram in histograms.items():
+        bounds = bounds or histogram.bounds
+        counts, _, total = histogram.snapshot()
+        samples[key] = counts + [total]
+    return metric_family(name, 'histogram', help, labels, samples, tuple(bound / 1000 for bound in bounds))
+
+
+class MetricsRegistry:
+    """지표 목록 (Counter/Histogram + 수집할 때 값을 만드는 수집 함수)"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors: List[Callable[[], List[dict]]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[dict]]):
+        """수집할 때마다 호출해 지표 dict 목록을 받을 함수 등록 (gauge 등)"""
+        self._collectors.append(collector)
+
+    def collect(self) -> List[dict]:
+        """모든 지표 수집"""
+        families = [metric.collect() for metric in self._metrics]
+        for collector in self._collectors:
+            families.extend(family for family in collector() if family is not None)
+        return families
+
+
+def add_label(families: List[dict], name: str, value: str) -> List[dict]:
+    """모든 지표 샘플에 레이블 하나를 앞에 추가 (워커별 지표를 합칠 때)"""
+    result = []
+    for family in families:
+        labeled = dict(family)
+        labeled['labels'] = (name,) + tuple(family['labels'])
+        labeled['samples'] = {(value,) + tuple(key): sample for key, sample in family['samples'].items()}
+        result.append(labeled)
+    return result
+
+
+def merge_families(families: List[dict]) -> List[dict]:
+    """이름이 같은 지표의 샘플을 하나로 합침 (같은 레이블 값이면 더함)"""
+    merged: Dict[str, dict] = {}
+    for family in families:
+        current = merged.get(family['name'])
+        if current is None:
+            merged[family['name']] = dict(family, samples=dict(family['samples']))
+            continue
+        samples = current['samples']
+        for key, sample in family['samples'].items():
+            if key not in samples:
+                samples[key] = sample
+            elif family['type'] == 'histogram':
+                samples[key] = [a + b for a, b in zip(samples[key], sample)]
+            else:
+                samples[key] = samples[key] + sample
+    return list(merged.values())
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        if math.isnan(value):
+            return 'NaN'
+        return repr(value)
+    return str(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _label_text(names: Tuple[str, ...], values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def render_prometheus(families: List[dict]) -> str:
+    """
+    Prometheus 텍스트 형식 (0.0.4)
+
+    Args:
+        families: collect() / merge_families() 결과
+
+    Returns:
+        /metrics 응답 본문
+    """
+    lines = []
+    for family in sorted(families, key=lambda f: f['name']):
+        name, labels = family['name'], family['labels']
+        help_text = family['help'].replace('\\', r'\\').replace('\n', r'\n')
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for key in sorted(family['samples'], key=lambda k: tuple(str(v) for v in k)):
+            sample = family['samples'][key]
+            if family['type'] != 'histogram':
+                lines.append(f"{name}{_label_text(labels, key)} {_format_value(sample)}")
+                continue
+            # 버킷 합으로 _count를 만들어 +Inf 버킷과 항상 같게 함
+            running = 0
+            for bound, count in zip(tuple(family['buckets']) + (math.inf,), sample[:-1]):
+                running += count
+                le = 'le="+Inf"' if math.isinf(bound) else f'le="{_format_value(float(bound))}"'
+                lines.append(f"{name}_bucket{_label_text(labels, key, le)} {running}")
+            lines.append(f"{name}_sum{_label_text(labels, key)} {_format_value(float(sample[-1]))}")
+            lines.append(f"{name}_count{_label_text(labels, key)} {running}")
+    return '\n'.join(lines) + '\n'
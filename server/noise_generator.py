@@ -3,30 +3,39 @@
 R3 이후 플레이어 간 배경 트래픽을 생성하여 공격 탐지를 어렵게 만듦
 """
 
-import threading
-import time
+import math
 import random
-import string
-from typing import Callable, List
-from common.message_types import Message
-from common.constants import MSG_TYPE_NOISE
+from typing import Callable, List, Optional
+from common.message_types import NoiseMessage
+from server.traffic_scheduler import get_traffic_scheduler
+from server.frame_pool import FramePool, build_pair_frames, take_pair_frame, random_suffixes
+from server.traffic_profiles import TokenBucket
+from server.telemetry import GENERATOR_FRAMES
+from common.log import get_logger
+
+log = get_logger(__name__, "NoiseGenerator")
 
 
 class NoiseGenerator:
     """노이즈 트래픽 생성기"""
 
-    def __init__(self, player_manager, send_to_player_callback: Callable):
+    def __init__(self, player_manager, send_to_player_callback: Callable, scheduler=None):
         """
         Args:
             player_manager: PlayerManager 인스턴스
             send_to_player_callback: 특정 플레이어에게 메시지 전송하는 콜백 (player, message)
+            scheduler: 전송 시각을 관리할 TrafficScheduler (None이면 프로세스 공용 스케줄러)
         """
         self.player_manager = player_manager
         self.send_to_player_callback = send_to_player_callback
         self.running = False
-        self.thread = None
+        self.scheduler = scheduler or get_traffic_scheduler()
+        self.entry = None  # 스케줄러 등록 항목 (stop() 시 취소)
+        self.pool = FramePool(self._build_frames)  # 미리 직렬화한 (프레임, 송신자, 수신자)
         self.interval_min = 3.0  # 최소 노이즈 간격 (초)
         self.interval_max = 8.0  # 최대 노이즈 간격 (초)
+        self.pacer = None  # 트래픽 프로필의 토큰 버킷 (None이면 랜덤 인터벌)
+        self.log_packets = True
 
     def start(self):
         """노이즈 트래픽 생성 시작"""
@@ -34,83 +43,108 @@ class NoiseGenerator:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._generate_loop, daemon=True)
-        self.thread.start()
-        print("[NoiseGenerator] 노이즈 트래픽 생성 시작")
+        if self.pacer:
+            self.pacer.reset()
+        self.entry = self.scheduler.add(self)
+        log.info("노이즈 트래픽 생성 시작")
 
     def stop(self):
         """노이즈 트래픽 생성 중지"""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=3)
-        print("[NoiseGenerator] 노이즈 트래픽 생성 중지")
-
-    def _generate_loop(self):
-        """노이즈 트래픽 생성 루프"""
-        while self.running:
-            try:
-                # 랜덤 인터벌로 대기
-                interval = random.uniform(self.interval_min, self.interval_max)
-                time.sleep(interval)
+        # 스케줄러에서 빼기만 하면 되므로 스레드를 기다리지 않고 바로 반환
+        if self.entry:
+            self.entry.cancel()
+            self.entry = None
+        if self.pacer:
+            self.pacer.finish()
+        log.info("노이즈 트래픽 생성 중지")
+
+    def next_delay(self) -> float:
+        """다음 노이즈 패킷까지 대기 시간 (전송률이 설정되어 있으면 토큰 버킷, 아니면 랜덤 인터벌)"""
+        if self.pacer:
+            return self.pacer.next_delay()
+        return random.uniform(self.interval_min, self.interval_max)
+
+    def emit(self):
+        """노이즈 패킷 한 개 전송 (스케줄러 스레드에서 호출)"""
+        try:
+            self._send_noise_packet()
+        except Exception as e:
+            log.error("노이즈 생성 중 오류: %s", e)
+
+    def refill(self, duration: float, versions) -> int:
+        """
+        duration초 동안 보낼 만큼 프레임 풀 채우기 (PREPARATION/ROUND_END 단계에서 호출)
 
-                if not self.running:
-                    break
+        Args:
+            duration: 노이즈를 보낼 시간 (초)
+            versions: 방 플레이어들의 와이어 버전
 
-                # 노이즈 패킷 생성 및 전송
-                self._send_noise_packet()
+        Returns:
+            새로 만든 프레임 수
+        """
+        if self.pacer:
+            return self.pool.refill(self.pacer.frames_for(duration), versions)
+        return self.pool.refill(math.ceil(duration / self.interval_min) + 1, versions)
 
-            except Exception as e:
-                print(f"[NoiseGenerator] 노이즈 생성 중 오류: {e}")
+    def _build_frames(self, count: int, versions: tuple) -> list:
+        """노이즈 프레임 count개 생성 (송신자/수신자 쌍과 페이로드를 미리 뽑음)"""
+        return build_pair_frames(self.player_manager, count, versions, self._create_noise_message)
 
     def _send_noise_packet(self):
         """
         랜덤한 두 플레이어 간 노이즈 패킷 전송
+        풀에 미리 만든 프레임이 있으면 그대로 보내고, 없으면 즉석에서 생성
         """
-        players = self.player_manager.get_all_players()
+        pooled = take_pair_frame(self.pool, self.player_manager)
+        if pooled:
+            sender, receiver, noise_msg = pooled
+        else:
+            players = self.player_manager.snapshot().players
 
-        # 최소 2명의 플레이어가 필요
-        if len(players) < 2:
-            return
+            # 최소 2명의 플레이어가 필요
+            if len(players) < 2:
+                return
 
-        # 랜덤으로 송신자와 수신자 선택
-        sender = random.choice(players)
-        receiver = random.choice([p for p in players if p.player_id != sender.player_id])
+            # 랜덤으로 서로 다른 송신자와 수신자 선택
+            sender, receiver = random.sample(players, 2)
 
-        # 노이즈 메시지 생성
-        noise_msg = self._create_noise_message(sender, receiver)
+            # 노이즈 메시지 생성
+            noise_msg = self._create_noise_message(sender, receiver)
 
         # 수신자에게 전송
         self.send_to_player_callback(receiver, noise_msg)
+        GENERATOR_FRAMES.inc("noise")
+        if self.pacer:
+            self.pacer.record_sent()
 
-        print(f"[NoiseGenerator] 노이즈: {sender.player_id} ({sender.ip}) -> {receiver.player_id} ({receiver.ip})")
+        if self.log_packets:
+            log.debug("노이즈: %s (%s) -> %s (%s)", sender.player_id, sender.ip, receiver.player_id, receiver.ip)
 
-    def _create_noise_message(self, sender, receiver) -> Message:
+    def _create_noise_message(self, sender, receiver, random_suffix: Optional[str] = None) -> NoiseMessage:
         """
         노이즈 메시지 생성
 
         Args:
             sender: 송신 플레이어
             receiver: 수신 플레이어
+            random_suffix: 페이로드 접미사 (None이면 새로 생성)
 
         Returns:
-            Message 객체
+            NoiseMessage 객체
         """
-        from common.message_types import encode_payload
-
         # 랜덤 페이로드 생성 (실제 공격과 구분하기 어렵게)
-        random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        if random_suffix is None:
+            random_suffix = random_suffixes(1)[0]
         payload = f"NOISE_{random_suffix}"
 
-        # base64 인코딩
-        encoded_payload = encode_payload(payload)
-
-        return Message(
-            MSG_TYPE_NOISE,
+        # 페이로드는 NoiseMessage에서 base64 인코딩
+        return NoiseMessage(
             from_ip=sender.ip,
             to_ip=receiver.ip,
             from_player=sender.player_id,
             to_player=receiver.player_id,
-            payload=encoded_payload,
+            payload=payload,
             _original_payload=payload
         )
 
@@ -125,6 +159,25 @@ class NoiseGenerator:
         self.interval_min = min_sec
         self.interval_max = max_sec if max_sec is not None else min_sec
         if max_sec is None or min_sec == max_sec:
-            print(f"[NoiseGenerator] 인터벌 설정: {min_sec}초 (고정)")
+            log.debug("인터벌 설정: %s초 (고정)", min_sec)
+        else:
+            log.debug("인터벌 설정: %s~%s초", min_sec, max_sec)
+
+    def set_rate(self, pps: Optional[float], burst: int = 1):
+        """
+        토큰 버킷 전송률 설정 (트래픽 프로필)
+
+        Args:
+            pps: 초당 노이즈 패킷 수 (None이면 랜덤 인터벌로 복귀)
+            burst: 밀린 전송을 한 번에 몰아 보낼 수 있는 최대 개수
+        """
+        if pps is None:
+            self.pacer = None
         else:
-            print(f"[NoiseGenerator] 인터벌 설정: {min_sec}~{max_sec}초")
+            self.pacer = TokenBucket(pps, burst, self.scheduler.clock)
+            log.info("전송률 설정: %spps (burst %s)", pps, burst)
+        self.log_packets = self.pacer is None  # 고속 전송 중에는 패킷마다 로그를 남기지 않음
+
+    def pacing_stats(self) -> Optional[dict]:
+        """요청 대비 실제 전송률 (전송률을 설정하지 않았으면 None)"""
+        return self.pacer.stats() if self.pacer else None
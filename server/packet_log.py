@@ -0,0 +1,248 @@
+"""
+패킷 로그 모듈
+게임 한 판의 전체 수신 패킷을 디스크에 남기는 추가 전용(append-only) 로그
+
+- 세그먼트 파일을 SEGMENT_SIZE 크기로 미리 만들고 mmap으로 열어 JSON 한 줄씩 이어 씀
+- 세그먼트가 차면 실제 길이로 잘라 닫고 다음 세그먼트로 넘어감 (MAX_SEGMENTS개를 넘으면 가장 오래된 것부터 삭제)
+- 수신 스레드는 큐에 넣기만 하고 직렬화/쓰기는 기록 스레드가 하므로 패킷 처리 지연이 늘지 않음
+- 큐가 MAX_PENDING개를 넘으면 (디스크가 못 따라가면) 새 기록은 버리고 수만 셈
+
+파일: <디렉터리>/packets-<pid>-<순번>.jsonl (멀티 프로세스 워커도 pid로 구분)
+분석: read_packet_log(디렉터리) 또는 python server/packet_log.py <디렉터리>
+"""
+
+import glob
+import json
+import mmap
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Iterator, Optional
+
+from common.log import get_logger
+
+log = get_logger(__name__, "PacketLog")
+
+SEGMENT_SIZE = 32 * 1024 * 1024  # 세그먼트 파일 하나의 최대 크기 (바이트)
+MAX_SEGMENTS = 32  # 프로세스별로 보관할 최대 세그먼트 수 (초과 시 오래된 것부터 삭제)
+MAX_PENDING = 65536  # 기록 스레드가 아직 쓰지 않은 최대 기록 수
+WRITE_BATCH = 1024  # 기록 스레드가 한 번에 꺼내 쓰는 최대 기록 수
+
+_STOP = object()  # 기록 스레드 종료 표시
+
+
+class MmapPacketLog:
+    """mmap 세그먼트에 패킷을 JSON 줄로 이어 쓰는 로그 (기록은 별도 스레드)"""
+
+    def __init__(self, directory: str, segment_size: int = SEGMENT_SIZE, max_segments: int = MAX_SEGMENTS,
+                 max_pending: int = MAX_PENDING):
+        """
+        Args:
+            directory: 세그먼트 파일을 둘 디렉터리 (없으면 생성)
+            segment_size: 세그먼트 파일 크기 (바이트)
+            max_segments: 보관할 최대 세그먼트 수 (0이면 삭제하지 않음)
+            max_pending: 쓰기 대기 큐 최대 길이
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.max_pending = max_pending
+        self.prefix = f"packets-{os.getpid()}-"
+
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()  # start/close 보호
+        self._file = None
+        self._map = None
+        self._offset = 0
+        self._sequence = 0
+        self._segments = []  # 이 로그가 만든 세그먼트 경로 (오래된 것부터)
+
+        # 통계
+        self.written = 0
+        self.dropped = 0  # 큐가 가득 차서 버린 기록 수
+        self.oversize = 0  # 세그먼트보다 커서 버린 기록 수
+        self.errors = 0
+        self.bytes_written = 0
+
+    def start(self):
+        """기록 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, daemon=True, name="packet-log")
+            self._thread.start()
+        limit = f"최대 {self.max_segments}개" if self.max_segments else "개수 제한 없음"
+        log.info("패킷 로그 기록 시작: %s (세그먼트 %sMB, %s)", self.directory, self.segment_size // (1024 * 1024), limit)
+
+    def close(self):
+        """남은 기록을 모두 쓰고 현재 세그먼트를 닫음 (다시 start() 가능)"""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+            thread.join(timeout=10)
+            self._thread = None
+        log.info("패킷 로그 기록 종료: %s개 기록, %s개 버림", self.written, self.dropped)
+
+    def append(self, record: dict):
+        """
+        기록 추가 (수신 스레드에서 호출, 큐에 넣기만 함)
+
+        Args:
+            record: 패킷 로그 항목 (이후 변경하지 않아야 함)
+        """
+        if self._thread is None:
+            return
+        if self._queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            return
+        self._queue.put((time.time(), record))
+
+    def _run(self):
+        """기록 스레드 루프 (큐에서 꺼내 한 번에 여러 개씩 씀)"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                    continue
+                try:
+                    self._write(item)
+                except Exception as e:
+                    self.errors += 1
+                    log.error("기록 오류: %s", e)
+            if stop:
+                self._close_segment()
+                return
+
+    def _write(self, item: tuple):
+        """기록 하나를 JSON 줄로 현재 세그먼트에 씀 (자리가 없으면 다음 세그먼트)"""
+        ts, record = item
+        line = json.dumps({'ts': round(ts, 6), **record}, ensure_ascii=False,
+                          separators=(',', ':'), default=str).encode('utf-8') + b'\n'
+        if len(line) > self.segment_size:
+            self.oversize += 1
+            return
+        if self._map is None or self._offset + len(line) > self.segment_size:
+            self._open_segment()
+        end = self._offset + len(line)
+        self._map[self._offset:end] = line
+        self._offset = end
+        self.written += 1
+        self.bytes_written += len(line)
+
+    def _open_segment(self):
+        """현재 세그먼트를 닫고 새 세그먼트를 만들어 mmap으로 엶 (보관 개수 초과분 삭제)"""
+        self._close_segment()
+        self._sequence += 1
+        path = os.path.join(self.directory, f"{self.prefix}{self._sequence:06d}.jsonl")
+        self._file = open(path, 'w+b')
+        self._file.truncate(self.segment_size)
+        self._map = mmap.mmap(self._file.fileno(), self.segment_size)
+        self._offset = 0
+        self._segments.append(path)
+
+        while self.max_segments and len(self._segments) > self.max_segments:
+            oldest = self._segments.pop(0)
+            try:
+                os.remove(oldest)
+            except OSError:
+                pass
+
+    def _close_segment(self):
+        """현재 세그먼트를 디스크에 반영하고 실제 기록 길이로 자름"""
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._map = None
+        self._file = None
+
+    def stats(self) -> dict:
+        """기록 통계 (기록/버림 수, 대기 중인 기록 수, 현재 세그먼트)"""
+        return {
+            'directory': self.directory,
+            'running': self._thread is not None,
+            'written': self.written,
+            'pending': self._queue.qsize(),
+            'dropped': self.dropped,
+            'oversize': self.oversize,
+            'errors': self.errors,
+            'bytes': self.bytes_written,
+            'segments': len(self._segments),
+            'segment': os.path.basename(self._segments[-1]) if self._segments else None
+        }
+
+
+def read_packet_log(directory: str, room_id: Optional[str] = None) -> Iterator[dict]:
+    """
+    디렉터리의 패킷 로그 세그먼트를 프로세스/순번 순서로 읽음
+
+    비정상 종료로 잘리지 않은 세그먼트의 뒤쪽 0 바이트와 쓰다 만 줄은 건너뜀
+
+    Args:
+        directory: MmapPacketLog 디렉터리
+        room_id: 이 방의 기록만 (None이면 전체)
+
+    Yields:
+        패킷 로그 항목 (ts: 수신 시각 epoch 초)
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "packets-*.jsonl"))):
+        with open(path, 'rb') as f:
+            data = f.read()
+        for line in data.rstrip(b'\0').splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if room_id is None or record.get('room_id') == room_id:
+                yield record
+
+
+def main():
+    """패킷 로그 요약 (방/메시지 타입별 개수와 기록 구간)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='패킷 로그 요약')
+    parser.add_argument('directory', help='패킷 로그 디렉터리 (--packet-log-dir)')
+    parser.add_argument('--room', default=None, help='이 방의 기록만')
+    parser.add_argument('--dump', action='store_true', help='요약 대신 기록을 JSON 줄로 출력')
+    args = parser.parse_args()
+
+    counts = Counter()
+    first = last = None
+    for record in read_packet_log(args.directory, args.room):
+        if args.dump:
+            print(json.dumps(record, ensure_ascii=False))
+            continue
+        counts[(record.get('room_id'), record.get('type'))] += 1
+        first = record['ts'] if first is None else min(first, record['ts'])
+        last = record['ts'] if last is None else max(last, record['ts'])
+
+    if args.dump:
+        return
+    if first is None:
+        print("기록 없음")
+        return
+    print(f"기록 {sum(counts.values())}개, {time.strftime('%H:%M:%S', time.localtime(first))} ~ "
+          f"{time.strftime('%H:%M:%S', time.localtime(last))}")
+    for (room_id, msg_type), count in sorted(counts.items(), key=lambda item: (str(item[0][0]), -item[1])):
+        print(f"  {room_id:<12} {msg_type:<24} {count}")
+
+
+if __name__ == '__main__':
+    main()
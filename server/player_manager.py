@@ -1,13 +1,34 @@
 """
 플레이어 관리 모듈
 서버에 연결된 플레이어들의 정보를 관리
+
+플레이어 목록 조회는 락 없이 불변 스냅샷(PlayerSnapshot)을 읽는다.
+접속/종료와 점수/HP 변경은 self.lock 안에서 새 스냅샷을 만들어 통째로 교체하므로
+(참조 대입은 원자적) 읽는 쪽은 항상 일관된 목록을 본다.
 """
 
+import heapq
+import logging
 import socket
 import threading
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
+from common.constants import (
+    WIRE_VERSION_JSON, PLAYER_INDEX_MODE, PLAYER_INDEX_STABLE, PLAYER_INDEX_JOIN_ORDER
+)
+from server.ip_allocator import IPAllocator, ip_to_int, int_to_ip
+from common.log import get_logger
+
+log = get_logger(__name__, "PlayerManager")
+
+
+class DuplicatePlayerError(ValueError):
+    """이미 접속 중인 플레이어 ID로 다시 접속한 경우"""
+
+    def __init__(self, player_id: str):
+        super().__init__(f"이미 접속 중인 플레이어 ID: {player_id}")
+        self.player_id = player_id
 
 @dataclass
 class Player:
@@ -16,55 +37,152 @@ class Player:
     socket: socket.socket
     address: tuple
     ip: str
+    ip_int: int = 0  # 가상 IP 정수 표현 (IP 인덱스/할당기 키)
+    slot: int = 0  # 접속 중 고정되는 슬롯 번호 (P2P 포트 계산용)
     score: int = 0
     hp: int = 100
     is_connected: bool = True
-    attacks_received: List[str] = field(default_factory=list)  # 이번 라운드에 받은 공격자 IP 목록
+    wire_version: int = WIRE_VERSION_JSON  # CONNECT 시 협상된 와이어 포맷 버전
+    room_id: Optional[str] = None  # 소속 방
+    writer: Optional[Any] = field(default=None, repr=False)  # 송신 큐 (ConnectionWriter)
+    attacks_received: List[int] = field(default_factory=list)  # 이번 라운드에 받은 공격자 가상 IP(정수) 목록
 
     def reset_round_data(self):
         """라운드 데이터 초기화"""
         self.attacks_received.clear()
 
-    def add_attack(self, attacker_ip: str):
+    def add_attack(self, attacker_ip_int: int):
         """공격 받은 기록 추가"""
-        if attacker_ip not in self.attacks_received:
-            self.attacks_received.append(attacker_ip)
+        if attacker_ip_int not in self.attacks_received:
+            self.attacks_received.append(attacker_ip_int)
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (전송용)"""
         return {
             'player_id': self.player_id,
             'ip': self.ip,
+            'player_index': self.slot,
             'score': self.score,
             'hp': self.hp,
             'is_connected': self.is_connected
         }
 
 
+class PlayerSnapshot:
+    """플레이어 목록의 불변 스냅샷 (읽기 전용, 변경은 PlayerManager가 새 스냅샷으로 교체)"""
+
+    __slots__ = ('version', 'players', 'by_id', 'by_ip', 'join_order', '_players_info')
+
+    def __init__(self, version: int, players: Tuple[Player, ...] = (),
+                 by_id: Optional[Dict[str, Player]] = None,
+                 by_ip: Optional[Dict[int, Player]] = None,
+                 join_order: bool = False):
+        """
+        Args:
+            version: 스냅샷 버전 (변경마다 1 증가)
+            players: 플레이어 목록 (접속 순서)
+            by_id: player_id -> 플레이어
+            by_ip: 가상 IP(정수) -> 플레이어
+            join_order: players_info의 player_index를 접속 순서로 채울지 여부
+        """
+        self.version = version
+        self.players = players
+        self.by_id = by_id if by_id is not None else {}
+        self.by_ip = by_ip if by_ip is not None else {}
+        self.join_order = join_order
+        self._players_info = None
+
+    def players_info(self) -> Tuple[dict, ...]:
+        """
+        전송용 플레이어 정보 (이 스냅샷에서 처음 조회할 때 한 번만 생성)
+
+        여러 스레드가 동시에 처음 조회하면 같은 내용을 중복 생성할 수 있지만 결과는 동일하다.
+        """
+        info = self._players_info
+        if info is None:
+            info = [player.to_dict() for player in self.players]
+            if self.join_order:
+                for index, item in enumerate(info):
+                    item['player_index'] = index
+            info = tuple(info)
+            self._players_info = info
+        return info
+
+
 class PlayerManager:
     """플레이어 관리 클래스"""
 
-    def __init__(self):
-        self.players: Dict[str, Player] = {}
-        self.lock = threading.Lock()
-        self.virtual_ip_pool = [f"172.20.1.{i}" for i in range(1, 21)]  # 172.20.1.1 ~ 172.20.1.20
-        self.used_ips = set()  # 현재 사용 중인 가상 IP
+    def __init__(self, network: str = "172.20.1.0/24", allocator: Optional[IPAllocator] = None,
+                 index_mode: str = PLAYER_INDEX_MODE):
+        """
+        Args:
+            network: 가상 IP 대역 CIDR (방마다 다른 대역 사용)
+            allocator: 가상 IP 할당기 (None이면 network 대역의 IPAllocator)
+            index_mode: 플레이어 인덱스 방식 (PLAYER_INDEX_STABLE 또는 PLAYER_INDEX_JOIN_ORDER)
+        """
+        if index_mode not in (PLAYER_INDEX_STABLE, PLAYER_INDEX_JOIN_ORDER):
+            raise ValueError(f"알 수 없는 플레이어 인덱스 방식: {index_mode}")
+        self.players: Dict[str, Player] = {}  # 쓰기용 원본 (self.lock 안에서만 접근)
+        self.lock = threading.Lock()  # 쓰기 전용 락 (조회는 self._snapshot 사용)
+        self._snapshot = PlayerSnapshot(version=0, join_order=index_mode == PLAYER_INDEX_JOIN_ORDER)
+        self.allocator = allocator or IPAllocator(network)
+        self.index_mode = index_mode
+
+        # 슬롯 테이블: 반환된 슬롯 중 가장 작은 번호부터 재사용
+        self._free_slots: List[int] = []  # 최소 힙
+        self._next_slot = 0
+
+    def _allocate_slot(self) -> int:
+        """빈 슬롯 번호 할당 (self.lock을 잡은 상태에서 호출)"""
+        if self._free_slots:
+            return heapq.heappop(self._free_slots)
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    def _release_slot(self, slot: int):
+        """슬롯 번호 반환 (self.lock을 잡은 상태에서 호출)"""
+        heapq.heappush(self._free_slots, slot)
+
+    def _publish_locked(self, membership: bool = True):
+        """
+        새 스냅샷 발행 (self.lock을 잡은 상태에서 호출)
 
-    def _allocate_virtual_ip(self) -> str:
+        Args:
+            membership: 접속/종료로 목록이 바뀌었는지 여부 (False면 점수/HP만 바뀐 것이므로
+                        목록과 인덱스는 이전 스냅샷 것을 재사용하고 전송용 정보만 새로 만듦)
         """
-        사용 가능한 가상 IP 할당
+        previous = self._snapshot
+        if membership:
+            players = tuple(self.players.values())
+            by_id = dict(self.players)
+            by_ip = {player.ip_int: player for player in players}
+        else:
+            players, by_id, by_ip = previous.players, previous.by_id, previous.by_ip
+        self._snapshot = PlayerSnapshot(
+            version=previous.version + 1,
+            players=players,
+            by_id=by_id,
+            by_ip=by_ip,
+            join_order=self.index_mode == PLAYER_INDEX_JOIN_ORDER
+        )
+
+    def snapshot(self) -> PlayerSnapshot:
+        """
+        현재 플레이어 목록 스냅샷 (락 없음, 복사 없음)
 
         Returns:
-            할당된 가상 IP
+            PlayerSnapshot (수정하지 말 것)
         """
-        for ip in self.virtual_ip_pool:
-            if ip not in self.used_ips:
-                self.used_ips.add(ip)
-                return ip
-        # IP 풀이 모두 사용된 경우 (최대 20명)
-        raise Exception("가상 IP 풀이 고갈됨. 최대 20명까지 지원합니다.")
-
-    def add_player(self, player_id: str, sock: socket.socket, address: tuple) -> Player:
+        return self._snapshot
+
+    @property
+    def capacity(self) -> int:
+        """가상 IP 대역으로 수용 가능한 최대 플레이어 수"""
+        return self.allocator.capacity
+
+    def add_player(self, player_id: str, sock: socket.socket, address: tuple,
+                   wire_version: int = WIRE_VERSION_JSON, writer=None) -> Player:
         """
         새 플레이어 추가 (가상 IP 자동 할당)
 
@@ -72,23 +190,37 @@ class PlayerManager:
             player_id: 플레이어 ID
             sock: 플레이어 소켓
             address: 플레이어 주소
+            wire_version: 협상된 와이어 포맷 버전
+            writer: 플레이어 송신 큐 (ConnectionWriter, 선택)
 
         Returns:
             생성된 Player 객체
+
+        Raises:
+            DuplicatePlayerError: 같은 ID의 플레이어가 이미 접속 중인 경우
         """
         with self.lock:
             real_ip = address[0]
-            # 가상 IP 할당
-            virtual_ip = self._allocate_virtual_ip()
+            if player_id in self.players:
+                raise DuplicatePlayerError(player_id)
+
+            # 가상 IP 할당 (free-list, O(1))
+            ip_int = self.allocator.allocate()
+            virtual_ip = int_to_ip(ip_int)
 
             player = Player(
                 player_id=player_id,
                 socket=sock,
                 address=address,
-                ip=virtual_ip  # 가상 IP 사용
+                ip=virtual_ip,  # 가상 IP 사용
+                ip_int=ip_int,
+                slot=self._allocate_slot(),
+                wire_version=wire_version,
+                writer=writer
             )
             self.players[player_id] = player
-            print(f"[PlayerManager] 플레이어 추가: {player_id} (실제 IP: {real_ip}, 가상 IP: {virtual_ip})")
+            self._publish_locked()
+            log.info("플레이어 추가: %s (실제 IP: %s, 가상 IP: %s)", player_id, real_ip, virtual_ip)
             return player
 
     def remove_player(self, player_id: str) -> bool:
@@ -107,11 +239,12 @@ class PlayerManager:
                 player.is_connected = False
 
                 # 가상 IP 반환
-                if player.ip in self.used_ips:
-                    self.used_ips.remove(player.ip)
+                self.allocator.release(player.ip_int)
+                self._release_slot(player.slot)
 
-                print(f"[PlayerManager] 플레이어 제거: {player_id} (가상 IP 반환: {player.ip})")
+                log.info("플레이어 제거: %s (가상 IP 반환: %s)", player_id, player.ip)
                 del self.players[player_id]
+                self._publish_locked()
                 return True
             return False
 
@@ -125,8 +258,7 @@ class PlayerManager:
         Returns:
             Player 객체 또는 None
         """
-        with self.lock:
-            return self.players.get(player_id)
+        return self._snapshot.by_id.get(player_id)
 
     def get_player_by_ip(self, ip: str) -> Optional[Player]:
         """
@@ -138,26 +270,22 @@ class PlayerManager:
         Returns:
             Player 객체 또는 None
         """
-        with self.lock:
-            for player in self.players.values():
-                if player.ip == ip:
-                    return player
+        ip_int = ip_to_int(ip)
+        if ip_int is None:
             return None
+        return self._snapshot.by_ip.get(ip_int)
 
     def get_all_players(self) -> List[Player]:
         """모든 플레이어 목록 반환"""
-        with self.lock:
-            return list(self.players.values())
+        return list(self._snapshot.players)
 
     def get_player_count(self) -> int:
         """현재 플레이어 수 반환"""
-        with self.lock:
-            return len(self.players)
+        return len(self._snapshot.players)
 
     def get_connected_players(self) -> List[Player]:
         """연결된 플레이어 목록 반환"""
-        with self.lock:
-            return [p for p in self.players.values() if p.is_connected]
+        return [p for p in self._snapshot.players if p.is_connected]
 
     def update_score(self, player_id: str, score_delta: int) -> int:
         """
@@ -173,6 +301,7 @@ class PlayerManager:
         with self.lock:
             if player_id in self.players:
                 self.players[player_id].score += score_delta
+                self._publish_locked(membership=False)
                 return self.players[player_id].score
             return 0
 
@@ -192,6 +321,7 @@ class PlayerManager:
                 self.players[player_id].hp += hp_delta
                 if self.players[player_id].hp < 0:
                     self.players[player_id].hp = 0
+                self._publish_locked(membership=False)
                 return self.players[player_id].hp
             return 0
 
@@ -202,22 +332,22 @@ class PlayerManager:
                 player.reset_round_data()
 
     def get_players_info(self) -> List[dict]:
-        """모든 플레이어 정보를 딕셔너리 리스트로 반환"""
-        with self.lock:
-            return [player.to_dict() for player in self.players.values()]
+        """모든 플레이어 정보를 딕셔너리 리스트로 반환 (스냅샷의 딕셔너리를 공유하므로 수정하지 말 것)"""
+        return list(self._snapshot.players_info())
 
-    def record_attack(self, target_player_id: str, attacker_ip: str):
+    def record_attack(self, target_player_id: str, attacker_ip_int: int):
         """
         공격 기록
 
         Args:
             target_player_id: 공격 대상 플레이어 ID
-            attacker_ip: 공격자 IP
+            attacker_ip_int: 공격자 가상 IP (정수, Player.ip_int)
         """
         with self.lock:
             if target_player_id in self.players:
-                self.players[target_player_id].add_attack(attacker_ip)
-                print(f"[PlayerManager] 공격 기록: {attacker_ip} -> {target_player_id}")
+                self.players[target_player_id].add_attack(attacker_ip_int)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("공격 기록: %s -> %s", int_to_ip(attacker_ip_int), target_player_id)
 
     def get_attacks_received(self, player_id: str) -> List[str]:
         """
@@ -231,32 +361,47 @@ class PlayerManager:
         """
         with self.lock:
             if player_id in self.players:
-                return self.players[player_id].attacks_received.copy()
+                return [int_to_ip(ip_int) for ip_int in self.players[player_id].attacks_received]
             return []
 
     def clear(self):
         """모든 플레이어 제거 (가상 IP 풀 초기화)"""
         with self.lock:
             self.players.clear()
-            self.used_ips.clear()
-            print("[PlayerManager] 모든 플레이어 제거됨 (가상 IP 풀 초기화)")
+            self.allocator.reset()
+            self._free_slots.clear()
+            self._next_slot = 0
+            self._publish_locked()
+            log.info("모든 플레이어 제거됨 (가상 IP 풀 초기화)")
+
+    def get_connection_stats(self) -> Dict[str, dict]:
+        """
+        플레이어별 송신 큐 통계 (큐 깊이, 드롭 수 등)
+
+        Returns:
+            {player_id: ConnectionWriter.stats()}
+        """
+        return {p.player_id: p.writer.stats() for p in self._snapshot.players if p.writer is not None}
 
     def get_player_index(self, player_id: str) -> int:
         """
         플레이어 인덱스 반환 (포트 할당 등에 사용)
 
-        v2.0: 연결 순서 기반 인덱스 사용 (정렬하지 않음)
-        P2P 포트 할당을 위해 연결 순서를 유지해야 함
+        PLAYER_INDEX_STABLE: 접속 시 받은 슬롯 번호 (O(1), 접속 중에는 바뀌지 않으므로
+        WELCOME으로 알려준 P2P 포트와 공격 승인 시 계산한 포트가 항상 같음)
+        PLAYER_INDEX_JOIN_ORDER: v2.0 방식, 현재 접속자 중 연결 순서
 
         Args:
             player_id: 플레이어 ID
 
         Returns:
-            플레이어 인덱스 (0부터 시작, 연결 순서), 없으면 0
+            플레이어 인덱스 (0부터 시작), 없으면 0
         """
-        with self.lock:
-            # 정렬하지 않고 연결 순서(삽입 순서) 유지
-            player_ids = list(self.players.keys())
-            if player_id in player_ids:
-                return player_ids.index(player_id)
+        snapshot = self._snapshot
+        player = snapshot.by_id.get(player_id)
+        if player is None:
             return 0
+        if self.index_mode == PLAYER_INDEX_STABLE:
+            return player.slot
+        # 정렬하지 않고 연결 순서(삽입 순서) 유지
+        return snapshot.players.index(player)
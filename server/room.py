@@ -0,0 +1,308 @@
+"""
+게임 방 모듈
+한 서버 프로세스에서 여러 게임을 동시에 진행하기 위한 방 단위 상태 관리
+- 방마다 독립된 PlayerManager / GameManager / 트래픽 생성기 / 가상 IP 대역
+- 방마다 락이 분리되어 있어 한 방의 부하가 다른 방을 느리게 하지 않음
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from common.constants import (
+    ROOM_PREFIX_LENGTH, MAX_ROOMS, DEFAULT_ROOM_ID, TOTAL_ROUNDS, MSG_TYPE_DUMMY, PACKET_LOG_SIZE
+)
+from common.message_types import PlayerListMessage
+from common.protocol import Protocol, EncodedFrame
+from server.player_manager import PlayerManager, Player
+from server.game_manager import GameManager, GameState
+from server.dummy_generator import DummyGenerator
+from server.noise_generator import NoiseGenerator
+from server.decoy_generator import DecoyGenerator
+from server.traffic_scheduler import TrafficScheduler, get_traffic_scheduler
+from server.telemetry import BROADCAST_FANOUT
+from common.log import get_logger
+
+log = get_logger(__name__, "RoomManager")
+dummy_log = get_logger("server.dummy_generator", "DummyGenerator")
+
+
+class Room:
+    """게임 방 (플레이어, 게임 진행, 트래픽 생성기, 패킷 로그)"""
+
+    def __init__(self, room_id: str, subnet: int,
+                 on_player_list: Optional[Callable[[str, List[dict]], None]] = None,
+                 max_packet_log: int = PACKET_LOG_SIZE, clock=None, scheduler=None, event_bus=None):
+        """
+        Args:
+            room_id: 방 ID
+            subnet: 가상 IP 대역 번호 (172.20.<subnet>.0/ROOM_PREFIX_LENGTH)
+            on_player_list: 플레이어 목록 변경 시 호출되는 콜백 (room_id, players_info)
+            max_packet_log: 보관할 패킷 로그 수
+            clock: 게임 진행/트래픽 생성기가 쓸 시계 (None이면 실제 단조 시계)
+            scheduler: 트래픽 생성기 스케줄러 (None이면 공용 스케줄러, clock을 주면 그 시계를 쓰는 방 전용 스케줄러)
+            event_bus: 게임 이벤트를 발행할 EventBus (None이면 구독자 없는 방 전용 버스)
+        """
+        self.room_id = room_id
+        self.subnet = subnet
+        self.on_player_list = on_player_list
+        self.members = 0  # 접속 중이거나 접속 처리 중인 인원 (RoomManager가 관리)
+
+        # 방별 매니저
+        self.network = f"172.20.{subnet}.0/{ROOM_PREFIX_LENGTH}"
+        self.player_manager = PlayerManager(network=self.network)
+        self.capacity = self.player_manager.capacity  # 최대 접속 인원 (가상 IP 대역 크기)
+        if scheduler is None:
+            scheduler = TrafficScheduler(clock, name=f"traffic-{room_id}") if clock else get_traffic_scheduler()
+        self.scheduler = scheduler
+        self.dummy_generator = DummyGenerator(self.broadcast_message, scheduler=scheduler)
+        self.noise_generator = NoiseGenerator(self.player_manager, self.send_to_player, scheduler=scheduler)
+        self.decoy_generator = DecoyGenerator(self.player_manager, self.send_to_player, scheduler=scheduler)
+        self.game_manager = GameManager(
+            self.player_manager,
+            self.broadcast_message,
+            self.dummy_generator,
+            self.noise_generator,
+            self.decoy_generator,
+            self.broadcast_player_list,  # HP 업데이트 시 플레이어 목록 브로드캐스트
+            clock=clock,
+            room_id=room_id,
+            event_bus=event_bus
+        )
+
+        # 패킷 로그 (디버깅용, 최근 max_packet_log개만 유지하는 링 버퍼, 전체 기록은 MmapPacketLog)
+        self.packet_log = deque(maxlen=max_packet_log)
+        self.max_packet_log = max_packet_log
+
+    def is_joinable(self) -> bool:
+        """자동 배정 가능 여부 (게임 진행 중이 아니고 자리가 남은 방)"""
+        return (self.game_manager.state in (GameState.WAITING, GameState.GAME_END)
+                and self.members < self.capacity)
+
+    def start_game(self, traffic_profile: Optional[str] = None) -> bool:
+        """
+        게임 시작
+
+        Args:
+            traffic_profile: 트래픽 프로필 이름 (None이면 기본 프로필)
+        """
+        if self.game_manager.start_game(traffic_profile):
+            self.dummy_generator.start()
+            return True
+        return False
+
+    def stop_game(self):
+        """게임 중지"""
+        self.game_manager.stop_game()
+        self.dummy_generator.stop()
+
+    def broadcast_message(self, message, target_players=None):
+        """
+        메시지 브로드캐스트
+        메시지는 한 번만 인코딩하고 같은 프레임을 모든 수신자에게 전송
+
+        Args:
+            message: Message 객체 또는 미리 인코딩된 EncodedFrame
+            target_players: 수신 플레이어 목록 (None이면 방 전체)
+        """
+        if target_players is None:
+            # 락/복사 없이 현재 스냅샷을 그대로 순회
+            target_players = self.player_manager.snapshot().players
+
+        # 더미 패킷 로깅 (디버그용, 트래픽 프로필로 고속 전송 중에는 생략)
+        if message.type == MSG_TYPE_DUMMY and self.dummy_generator.log_packets:
+            dummy_log.debug("[%s] 더미 패킷 브로드캐스트: %s명에게 전송", self.room_id, len(target_players))
+
+        start = time.perf_counter()
+        # 와이어 버전별로 한 번만 직렬화되는 프레임을 모든 수신자가 공유
+        frame = message if isinstance(message, EncodedFrame) else Protocol.encode_message(message)
+
+        for player in target_players:
+            self.send_to_player(player, frame)
+        BROADCAST_FANOUT.observe(time.perf_counter() - start, frame.type)
+
+    def send_to_player(self, player: Player, message):
+        """
+        특정 플레이어의 송신 큐에 메시지 추가 (Message 또는 EncodedFrame)
+        실제 전송은 플레이어별 writer가 담당하므로 호출 스레드는 막히지 않음
+        """
+        if player.is_connected and player.writer is not None:
+            player.writer.send(message)
+
+    def broadcast_player_list(self):
+        """플레이어 목록 브로드캐스트"""
+        players_info = self.player_manager.get_players_info()
+        msg = PlayerListMessage(players=players_info)
+        self.broadcast_message(msg, None)
+
+        if self.on_player_list:
+            self.on_player_list(self.room_id, players_info)
+
+    def add_packet_log(self, packet_data: dict):
+        """패킷 로그 추가 (O(1), 가득 차면 가장 오래된 항목이 빠짐)"""
+        self.packet_log.append(packet_data)
+
+    def get_packet_log(self) -> list:
+        """패킷 로그 복사본 (오래된 것부터)"""
+        while True:
+            try:
+                return list(self.packet_log)
+            except RuntimeError:  # 복사 중 수신 스레드가 추가한 경우 다시 복사
+                continue
+
+    def summary(self) -> dict:
+        """방 목록용 요약 정보"""
+        return {
+            'room_id': self.room_id,
+            'subnet': self.network,
+            'game_state': self.game_manager.state.value,
+            'current_round': self.game_manager.current_round,
+            'player_count': self.player_manager.get_player_count()
+        }
+
+    def get_status(self) -> dict:
+        """방 상세 상태"""
+        return {
+            'room_id': self.room_id,
+            'game_state': self.game_manager.state.value,
+            'current_round': self.game_manager.current_round,
+            'total_rounds': TOTAL_ROUNDS,
+            'traffic_profile': self.game_manager.get_traffic_stats(),  # 선택한 프로필, 요청 대비 실제 전송률
+            'player_count': self.player_manager.get_player_count(),
+            'players': self.player_manager.get_players_info(),
+            'connections': self.player_manager.get_connection_stats(),  # 플레이어별 송신 큐 깊이/드롭 수
+            'attacks': self.game_manager.get_attack_stats(),  # 진행 중 공격, 요청→전달 지연 히스토그램
+            'traffic_pools': {  # 미리 만든 트래픽 프레임 풀
+                'dummy': self.dummy_generator.pool.stats(),
+                'noise': self.noise_generator.pool.stats(),
+                'decoy': self.decoy_generator.pool.stats()
+            }
+        }
+
+
+class RoomManager:
+    """
+    방 목록 관리
+
+    self.lock은 방 목록과 인원 수(members)만 보호한다. 방 안의 게임 진행/플레이어 상태는
+    각 방의 PlayerManager/GameManager 락을 사용하므로 방끼리 락을 공유하지 않는다.
+
+    멀티 프로세스 워커 모드에서는 owns로 이 워커가 소유한 방 이름만 만들고,
+    가상 IP 대역도 subnet_start부터 subnet_step 간격으로 나눠 워커끼리 겹치지 않게 한다.
+    """
+
+    def __init__(self, on_player_list: Optional[Callable[[str, List[dict]], None]] = None,
+                 owns: Optional[Callable[[str], bool]] = None,
+                 subnet_start: int = 1, subnet_step: int = 1, event_bus=None):
+        """
+        Args:
+            on_player_list: 방의 플레이어 목록 변경 시 호출되는 콜백 (room_id, players_info)
+            owns: 방 ID를 이 프로세스가 소유하는지 판단하는 함수 (None이면 모든 방 소유)
+            subnet_start: 첫 가상 IP 대역 번호
+            subnet_step: 가상 IP 대역 번호 간격
+            event_bus: 모든 방의 게임 이벤트를 발행할 EventBus
+        """
+        self.on_player_list = on_player_list
+        self.owns = owns or (lambda room_id: True)
+        self.subnet_start = subnet_start
+        self.subnet_step = subnet_step
+        self.event_bus = event_bus
+        self.rooms: Dict[str, Room] = {}
+        self.lock = threading.Lock()
+        self._auto_sequence = 0  # 자동 생성 방 이름용 시퀀스
+
+        # 기본 방 (단일 프로세스에서는 172.20.1.x, 기존 단일 방 서버와 같은 대역)
+        self.default_room_id = self._owned_name(DEFAULT_ROOM_ID, [""] + [f"-{n}" for n in range(2, MAX_ROOMS + 2)])
+        self._create_room(self.default_room_id)
+
+    def _owned_name(self, base: str, suffixes) -> str:
+        """base + suffix 중 이 프로세스가 소유하고 아직 없는 첫 방 이름"""
+        for suffix in suffixes:
+            room_id = f"{base}{suffix}"
+            if room_id not in self.rooms and self.owns(room_id):
+                return room_id
+        raise Exception(f"사용 가능한 방 이름 없음: {base}")
+
+    def _free_subnet(self) -> int:
+        """사용하지 않는 가장 작은 대역 번호 (self.lock을 잡은 상태에서 호출)"""
+        used = {room.subnet for room in self.rooms.values()}
+        for subnet in range(self.subnet_start, MAX_ROOMS + 1, self.subnet_step):
+            if subnet not in used:
+                return subnet
+        raise Exception(f"방 개수 초과. 최대 {MAX_ROOMS}개까지 지원합니다.")
+
+    def _create_room(self, room_id: str) -> Room:
+        """방 생성 (self.lock을 잡은 상태에서 호출)"""
+        room = Room(room_id, self._free_subnet(), on_player_list=self.on_player_list, event_bus=self.event_bus)
+        self.rooms[room_id] = room
+        log.info("방 생성: %s (%s)", room_id, room.network)
+        return room
+
+    def join(self, requested: Optional[str] = None) -> Room:
+        """
+        접속할 방 결정 및 자리 예약
+
+        Args:
+            requested: 클라이언트가 CONNECT에 지정한 방 ID (없으면 자동 배정)
+
+        Returns:
+            배정된 Room (members가 1 증가한 상태, 접속 실패/종료 시 leave 호출 필요)
+        """
+        with self.lock:
+            if requested:
+                room = self.rooms.get(requested)
+                if room is None:
+                    room = self._create_room(requested)
+                elif room.members >= room.capacity:
+                    raise Exception(f"방 '{requested}' 인원 초과 (최대 {room.capacity}명)")
+            else:
+                # 대기 중이고 자리가 남은 첫 방, 없으면 새 방
+                room = next((r for r in self.rooms.values() if r.is_joinable()), None)
+                if room is None:
+                    self._auto_sequence += 1
+                    while (f"room-{self._auto_sequence}" in self.rooms
+                           or not self.owns(f"room-{self._auto_sequence}")):
+                        self._auto_sequence += 1
+                    room = self._create_room(f"room-{self._auto_sequence}")
+            room.members += 1
+            return room
+
+    def leave(self, room: Room):
+        """
+        자리 반환 (빈 방은 기본 방을 제외하고 제거)
+
+        Args:
+            room: 떠나는 방
+        """
+        with self.lock:
+            room.members -= 1
+            if room.members > 0 or room.room_id == self.default_room_id:
+                return
+            self.rooms.pop(room.room_id, None)
+        log.info("빈 방 제거: %s", room.room_id)
+        if room.game_manager.running:
+            # stop_game은 게임 스레드 종료를 기다리므로 호출 스레드(수신 루프)를 막지 않도록 분리
+            threading.Thread(target=room.stop_game, daemon=True).start()
+
+    def get_room(self, room_id: Optional[str] = None) -> Optional[Room]:
+        """
+        방 조회
+
+        Args:
+            room_id: 방 ID (None이면 기본 방)
+
+        Returns:
+            Room 객체 또는 None
+        """
+        # 수신 메시지마다 호출되므로 락 없이 조회 (dict 조회는 원자적, 변경은 self.lock 안에서만)
+        return self.rooms.get(room_id or self.default_room_id)
+
+    def get_all_rooms(self) -> List[Room]:
+        """모든 방 목록"""
+        with self.lock:
+            return list(self.rooms.values())
+
+    def get_rooms_info(self) -> List[dict]:
+        """모든 방의 요약 정보"""
+        return [room.summary() for room in self.get_all_rooms()]
@@ -0,0 +1,462 @@
+"""
+라운드 점수 계산 모듈
+라운드 공격 기록과 방어 제출로 플레이어별 점수/HP 변화량을 계산
+
+규칙 (GameManager v2.1과 동일):
+- 정답: 제출한 IP 중 실제로 나를 공격한 IP (고유 IP 기준)
+- 오답: 제출한 IP 중 나를 공격하지 않은 IP (가짜 공격 포함)
+- 놓친 공격: 실제 공격 횟수 - 정답 수 (정답 IP도 1번만 방어한 것으로 처리)
+- HP 감소: 놓친 공격 1개당 HP_DAMAGE_PER_ATTACK
+
+- ScoreEngine: 라운드 기록 전체를 한 번에 계산, 상태 없음 (Counter, 공격/플레이어가 많고
+  NumPy가 설치된 경우 NumPy 경로)
+- RoundScoreboard: 라운드 상태 보관. 공격 완료/방어 제출 시점마다 RoundAttackLog에 기록하고
+  대상별 카운터를 갱신해 두어 방어 단계가 끝나면 바로 결과를 낼 수 있게 함 (GameManager가 사용)
+- RoundAttackLog: 라운드 공격 기록을 배열 열(column)로 보관, 라운드마다 재사용
+
+IP는 가상 IP 정수(Player.ip_int)로 다룬다. 문자열 변환은 경계에서만
+(방어 제출: RoundScoreboard.ip_key, 표시: int_to_ip)
+"""
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from common.constants import (
+    SCORE_CORRECT_DEFENSE_NORMAL, SCORE_WRONG_DEFENSE_NORMAL, SCORE_MISSED_ATTACK_NORMAL,
+    SCORE_CORRECT_DEFENSE_FINAL, SCORE_WRONG_DEFENSE_FINAL, SCORE_MISSED_ATTACK_FINAL,
+    HP_DAMAGE_PER_ATTACK
+)
+from server.ip_allocator import ip_to_int, int_to_ip
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 공격 기록 + 방어 제출 수가 이 값 이상이면 NumPy 경로 사용
+NUMPY_THRESHOLD = 20000
+
+# 잘못된 IP 문자열 제출에 붙이는 키 시작값 (IPv4 정수 범위 밖이라 실제 공격자 IP와 겹치지 않음)
+INVALID_IP_BASE = 1 << 32
+
+
+@dataclass
+class ScoreResult:
+    """플레이어 한 명의 라운드 결과"""
+    player_id: str
+    score_delta: int
+    hp_damage: int
+    correct_count: int  # 정답 IP 수
+    wrong_count: int  # 오답 IP 수
+    missed_count: int  # 놓친 공격 횟수
+    missed_unique: int  # 하나도 막지 못한 공격자 IP 수
+    reason: str
+
+    @property
+    def correct(self) -> bool:
+        """오답과 놓친 공격자가 없는지 여부"""
+        return self.wrong_count == 0 and self.missed_unique == 0
+
+
+def round_weights(is_final_round: bool) -> Tuple[int, int, int]:
+    """
+    라운드별 점수 가중치
+
+    Returns:
+        (정답, 오답, 놓친 공격) 점수
+    """
+    if is_final_round:
+        return SCORE_CORRECT_DEFENSE_FINAL, SCORE_WRONG_DEFENSE_FINAL, SCORE_MISSED_ATTACK_FINAL
+    return SCORE_CORRECT_DEFENSE_NORMAL, SCORE_WRONG_DEFENSE_NORMAL, SCORE_MISSED_ATTACK_NORMAL
+
+
+def format_reason(correct: int, wrong: int, missed: int, weights: Tuple[int, int, int],
+                  is_final_round: bool) -> str:
+    """SCORE 메시지의 결과 설명"""
+    score_correct, score_wrong, score_missed = weights
+    reason_parts = []
+    if correct:
+        reason_parts.append(f"정확한 방어: {correct}개 (+{correct * score_correct}점)")
+    if wrong:
+        reason_parts.append(f"오답: {wrong}개 ({wrong * score_wrong}점)")
+    if missed > 0:
+        reason_parts.append(f"놓친 공격: {missed}개 ({missed * score_missed}점)")
+
+    reason = ", ".join(reason_parts) if reason_parts else "공격 없음"
+
+    # v2.0: 가짜 공격 경고 추가 (R5)
+    if is_final_round and wrong > 0:
+        reason += f" [경고: 가짜 공격 {wrong}개 포함 가능]"
+    return reason
+
+
+def build_results(player_ids: List[str], counts: Iterable[Tuple[int, int, int, int]],
+                  is_final_round: bool) -> Dict[str, ScoreResult]:
+    """
+    플레이어별 카운트로 ScoreResult 생성
+
+    Args:
+        player_ids: 플레이어 ID 목록
+        counts: player_ids 순서대로 (정답, 오답, 놓친 공격 횟수, 놓친 공격자 수)
+        is_final_round: 마지막 라운드 여부
+
+    Returns:
+        {player_id: ScoreResult}
+    """
+    weights = round_weights(is_final_round)
+    score_correct, score_wrong, score_missed = weights
+    results = {}
+    for player_id, (correct, wrong, missed, missed_unique) in zip(player_ids, counts):
+        results[player_id] = ScoreResult(
+            player_id=player_id,
+            score_delta=correct * score_correct + wrong * score_wrong + missed * score_missed,
+            hp_damage=missed * HP_DAMAGE_PER_ATTACK,
+            correct_count=correct,
+            wrong_count=wrong,
+            missed_count=missed,
+            missed_unique=missed_unique,
+            reason=format_reason(correct, wrong, missed, weights, is_final_round)
+        )
+    return results
+
+
+class ScoreEngine:
+    """라운드 점수 계산기 (입력만 읽고 결과만 반환)"""
+
+    def __init__(self, numpy_threshold: int = NUMPY_THRESHOLD, use_numpy: Optional[bool] = None):
+        """
+        Args:
+            numpy_threshold: NumPy 경로를 사용할 최소 입력 크기 (공격 기록 + 방어 제출 수)
+            use_numpy: True/False로 경로 고정 (None이면 입력 크기로 결정, NumPy 미설치 시 항상 False)
+        """
+        self.numpy_threshold = numpy_threshold
+        self.use_numpy = use_numpy
+
+    def score_round(self, player_ids: Iterable[str], attacks: Union['RoundAttackLog', Iterable[dict]],
+                    submissions: Dict[str, Iterable[int]], is_final_round: bool) -> Dict[str, ScoreResult]:
+        """
+        라운드 점수 계산
+
+        Args:
+            player_ids: 점수를 계산할 플레이어 ID 목록
+            attacks: RoundAttackLog, 또는 공격 기록 ({'target_id', 'attacker_ip', 'is_real'(선택)} 딕셔너리)
+            submissions: {player_id: 제출한 공격자 IP(정수) 목록}
+            is_final_round: 마지막 라운드 여부 (가중치/경고 문구)
+
+        Returns:
+            {player_id: ScoreResult}
+        """
+        player_ids = list(player_ids)
+        if not isinstance(attacks, (list, RoundAttackLog)):
+            attacks = list(attacks)
+
+        use_numpy = self.use_numpy
+        if use_numpy is None:
+            size = len(attacks) + sum(len(ips) for ips in submissions.values())
+            use_numpy = size >= self.numpy_threshold
+        if use_numpy and np is not None:
+            counts = self._count_numpy(player_ids, self._real_pairs(attacks), submissions)
+        else:
+            counts = self._count(player_ids, self._real_pairs(attacks), submissions)
+        return build_results(player_ids, counts, is_final_round)
+
+    @staticmethod
+    def _real_pairs(attacks) -> Iterator[Tuple[str, int]]:
+        """실제 공격의 (대상, 공격자 IP) 쌍 (RoundAttackLog는 딕셔너리를 만들지 않고 열에서 바로 읽음)"""
+        if isinstance(attacks, RoundAttackLog):
+            return attacks.real_pairs()
+        return ((attack['target_id'], attack['attacker_ip'])
+                for attack in attacks if attack.get('is_real', True))
+
+    @staticmethod
+    def _count(player_ids: List[str], pairs: Iterable[Tuple[str, int]],
+               submissions: Dict[str, Iterable[int]]) -> List[Tuple[int, int, int, int]]:
+        """
+        Counter 경로
+
+        Returns:
+            플레이어 순서대로 (정답, 오답, 놓친 공격 횟수, 놓친 공격자 수)
+        """
+        # (대상, 공격자 IP) 쌍별 공격 횟수 (실제 공격만)
+        pair_counts = Counter(pairs)
+        totals = Counter()  # 대상별 공격 횟수
+        attackers = Counter()  # 대상별 고유 공격자 수
+        for (target_id, _), count in pair_counts.items():
+            totals[target_id] += count
+            attackers[target_id] += 1
+
+        counts = []
+        for player_id in player_ids:
+            submitted = set(submissions.get(player_id, ()))
+            correct = sum(1 for ip in submitted if (player_id, ip) in pair_counts)
+            counts.append((
+                correct,
+                len(submitted) - correct,
+                totals[player_id] - correct,
+                attackers[player_id] - correct
+            ))
+        return counts
+
+    @staticmethod
+    def _count_numpy(player_ids: List[str], pairs: Iterable[Tuple[str, int]],
+                     submissions: Dict[str, Iterable[int]]) -> List[Tuple[int, int, int, int]]:
+        """
+        NumPy 경로 (결과는 _count와 동일)
+
+        (대상, 공격자 IP) 쌍을 정수 키 하나로 만들어 고유 쌍/정답 판정을 배열 연산으로 처리
+        """
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        ip_codes: Dict[str, int] = {}
+
+        attack_targets, attack_ips = [], []
+        for target_id, attacker_ip in pairs:
+            target = index.get(target_id)
+            if target is None:
+                continue
+            attack_targets.append(target)
+            attack_ips.append(ip_codes.setdefault(attacker_ip, len(ip_codes)))
+
+        submit_targets, submit_ips = [], []
+        for player_id, ips in submissions.items():
+            target = index.get(player_id)
+            if target is None:
+                continue
+            for ip in set(ips):
+                submit_targets.append(target)
+                submit_ips.append(ip_codes.setdefault(ip, len(ip_codes)))
+
+        n = len(player_ids)
+        width = max(len(ip_codes), 1)
+        attack_targets = np.asarray(attack_targets, dtype=np.int64)
+        submit_targets = np.asarray(submit_targets, dtype=np.int64)
+        attack_keys = attack_targets * width + np.asarray(attack_ips, dtype=np.int64)
+        submit_keys = submit_targets * width + np.asarray(submit_ips, dtype=np.int64)
+
+        totals = np.bincount(attack_targets, minlength=n)
+        unique_keys = np.unique(attack_keys)
+        unique_counts = np.bincount(unique_keys // width, minlength=n)
+        submitted = np.bincount(submit_targets, minlength=n)
+        correct = np.bincount(submit_keys[np.isin(submit_keys, unique_keys)] // width, minlength=n)
+
+        return list(zip(
+            correct.tolist(),
+            (submitted - correct).tolist(),
+            (totals - correct).tolist(),
+            (unique_counts - correct).tolist()
+        ))
+
+
+class RoundScoreboard:
+    """
+    라운드 점수 카운터 (공격 완료/방어 제출 시 O(1)로 갱신)
+
+    정답 수는 '제출한 IP'와 '실제 공격자 IP'의 교집합 크기이므로 공격과 제출이
+    어떤 순서로 도착해도 결과는 ScoreEngine과 같다. 완료된 공격은 log(RoundAttackLog)에도
+    남겨 recount()로 같은 결과를 다시 계산할 수 있다. 스레드 안전하지 않음 (호출 측 락 사용).
+    """
+
+    def __init__(self):
+        self.log = RoundAttackLog()  # 라운드 공격 기록 (라운드마다 버퍼 재사용)
+        self.pair_counts: Dict[Tuple[str, int], int] = {}  # (대상, 공격자 IP) -> 공격 횟수
+        self.totals: Counter = Counter()  # 대상별 공격 횟수
+        self.attackers: Counter = Counter()  # 대상별 고유 공격자 수
+        self.correct: Counter = Counter()  # 대상별 정답 IP 수
+        self.submitted: Dict[str, Set[int]] = {}  # 대상별 제출한 IP
+        self.invalid: Dict[str, int] = {}  # 잘못된 IP 문자열 -> 키 (INVALID_IP_BASE부터, 항상 오답)
+
+    def reset(self):
+        """라운드 시작 시 초기화"""
+        self.log.clear()
+        self.pair_counts.clear()
+        self.totals.clear()
+        self.attackers.clear()
+        self.correct.clear()
+        self.submitted.clear()
+        self.invalid.clear()
+
+    def ip_key(self, ip) -> int:
+        """
+        제출된 IP 문자열을 점수 키로 변환 (방어 제출 경계에서 한 번만 호출)
+
+        정규 IPv4 표기면 가상 IP 정수, 아니면 같은 문자열마다 같은 INVALID_IP_BASE 이상 키를
+        붙여 중복 없이 오답 하나로 센다.
+
+        Args:
+            ip: 클라이언트가 보낸 IP (보통 문자열)
+        """
+        value = ip_to_int(ip, strict=True) if isinstance(ip, str) else None
+        if value is None:
+            text = str(ip)
+            value = self.invalid.get(text)
+            if value is None:
+                value = self.invalid[text] = INVALID_IP_BASE + len(self.invalid)
+        return value
+
+    def ip_text(self, key: int) -> str:
+        """점수 키를 표시용 문자열로 변환 (ip_key의 역변환)"""
+        if key < INVALID_IP_BASE:
+            return int_to_ip(key)
+        for text, value in self.invalid.items():
+            if value == key:
+                return text
+        return str(key)
+
+    def record_attack(self, attacker_id: str, target_id: str, attacker_ip: int, timestamp: float):
+        """
+        완료된 실제 공격 기록 및 반영
+
+        Args:
+            attacker_id: 공격자 플레이어 ID
+            target_id: 공격 대상 플레이어 ID
+            attacker_ip: 공격자 가상 IP (정수)
+            timestamp: 공격 완료 시각 (time.time)
+        """
+        self.log.append(attacker_id, target_id, attacker_ip, timestamp)
+        key = (target_id, attacker_ip)
+        previous = self.pair_counts.get(key, 0)
+        self.pair_counts[key] = previous + 1
+        self.totals[target_id] += 1
+        if previous == 0:
+            self.attackers[target_id] += 1
+            submitted = self.submitted.get(target_id)
+            if submitted is not None and attacker_ip in submitted:
+                self.correct[target_id] += 1
+
+    def submit(self, player_id: str, attacker_ips: Iterable[int]) -> Set[int]:
+        """
+        방어 제출 반영 (중복 제출 시 누적)
+
+        Args:
+            player_id: 제출한 플레이어 ID
+            attacker_ips: 공격자 IP 키 목록 (ip_key로 변환한 값)
+
+        Returns:
+            지금까지 제출한 IP 키 집합
+        """
+        submitted = self.submitted.setdefault(player_id, set())
+        for ip in attacker_ips:
+            if ip in submitted:
+                continue
+            submitted.add(ip)
+            if (player_id, ip) in self.pair_counts:
+                self.correct[player_id] += 1
+        return submitted
+
+    def counts(self, player_id: str) -> Tuple[int, int, int, int]:
+        """
+        현재까지의 카운트
+
+        Returns:
+            (정답, 오답, 놓친 공격 횟수, 놓친 공격자 수)
+        """
+        correct = self.correct[player_id]
+        return (
+            correct,
+            len(self.submitted.get(player_id, ())) - correct,
+            self.totals[player_id] - correct,
+            self.attackers[player_id] - correct
+        )
+
+    def results(self, player_ids: Iterable[str], is_final_round: bool) -> Dict[str, ScoreResult]:
+        """
+        플레이어별 라운드 결과 (플레이어 수에 비례, 공격 수와 무관)
+
+        Args:
+            player_ids: 플레이어 ID 목록
+            is_final_round: 마지막 라운드 여부
+        """
+        player_ids = list(player_ids)
+        return build_results(player_ids, [self.counts(player_id) for player_id in player_ids], is_final_round)
+
+    def recount(self, player_ids: Iterable[str], is_final_round: bool,
+                engine: Optional[ScoreEngine] = None) -> Dict[str, ScoreResult]:
+        """
+        라운드 공격 기록과 제출 목록으로 결과를 처음부터 다시 계산 (누적 카운터 검증용)
+
+        Args:
+            player_ids: 플레이어 ID 목록
+            is_final_round: 마지막 라운드 여부
+            engine: 계산에 쓸 ScoreEngine (None이면 기본 설정)
+        """
+        return (engine or ScoreEngine()).score_round(player_ids, self.log, self.submitted, is_final_round)
+
+
+class RoundAttackLog:
+    """
+    라운드 공격 기록 (배열 열 + 플레이어 ID 코드 테이블)
+
+    플레이어 ID는 코드 번호로, 공격자 IP는 가상 IP 정수 그대로 array에 저장하고, clear()는 길이만 0으로 되돌려
+    다음 라운드에 같은 버퍼를 재사용한다. 스레드 안전하지 않음 (호출 측 락 사용).
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Args:
+            capacity: 초기 버퍼 크기 (기록 수)
+        """
+        self.length = 0
+        self.targets = array('I', bytes(4 * capacity))  # 대상 플레이어 ID 코드
+        self.attackers = array('I', bytes(4 * capacity))  # 공격자 플레이어 ID 코드
+        self.attacker_ips = array('I', bytes(4 * capacity))  # 공격자 가상 IP (정수)
+        self.timestamps = array('d', bytes(8 * capacity))  # 공격 완료 시각 (time.time)
+        self.real = array('B', bytes(capacity))  # 실제 공격 여부
+        self._symbols: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def _code(self, value: str) -> int:
+        """문자열 코드 번호 (처음 보는 값이면 등록)"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._symbols)
+            self._symbols.append(value)
+            self._codes[value] = code
+        return code
+
+    def _grow(self):
+        """버퍼 크기 2배로 확장"""
+        for column in (self.targets, self.attackers, self.attacker_ips, self.timestamps, self.real):
+            column.extend(column)
+
+    def append(self, attacker_id: str, target_id: str, attacker_ip: int,
+               timestamp: float, is_real: bool = True):
+        """공격 기록 추가"""
+        if self.length == len(self.targets):
+            self._grow()
+        i = self.length
+        self.targets[i] = self._code(target_id)
+        self.attackers[i] = self._code(attacker_id)
+        self.attacker_ips[i] = attacker_ip
+        self.timestamps[i] = timestamp
+        self.real[i] = 1 if is_real else 0
+        self.length = i + 1
+
+    def clear(self):
+        """기록 초기화 (버퍼는 유지)"""
+        self.length = 0
+        self._symbols.clear()
+        self._codes.clear()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def real_pairs(self) -> Iterator[Tuple[str, int]]:
+        """실제 공격의 (대상 ID, 공격자 IP) 쌍 순회 (ScoreEngine 입력, 딕셔너리를 만들지 않음)"""
+        symbols = self._symbols
+        targets, attacker_ips, real = self.targets, self.attacker_ips, self.real
+        for i in range(self.length):
+            if real[i]:
+                yield symbols[targets[i]], attacker_ips[i]
+
+    def __iter__(self) -> Iterator[dict]:
+        """기록을 딕셔너리로 순회 (ScoreEngine 입력 형식)"""
+        symbols = self._symbols
+        for i in range(self.length):
+            yield {
+                'attacker_id': symbols[self.attackers[i]],
+                'target_id': symbols[self.targets[i]],
+                'attacker_ip': self.attacker_ips[i],
+                'timestamp': self.timestamps[i],
+                'is_real': bool(self.real[i])
+            }
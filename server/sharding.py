@@ -0,0 +1,501 @@
+"""
+멀티 프로세스 샤딩 모듈 (Linux)
+GIL 때문에 한 프로세스는 코어 하나만 쓰므로, 워커 프로세스 N개가 SO_REUSEPORT로
+같은 게임 포트에 바인딩하고 방을 나눠 소유한다.
+
+- 방 소유: crc32(room_id) % N (room_owner)
+- 방을 지정하지 않은 연결은 워커 0(AUTO_ASSIGN_WORKER)이 모두 받아 자동 배정한다
+  (워커마다 기본 방에 나눠 받으면 플레이어가 흩어지고, GUI는 워커 0의 기본 방만 시작하므로)
+- 커널이 연결을 아무 워커에나 분배하므로, CONNECT의 room을 소유하지 않은 워커는
+  소켓 fd를 소유 워커에 넘긴다 (SCM_RIGHTS, socket.send_fds)
+- 감독 프로세스(ShardSupervisor)는 제어 파이프로 워커에 명령을 보내고
+  상태/플레이어 목록/패킷 로그를 모아 웹 GUI에 전달한다
+"""
+
+import itertools
+import logging
+import multiprocessing
+import queue
+import socket
+import threading
+import zlib
+from typing import Callable, List, Optional
+
+from common.constants import DEFAULT_HOST, DEFAULT_PORT, MAX_FRAME_SIZE
+from server.engines import DEFAULT_ENGINE
+from server.game_server import GameServer, GUI_LOG_LEVELS
+from server.gui_publisher import GuiPublisher
+from server.traffic_profiles import DEFAULT_TRAFFIC_PROFILE, get_traffic_profile
+from server.metrics import add_label, merge_families
+from server.telemetry import process_families
+from common.log import get_logger
+
+log = get_logger(__name__, "Shard")
+server_log = get_logger("server.game_server", "서버")
+
+# 방을 지정하지 않은 연결을 받아 자동 배정하는 워커 (GUI의 기본 방 제어 대상과 같음)
+AUTO_ASSIGN_WORKER = 0
+
+# 감독 프로세스 이벤트 큐 최대 묶음 수 (워커마다 틱당 하나, 넘치면 화면 이벤트 묶음을 버림)
+EVENT_QUEUE_SIZE = 256
+
+
+def room_owner(room_id: Optional[str], workers: int) -> int:
+    """
+    방을 소유하는 워커 번호
+
+    Args:
+        room_id: 방 ID (없으면 자동 배정을 맡는 AUTO_ASSIGN_WORKER)
+        workers: 워커 수
+
+    Returns:
+        0 ~ workers-1
+    """
+    if not room_id:
+        return AUTO_ASSIGN_WORKER
+    return zlib.crc32(room_id.encode('utf-8')) % workers
+
+
+class ShardRouter:
+    """워커 쪽 라우터: 방 소유 판단과 워커 간 연결 넘기기"""
+
+    def __init__(self, index: int, workers: int, inboxes: List[tuple]):
+        """
+        Args:
+            index: 이 워커 번호
+            workers: 워커 수
+            inboxes: 워커별 (수신 소켓, 송신 소켓) UNIX 데이터그램 소켓 쌍 목록
+        """
+        self.index = index
+        self.workers = workers
+        self.inbox = inboxes[index][0]
+        self.outboxes = [pair[1] for pair in inboxes]
+        self.thread = None
+
+    def owner_of(self, room_id: Optional[str]) -> int:
+        """방을 소유하는 워커 번호 (room_id가 없으면 자동 배정 워커)"""
+        return room_owner(room_id, self.workers)
+
+    def owns(self, room_id: Optional[str]) -> bool:
+        """이 워커가 소유한 방인지 여부"""
+        return self.owner_of(room_id) == self.index
+
+    def handoff(self, worker: int, sock, frame: bytes) -> bool:
+        """
+        연결을 다른 워커에 넘김 (호출 측은 이후 자기 fd만 닫아야 함)
+
+        Args:
+            worker: 받을 워커 번호
+            sock: 클라이언트 소켓
+            frame: 받는 워커가 먼저 처리할 프레임 (CONNECT)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            socket.send_fds(self.outboxes[worker], [frame], [sock.fileno()])
+            return True
+        except OSError as e:
+            log.warning("워커 %s에 연결 넘기기 실패: %s", worker, e)
+            return False
+
+    def start(self, adopt: Callable[[socket.socket, bytes], None]):
+        """
+        넘겨받은 연결 수신 스레드 시작
+
+        Args:
+            adopt: (소켓, 먼저 처리할 프레임) -> None, 엔진의 adopt
+        """
+        def receive_loop():
+            while True:
+                try:
+                    frame, fds, _, _ = socket.recv_fds(self.inbox, MAX_FRAME_SIZE, 1)
+                except OSError:
+                    break
+                for fd in fds:
+                    try:
+                        adopt(socket.socket(fileno=fd), frame)
+                    except Exception as e:
+                        log.warning("넘겨받은 연결 처리 실패: %s", e)
+
+        self.thread = threading.Thread(target=receive_loop, daemon=True, name=f"shard-inbox-{self.index}")
+        self.thread.start()
+
+
+class WorkerEventPublisher(GuiPublisher):
+    """
+    워커 쪽 화면 이벤트 묶음
+
+    GuiPublisher와 같은 틱/상한 규칙으로 모은 뒤, 한 틱에 나온 이벤트를
+    제어 파이프 메시지 하나로 감독 프로세스에 보낸다 (이벤트마다 pickle/send하지 않음).
+    """
+
+    def __init__(self, send: Callable[[list], None]):
+        """
+        Args:
+            send: 틱마다 [(이벤트 이름, 데이터), ...]를 받아 전송하는 함수 (발행 스레드에서 호출)
+        """
+        self._send = send
+        self._batch = []
+        super().__init__(self._collect)
+
+    def _collect(self, event: str, data: dict):
+        self._batch.append((event, data))
+
+    def flush(self):
+        """모인 이벤트를 묶음 하나로 보냄"""
+        super().flush()
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._send(batch)
+
+
+class WorkerGameServer(GameServer):
+    """워커 프로세스의 GameServer: 화면 훅을 틱마다 묶어 제어 파이프로 감독 프로세스에 전달"""
+
+    # 감독 프로세스가 호출할 수 있는 메서드
+    CONTROL_METHODS = frozenset({
+        'start', 'stop', 'start_game', 'stop_game',
+        'get_status', 'get_packet_log', 'get_rooms_info', 'get_metrics', 'get_attack_traces'
+    })
+
+    def __init__(self, conn, **kwargs):
+        """
+        Args:
+            conn: 감독 프로세스와의 제어 파이프 (multiprocessing Connection)
+            kwargs: GameServer 인자
+        """
+        self.conn = conn
+        self.conn_lock = threading.Lock()
+        self.publisher = WorkerEventPublisher(self._send_events)
+        self.publisher.start()
+        super().__init__(**kwargs)
+
+    def _send_events(self, events: list):
+        """감독 프로세스에 이벤트 묶음 전송 (제어 응답과 같은 파이프이므로 락으로 보호)"""
+        try:
+            with self.conn_lock:
+                self.conn.send(('event', 'batch', events))
+        except (OSError, EOFError, BrokenPipeError):
+            pass
+
+    def log_to_gui(self, message: str, level: str = "info"):
+        """서버 로그 (다음 틱에 감독 프로세스로 전달)"""
+        self.publisher.publish_log({'message': message, 'level': level})
+
+    def _publish_player_list(self, room_id: str, players_info: list):
+        """방의 플레이어 목록 변경 (다음 틱에 감독 프로세스로 전달)"""
+        self.publisher.publish_player_list(room_id, players_info)
+
+    def _publish_packet(self, packet_data: dict):
+        """패킷 로그 (다음 틱에 감독 프로세스로 전달)"""
+        self.publisher.publish_packet(packet_data)
+
+    def serve_control(self):
+        """제어 파이프 명령 처리 루프 (파이프가 닫히거나 shutdown을 받으면 종료)"""
+        while True:
+            try:
+                _, req_id, method, args = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            if method == 'shutdown':
+                break
+
+            try:
+                if method not in self.CONTROL_METHODS:
+                    raise ValueError(f"허용되지 않은 제어 명령: {method}")
+                reply = ('result', req_id, getattr(self, method)(*args))
+            except Exception as e:
+                reply = ('error', req_id, str(e))
+            try:
+                with self.conn_lock:
+                    self.conn.send(reply)
+            except (OSError, EOFError, BrokenPipeError):
+                break
+
+        if self.running:
+            self.stop()
+        # 남은 이벤트를 마지막 묶음으로 보냄
+        self.publisher.stop()
+
+
+def worker_main(index: int, workers: int, host: str, port: int, engine: str, conn, inboxes: List[tuple],
+                packet_log_dir: Optional[str] = None):
+    """
+    워커 프로세스 진입점
+
+    Args:
+        index: 워커 번호
+        workers: 워커 수
+        host: 게임 서버 호스트
+        port: 게임 서버 포트 (모든 워커가 SO_REUSEPORT로 공유)
+        engine: 연결 처리 엔진 이름
+        conn: 감독 프로세스와의 제어 파이프
+        inboxes: 워커별 연결 넘기기용 소켓 쌍 목록
+        packet_log_dir: 전체 패킷 로그 디렉터리 (워커마다 pid로 구분된 세그먼트 파일)
+    """
+    shard = ShardRouter(index, workers, inboxes)
+    server = WorkerGameServer(conn, host=host, port=port, engine=engine, shard=shard,
+                              packet_log_dir=packet_log_dir)
+    shard.start(server.engine.adopt)
+    log.info("워커 %s/%s 준비 완료", index, workers)
+    server.serve_control()
+
+
+class ShardSupervisor:
+    """
+    감독 프로세스: 워커 프로세스 생성과 제어, 상태 집계
+
+    GameServer와 같은 제어 인터페이스(start/stop/start_game/stop_game/get_status/
+    get_packet_log/get_rooms_info)와 화면 훅을 제공하므로 웹 GUI가 그대로 사용할 수 있다.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 engine: str = DEFAULT_ENGINE, workers: int = 2, call_timeout: float = 5.0,
+                 traffic_profile: str = DEFAULT_TRAFFIC_PROFILE, packet_log_dir: Optional[str] = None):
+        """
+        Args:
+            host: 게임 서버 호스트
+            port: 게임 서버 포트
+            engine: 워커의 연결 처리 엔진 이름
+            workers: 워커 프로세스 수
+            call_timeout: 워커 제어 명령 응답 대기 시간 (초)
+            traffic_profile: 게임 시작 시 프로필을 지정하지 않으면 쓸 트래픽 프로필 이름
+            packet_log_dir: 워커들이 전체 패킷 로그를 남길 디렉터리 (None이면 남기지 않음)
+        """
+        self.host = host
+        self.port = port
+        self.engine = engine
+        self.traffic_profile = get_traffic_profile(traffic_profile).name
+        self.packet_log_dir = packet_log_dir
+        self.workers = workers
+        self.call_timeout = call_timeout
+        self.running = False
+
+        self.processes = []
+        self.conns = []
+        self.conn_locks = []
+        self._pending = {}  # {요청 ID: [완료 이벤트, 성공 여부, 결과]}
+        self._pending_lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._events = queue.Queue(maxsize=EVENT_QUEUE_SIZE)  # (워커 번호, [(이벤트 이름, 데이터), ...])
+        self.events_dropped = 0  # 큐가 넘쳐 버린 이벤트 묶음 수
+
+    def spawn(self):
+        """
+        워커 프로세스 생성 (fork 시점에 스레드가 없도록 다른 스레드를 시작하기 전에 호출)
+        """
+        ctx = multiprocessing.get_context('fork')
+        inboxes = [socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM) for _ in range(self.workers)]
+
+        for index in range(self.workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=worker_main,
+                args=(index, self.workers, self.host, self.port, self.engine, child_conn, inboxes,
+                      self.packet_log_dir),
+                daemon=True,
+                name=f"game-worker-{index}"
+            )
+            process.start()
+            child_conn.close()
+            self.processes.append(process)
+            self.conns.append(parent_conn)
+            self.conn_locks.append(threading.Lock())
+
+        # 연결 넘기기 소켓은 워커끼리만 사용
+        for recv_sock, send_sock in inboxes:
+            recv_sock.close()
+            send_sock.close()
+
+        for index in range(self.workers):
+            threading.Thread(target=self._read_loop, args=(index,), daemon=True,
+                             name=f"shard-control-{index}").start()
+        threading.Thread(target=self._event_loop, daemon=True, name="shard-events").start()
+        log.info("워커 %s개 시작 (포트 %s, SO_REUSEPORT)", self.workers, self.port)
+
+    def _read_loop(self, index: int):
+        """워커 제어 파이프 수신 (응답은 대기 중인 호출에 전달, 이벤트는 이벤트 큐로)"""
+        conn = self.conns[index]
+        while True:
+            try:
+                kind, key, value = conn.recv()
+            except (EOFError, OSError):
+                break
+            if kind == 'event':
+                try:
+                    self._events.put_nowait((index, value))
+                except queue.Full:
+                    # 화면 훅이 밀려도 제어 응답 수신은 막지 않음 (플레이어 목록은 다음 변경 때 다시 옴)
+                    self.events_dropped += 1
+                continue
+            with self._pending_lock:
+                entry = self._pending.pop(key, None)
+            if entry is not None:
+                entry[1] = kind == 'result'
+                entry[2] = value
+                entry[0].set()
+
+    def _event_loop(self):
+        """워커 이벤트 묶음을 화면 훅으로 전달 (훅이 워커를 다시 호출해도 수신 스레드가 막히지 않도록 분리)"""
+        while True:
+            index, events = self._events.get()
+            for event, data in events:
+                try:
+                    if event == 'server_log_batch':
+                        for entry in data['logs']:
+                            self.log_to_gui(f"[W{index}] {entry['message']}", entry['level'])
+                    elif event == 'player_list_update':
+                        self._publish_player_list(data['room_id'], data['players'])
+                    elif event == 'packet_log_batch':
+                        for packet_data in data['packets']:
+                            self._publish_packet(packet_data)
+                except Exception as e:
+                    log.warning("이벤트 처리 실패: %s", e)
+
+    def _request(self, index: int, method: str, *args) -> list:
+        """워커에 제어 명령 전송 (응답 대기 항목 반환)"""
+        req_id = next(self._sequence)
+        entry = [threading.Event(), False, None]
+        with self._pending_lock:
+            self._pending[req_id] = entry
+        try:
+            with self.conn_locks[index]:
+                self.conns[index].send(('call', req_id, method, args))
+        except (OSError, EOFError, BrokenPipeError) as e:
+            with self._pending_lock:
+                self._pending.pop(req_id, None)
+            entry[2] = f"워커 {index} 연결 끊김: {e}"
+            entry[0].set()
+        return entry
+
+    def _wait(self, index: int, entry: list):
+        """응답 대기 (실패하면 RuntimeError)"""
+        if not entry[0].wait(self.call_timeout):
+            raise RuntimeError(f"워커 {index} 응답 없음")
+        if not entry[1]:
+            raise RuntimeError(entry[2])
+        return entry[2]
+
+    def call(self, index: int, method: str, *args):
+        """워커 하나에 제어 명령 실행"""
+        return self._wait(index, self._request(index, method, *args))
+
+    def call_all(self, method: str, *args) -> list:
+        """모든 워커에 제어 명령을 동시에 보내고 결과 목록 반환"""
+        entries = [self._request(index, method, *args) for index in range(self.workers)]
+        return [self._wait(index, entry) for index, entry in enumerate(entries)]
+
+    def _owner(self, room_id: Optional[str]) -> int:
+        """방을 소유한 워커 (room_id가 없으면 자동 배정 워커의 기본 방)"""
+        return room_owner(room_id, self.workers)
+
+    def start(self):
+        """모든 워커의 게임 서버 시작"""
+        if self.running:
+            return False, "서버가 이미 실행 중입니다"
+        try:
+            results = self.call_all('start')
+        except RuntimeError as e:
+            return False, f"서버 시작 실패: {e}"
+        failed = [f"W{index}: {message}" for index, (ok, message) in enumerate(results) if not ok]
+        self.running = len(failed) < self.workers
+        if failed:
+            return False, f"일부 워커 시작 실패 ({', '.join(failed)})"
+        self.log_to_gui(f"서버 시작: {self.host}:{self.port} (워커 {self.workers}개, {self.engine})", "success")
+        return True, f"서버 시작됨 (워커 {self.workers}개)"
+
+    def stop(self):
+        """모든 워커의 게임 서버 중지"""
+        if not self.running:
+            return False, "서버가 실행되지 않았습니다"
+        self.running = False
+        try:
+            self.call_all('stop')
+        except RuntimeError as e:
+            self.log_to_gui(f"워커 중지 오류: {e}", "error")
+        self.log_to_gui("서버 중지됨", "warning")
+        return True, "서버 중지됨"
+
+    def shutdown(self):
+        """워커 프로세스 종료"""
+        for index in range(self.workers):
+            try:
+                with self.conn_locks[index]:
+                    self.conns[index].send(('call', None, 'shutdown', ()))
+            except (OSError, EOFError, BrokenPipeError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+
+    def start_game(self, room_id: Optional[str] = None, traffic_profile: Optional[str] = None):
+        """방의 게임 시작 (방을 소유한 워커에서 실행, 트래픽 프로필을 지정하지 않으면 감독 프로세스의 기본 프로필)"""
+        try:
+            return tuple(self.call(self._owner(room_id), 'start_game', room_id, traffic_profile or self.traffic_profile))
+        except RuntimeError as e:
+            return False, str(e)
+
+    def stop_game(self, room_id: Optional[str] = None):
+        """방의 게임 중지 (방을 소유한 워커에서 실행)"""
+        try:
+            return tuple(self.call(self._owner(room_id), 'stop_game', room_id))
+        except RuntimeError as e:
+            return False, str(e)
+
+    def get_rooms_info(self) -> list:
+        """모든 워커의 방 요약 정보 (worker 필드 추가)"""
+        rooms = []
+        for index, worker_rooms in enumerate(self.call_all('get_rooms_info')):
+            for room in worker_rooms:
+                room['worker'] = index
+                rooms.append(room)
+        return rooms
+
+    def get_packet_log(self, room_id: Optional[str] = None) -> list:
+        """방의 패킷 로그"""
+        return self.call(self._owner(room_id), 'get_packet_log', room_id)
+
+    def get_attack_traces(self, room_id: Optional[str] = None) -> list:
+        """방의 공격 타임라인"""
+        return self.call(self._owner(room_id), 'get_attack_traces', room_id)
+
+    def get_metrics(self) -> list:
+        """모든 워커의 지표 (worker 레이블 추가, 감독 프로세스는 worker="supervisor")"""
+        families = []
+        for index, worker_families in enumerate(self.call_all('get_metrics')):
+            families.extend(add_label(worker_families, 'worker', str(index)))
+        families.extend(add_label(process_families(), 'worker', 'supervisor'))
+        return merge_families(families)
+
+    def get_status(self, room_id: Optional[str] = None):
+        """
+        서버 상태 반환 (모든 워커의 방 목록 + 선택한 방의 상세 상태)
+
+        Args:
+            room_id: 상세 상태를 볼 방 ID (None이거나 없는 방이면 워커 0의 기본 방)
+        """
+        rooms = self.get_rooms_info()
+        if not any(room['room_id'] == room_id for room in rooms):
+            room_id = None
+        status = self.call(self._owner(room_id), 'get_status', room_id)
+        status.update({
+            'running': self.running,
+            'engine': self.engine,
+            'workers': self.workers,
+            'rooms': rooms,
+            'default_traffic_profile': self.traffic_profile,
+            'events_dropped': self.events_dropped
+        })
+        return status
+
+    def _publish_player_list(self, room_id: str, players_info: list):
+        """방의 플레이어 목록 변경 알림 훅 (기본: 없음)"""
+        pass
+
+    def _publish_packet(self, packet_data: dict):
+        """패킷 로그 알림 훅 (기본: 없음)"""
+        pass
+
+    def log_to_gui(self, message: str, level: str = "info"):
+        """서버 로그 훅 (기본: 로그 출력)"""
+        server_log.log(GUI_LOG_LEVELS.get(level, logging.INFO), message)
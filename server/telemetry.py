@@ -0,0 +1,143 @@
+"""
+서버 텔레메트리 모듈
+웹 GUI의 /metrics로 내보내는 서버 지표 정의와 수집
+
+- 수신/송신 프레임·바이트 (메시지 타입별): 엔진 수신 루프, 플레이어별 writer
+- 송신 지연 (플레이어별): 송신 큐에 넣은 뒤 소켓에 다 쓰기까지
+- 브로드캐스트 분배 시간 (메시지 타입별): 한 메시지를 모든 수신자 송신 큐에 넣기까지
+- 단계 시작 지연 (phase drift): 이전 단계가 끝나야 할 시각보다 다음 단계가 늦게 시작한 시간
+- 생성기 전송 수 (rate()가 실제 전송률)
+  위 지표는 기록하는 스레드의 값에만 더하므로 (server.metrics.Counter/Histogram) 수집이 게임 경로를 막지 않음
+- 공격 단계별 지연, 생성기 요청/실제 전송률, 송신 큐 깊이, 스레드/열린 소켓 수는 수집할 때 계산
+"""
+
+import os
+import threading
+from typing import List, Optional
+
+from server.metrics import MetricsRegistry, FAST_BUCKETS, metric_family, latency_family
+
+REGISTRY = MetricsRegistry()
+
+FRAMES_RECEIVED = REGISTRY.counter('comnet_frames_received_total', '수신 프레임 수', ('type',))
+BYTES_RECEIVED = REGISTRY.counter('comnet_bytes_received_total', '수신 바이트 (길이 헤더 포함)', ('type',))
+FRAMES_SENT = REGISTRY.counter('comnet_frames_sent_total', '송신 프레임 수', ('type',))
+BYTES_SENT = REGISTRY.counter('comnet_bytes_sent_total', '송신 바이트 (길이 헤더 포함)', ('type',))
+SEND_LATENCY = REGISTRY.histogram('comnet_send_latency_seconds',
+                                  '송신 큐에 넣은 뒤 소켓에 다 쓰기까지 걸린 시간', ('player',), FAST_BUCKETS)
+BROADCAST_FANOUT = REGISTRY.histogram('comnet_broadcast_fanout_seconds',
+                                      '브로드캐스트 한 번을 모든 수신자 송신 큐에 넣기까지 걸린 시간', ('type',),
+                                      FAST_BUCKETS)
+PHASE_DRIFT = REGISTRY.histogram('comnet_phase_drift_seconds',
+                                 '게임 단계가 예정 시각(이전 단계 시작 + 단계 길이)보다 늦게 시작한 시간', ('phase',))
+GENERATOR_FRAMES = REGISTRY.counter('comnet_generator_frames_total',
+                                    '생성기가 보낸 트래픽 수 (rate()가 실제 전송률)', ('generator',))
+
+# 공격 테이블 지연 히스토그램 이름 → stage 레이블 (attacker_*/target_*는 클라이언트 보고 구간)
+ATTACK_STAGES = ('approve', 'sent', 'delivery', 'complete', 'approved_to_complete',
+                 'attacker_dispatch', 'attacker_connect', 'attacker_send', 'target_wait', 'target_read', 'transit')
+
+
+def record_frame_received(msg_type: str, size: int):
+    """
+    수신 프레임 한 개 기록 (엔진 수신 루프에서 호출)
+
+    Args:
+        msg_type: 메시지 타입
+        size: 길이 헤더를 포함한 프레임 크기 (바이트)
+    """
+    FRAMES_RECEIVED.inc(msg_type)
+    BYTES_RECEIVED.inc(msg_type, amount=size)
+
+
+def _count_open_sockets() -> Optional[int]:
+    """열린 소켓 fd 수 (/proc이 없으면 None)"""
+    try:
+        names = os.listdir('/proc/self/fd')
+    except OSError:
+        return None
+    count = 0
+    for name in names:
+        try:
+            if os.readlink(f'/proc/self/fd/{name}').startswith('socket:'):
+                count += 1
+        except OSError:
+            pass  # listdir 이후 닫힌 fd
+    return count
+
+
+def process_families() -> List[dict]:
+    """프로세스 지표 (스레드 수, 열린 소켓 수)"""
+    families = [metric_family('comnet_threads', 'gauge', '실행 중인 스레드 수', (),
+                              {(): threading.active_count()})]
+    sockets = _count_open_sockets()
+    if sockets is not None:
+        families.append(metric_family('comnet_open_sockets', 'gauge', '열린 소켓 수 (서버/클라이언트/내부 파이프 포함)', (),
+                                      {(): sockets}))
+    return families
+
+
+def room_families(rooms) -> List[dict]:
+    """
+    방별 지표 (플레이어 수, 송신 큐 깊이, 공격 단계별 지연/만료/실패, 생성기 전송률)
+
+    Args:
+        rooms: Room 목록
+    """
+    players = {}
+    queue_depth = {}
+    attack_latency = {}
+    attack_expired = {}
+    attack_failures = {}
+    requested = {}
+    achieved = {}
+    for room in rooms:
+        room_id = room.room_id
+        players[(room_id,)] = room.player_manager.get_player_count()
+        for player in room.player_manager.snapshot().players:
+            if player.writer is not None:
+                queue_depth[(room_id, player.player_id)] = player.writer.queue_depth()
+        # 히스토그램마다 자체 락이 있으므로 게임 락 없이 읽음 (카운터 dict는 복사해서 읽음)
+        attacks = room.game_manager.attacks
+        for stage in ATTACK_STAGES:
+            if stage in attacks.latency:
+                attack_latency[(room_id, stage)] = attacks.latency[stage]
+        for state, count in dict(attacks.expired_from).items():
+            attack_expired[(room_id, state)] = count
+        for (stage, error), count in dict(attacks.failures).items():
+            attack_failures[(room_id, stage, error)] = count
+        for name, stats in room.game_manager.get_traffic_stats()['generators'].items():
+            if stats:
+                requested[(room_id, name)] = stats['requested_pps']
+                achieved[(room_id, name)] = stats['achieved_pps']
+
+    return [
+        metric_family('comnet_room_players', 'gauge', '방의 플레이어 수', ('room',), players),
+        metric_family('comnet_send_queue_depth', 'gauge', '플레이어별 송신 큐에 쌓인 프레임 수',
+                      ('room', 'player'), queue_depth),
+        latency_family('comnet_attack_stage_seconds',
+                       'P2P 공격 단계별 지연 (approve/sent/delivery/complete는 요청부터, '
+                       'approved_to_complete는 승인부터, attacker_*/target_*는 클라이언트 보고, '
+                       'transit은 승인→전송 확인 중 공격자 밖에서 보낸 시간)', ('room', 'stage'), attack_latency),
+        metric_family('comnet_attacks_expired_total', 'counter', '만료된 공격 수 (만료 직전 상태별)',
+                      ('room', 'last_state'), attack_expired),
+        metric_family('comnet_attack_failures_total', 'counter', '공격자가 보고한 P2P 전송 실패 수',
+                      ('room', 'stage', 'error'), attack_failures),
+        metric_family('comnet_generator_requested_pps', 'gauge', '트래픽 프로필이 요청한 생성기 전송률',
+                      ('room', 'generator'), requested),
+        metric_family('comnet_generator_achieved_pps', 'gauge', '토큰 버킷으로 보낸 생성기의 실제 전송률',
+                      ('room', 'generator'), achieved)
+    ]
+
+
+def collect_server(rooms) -> List[dict]:
+    """
+    게임 서버 프로세스의 모든 지표
+
+    Args:
+        rooms: 이 프로세스의 Room 목록
+
+    Returns:
+        지표 dict 목록 (server.metrics.render_prometheus로 텍스트 변환)
+    """
+    return REGISTRY.collect() + process_families() + room_families(rooms)
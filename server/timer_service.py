@@ -0,0 +1,198 @@
+"""
+타이머 서비스 모듈
+타이머마다 스레드를 만드는 threading.Timer 대신, 스레드 하나가 최소 힙으로 모든 타이머를 처리
+
+- schedule(): O(log n), 가장 이른 타이머가 바뀔 때만 스레드를 깨움
+- cancel(): O(1) (표시만 하고 힙에서는 꺼낼 때 건너뜀, 취소된 항목이 많아지면 힙 재구성)
+- 콜백은 타이머 스레드에서 실행되므로 오래 막히는 작업은 하지 않아야 함
+- stats(): 대기 중 타이머 수, 실행/취소 수, 실행 지연(lag)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+from common.log import get_logger
+
+log = get_logger(__name__, "TimerService")
+
+# 취소된 항목이 이 수 이상이고 힙의 절반을 넘으면 힙 재구성
+COMPACT_MIN_CANCELLED = 64
+
+
+class TimerHandle:
+    """예약된 타이머 (cancel()로 취소)"""
+
+    __slots__ = ('when', 'callback', 'args', 'cancelled', 'done', '_service')
+
+    def __init__(self, service: 'TimerService', when: float, callback: Callable, args: tuple):
+        self._service = service
+        self.when = when  # 실행 예정 시각 (time.monotonic 기준)
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.done = False  # 실행을 위해 꺼낸 상태
+
+    def cancel(self) -> bool:
+        """
+        타이머 취소
+
+        Returns:
+            취소 여부 (이미 실행됐거나 취소된 타이머면 False)
+        """
+        return self._service._cancel(self)
+
+
+class TimerService:
+    """최소 힙 기반 타이머 스케줄러 (스레드 하나)"""
+
+    def __init__(self, name: str = "timer-service"):
+        """
+        Args:
+            name: 타이머 스레드 이름
+        """
+        self.name = name
+        self._heap = []  # (실행 시각, 순번, TimerHandle)
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        # 통계
+        self._live = 0
+        self._cancelled_in_heap = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self._lag_total = 0.0
+
+    def start(self):
+        """타이머 스레드 시작 (schedule()이 필요할 때 자동으로 호출)"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+            self._thread.start()
+
+    def stop(self):
+        """타이머 스레드 중지 (대기 중인 타이머는 실행하지 않음)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def schedule(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """
+        delay초 뒤 callback(*args) 실행 예약
+
+        Args:
+            delay: 대기 시간 (초)
+            callback: 실행할 함수
+            args: callback 인자
+
+        Returns:
+            TimerHandle
+        """
+        when = time.monotonic() + delay
+        handle = TimerHandle(self, when, callback, args)
+        with self._cond:
+            if not self._running:
+                self.start()
+            heapq.heappush(self._heap, (when, next(self._sequence), handle))
+            self._live += 1
+            # 가장 이른 타이머가 바뀐 경우에만 대기 시간을 다시 계산하도록 깨움
+            if self._heap[0][2] is handle:
+                self._cond.notify()
+        return handle
+
+    def _cancel(self, handle: TimerHandle) -> bool:
+        """타이머 취소 (TimerHandle.cancel에서 호출)"""
+        with self._cond:
+            if handle.cancelled or handle.done:
+                return False
+            handle.cancelled = True
+            handle.callback = None  # 콜백이 잡고 있는 객체를 바로 놓아줌
+            handle.args = ()
+            self._live -= 1
+            self.cancelled += 1
+            self._cancelled_in_heap += 1
+            if (self._cancelled_in_heap >= COMPACT_MIN_CANCELLED
+                    and self._cancelled_in_heap * 2 > len(self._heap)):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_in_heap = 0
+            return True
+
+    def _next_due(self) -> Optional[TimerHandle]:
+        """실행할 타이머가 생길 때까지 대기 후 꺼냄 (중지되면 None)"""
+        with self._cond:
+            while self._running:
+                heap = self._heap
+                while heap and heap[0][2].cancelled:
+                    heapq.heappop(heap)
+                    self._cancelled_in_heap -= 1
+                if not heap:
+                    self._cond.wait()
+                    continue
+                delay = heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                handle = heapq.heappop(heap)[2]
+                handle.done = True
+                self._live -= 1
+                return handle
+            return None
+
+    def _run(self):
+        """타이머 스레드 루프"""
+        while True:
+            handle = self._next_due()
+            if handle is None:
+                return
+
+            lag = time.monotonic() - handle.when
+            self.fired += 1
+            self.lag_last = lag
+            self._lag_total += lag
+            if lag > self.lag_max:
+                self.lag_max = lag
+
+            try:
+                handle.callback(*handle.args)
+            except Exception as e:
+                log.error("타이머 콜백 오류: %s", e)
+
+    def stats(self) -> dict:
+        """타이머 통계 (대기 중 타이머 수, 실행/취소 수, 실행 지연 ms)"""
+        with self._cond:
+            live = self._live
+            heap_size = len(self._heap)
+        return {
+            'live': live,
+            'heap_size': heap_size,
+            'fired': self.fired,
+            'cancelled': self.cancelled,
+            'lag_last_ms': round(self.lag_last * 1000, 3),
+            'lag_max_ms': round(self.lag_max * 1000, 3),
+            'lag_avg_ms': round(self._lag_total / self.fired * 1000, 3) if self.fired else 0.0
+        }
+
+
+_default_service = None
+_default_lock = threading.Lock()
+
+
+def get_timer_service() -> TimerService:
+    """프로세스 공용 타이머 서비스 (모든 방의 GameManager가 공유)"""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = TimerService()
+        return _default_service
@@ -0,0 +1,178 @@
+"""
+트래픽 프로필 모듈
+캡처/서버 부하 테스트용으로 더미/노이즈/가짜 공격 전송률을 게임 단위로 바꾸는 이름 붙은 프로필
+
+- classic: 기존 라운드별 난이도(DIFFICULTY_BY_ROUND)를 그대로 사용
+- 부하 프로필: 생성기마다 초당 전송 수(pps)를 지정하고 토큰 버킷으로 간격을 맞춤
+- 프로필은 게임 시작 시 서버 GUI 또는 CLI(--traffic-profile)에서 선택 (common/constants.py 수정 불필요)
+
+pps는 생성기 emit 수 기준 (더미는 방 전체 브로드캐스트 1회가 1개, 수신자마다 프레임 1개씩 전송)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+DEFAULT_TRAFFIC_PROFILE = "classic"
+
+
+@dataclass(frozen=True)
+class TrafficProfile:
+    """
+    트래픽 프로필
+
+    생성기별 pps가 None이면 라운드 난이도 설정을 따름 (노이즈/가짜 공격은 0이면 끔)
+    """
+    name: str
+    description: str
+    dummy_pps: Optional[float] = None
+    noise_pps: Optional[float] = None
+    decoy_pps: Optional[float] = None
+    burst: int = 1  # 밀린 전송을 한 번에 몰아 보낼 수 있는 최대 개수
+
+    @property
+    def paced(self) -> bool:
+        """토큰 버킷으로 전송률을 맞추는 생성기가 있는지"""
+        return any(pps is not None for pps in (self.dummy_pps, self.noise_pps, self.decoy_pps))
+
+    def apply(self, difficulty: dict, round_time: float) -> dict:
+        """
+        라운드 난이도 설정에 프로필을 적용한 복사본
+
+        Args:
+            difficulty: DIFFICULTY_BY_ROUND의 라운드 설정
+            round_time: 라운드 진행 시간 (초, 가짜 공격 개수 계산용)
+
+        Returns:
+            노이즈/가짜 공격 활성화 여부와 가짜 공격 개수를 바꾼 난이도 설정
+        """
+        if not self.paced:
+            return difficulty
+        difficulty = dict(difficulty)
+        if self.noise_pps is not None:
+            difficulty['noise_traffic'] = self.noise_pps > 0
+        if self.decoy_pps is not None:
+            difficulty['decoy_attacks'] = self.decoy_pps > 0
+            difficulty['decoy_count'] = math.ceil(self.decoy_pps * round_time)
+        return difficulty
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'description': self.description,
+            'dummy_pps': self.dummy_pps,
+            'noise_pps': self.noise_pps,
+            'decoy_pps': self.decoy_pps,
+            'burst': self.burst
+        }
+
+
+TRAFFIC_PROFILES: Dict[str, TrafficProfile] = {
+    profile.name: profile for profile in (
+        TrafficProfile("classic", "라운드별 난이도 설정 (기본)"),
+        TrafficProfile("load-100", "부하 테스트: 더미 100 / 노이즈 50 / 가짜 공격 10 pps",
+                       dummy_pps=100, noise_pps=50, decoy_pps=10, burst=10),
+        TrafficProfile("load-1k", "부하 테스트: 더미 1000 / 노이즈 500 / 가짜 공격 100 pps",
+                       dummy_pps=1000, noise_pps=500, decoy_pps=100, burst=50),
+        TrafficProfile("load-5k", "부하 테스트: 더미 5000 / 노이즈 2000 / 가짜 공격 500 pps",
+                       dummy_pps=5000, noise_pps=2000, decoy_pps=500, burst=200),
+    )
+}
+
+
+def get_traffic_profile(name: Optional[str] = None) -> TrafficProfile:
+    """
+    이름으로 트래픽 프로필 조회
+
+    Args:
+        name: 프로필 이름 (None이면 기본 프로필)
+
+    Returns:
+        TrafficProfile
+
+    Raises:
+        ValueError: 없는 프로필 이름
+    """
+    profile = TRAFFIC_PROFILES.get(name or DEFAULT_TRAFFIC_PROFILE)
+    if profile is None:
+        raise ValueError(f"알 수 없는 트래픽 프로필: {name} (사용 가능: {', '.join(TRAFFIC_PROFILES)})")
+    return profile
+
+
+class TokenBucket:
+    """
+    토큰 버킷 전송 간격 조절기 (생성기의 next_delay()에서 사용)
+
+    이론적 도착 시각(GCRA) 방식: 전송 시각을 절대 시각으로 1/rate씩 진행하므로
+    스케줄러 지연이 누적되지 않고, 늦어진 만큼은 최대 burst개까지 바로 몰아서 보낸다.
+    burst개보다 더 밀리면 그 이상은 버리고 현재 시각부터 다시 맞춘다.
+    """
+
+    def __init__(self, rate: float, burst: int, clock):
+        """
+        Args:
+            rate: 초당 전송 수 (pps)
+            burst: 한 번에 몰아 보낼 수 있는 최대 개수 (1이면 항상 1/rate 간격)
+            clock: now()를 제공하는 시계 (스케줄러와 같은 시계)
+        """
+        if rate <= 0:
+            raise ValueError(f"전송률은 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.clock = clock
+        self.interval = 1.0 / rate
+        self.tolerance = (self.burst - 1) * self.interval  # 예정 시각보다 이만큼 앞서 보내도 됨
+        self.reset()
+
+    def reset(self):
+        """
+        전송 시작 (달성률 측정을 새로 시작)
+        버킷을 빈 상태로 시작하므로 첫 패킷부터 1/rate 간격이고, burst는 밀린 전송을 따라잡을 때만 쓰임
+        """
+        now = self.clock.now()
+        self.tat = now + self.tolerance  # 다음 토큰의 이론적 도착 시각
+        self.started = now
+        self.finished = None
+        self.sent = 0
+
+    def finish(self):
+        """전송 종료 (달성률 측정 구간을 닫음)"""
+        if self.finished is None:
+            self.finished = self.clock.now()
+
+    def next_delay(self) -> float:
+        """
+        다음 전송까지 대기 시간 (토큰 하나 예약)
+
+        Returns:
+            대기 시간 (초, 밀려 있으면 0)
+        """
+        now = self.clock.now()
+        send_at = max(self.tat - self.tolerance, now)
+        self.tat = max(self.tat, send_at) + self.interval
+        return send_at - now
+
+    def record_sent(self, count: int = 1):
+        """실제 전송 수 기록 (emit()에서 호출)"""
+        self.sent += count
+
+    def frames_for(self, duration: float) -> int:
+        """duration초 동안 보낼 최대 프레임 수 (프레임 풀 크기 계산용)"""
+        return math.ceil(duration * self.rate) + self.burst
+
+    def achieved_rate(self) -> float:
+        """시작 후 실제 전송률 (pps)"""
+        elapsed = (self.finished if self.finished is not None else self.clock.now()) - self.started
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> dict:
+        """요청 전송률 대비 실제 전송률"""
+        achieved = self.achieved_rate()
+        return {
+            'requested_pps': self.rate,
+            'achieved_pps': round(achieved, 1),
+            'ratio': round(achieved / self.rate, 3),
+            'burst': self.burst,
+            'sent': self.sent,
+            'running': self.finished is None
+        }
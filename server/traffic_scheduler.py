@@ -0,0 +1,237 @@
+"""
+트래픽 스케줄러 모듈
+더미/노이즈/가짜 공격 생성기의 다음 전송 시각을 최소 힙 하나로 관리 (스케줄러 스레드 하나)
+
+생성기는 스레드를 만들지 않고 다음 두 메서드만 제공:
+- next_delay(): 다음 전송까지 대기 시간 (초, None이면 종료)
+- emit(): 패킷 한 개 전송
+
+- add(): 생성기 등록 (O(log n)), 가장 이른 전송 시각이 바뀔 때만 스레드를 깨움
+- ScheduledSource.cancel(): O(1) 즉시 중지 (스레드 join 없음, 힙에서는 꺼낼 때 건너뜀)
+- 대기는 주입된 시계(server.clock)를 사용하므로 VirtualClock에서도 게임 진행과 맞물려 동작
+- emit()은 스케줄러 스레드에서 실행되므로 송신 큐에 넣는 정도로 짧아야 함
+"""
+
+import heapq
+import itertools
+import threading
+from typing import Optional
+
+from server.clock import get_default_clock
+from common.log import get_logger
+
+log = get_logger(__name__, "TrafficScheduler")
+
+# 취소된 항목이 이 수 이상이고 힙의 절반을 넘으면 힙 재구성
+COMPACT_MIN_CANCELLED = 64
+
+
+class ScheduledSource:
+    """스케줄러에 등록된 생성기 (cancel()로 중지)"""
+
+    __slots__ = ('source', 'due', 'cancelled', 'queued', 'emitted', '_scheduler')
+
+    def __init__(self, scheduler: 'TrafficScheduler', source):
+        self._scheduler = scheduler
+        self.source = source
+        self.due = 0.0  # 다음 전송 시각 (스케줄러 시계 기준)
+        self.cancelled = False
+        self.queued = False  # 힙에 들어 있는지 (emit 중이면 False)
+        self.emitted = 0
+
+    def cancel(self) -> bool:
+        """
+        생성기 중지 (이미 실행 중인 emit은 끝까지 진행)
+
+        Returns:
+            취소 여부 (이미 취소/종료된 경우 False)
+        """
+        return self._scheduler._cancel(self)
+
+
+class TrafficScheduler:
+    """최소 힙 기반 트래픽 스케줄러 (여러 방의 생성기가 스레드 하나를 공유)"""
+
+    def __init__(self, clock=None, name: str = "traffic-scheduler"):
+        """
+        Args:
+            clock: 대기에 쓸 시계 (None이면 실제 단조 시계)
+            name: 스케줄러 스레드 이름
+        """
+        self.clock = clock or get_default_clock()
+        self.name = name
+        self._heap = []  # (전송 시각, 순번, ScheduledSource)
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()  # 더 이른 전송이 등록되거나 중지될 때 설정
+        self._thread = None
+        self._running = False
+
+        # 통계
+        self._live = 0
+        self._cancelled_in_heap = 0
+        self.emitted = 0
+        self.errors = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+
+    def start(self):
+        """스케줄러 스레드 시작 (add()가 필요할 때 자동으로 호출)"""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+        self._thread.start()
+        self.clock.attach(self._thread)
+
+    def stop(self):
+        """스케줄러 스레드 중지 (등록된 생성기는 더 이상 전송하지 않음)"""
+        with self._lock:
+            self._running = False
+            self._wake.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def add(self, source) -> Optional[ScheduledSource]:
+        """
+        생성기 등록 (next_delay() 뒤 첫 전송)
+
+        Args:
+            source: next_delay()/emit()을 제공하는 생성기
+
+        Returns:
+            ScheduledSource (첫 next_delay()가 None이면 None)
+        """
+        delay = source.next_delay()
+        if delay is None:
+            return None
+        entry = ScheduledSource(self, source)
+        with self._lock:
+            self._start_locked()
+            self._live += 1
+            self._push_locked(entry, self.clock.now() + delay)
+        return entry
+
+    def _push_locked(self, entry: ScheduledSource, due: float):
+        entry.due = due
+        entry.queued = True
+        heapq.heappush(self._heap, (due, next(self._sequence), entry))
+        # 가장 이른 전송이 바뀐 경우에만 대기 시간을 다시 계산하도록 깨움
+        if self._heap[0][2] is entry:
+            self._wake.set()
+
+    def _cancel(self, entry: ScheduledSource) -> bool:
+        """생성기 중지 (ScheduledSource.cancel에서 호출)"""
+        with self._lock:
+            if entry.cancelled:
+                return False
+            entry.cancelled = True
+            self._live -= 1
+            if not entry.queued:
+                return True  # emit 중인 항목은 다시 넣지 않음
+            self._cancelled_in_heap += 1
+            if (self._cancelled_in_heap >= COMPACT_MIN_CANCELLED
+                    and self._cancelled_in_heap * 2 > len(self._heap)):
+                self._heap = [item for item in self._heap if not item[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_in_heap = 0
+            return True
+
+    def _next_due(self):
+        """
+        전송할 생성기가 생길 때까지 대기 후 꺼냄
+
+        Returns:
+            (ScheduledSource, 예정 시각) 또는 중지 시 None
+        """
+        while True:
+            with self._lock:
+                if not self._running:
+                    return None
+                heap = self._heap
+                while heap and heap[0][2].cancelled:
+                    heapq.heappop(heap)
+                    self._cancelled_in_heap -= 1
+                if heap:
+                    delay = heap[0][0] - self.clock.now()
+                    if delay <= 0:
+                        due, _, entry = heapq.heappop(heap)
+                        entry.queued = False
+                        return entry, due
+                else:
+                    delay = None  # 등록된 생성기가 없으면 add()까지 대기
+                # 락을 놓기 전에 지워야 그 사이의 add()/stop() 알림을 놓치지 않음
+                self._wake.clear()
+            self.clock.wait(self._wake, delay)
+
+    def _run(self):
+        """스케줄러 스레드 루프"""
+        while True:
+            item = self._next_due()
+            if item is None:
+                return
+            entry, due = item
+
+            lag = self.clock.now() - due
+            self.lag_last = lag
+            if lag > self.lag_max:
+                self.lag_max = lag
+
+            source = entry.source
+            try:
+                source.emit()
+                entry.emitted += 1
+                self.emitted += 1
+            except Exception as e:
+                self.errors += 1
+                log.error("%s 전송 오류: %s", type(source).__name__, e)
+
+            delay = None
+            if not entry.cancelled:
+                try:
+                    delay = source.next_delay()
+                except Exception as e:
+                    self.errors += 1
+                    log.error("%s 간격 계산 오류: %s", type(source).__name__, e)
+
+            with self._lock:
+                if entry.cancelled:
+                    continue
+                if delay is None:
+                    # 생성기가 스스로 끝남 (예: 가짜 공격 개수 소진)
+                    entry.cancelled = True
+                    self._live -= 1
+                    continue
+                self._push_locked(entry, self.clock.now() + delay)
+
+    def stats(self) -> dict:
+        """스케줄러 통계 (등록된 생성기 수, 전송/오류 수, 전송 지연 ms)"""
+        with self._lock:
+            live = self._live
+            heap_size = len(self._heap)
+        return {
+            'sources': live,
+            'heap_size': heap_size,
+            'emitted': self.emitted,
+            'errors': self.errors,
+            'lag_last_ms': round(self.lag_last * 1000, 3),
+            'lag_max_ms': round(self.lag_max * 1000, 3)
+        }
+
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+
+def get_traffic_scheduler() -> TrafficScheduler:
+    """프로세스 공용 트래픽 스케줄러 (실제 시계, 모든 방의 생성기가 공유)"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TrafficScheduler()
+        return _default_scheduler